@@ -1,3 +0,0 @@
-/*! For license information please see async-markdown.js.LICENSE */
-(window.webpackJsonpdash_core_components=window.webpackJsonpdash_core_components||[]).push([[5],{101:function(t,e){(e=t.exports=function(t){return t.replace(/^\s*|\s*$/g,"")}).left=function(t){return t.replace(/^\s*/,"")},e.right=function(t){return t.replace(/\s*$/,"")}},121:function(t,e,i){"use strict";t.exports=function(t){var e="string"==typeof t?t.charCodeAt(0):t;return e>=48&&e<=57}},122:function(t,e,i){"use strict";t.exports=o;var r=i(528),n=r.CONTINUE,s=r.SKIP,a=r.EXIT;function o(t,e,i,n){"function"==typeof e&&"function"!=typeof i&&(n=i,i=e,e=null),r(t,e,(function(t,e){var r=e[e.length-1],n=r?r.children.indexOf(t):null;return i(t,n,r)}),n)}o.CONTINUE=n,o.SKIP=s,o.EXIT=a},152:function(t,e,i){"use strict";var r=i(517),n=i(518),s=i(121),a=i(519),o=i(520),c=i(521);t.exports=function(t,e){var i,s,a={};e||(e={});for(s in p)i=e[s],a[s]=null==i?p[s]:i;(a.position.indent||a.position.start)&&(a.indent=a.position.indent||[],a.position=a.position.start);return function(t,e){var i,s,a,p,C,T,I,P,O,L,N,j,V,M,B,R,D,H,U,F=e.additional,G=e.nonTerminated,z=e.text,W=e.reference,q=e.warning,K=e.textContext,X=e.referenceContext,J=e.warningContext,Q=e.position,Z=e.indent||[],$=t.length,Y=0,tt=-1,et=Q.column||1,it=Q.line||1,rt="",nt=[];R=at(),P=q?function(t,e){var i=at();i.column+=e,i.offset+=e,q.call(J,S[t],i,t)}:l,Y--,$++;for(;++Y<$;)if("\n"===C&&(et=Z[tt]||1),"&"!==(C=ot(Y)))"\n"===C&&(it++,tt++,et=0),C?(rt+=C,et++):ct();else{if("\t"===(I=ot(Y+1))||"\n"===I||"\f"===I||" "===I||"<"===I||"&"===I||""===I||F&&I===F){rt+=C,et++;continue}for(j=V=Y+1,U=V,"#"!==I?M=f:(U=++j,"x"===(I=ot(U))||"X"===I?(M=d,U=++j):M=m),i="",N="",p="",B=x[M],U--;++U<$&&(I=ot(U),B(I));)p+=I,M===f&&h.call(r,p)&&(i=p,N=r[p]);(a=";"===ot(U))&&(U++,(s=M===f&&c(p))&&(i=p,N=s)),H=1+U-V,(a||G)&&(p?M===f?(a&&!N?P(_,1):(i!==p&&(U=j+i.length,H=1+U-j,a=!1),a||(O=i?y:b,e.attribute?"="===(I=ot(U))?(P(O,H),N=null):o(I)?N=null:P(O,H):P(O,H))),T=N):(a||P(v,H),T=parseInt(p,g[M]),(st=T)>=55296&&st<=57343||st>1114111?(P(A,H),T="�"):T in n?(P(w,H),T=n[T]):(L="",E(T)&&P(w,H),T>65535&&(L+=u((T-=65536)>>>10|55296),T=56320|1023&T),T=L+u(T))):M!==f&&P(k,H)),T?(ct(),R=at(),Y=U-1,et+=U-V+1,nt.push(T),(D=at()).offset++,W&&W.call(X,T,{start:R,end:D},t.slice(V-1,U)),R=D):(p=t.slice(V-1,U),rt+=p,et+=p.length,Y=U-1)}var st;return nt.join("");function at(){return{line:it,column:et,offset:Y+(Q.offset||0)}}function ot(e){return t.charAt(e)}function ct(){rt&&(nt.push(rt),z&&z.call(K,rt,{start:R,end:at()}),rt="")}}(t,a)};var h={}.hasOwnProperty,u=String.fromCharCode,l=Function.prototype,p={warning:null,reference:null,text:null,warningContext:null,referenceContext:null,textContext:null,position:{},additional:null,attribute:!1,nonTerminated:!0},f="named",d="hexadecimal",m="decimal",g={};g[d]=16,g[m]=10;var x={};x[f]=o,x[m]=s,x[d]=a;var y=1,v=2,b=3,k=4,_=5,w=6,A=7,S={};function E(t){return t>=1&&t<=8||11===t||t>=13&&t<=31||t>=127&&t<=159||t>=64976&&t<=65007||65535==(65535&t)||65534==(65535&t)}S[y]="Named character references must be terminated by a semicolon",S[v]="Numeric character references must be terminated by a semicolon",S[b]="Named character references cannot be empty",S[k]="Numeric character references cannot be empty",S[_]="Named character references must be known",S[w]="Numeric character references cannot be disallowed",S[A]="Numeric character references cannot be outside the permissible Unicode range"},153:function(t,e,i){"use strict";var r,n="";t.exports=function(t,e){if("string"!=typeof t)throw new TypeError("expected a string");if(1===e)return t;if(2===e)return t+t;var i=t.length*e;if(r!==t||void 0===r)r=t,n="";else if(n.length>=i)return n.substr(0,i);for(;i>n.length&&e>1;)1&e&&(n+=t),e>>=1,t+=t;return n=(n+=t).substr(0,i)}},154:function(t,e,i){"use strict";t.exports=function(t){var e=String(t),i=e.length;for(;e.charAt(--i)===r;);return e.slice(0,i+1)};var r="\n"},155:function(t,e,i){"use strict";t.exports=function(t,e,i,r){var n,s,a,o,c,h,u=["pedantic","commonmark"],l=u.length,p=t.length,f=-1;for(;++f<p;){for(n=t[f],s=n[1]||{},a=n[0],o=-1,h=!1;++o<l;)if(void 0!==s[c=u[o]]&&s[c]!==i.options[c]){h=!0;break}if(!h&&e[a].apply(i,r))return!0}return!1}},156:function(t,e,i){"use strict";var r=i(541);t.exports=function(t){return r(t).toLowerCase()}},193:function(t,e,i){(function(t){function i(t,e){for(var i=0,r=t.length-1;r>=0;r--){var n=t[r];"."===n?t.splice(r,1):".."===n?(t.splice(r,1),i++):i&&(t.splice(r,1),i--)}if(e)for(;i--;i)t.unshift("..");return t}function r(t,e){if(t.filter)return t.filter(e);for(var i=[],r=0;r<t.length;r++)e(t[r],r,t)&&i.push(t[r]);return i}e.resolve=function(){for(var e="",n=!1,s=arguments.length-1;s>=-1&&!n;s--){var a=s>=0?arguments[s]:t.cwd();if("string"!=typeof a)throw new TypeError("Arguments to path.resolve must be strings");a&&(e=a+"/"+e,n="/"===a.charAt(0))}return(n?"/":"")+(e=i(r(e.split("/"),(function(t){return!!t})),!n).join("/"))||"."},e.normalize=function(t){var s=e.isAbsolute(t),a="/"===n(t,-1);return(t=i(r(t.split("/"),(function(t){return!!t})),!s).join("/"))||s||(t="."),t&&a&&(t+="/"),(s?"/":"")+t},e.isAbsolute=function(t){return"/"===t.charAt(0)},e.join=function(){var t=Array.prototype.slice.call(arguments,0);return e.normalize(r(t,(function(t,e){if("string"!=typeof t)throw new TypeError("Arguments to path.join must be strings");return t})).join("/"))},e.relative=function(t,i){function r(t){for(var e=0;e<t.length&&""===t[e];e++);for(var i=t.length-1;i>=0&&""===t[i];i--);return e>i?[]:t.slice(e,i-e+1)}t=e.resolve(t).substr(1),i=e.resolve(i).substr(1);for(var n=r(t.split("/")),s=r(i.split("/")),a=Math.min(n.length,s.length),o=a,c=0;c<a;c++)if(n[c]!==s[c]){o=c;break}var h=[];for(c=o;c<n.length;c++)h.push("..");return(h=h.concat(s.slice(o))).join("/")},e.sep="/",e.delimiter=":",e.dirname=function(t){if("string"!=typeof t&&(t+=""),0===t.length)return".";for(var e=t.charCodeAt(0),i=47===e,r=-1,n=!0,s=t.length-1;s>=1;--s)if(47===(e=t.charCodeAt(s))){if(!n){r=s;break}}else n=!1;return-1===r?i?"/":".":i&&1===r?"/":t.slice(0,r)},e.basename=function(t,e){var i=function(t){"string"!=typeof t&&(t+="");var e,i=0,r=-1,n=!0;for(e=t.length-1;e>=0;--e)if(47===t.charCodeAt(e)){if(!n){i=e+1;break}}else-1===r&&(n=!1,r=e+1);return-1===r?"":t.slice(i,r)}(t);return e&&i.substr(-1*e.length)===e&&(i=i.substr(0,i.length-e.length)),i},e.extname=function(t){"string"!=typeof t&&(t+="");for(var e=-1,i=0,r=-1,n=!0,s=0,a=t.length-1;a>=0;--a){var o=t.charCodeAt(a);if(47!==o)-1===r&&(n=!1,r=a+1),46===o?-1===e?e=a:1!==s&&(s=1):-1!==e&&(s=-1);else if(!n){i=a+1;break}}return-1===e||-1===r||0===s||1===s&&e===r-1&&e===i+1?"":t.slice(e,r)};var n="b"==="ab".substr(-1)?function(t,e,i){return t.substr(e,i)}:function(t,e,i){return e<0&&(e=t.length+e),t.substr(e,i)}}).call(this,i(36))},194:function(t,e,i){"use strict";t.exports=function(t){var e="string"==typeof t?t.charCodeAt(0):t;return e>=97&&e<=122||e>=65&&e<=90}},195:function(t,e,i){"use strict";t.exports={position:!0,gfm:!0,commonmark:!1,footnotes:!1,pedantic:!1,blocks:i(525)}},196:function(t,e,i){"use strict";t.exports=function(t){var e,i=0,n=0,s=t.charAt(i),a={};for(;s in r;)e=r[s],n+=e,e>1&&(n=Math.floor(n/e)*e),a[n]=i,s=t.charAt(++i);return{indent:n,stops:a}};var r={" ":1,"\t":4}},197:function(t,e,i){"use strict";var r="<[A-Za-z][A-Za-z0-9\\-]*(?:\\s+[a-zA-Z_:][a-zA-Z0-9:._-]*(?:\\s*=\\s*(?:[^\"'=<>`\\u0000-\\u0020]+|'[^']*'|\"[^\"]*\"))?)*\\s*\\/?>",n="<\\/[A-Za-z][A-Za-z0-9\\-]*\\s*>";e.openCloseTag=new RegExp("^(?:"+r+"|"+n+")"),e.tag=new RegExp("^(?:"+r+"|"+n+"|\x3c!----\x3e|\x3c!--(?:-?[^>-])(?:-?[^-])*--\x3e|<[?].*?[?]>|<![A-Za-z]+\\s+[^>]*>|<!\\[CDATA\\[[\\s\\S]*?\\]\\]>)")},198:function(t,e,i){"use strict";t.exports=function(t,e){return t.indexOf("<",e)}},199:function(t,e,i){"use strict";t.exports=function(t,e){var i=t.indexOf("[",e),r=t.indexOf("![",e);if(-1===r)return i;return i<r?i:r}},494:function(t,e,i){(function(t){var r,n,s,a;function o(t,e){for(var i=0;i<e.length;i++){var r=e[i];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(t,r.key,r)}}function c(t,e){return!e||"object"!==p(e)&&"function"!=typeof e?function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t):e}function h(t,e,i){return(h="undefined"!=typeof Reflect&&Reflect.get?Reflect.get:function(t,e,i){var r=function(t,e){for(;!Object.prototype.hasOwnProperty.call(t,e)&&null!==(t=u(t)););return t}(t,e);if(r){var n=Object.getOwnPropertyDescriptor(r,e);return n.get?n.get.call(i):n.value}})(t,e,i||t)}function u(t){return(u=Object.setPrototypeOf?Object.getPrototypeOf:function(t){return t.__proto__||Object.getPrototypeOf(t)})(t)}function l(t,e){return(l=Object.setPrototypeOf||function(t,e){return t.__proto__=e,t})(t,e)}function p(t){return(p="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t})(t)}a=function(t){return function(t){var e={};function i(r){if(e[r])return e[r].exports;var n=e[r]={i:r,l:!1,exports:{}};return t[r].call(n.exports,n,n.exports,i),n.l=!0,n.exports}return i.m=t,i.c=e,i.d=function(t,e,r){i.o(t,e)||Object.defineProperty(t,e,{enumerable:!0,get:r})},i.r=function(t){"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0})},i.t=function(t,e){if(1&e&&(t=i(t)),8&e)return t;if(4&e&&"object"==p(t)&&t&&t.__esModule)return t;var r=Object.create(null);if(i.r(r),Object.defineProperty(r,"default",{enumerable:!0,value:t}),2&e&&"string"!=typeof t)for(var n in t)i.d(r,n,function(e){return t[e]}.bind(null,n));return r},i.n=function(t){var e=t&&t.__esModule?function(){return t.default}:function(){return t};return i.d(e,"a",e),e},i.o=function(t,e){return Object.prototype.hasOwnProperty.call(t,e)},i.p="",i(i.s=4)}([function(e,i){e.exports=t},function(t,e,i){"use strict";i.r(e),i.d(e,"Node",(function(){return at})),i.d(e,"Parser",(function(){return G})),i.d(e,"Position",(function(){return j})),i.d(e,"SourceLocation",(function(){return V})),i.d(e,"TokContext",(function(){return ht})),i.d(e,"Token",(function(){return Pt})),i.d(e,"TokenType",(function(){return g})),i.d(e,"defaultOptions",(function(){return B})),i.d(e,"getLineInfo",(function(){return M})),i.d(e,"isIdentifierChar",(function(){return m})),i.d(e,"isIdentifierStart",(function(){return d})),i.d(e,"isNewLine",(function(){return S})),i.d(e,"keywordTypes",(function(){return b})),i.d(e,"lineBreak",(function(){return w})),i.d(e,"lineBreakG",(function(){return A})),i.d(e,"nonASCIIwhitespace",(function(){return E})),i.d(e,"parse",(function(){return Vt})),i.d(e,"parseExpressionAt",(function(){return Mt})),i.d(e,"tokContexts",(function(){return ut})),i.d(e,"tokTypes",(function(){return _})),i.d(e,"tokenizer",(function(){return Bt})),i.d(e,"version",(function(){return jt}));var r={3:"abstract boolean byte char class double enum export extends final float goto implements import int interface long native package private protected public short static super synchronized throws transient volatile",5:"class enum extends super const export import",6:"enum",strict:"implements interface let package private protected public static yield",strictBind:"eval arguments"},n="break case catch continue debugger default do else finally for function if return switch throw try var while with null true false instanceof typeof void delete new in this",s={5:n,"5module":n+" export import",6:n+" const class extends export import super"},a=/^in(stanceof)?$/,o="ªµºÀ-ÖØ-öø-ˁˆ-ˑˠ-ˤˬˮͰ-ʹͶͷͺ-ͽͿΆΈ-ΊΌΎ-ΡΣ-ϵϷ-ҁҊ-ԯԱ-Ֆՙՠ-ֈא-תׯ-ײؠ-يٮٯٱ-ۓەۥۦۮۯۺ-ۼۿܐܒ-ܯݍ-ޥޱߊ-ߪߴߵߺࠀ-ࠕࠚࠤࠨࡀ-ࡘࡠ-ࡪࢠ-ࢴࢶ-ࢽऄ-हऽॐक़-ॡॱ-ঀঅ-ঌএঐও-নপ-রলশ-হঽৎড়ঢ়য়-ৡৰৱৼਅ-ਊਏਐਓ-ਨਪ-ਰਲਲ਼ਵਸ਼ਸਹਖ਼-ੜਫ਼ੲ-ੴઅ-ઍએ-ઑઓ-નપ-રલળવ-હઽૐૠૡૹଅ-ଌଏଐଓ-ନପ-ରଲଳଵ-ହଽଡ଼ଢ଼ୟ-ୡୱஃஅ-ஊஎ-ஐஒ-கஙசஜஞடணதந-பம-ஹௐఅ-ఌఎ-ఐఒ-నప-హఽౘ-ౚౠౡಀಅ-ಌಎ-ಐಒ-ನಪ-ಳವ-ಹಽೞೠೡೱೲഅ-ഌഎ-ഐഒ-ഺഽൎൔ-ൖൟ-ൡൺ-ൿඅ-ඖක-නඳ-රලව-ෆก-ะาำเ-ๆກຂຄຆ-ຊຌ-ຣລວ-ະາຳຽເ-ໄໆໜ-ໟༀཀ-ཇཉ-ཬྈ-ྌက-ဪဿၐ-ၕၚ-ၝၡၥၦၮ-ၰၵ-ႁႎႠ-ჅჇჍა-ჺჼ-ቈቊ-ቍቐ-ቖቘቚ-ቝበ-ኈኊ-ኍነ-ኰኲ-ኵኸ-ኾዀዂ-ዅወ-ዖዘ-ጐጒ-ጕጘ-ፚᎀ-ᎏᎠ-Ᏽᏸ-ᏽᐁ-ᙬᙯ-ᙿᚁ-ᚚᚠ-ᛪᛮ-ᛸᜀ-ᜌᜎ-ᜑᜠ-ᜱᝀ-ᝑᝠ-ᝬᝮ-ᝰក-ឳៗៜᠠ-ᡸᢀ-ᢨᢪᢰ-ᣵᤀ-ᤞᥐ-ᥭᥰ-ᥴᦀ-ᦫᦰ-ᧉᨀ-ᨖᨠ-ᩔᪧᬅ-ᬳᭅ-ᭋᮃ-ᮠᮮᮯᮺ-ᯥᰀ-ᰣᱍ-ᱏᱚ-ᱽᲀ-ᲈᲐ-ᲺᲽ-Ჿᳩ-ᳬᳮ-ᳳᳵᳶᳺᴀ-ᶿḀ-ἕἘ-Ἕἠ-ὅὈ-Ὅὐ-ὗὙὛὝὟ-ώᾀ-ᾴᾶ-ᾼιῂ-ῄῆ-ῌῐ-ΐῖ-Ίῠ-Ῥῲ-ῴῶ-ῼⁱⁿₐ-ₜℂℇℊ-ℓℕ℘-ℝℤΩℨK-ℹℼ-ℿⅅ-ⅉⅎⅠ-ↈⰀ-Ⱞⰰ-ⱞⱠ-ⳤⳫ-ⳮⳲⳳⴀ-ⴥⴧⴭⴰ-ⵧⵯⶀ-ⶖⶠ-ⶦⶨ-ⶮⶰ-ⶶⶸ-ⶾⷀ-ⷆⷈ-ⷎⷐ-ⷖⷘ-ⷞ々-〇〡-〩〱-〵〸-〼ぁ-ゖ゛-ゟァ-ヺー-ヿㄅ-ㄯㄱ-ㆎㆠ-ㆺㇰ-ㇿ㐀-䶵一-鿯ꀀ-ꒌꓐ-ꓽꔀ-ꘌꘐ-ꘟꘪꘫꙀ-ꙮꙿ-ꚝꚠ-ꛯꜗ-ꜟꜢ-ꞈꞋ-ꞿꟂ-Ᶎꟷ-ꠁꠃ-ꠅꠇ-ꠊꠌ-ꠢꡀ-ꡳꢂ-ꢳꣲ-ꣷꣻꣽꣾꤊ-ꤥꤰ-ꥆꥠ-ꥼꦄ-ꦲꧏꧠ-ꧤꧦ-ꧯꧺ-ꧾꨀ-ꨨꩀ-ꩂꩄ-ꩋꩠ-ꩶꩺꩾ-ꪯꪱꪵꪶꪹ-ꪽꫀꫂꫛ-ꫝꫠ-ꫪꫲ-ꫴꬁ-ꬆꬉ-ꬎꬑ-ꬖꬠ-ꬦꬨ-ꬮꬰ-ꭚꭜ-ꭧꭰ-ꯢ가-힣ힰ-ퟆퟋ-ퟻ豈-舘並-龎ﬀ-ﬆﬓ-ﬗיִײַ-ﬨשׁ-זּטּ-לּמּנּסּףּפּצּ-ﮱﯓ-ﴽﵐ-ﶏﶒ-ﷇﷰ-ﷻﹰ-ﹴﹶ-ﻼＡ-Ｚａ-ｚｦ-ﾾￂ-ￇￊ-ￏￒ-ￗￚ-ￜ",c="‌‍·̀-ͯ·҃-֑҇-ׇֽֿׁׂׅׄؐ-ًؚ-٩ٰۖ-ۜ۟-۪ۤۧۨ-ۭ۰-۹ܑܰ-݊ަ-ް߀-߉߫-߽߳ࠖ-࠙ࠛ-ࠣࠥ-ࠧࠩ-࡙࠭-࡛࣓-ࣣ࣡-ःऺ-़ा-ॏ॑-ॗॢॣ०-९ঁ-ঃ়া-ৄেৈো-্ৗৢৣ০-৯৾ਁ-ਃ਼ਾ-ੂੇੈੋ-੍ੑ੦-ੱੵઁ-ઃ઼ા-ૅે-ૉો-્ૢૣ૦-૯ૺ-૿ଁ-ଃ଼ା-ୄେୈୋ-୍ୖୗୢୣ୦-୯ஂா-ூெ-ைொ-்ௗ௦-௯ఀ-ఄా-ౄె-ైొ-్ౕౖౢౣ౦-౯ಁ-ಃ಼ಾ-ೄೆ-ೈೊ-್ೕೖೢೣ೦-೯ഀ-ഃ഻഼ാ-ൄെ-ൈൊ-്ൗൢൣ൦-൯ංඃ්ා-ුූෘ-ෟ෦-෯ෲෳัิ-ฺ็-๎๐-๙ັິ-ຼ່-ໍ໐-໙༘༙༠-༩༹༵༷༾༿ཱ-྄྆྇ྍ-ྗྙ-ྼ࿆ါ-ှ၀-၉ၖ-ၙၞ-ၠၢ-ၤၧ-ၭၱ-ၴႂ-ႍႏ-ႝ፝-፟፩-፱ᜒ-᜔ᜲ-᜴ᝒᝓᝲᝳ឴-៓៝០-៩᠋-᠍᠐-᠙ᢩᤠ-ᤫᤰ-᤻᥆-᥏᧐-᧚ᨗ-ᨛᩕ-ᩞ᩠-᩿᩼-᪉᪐-᪙᪰-᪽ᬀ-ᬄ᬴-᭄᭐-᭙᭫-᭳ᮀ-ᮂᮡ-ᮭ᮰-᮹᯦-᯳ᰤ-᰷᱀-᱉᱐-᱙᳐-᳔᳒-᳨᳭᳴᳷-᳹᷀-᷹᷻-᷿‿⁀⁔⃐-⃥⃜⃡-⃰⳯-⵿⳱ⷠ-〪ⷿ-゙゚〯꘠-꘩꙯ꙴ-꙽ꚞꚟ꛰꛱ꠂ꠆ꠋꠣ-ꠧꢀꢁꢴ-ꣅ꣐-꣙꣠-꣱ꣿ-꤉ꤦ-꤭ꥇ-꥓ꦀ-ꦃ꦳-꧀꧐-꧙ꧥ꧰-꧹ꨩ-ꨶꩃꩌꩍ꩐-꩙ꩻ-ꩽꪰꪲ-ꪴꪷꪸꪾ꪿꫁ꫫ-ꫯꫵ꫶ꯣ-ꯪ꯬꯭꯰-꯹ﬞ︀-️︠-︯︳︴﹍-﹏０-９＿",h=new RegExp("["+o+"]"),u=new RegExp("["+o+c+"]");o=c=null;var l=[0,11,2,25,2,18,2,1,2,14,3,13,35,122,70,52,268,28,4,48,48,31,14,29,6,37,11,29,3,35,5,7,2,4,43,157,19,35,5,35,5,39,9,51,157,310,10,21,11,7,153,5,3,0,2,43,2,1,4,0,3,22,11,22,10,30,66,18,2,1,11,21,11,25,71,55,7,1,65,0,16,3,2,2,2,28,43,28,4,28,36,7,2,27,28,53,11,21,11,18,14,17,111,72,56,50,14,50,14,35,477,28,11,0,9,21,155,22,13,52,76,44,33,24,27,35,30,0,12,34,4,0,13,47,15,3,22,0,2,0,36,17,2,24,85,6,2,0,2,3,2,14,2,9,8,46,39,7,3,1,3,21,2,6,2,1,2,4,4,0,19,0,13,4,159,52,19,3,21,0,33,47,21,1,2,0,185,46,42,3,37,47,21,0,60,42,14,0,72,26,230,43,117,63,32,0,161,7,3,38,17,0,2,0,29,0,11,39,8,0,22,0,12,45,20,0,35,56,264,8,2,36,18,0,50,29,113,6,2,1,2,37,22,0,26,5,2,1,2,31,15,0,328,18,270,921,103,110,18,195,2749,1070,4050,582,8634,568,8,30,114,29,19,47,17,3,32,20,6,18,689,63,129,74,6,0,67,12,65,1,2,0,29,6135,9,754,9486,286,50,2,18,3,9,395,2309,106,6,12,4,8,8,9,5991,84,2,70,2,1,3,0,3,1,3,3,2,11,2,0,2,6,2,64,2,3,3,7,2,6,2,27,2,3,2,4,2,0,4,6,2,339,3,24,2,24,2,30,2,24,2,30,2,24,2,30,2,24,2,30,2,24,2,7,2357,44,11,6,17,0,370,43,1301,196,60,67,8,0,1205,3,2,26,2,1,2,0,3,0,2,9,2,3,2,0,2,0,7,0,5,0,2,0,2,0,2,2,2,1,2,0,3,0,2,0,2,0,2,0,2,0,2,1,2,0,3,3,2,6,2,3,2,3,2,0,2,9,2,16,6,2,2,4,2,16,4421,42710,42,4148,12,221,3,5761,15,7472,3104,541],p=[509,0,227,0,150,4,294,9,1368,2,2,1,6,3,41,2,5,0,166,1,574,3,9,9,525,10,176,2,54,14,32,9,16,3,46,10,54,9,7,2,37,13,2,9,6,1,45,0,13,2,49,13,9,3,4,9,83,11,7,0,161,11,6,9,7,3,56,1,2,6,3,1,3,2,10,0,11,1,3,6,4,4,193,17,10,9,5,0,82,19,13,9,214,6,3,8,28,1,83,16,16,9,82,12,9,9,84,14,5,9,243,14,166,9,232,6,3,6,4,0,29,9,41,6,2,3,9,0,10,10,47,15,406,7,2,7,17,9,57,21,2,13,123,5,4,0,2,1,2,6,2,0,9,9,49,4,2,1,2,4,9,9,330,3,19306,9,135,4,60,6,26,9,1014,0,2,54,8,3,19723,1,5319,4,4,5,9,7,3,6,31,3,149,2,1418,49,513,54,5,49,9,0,15,0,23,4,2,14,1361,6,2,16,3,6,2,1,2,4,262,6,10,9,419,13,1495,6,110,6,6,9,792487,239];function f(t,e){for(var i=65536,r=0;r<e.length;r+=2){if((i+=e[r])>t)return!1;if((i+=e[r+1])>=t)return!0}}function d(t,e){return t<65?36===t:t<91||(t<97?95===t:t<123||(t<=65535?t>=170&&h.test(String.fromCharCode(t)):!1!==e&&f(t,l)))}function m(t,e){return t<48?36===t:t<58||!(t<65)&&(t<91||(t<97?95===t:t<123||(t<=65535?t>=170&&u.test(String.fromCharCode(t)):!1!==e&&(f(t,l)||f(t,p)))))}var g=function(t,e){void 0===e&&(e={}),this.label=t,this.keyword=e.keyword,this.beforeExpr=!!e.beforeExpr,this.startsExpr=!!e.startsExpr,this.isLoop=!!e.isLoop,this.isAssign=!!e.isAssign,this.prefix=!!e.prefix,this.postfix=!!e.postfix,this.binop=e.binop||null,this.updateContext=null};function x(t,e){return new g(t,{beforeExpr:!0,binop:e})}var y={beforeExpr:!0},v={startsExpr:!0},b={};function k(t,e){return void 0===e&&(e={}),e.keyword=t,b[t]=new g(t,e)}var _={num:new g("num",v),regexp:new g("regexp",v),string:new g("string",v),name:new g("name",v),eof:new g("eof"),bracketL:new g("[",{beforeExpr:!0,startsExpr:!0}),bracketR:new g("]"),braceL:new g("{",{beforeExpr:!0,startsExpr:!0}),braceR:new g("}"),parenL:new g("(",{beforeExpr:!0,startsExpr:!0}),parenR:new g(")"),comma:new g(",",y),semi:new g(";",y),colon:new g(":",y),dot:new g("."),question:new g("?",y),arrow:new g("=>",y),template:new g("template"),invalidTemplate:new g("invalidTemplate"),ellipsis:new g("...",y),backQuote:new g("`",v),dollarBraceL:new g("${",{beforeExpr:!0,startsExpr:!0}),eq:new g("=",{beforeExpr:!0,isAssign:!0}),assign:new g("_=",{beforeExpr:!0,isAssign:!0}),incDec:new g("++/--",{prefix:!0,postfix:!0,startsExpr:!0}),prefix:new g("!/~",{beforeExpr:!0,prefix:!0,startsExpr:!0}),logicalOR:x("||",1),logicalAND:x("&&",2),bitwiseOR:x("|",3),bitwiseXOR:x("^",4),bitwiseAND:x("&",5),equality:x("==/!=/===/!==",6),relational:x("</>/<=/>=",7),bitShift:x("<</>>/>>>",8),plusMin:new g("+/-",{beforeExpr:!0,binop:9,prefix:!0,startsExpr:!0}),modulo:x("%",10),star:x("*",10),slash:x("/",10),starstar:new g("**",{beforeExpr:!0}),_break:k("break"),_case:k("case",y),_catch:k("catch"),_continue:k("continue"),_debugger:k("debugger"),_default:k("default",y),_do:k("do",{isLoop:!0,beforeExpr:!0}),_else:k("else",y),_finally:k("finally"),_for:k("for",{isLoop:!0}),_function:k("function",v),_if:k("if"),_return:k("return",y),_switch:k("switch"),_throw:k("throw",y),_try:k("try"),_var:k("var"),_const:k("const"),_while:k("while",{isLoop:!0}),_with:k("with"),_new:k("new",{beforeExpr:!0,startsExpr:!0}),_this:k("this",v),_super:k("super",v),_class:k("class",v),_extends:k("extends",y),_export:k("export"),_import:k("import",v),_null:k("null",v),_true:k("true",v),_false:k("false",v),_in:k("in",{beforeExpr:!0,binop:7}),_instanceof:k("instanceof",{beforeExpr:!0,binop:7}),_typeof:k("typeof",{beforeExpr:!0,prefix:!0,startsExpr:!0}),_void:k("void",{beforeExpr:!0,prefix:!0,startsExpr:!0}),_delete:k("delete",{beforeExpr:!0,prefix:!0,startsExpr:!0})},w=/\r\n?|\n|\u2028|\u2029/,A=new RegExp(w.source,"g");function S(t,e){return 10===t||13===t||!e&&(8232===t||8233===t)}var E=/[\u1680\u2000-\u200a\u202f\u205f\u3000\ufeff]/,C=/(?:\s|\/\/.*|\/\*[^]*?\*\/)*/g,T=Object.prototype,I=T.hasOwnProperty,P=T.toString;function O(t,e){return I.call(t,e)}var L=Array.isArray||function(t){return"[object Array]"===P.call(t)};function N(t){return new RegExp("^(?:"+t.replace(/ /g,"|")+")$")}var j=function(t,e){this.line=t,this.column=e};j.prototype.offset=function(t){return new j(this.line,this.column+t)};var V=function(t,e,i){this.start=e,this.end=i,null!==t.sourceFile&&(this.source=t.sourceFile)};function M(t,e){for(var i=1,r=0;;){A.lastIndex=r;var n=A.exec(t);if(!(n&&n.index<e))return new j(i,e-r);++i,r=n.index+n[0].length}}var B={ecmaVersion:10,sourceType:"script",onInsertedSemicolon:null,onTrailingComma:null,allowReserved:null,allowReturnOutsideFunction:!1,allowImportExportEverywhere:!1,allowAwaitOutsideFunction:!1,allowHashBang:!1,locations:!1,onToken:null,onComment:null,ranges:!1,program:null,sourceFile:null,directSourceFile:null,preserveParens:!1},R=2,D=1|R,H=4,U=8;function F(t,e){return R|(t?H:0)|(e?U:0)}var G=function(t,e,i){this.options=t=function(t){var e={};for(var i in B)e[i]=t&&O(t,i)?t[i]:B[i];if(e.ecmaVersion>=2015&&(e.ecmaVersion-=2009),null==e.allowReserved&&(e.allowReserved=e.ecmaVersion<5),L(e.onToken)){var r=e.onToken;e.onToken=function(t){return r.push(t)}}return L(e.onComment)&&(e.onComment=function(t,e){return function(i,r,n,s,a,o){var c={type:i?"Block":"Line",value:r,start:n,end:s};t.locations&&(c.loc=new V(this,a,o)),t.ranges&&(c.range=[n,s]),e.push(c)}}(e,e.onComment)),e}(t),this.sourceFile=t.sourceFile,this.keywords=N(s[t.ecmaVersion>=6?6:"module"===t.sourceType?"5module":5]);var n="";if(!0!==t.allowReserved){for(var a=t.ecmaVersion;!(n=r[a]);a--);"module"===t.sourceType&&(n+=" await")}this.reservedWords=N(n);var o=(n?n+" ":"")+r.strict;this.reservedWordsStrict=N(o),this.reservedWordsStrictBind=N(o+" "+r.strictBind),this.input=String(e),this.containsEsc=!1,i?(this.pos=i,this.lineStart=this.input.lastIndexOf("\n",i-1)+1,this.curLine=this.input.slice(0,this.lineStart).split(w).length):(this.pos=this.lineStart=0,this.curLine=1),this.type=_.eof,this.value=null,this.start=this.end=this.pos,this.startLoc=this.endLoc=this.curPosition(),this.lastTokEndLoc=this.lastTokStartLoc=null,this.lastTokStart=this.lastTokEnd=this.pos,this.context=this.initialContext(),this.exprAllowed=!0,this.inModule="module"===t.sourceType,this.strict=this.inModule||this.strictDirective(this.pos),this.potentialArrowAt=-1,this.yieldPos=this.awaitPos=this.awaitIdentPos=0,this.labels=[],this.undefinedExports={},0===this.pos&&t.allowHashBang&&"#!"===this.input.slice(0,2)&&this.skipLineComment(2),this.scopeStack=[],this.enterScope(1),this.regexpState=null},z={inFunction:{configurable:!0},inGenerator:{configurable:!0},inAsync:{configurable:!0},allowSuper:{configurable:!0},allowDirectSuper:{configurable:!0},treatFunctionsAsVar:{configurable:!0}};G.prototype.parse=function(){var t=this.options.program||this.startNode();return this.nextToken(),this.parseTopLevel(t)},z.inFunction.get=function(){return(this.currentVarScope().flags&R)>0},z.inGenerator.get=function(){return(this.currentVarScope().flags&U)>0},z.inAsync.get=function(){return(this.currentVarScope().flags&H)>0},z.allowSuper.get=function(){return(64&this.currentThisScope().flags)>0},z.allowDirectSuper.get=function(){return(128&this.currentThisScope().flags)>0},z.treatFunctionsAsVar.get=function(){return this.treatFunctionsAsVarInScope(this.currentScope())},G.prototype.inNonArrowFunction=function(){return(this.currentThisScope().flags&R)>0},G.extend=function(){for(var t=[],e=arguments.length;e--;)t[e]=arguments[e];for(var i=this,r=0;r<t.length;r++)i=t[r](i);return i},G.parse=function(t,e){return new this(e,t).parse()},G.parseExpressionAt=function(t,e,i){var r=new this(i,t,e);return r.nextToken(),r.parseExpression()},G.tokenizer=function(t,e){return new this(e,t)},Object.defineProperties(G.prototype,z);var W=G.prototype,q=/^(?:'((?:\\.|[^'])*?)'|"((?:\\.|[^"])*?)")/;function K(){this.shorthandAssign=this.trailingComma=this.parenthesizedAssign=this.parenthesizedBind=this.doubleProto=-1}W.strictDirective=function(t){for(;;){C.lastIndex=t,t+=C.exec(this.input)[0].length;var e=q.exec(this.input.slice(t));if(!e)return!1;if("use strict"===(e[1]||e[2]))return!0;t+=e[0].length,C.lastIndex=t,t+=C.exec(this.input)[0].length,";"===this.input[t]&&t++}},W.eat=function(t){return this.type===t&&(this.next(),!0)},W.isContextual=function(t){return this.type===_.name&&this.value===t&&!this.containsEsc},W.eatContextual=function(t){return!!this.isContextual(t)&&(this.next(),!0)},W.expectContextual=function(t){this.eatContextual(t)||this.unexpected()},W.canInsertSemicolon=function(){return this.type===_.eof||this.type===_.braceR||w.test(this.input.slice(this.lastTokEnd,this.start))},W.insertSemicolon=function(){if(this.canInsertSemicolon())return this.options.onInsertedSemicolon&&this.options.onInsertedSemicolon(this.lastTokEnd,this.lastTokEndLoc),!0},W.semicolon=function(){this.eat(_.semi)||this.insertSemicolon()||this.unexpected()},W.afterTrailingComma=function(t,e){if(this.type===t)return this.options.onTrailingComma&&this.options.onTrailingComma(this.lastTokStart,this.lastTokStartLoc),e||this.next(),!0},W.expect=function(t){this.eat(t)||this.unexpected()},W.unexpected=function(t){this.raise(null!=t?t:this.start,"Unexpected token")},W.checkPatternErrors=function(t,e){if(t){t.trailingComma>-1&&this.raiseRecoverable(t.trailingComma,"Comma is not permitted after the rest element");var i=e?t.parenthesizedAssign:t.parenthesizedBind;i>-1&&this.raiseRecoverable(i,"Parenthesized pattern")}},W.checkExpressionErrors=function(t,e){if(!t)return!1;var i=t.shorthandAssign,r=t.doubleProto;if(!e)return i>=0||r>=0;i>=0&&this.raise(i,"Shorthand property assignments are valid only in destructuring patterns"),r>=0&&this.raiseRecoverable(r,"Redefinition of __proto__ property")},W.checkYieldAwaitInDefaultParams=function(){this.yieldPos&&(!this.awaitPos||this.yieldPos<this.awaitPos)&&this.raise(this.yieldPos,"Yield expression cannot be a default value"),this.awaitPos&&this.raise(this.awaitPos,"Await expression cannot be a default value")},W.isSimpleAssignTarget=function(t){return"ParenthesizedExpression"===t.type?this.isSimpleAssignTarget(t.expression):"Identifier"===t.type||"MemberExpression"===t.type};var X=G.prototype;X.parseTopLevel=function(t){var e={};for(t.body||(t.body=[]);this.type!==_.eof;){var i=this.parseStatement(null,!0,e);t.body.push(i)}if(this.inModule)for(var r=0,n=Object.keys(this.undefinedExports);r<n.length;r+=1){var s=n[r];this.raiseRecoverable(this.undefinedExports[s].start,"Export '"+s+"' is not defined")}return this.adaptDirectivePrologue(t.body),this.next(),t.sourceType=this.options.sourceType,this.finishNode(t,"Program")};var J={kind:"loop"},Q={kind:"switch"};X.isLet=function(t){if(this.options.ecmaVersion<6||!this.isContextual("let"))return!1;C.lastIndex=this.pos;var e=C.exec(this.input),i=this.pos+e[0].length,r=this.input.charCodeAt(i);if(91===r)return!0;if(t)return!1;if(123===r)return!0;if(d(r,!0)){for(var n=i+1;m(this.input.charCodeAt(n),!0);)++n;var s=this.input.slice(i,n);if(!a.test(s))return!0}return!1},X.isAsyncFunction=function(){if(this.options.ecmaVersion<8||!this.isContextual("async"))return!1;C.lastIndex=this.pos;var t=C.exec(this.input),e=this.pos+t[0].length;return!(w.test(this.input.slice(this.pos,e))||"function"!==this.input.slice(e,e+8)||e+8!==this.input.length&&m(this.input.charAt(e+8)))},X.parseStatement=function(t,e,i){var r,n=this.type,s=this.startNode();switch(this.isLet(t)&&(n=_._var,r="let"),n){case _._break:case _._continue:return this.parseBreakContinueStatement(s,n.keyword);case _._debugger:return this.parseDebuggerStatement(s);case _._do:return this.parseDoStatement(s);case _._for:return this.parseForStatement(s);case _._function:return t&&(this.strict||"if"!==t&&"label"!==t)&&this.options.ecmaVersion>=6&&this.unexpected(),this.parseFunctionStatement(s,!1,!t);case _._class:return t&&this.unexpected(),this.parseClass(s,!0);case _._if:return this.parseIfStatement(s);case _._return:return this.parseReturnStatement(s);case _._switch:return this.parseSwitchStatement(s);case _._throw:return this.parseThrowStatement(s);case _._try:return this.parseTryStatement(s);case _._const:case _._var:return r=r||this.value,t&&"var"!==r&&this.unexpected(),this.parseVarStatement(s,r);case _._while:return this.parseWhileStatement(s);case _._with:return this.parseWithStatement(s);case _.braceL:return this.parseBlock(!0,s);case _.semi:return this.parseEmptyStatement(s);case _._export:case _._import:if(this.options.ecmaVersion>10&&n===_._import){C.lastIndex=this.pos;var a=C.exec(this.input),o=this.pos+a[0].length;if(40===this.input.charCodeAt(o))return this.parseExpressionStatement(s,this.parseExpression())}return this.options.allowImportExportEverywhere||(e||this.raise(this.start,"'import' and 'export' may only appear at the top level"),this.inModule||this.raise(this.start,"'import' and 'export' may appear only with 'sourceType: module'")),n===_._import?this.parseImport(s):this.parseExport(s,i);default:if(this.isAsyncFunction())return t&&this.unexpected(),this.next(),this.parseFunctionStatement(s,!0,!t);var c=this.value,h=this.parseExpression();return n===_.name&&"Identifier"===h.type&&this.eat(_.colon)?this.parseLabeledStatement(s,c,h,t):this.parseExpressionStatement(s,h)}},X.parseBreakContinueStatement=function(t,e){var i="break"===e;this.next(),this.eat(_.semi)||this.insertSemicolon()?t.label=null:this.type!==_.name?this.unexpected():(t.label=this.parseIdent(),this.semicolon());for(var r=0;r<this.labels.length;++r){var n=this.labels[r];if(null==t.label||n.name===t.label.name){if(null!=n.kind&&(i||"loop"===n.kind))break;if(t.label&&i)break}}return r===this.labels.length&&this.raise(t.start,"Unsyntactic "+e),this.finishNode(t,i?"BreakStatement":"ContinueStatement")},X.parseDebuggerStatement=function(t){return this.next(),this.semicolon(),this.finishNode(t,"DebuggerStatement")},X.parseDoStatement=function(t){return this.next(),this.labels.push(J),t.body=this.parseStatement("do"),this.labels.pop(),this.expect(_._while),t.test=this.parseParenExpression(),this.options.ecmaVersion>=6?this.eat(_.semi):this.semicolon(),this.finishNode(t,"DoWhileStatement")},X.parseForStatement=function(t){this.next();var e=this.options.ecmaVersion>=9&&(this.inAsync||!this.inFunction&&this.options.allowAwaitOutsideFunction)&&this.eatContextual("await")?this.lastTokStart:-1;if(this.labels.push(J),this.enterScope(0),this.expect(_.parenL),this.type===_.semi)return e>-1&&this.unexpected(e),this.parseFor(t,null);var i=this.isLet();if(this.type===_._var||this.type===_._const||i){var r=this.startNode(),n=i?"let":this.value;return this.next(),this.parseVar(r,!0,n),this.finishNode(r,"VariableDeclaration"),(this.type===_._in||this.options.ecmaVersion>=6&&this.isContextual("of"))&&1===r.declarations.length?(this.options.ecmaVersion>=9&&(this.type===_._in?e>-1&&this.unexpected(e):t.await=e>-1),this.parseForIn(t,r)):(e>-1&&this.unexpected(e),this.parseFor(t,r))}var s=new K,a=this.parseExpression(!0,s);return this.type===_._in||this.options.ecmaVersion>=6&&this.isContextual("of")?(this.options.ecmaVersion>=9&&(this.type===_._in?e>-1&&this.unexpected(e):t.await=e>-1),this.toAssignable(a,!1,s),this.checkLVal(a),this.parseForIn(t,a)):(this.checkExpressionErrors(s,!0),e>-1&&this.unexpected(e),this.parseFor(t,a))},X.parseFunctionStatement=function(t,e,i){return this.next(),this.parseFunction(t,$|(i?0:Y),!1,e)},X.parseIfStatement=function(t){return this.next(),t.test=this.parseParenExpression(),t.consequent=this.parseStatement("if"),t.alternate=this.eat(_._else)?this.parseStatement("if"):null,this.finishNode(t,"IfStatement")},X.parseReturnStatement=function(t){return this.inFunction||this.options.allowReturnOutsideFunction||this.raise(this.start,"'return' outside of function"),this.next(),this.eat(_.semi)||this.insertSemicolon()?t.argument=null:(t.argument=this.parseExpression(),this.semicolon()),this.finishNode(t,"ReturnStatement")},X.parseSwitchStatement=function(t){var e;this.next(),t.discriminant=this.parseParenExpression(),t.cases=[],this.expect(_.braceL),this.labels.push(Q),this.enterScope(0);for(var i=!1;this.type!==_.braceR;)if(this.type===_._case||this.type===_._default){var r=this.type===_._case;e&&this.finishNode(e,"SwitchCase"),t.cases.push(e=this.startNode()),e.consequent=[],this.next(),r?e.test=this.parseExpression():(i&&this.raiseRecoverable(this.lastTokStart,"Multiple default clauses"),i=!0,e.test=null),this.expect(_.colon)}else e||this.unexpected(),e.consequent.push(this.parseStatement(null));return this.exitScope(),e&&this.finishNode(e,"SwitchCase"),this.next(),this.labels.pop(),this.finishNode(t,"SwitchStatement")},X.parseThrowStatement=function(t){return this.next(),w.test(this.input.slice(this.lastTokEnd,this.start))&&this.raise(this.lastTokEnd,"Illegal newline after throw"),t.argument=this.parseExpression(),this.semicolon(),this.finishNode(t,"ThrowStatement")};var Z=[];X.parseTryStatement=function(t){if(this.next(),t.block=this.parseBlock(),t.handler=null,this.type===_._catch){var e=this.startNode();if(this.next(),this.eat(_.parenL)){e.param=this.parseBindingAtom();var i="Identifier"===e.param.type;this.enterScope(i?32:0),this.checkLVal(e.param,i?4:2),this.expect(_.parenR)}else this.options.ecmaVersion<10&&this.unexpected(),e.param=null,this.enterScope(0);e.body=this.parseBlock(!1),this.exitScope(),t.handler=this.finishNode(e,"CatchClause")}return t.finalizer=this.eat(_._finally)?this.parseBlock():null,t.handler||t.finalizer||this.raise(t.start,"Missing catch or finally clause"),this.finishNode(t,"TryStatement")},X.parseVarStatement=function(t,e){return this.next(),this.parseVar(t,!1,e),this.semicolon(),this.finishNode(t,"VariableDeclaration")},X.parseWhileStatement=function(t){return this.next(),t.test=this.parseParenExpression(),this.labels.push(J),t.body=this.parseStatement("while"),this.labels.pop(),this.finishNode(t,"WhileStatement")},X.parseWithStatement=function(t){return this.strict&&this.raise(this.start,"'with' in strict mode"),this.next(),t.object=this.parseParenExpression(),t.body=this.parseStatement("with"),this.finishNode(t,"WithStatement")},X.parseEmptyStatement=function(t){return this.next(),this.finishNode(t,"EmptyStatement")},X.parseLabeledStatement=function(t,e,i,r){for(var n=0,s=this.labels;n<s.length;n+=1)s[n].name===e&&this.raise(i.start,"Label '"+e+"' is already declared");for(var a=this.type.isLoop?"loop":this.type===_._switch?"switch":null,o=this.labels.length-1;o>=0;o--){var c=this.labels[o];if(c.statementStart!==t.start)break;c.statementStart=this.start,c.kind=a}return this.labels.push({name:e,kind:a,statementStart:this.start}),t.body=this.parseStatement(r?-1===r.indexOf("label")?r+"label":r:"label"),this.labels.pop(),t.label=i,this.finishNode(t,"LabeledStatement")},X.parseExpressionStatement=function(t,e){return t.expression=e,this.semicolon(),this.finishNode(t,"ExpressionStatement")},X.parseBlock=function(t,e){for(void 0===t&&(t=!0),void 0===e&&(e=this.startNode()),e.body=[],this.expect(_.braceL),t&&this.enterScope(0);!this.eat(_.braceR);){var i=this.parseStatement(null);e.body.push(i)}return t&&this.exitScope(),this.finishNode(e,"BlockStatement")},X.parseFor=function(t,e){return t.init=e,this.expect(_.semi),t.test=this.type===_.semi?null:this.parseExpression(),this.expect(_.semi),t.update=this.type===_.parenR?null:this.parseExpression(),this.expect(_.parenR),t.body=this.parseStatement("for"),this.exitScope(),this.labels.pop(),this.finishNode(t,"ForStatement")},X.parseForIn=function(t,e){var i=this.type===_._in;return this.next(),"VariableDeclaration"===e.type&&null!=e.declarations[0].init&&(!i||this.options.ecmaVersion<8||this.strict||"var"!==e.kind||"Identifier"!==e.declarations[0].id.type)?this.raise(e.start,(i?"for-in":"for-of")+" loop variable declaration may not have an initializer"):"AssignmentPattern"===e.type&&this.raise(e.start,"Invalid left-hand side in for-loop"),t.left=e,t.right=i?this.parseExpression():this.parseMaybeAssign(),this.expect(_.parenR),t.body=this.parseStatement("for"),this.exitScope(),this.labels.pop(),this.finishNode(t,i?"ForInStatement":"ForOfStatement")},X.parseVar=function(t,e,i){for(t.declarations=[],t.kind=i;;){var r=this.startNode();if(this.parseVarId(r,i),this.eat(_.eq)?r.init=this.parseMaybeAssign(e):"const"!==i||this.type===_._in||this.options.ecmaVersion>=6&&this.isContextual("of")?"Identifier"===r.id.type||e&&(this.type===_._in||this.isContextual("of"))?r.init=null:this.raise(this.lastTokEnd,"Complex binding patterns require an initialization value"):this.unexpected(),t.declarations.push(this.finishNode(r,"VariableDeclarator")),!this.eat(_.comma))break}return t},X.parseVarId=function(t,e){t.id=this.parseBindingAtom(),this.checkLVal(t.id,"var"===e?1:2,!1)};var $=1,Y=2;X.parseFunction=function(t,e,i,r){this.initFunction(t),(this.options.ecmaVersion>=9||this.options.ecmaVersion>=6&&!r)&&(this.type===_.star&&e&Y&&this.unexpected(),t.generator=this.eat(_.star)),this.options.ecmaVersion>=8&&(t.async=!!r),e&$&&(t.id=4&e&&this.type!==_.name?null:this.parseIdent(),!t.id||e&Y||this.checkLVal(t.id,this.strict||t.generator||t.async?this.treatFunctionsAsVar?1:2:3));var n=this.yieldPos,s=this.awaitPos,a=this.awaitIdentPos;return this.yieldPos=0,this.awaitPos=0,this.awaitIdentPos=0,this.enterScope(F(t.async,t.generator)),e&$||(t.id=this.type===_.name?this.parseIdent():null),this.parseFunctionParams(t),this.parseFunctionBody(t,i,!1),this.yieldPos=n,this.awaitPos=s,this.awaitIdentPos=a,this.finishNode(t,e&$?"FunctionDeclaration":"FunctionExpression")},X.parseFunctionParams=function(t){this.expect(_.parenL),t.params=this.parseBindingList(_.parenR,!1,this.options.ecmaVersion>=8),this.checkYieldAwaitInDefaultParams()},X.parseClass=function(t,e){this.next();var i=this.strict;this.strict=!0,this.parseClassId(t,e),this.parseClassSuper(t);var r=this.startNode(),n=!1;for(r.body=[],this.expect(_.braceL);!this.eat(_.braceR);){var s=this.parseClassElement(null!==t.superClass);s&&(r.body.push(s),"MethodDefinition"===s.type&&"constructor"===s.kind&&(n&&this.raise(s.start,"Duplicate constructor in the same class"),n=!0))}return t.body=this.finishNode(r,"ClassBody"),this.strict=i,this.finishNode(t,e?"ClassDeclaration":"ClassExpression")},X.parseClassElement=function(t){var e=this;if(this.eat(_.semi))return null;var i=this.startNode(),r=function(t,r){void 0===r&&(r=!1);var n=e.start,s=e.startLoc;return!(!e.eatContextual(t)||(e.type===_.parenL||r&&e.canInsertSemicolon())&&(i.key&&e.unexpected(),i.computed=!1,i.key=e.startNodeAt(n,s),i.key.name=t,e.finishNode(i.key,"Identifier"),1))};i.kind="method",i.static=r("static");var n=this.eat(_.star),s=!1;n||(this.options.ecmaVersion>=8&&r("async",!0)?(s=!0,n=this.options.ecmaVersion>=9&&this.eat(_.star)):r("get")?i.kind="get":r("set")&&(i.kind="set")),i.key||this.parsePropertyName(i);var a=i.key,o=!1;return i.computed||i.static||!("Identifier"===a.type&&"constructor"===a.name||"Literal"===a.type&&"constructor"===a.value)?i.static&&"Identifier"===a.type&&"prototype"===a.name&&this.raise(a.start,"Classes may not have a static property named prototype"):("method"!==i.kind&&this.raise(a.start,"Constructor can't have get/set modifier"),n&&this.raise(a.start,"Constructor can't be a generator"),s&&this.raise(a.start,"Constructor can't be an async method"),i.kind="constructor",o=t),this.parseClassMethod(i,n,s,o),"get"===i.kind&&0!==i.value.params.length&&this.raiseRecoverable(i.value.start,"getter should have no params"),"set"===i.kind&&1!==i.value.params.length&&this.raiseRecoverable(i.value.start,"setter should have exactly one param"),"set"===i.kind&&"RestElement"===i.value.params[0].type&&this.raiseRecoverable(i.value.params[0].start,"Setter cannot use rest params"),i},X.parseClassMethod=function(t,e,i,r){return t.value=this.parseMethod(e,i,r),this.finishNode(t,"MethodDefinition")},X.parseClassId=function(t,e){this.type===_.name?(t.id=this.parseIdent(),e&&this.checkLVal(t.id,2,!1)):(!0===e&&this.unexpected(),t.id=null)},X.parseClassSuper=function(t){t.superClass=this.eat(_._extends)?this.parseExprSubscripts():null},X.parseExport=function(t,e){if(this.next(),this.eat(_.star))return this.expectContextual("from"),this.type!==_.string&&this.unexpected(),t.source=this.parseExprAtom(),this.semicolon(),this.finishNode(t,"ExportAllDeclaration");if(this.eat(_._default)){var i;if(this.checkExport(e,"default",this.lastTokStart),this.type===_._function||(i=this.isAsyncFunction())){var r=this.startNode();this.next(),i&&this.next(),t.declaration=this.parseFunction(r,4|$,!1,i)}else if(this.type===_._class){var n=this.startNode();t.declaration=this.parseClass(n,"nullableID")}else t.declaration=this.parseMaybeAssign(),this.semicolon();return this.finishNode(t,"ExportDefaultDeclaration")}if(this.shouldParseExportStatement())t.declaration=this.parseStatement(null),"VariableDeclaration"===t.declaration.type?this.checkVariableExport(e,t.declaration.declarations):this.checkExport(e,t.declaration.id.name,t.declaration.id.start),t.specifiers=[],t.source=null;else{if(t.declaration=null,t.specifiers=this.parseExportSpecifiers(e),this.eatContextual("from"))this.type!==_.string&&this.unexpected(),t.source=this.parseExprAtom();else{for(var s=0,a=t.specifiers;s<a.length;s+=1){var o=a[s];this.checkUnreserved(o.local),this.checkLocalExport(o.local)}t.source=null}this.semicolon()}return this.finishNode(t,"ExportNamedDeclaration")},X.checkExport=function(t,e,i){t&&(O(t,e)&&this.raiseRecoverable(i,"Duplicate export '"+e+"'"),t[e]=!0)},X.checkPatternExport=function(t,e){var i=e.type;if("Identifier"===i)this.checkExport(t,e.name,e.start);else if("ObjectPattern"===i)for(var r=0,n=e.properties;r<n.length;r+=1){var s=n[r];this.checkPatternExport(t,s)}else if("ArrayPattern"===i)for(var a=0,o=e.elements;a<o.length;a+=1){var c=o[a];c&&this.checkPatternExport(t,c)}else"Property"===i?this.checkPatternExport(t,e.value):"AssignmentPattern"===i?this.checkPatternExport(t,e.left):"RestElement"===i?this.checkPatternExport(t,e.argument):"ParenthesizedExpression"===i&&this.checkPatternExport(t,e.expression)},X.checkVariableExport=function(t,e){if(t)for(var i=0,r=e;i<r.length;i+=1){var n=r[i];this.checkPatternExport(t,n.id)}},X.shouldParseExportStatement=function(){return"var"===this.type.keyword||"const"===this.type.keyword||"class"===this.type.keyword||"function"===this.type.keyword||this.isLet()||this.isAsyncFunction()},X.parseExportSpecifiers=function(t){var e=[],i=!0;for(this.expect(_.braceL);!this.eat(_.braceR);){if(i)i=!1;else if(this.expect(_.comma),this.afterTrailingComma(_.braceR))break;var r=this.startNode();r.local=this.parseIdent(!0),r.exported=this.eatContextual("as")?this.parseIdent(!0):r.local,this.checkExport(t,r.exported.name,r.exported.start),e.push(this.finishNode(r,"ExportSpecifier"))}return e},X.parseImport=function(t){return this.next(),this.type===_.string?(t.specifiers=Z,t.source=this.parseExprAtom()):(t.specifiers=this.parseImportSpecifiers(),this.expectContextual("from"),t.source=this.type===_.string?this.parseExprAtom():this.unexpected()),this.semicolon(),this.finishNode(t,"ImportDeclaration")},X.parseImportSpecifiers=function(){var t=[],e=!0;if(this.type===_.name){var i=this.startNode();if(i.local=this.parseIdent(),this.checkLVal(i.local,2),t.push(this.finishNode(i,"ImportDefaultSpecifier")),!this.eat(_.comma))return t}if(this.type===_.star){var r=this.startNode();return this.next(),this.expectContextual("as"),r.local=this.parseIdent(),this.checkLVal(r.local,2),t.push(this.finishNode(r,"ImportNamespaceSpecifier")),t}for(this.expect(_.braceL);!this.eat(_.braceR);){if(e)e=!1;else if(this.expect(_.comma),this.afterTrailingComma(_.braceR))break;var n=this.startNode();n.imported=this.parseIdent(!0),this.eatContextual("as")?n.local=this.parseIdent():(this.checkUnreserved(n.imported),n.local=n.imported),this.checkLVal(n.local,2),t.push(this.finishNode(n,"ImportSpecifier"))}return t},X.adaptDirectivePrologue=function(t){for(var e=0;e<t.length&&this.isDirectiveCandidate(t[e]);++e)t[e].directive=t[e].expression.raw.slice(1,-1)},X.isDirectiveCandidate=function(t){return"ExpressionStatement"===t.type&&"Literal"===t.expression.type&&"string"==typeof t.expression.value&&('"'===this.input[t.start]||"'"===this.input[t.start])};var tt=G.prototype;tt.toAssignable=function(t,e,i){if(this.options.ecmaVersion>=6&&t)switch(t.type){case"Identifier":this.inAsync&&"await"===t.name&&this.raise(t.start,"Cannot use 'await' as identifier inside an async function");break;case"ObjectPattern":case"ArrayPattern":case"RestElement":break;case"ObjectExpression":t.type="ObjectPattern",i&&this.checkPatternErrors(i,!0);for(var r=0,n=t.properties;r<n.length;r+=1){var s=n[r];this.toAssignable(s,e),"RestElement"!==s.type||"ArrayPattern"!==s.argument.type&&"ObjectPattern"!==s.argument.type||this.raise(s.argument.start,"Unexpected token")}break;case"Property":"init"!==t.kind&&this.raise(t.key.start,"Object pattern can't contain getter or setter"),this.toAssignable(t.value,e);break;case"ArrayExpression":t.type="ArrayPattern",i&&this.checkPatternErrors(i,!0),this.toAssignableList(t.elements,e);break;case"SpreadElement":t.type="RestElement",this.toAssignable(t.argument,e),"AssignmentPattern"===t.argument.type&&this.raise(t.argument.start,"Rest elements cannot have a default value");break;case"AssignmentExpression":"="!==t.operator&&this.raise(t.left.end,"Only '=' operator can be used for specifying default value."),t.type="AssignmentPattern",delete t.operator,this.toAssignable(t.left,e);case"AssignmentPattern":break;case"ParenthesizedExpression":this.toAssignable(t.expression,e,i);break;case"MemberExpression":if(!e)break;default:this.raise(t.start,"Assigning to rvalue")}else i&&this.checkPatternErrors(i,!0);return t},tt.toAssignableList=function(t,e){for(var i=t.length,r=0;r<i;r++){var n=t[r];n&&this.toAssignable(n,e)}if(i){var s=t[i-1];6===this.options.ecmaVersion&&e&&s&&"RestElement"===s.type&&"Identifier"!==s.argument.type&&this.unexpected(s.argument.start)}return t},tt.parseSpread=function(t){var e=this.startNode();return this.next(),e.argument=this.parseMaybeAssign(!1,t),this.finishNode(e,"SpreadElement")},tt.parseRestBinding=function(){var t=this.startNode();return this.next(),6===this.options.ecmaVersion&&this.type!==_.name&&this.unexpected(),t.argument=this.parseBindingAtom(),this.finishNode(t,"RestElement")},tt.parseBindingAtom=function(){if(this.options.ecmaVersion>=6)switch(this.type){case _.bracketL:var t=this.startNode();return this.next(),t.elements=this.parseBindingList(_.bracketR,!0,!0),this.finishNode(t,"ArrayPattern");case _.braceL:return this.parseObj(!0)}return this.parseIdent()},tt.parseBindingList=function(t,e,i){for(var r=[],n=!0;!this.eat(t);)if(n?n=!1:this.expect(_.comma),e&&this.type===_.comma)r.push(null);else{if(i&&this.afterTrailingComma(t))break;if(this.type===_.ellipsis){var s=this.parseRestBinding();this.parseBindingListItem(s),r.push(s),this.type===_.comma&&this.raise(this.start,"Comma is not permitted after the rest element"),this.expect(t);break}var a=this.parseMaybeDefault(this.start,this.startLoc);this.parseBindingListItem(a),r.push(a)}return r},tt.parseBindingListItem=function(t){return t},tt.parseMaybeDefault=function(t,e,i){if(i=i||this.parseBindingAtom(),this.options.ecmaVersion<6||!this.eat(_.eq))return i;var r=this.startNodeAt(t,e);return r.left=i,r.right=this.parseMaybeAssign(),this.finishNode(r,"AssignmentPattern")},tt.checkLVal=function(t,e,i){switch(void 0===e&&(e=0),t.type){case"Identifier":2===e&&"let"===t.name&&this.raiseRecoverable(t.start,"let is disallowed as a lexically bound name"),this.strict&&this.reservedWordsStrictBind.test(t.name)&&this.raiseRecoverable(t.start,(e?"Binding ":"Assigning to ")+t.name+" in strict mode"),i&&(O(i,t.name)&&this.raiseRecoverable(t.start,"Argument name clash"),i[t.name]=!0),0!==e&&5!==e&&this.declareName(t.name,e,t.start);break;case"MemberExpression":e&&this.raiseRecoverable(t.start,"Binding member expression");break;case"ObjectPattern":for(var r=0,n=t.properties;r<n.length;r+=1){var s=n[r];this.checkLVal(s,e,i)}break;case"Property":this.checkLVal(t.value,e,i);break;case"ArrayPattern":for(var a=0,o=t.elements;a<o.length;a+=1){var c=o[a];c&&this.checkLVal(c,e,i)}break;case"AssignmentPattern":this.checkLVal(t.left,e,i);break;case"RestElement":this.checkLVal(t.argument,e,i);break;case"ParenthesizedExpression":this.checkLVal(t.expression,e,i);break;default:this.raise(t.start,(e?"Binding":"Assigning to")+" rvalue")}};var et=G.prototype;et.checkPropClash=function(t,e,i){if(!(this.options.ecmaVersion>=9&&"SpreadElement"===t.type||this.options.ecmaVersion>=6&&(t.computed||t.method||t.shorthand))){var r,n=t.key;switch(n.type){case"Identifier":r=n.name;break;case"Literal":r=String(n.value);break;default:return}var s=t.kind;if(this.options.ecmaVersion>=6)"__proto__"===r&&"init"===s&&(e.proto&&(i&&i.doubleProto<0?i.doubleProto=n.start:this.raiseRecoverable(n.start,"Redefinition of __proto__ property")),e.proto=!0);else{var a=e[r="$"+r];a?("init"===s?this.strict&&a.init||a.get||a.set:a.init||a[s])&&this.raiseRecoverable(n.start,"Redefinition of property"):a=e[r]={init:!1,get:!1,set:!1},a[s]=!0}}},et.parseExpression=function(t,e){var i=this.start,r=this.startLoc,n=this.parseMaybeAssign(t,e);if(this.type===_.comma){var s=this.startNodeAt(i,r);for(s.expressions=[n];this.eat(_.comma);)s.expressions.push(this.parseMaybeAssign(t,e));return this.finishNode(s,"SequenceExpression")}return n},et.parseMaybeAssign=function(t,e,i){if(this.isContextual("yield")){if(this.inGenerator)return this.parseYield(t);this.exprAllowed=!1}var r=!1,n=-1,s=-1,a=-1;e?(n=e.parenthesizedAssign,s=e.trailingComma,a=e.shorthandAssign,e.parenthesizedAssign=e.trailingComma=e.shorthandAssign=-1):(e=new K,r=!0);var o=this.start,c=this.startLoc;this.type!==_.parenL&&this.type!==_.name||(this.potentialArrowAt=this.start);var h=this.parseMaybeConditional(t,e);if(i&&(h=i.call(this,h,o,c)),this.type.isAssign){var u=this.startNodeAt(o,c);return u.operator=this.value,u.left=this.type===_.eq?this.toAssignable(h,!1,e):h,r||K.call(e),e.shorthandAssign=-1,this.checkLVal(h),this.next(),u.right=this.parseMaybeAssign(t),this.finishNode(u,"AssignmentExpression")}return r&&this.checkExpressionErrors(e,!0),n>-1&&(e.parenthesizedAssign=n),s>-1&&(e.trailingComma=s),a>-1&&(e.shorthandAssign=a),h},et.parseMaybeConditional=function(t,e){var i=this.start,r=this.startLoc,n=this.parseExprOps(t,e);if(this.checkExpressionErrors(e))return n;if(this.eat(_.question)){var s=this.startNodeAt(i,r);return s.test=n,s.consequent=this.parseMaybeAssign(),this.expect(_.colon),s.alternate=this.parseMaybeAssign(t),this.finishNode(s,"ConditionalExpression")}return n},et.parseExprOps=function(t,e){var i=this.start,r=this.startLoc,n=this.parseMaybeUnary(e,!1);return this.checkExpressionErrors(e)?n:n.start===i&&"ArrowFunctionExpression"===n.type?n:this.parseExprOp(n,i,r,-1,t)},et.parseExprOp=function(t,e,i,r,n){var s=this.type.binop;if(null!=s&&(!n||this.type!==_._in)&&s>r){var a=this.type===_.logicalOR||this.type===_.logicalAND,o=this.value;this.next();var c=this.start,h=this.startLoc,u=this.parseExprOp(this.parseMaybeUnary(null,!1),c,h,s,n),l=this.buildBinary(e,i,t,u,o,a);return this.parseExprOp(l,e,i,r,n)}return t},et.buildBinary=function(t,e,i,r,n,s){var a=this.startNodeAt(t,e);return a.left=i,a.operator=n,a.right=r,this.finishNode(a,s?"LogicalExpression":"BinaryExpression")},et.parseMaybeUnary=function(t,e){var i,r=this.start,n=this.startLoc;if(this.isContextual("await")&&(this.inAsync||!this.inFunction&&this.options.allowAwaitOutsideFunction))i=this.parseAwait(),e=!0;else if(this.type.prefix){var s=this.startNode(),a=this.type===_.incDec;s.operator=this.value,s.prefix=!0,this.next(),s.argument=this.parseMaybeUnary(null,!0),this.checkExpressionErrors(t,!0),a?this.checkLVal(s.argument):this.strict&&"delete"===s.operator&&"Identifier"===s.argument.type?this.raiseRecoverable(s.start,"Deleting local variable in strict mode"):e=!0,i=this.finishNode(s,a?"UpdateExpression":"UnaryExpression")}else{if(i=this.parseExprSubscripts(t),this.checkExpressionErrors(t))return i;for(;this.type.postfix&&!this.canInsertSemicolon();){var o=this.startNodeAt(r,n);o.operator=this.value,o.prefix=!1,o.argument=i,this.checkLVal(i),this.next(),i=this.finishNode(o,"UpdateExpression")}}return!e&&this.eat(_.starstar)?this.buildBinary(r,n,i,this.parseMaybeUnary(null,!1),"**",!1):i},et.parseExprSubscripts=function(t){var e=this.start,i=this.startLoc,r=this.parseExprAtom(t),n="ArrowFunctionExpression"===r.type&&")"!==this.input.slice(this.lastTokStart,this.lastTokEnd);if(this.checkExpressionErrors(t)||n)return r;var s=this.parseSubscripts(r,e,i);return t&&"MemberExpression"===s.type&&(t.parenthesizedAssign>=s.start&&(t.parenthesizedAssign=-1),t.parenthesizedBind>=s.start&&(t.parenthesizedBind=-1)),s},et.parseSubscripts=function(t,e,i,r){for(var n=this.options.ecmaVersion>=8&&"Identifier"===t.type&&"async"===t.name&&this.lastTokEnd===t.end&&!this.canInsertSemicolon()&&"async"===this.input.slice(t.start,t.end);;){var s=this.parseSubscript(t,e,i,r,n);if(s===t||"ArrowFunctionExpression"===s.type)return s;t=s}},et.parseSubscript=function(t,e,i,r,n){var s=this.eat(_.bracketL);if(s||this.eat(_.dot)){var a=this.startNodeAt(e,i);a.object=t,a.property=s?this.parseExpression():this.parseIdent("never"!==this.options.allowReserved),a.computed=!!s,s&&this.expect(_.bracketR),t=this.finishNode(a,"MemberExpression")}else if(!r&&this.eat(_.parenL)){var o=new K,c=this.yieldPos,h=this.awaitPos,u=this.awaitIdentPos;this.yieldPos=0,this.awaitPos=0,this.awaitIdentPos=0;var l=this.parseExprList(_.parenR,this.options.ecmaVersion>=8,!1,o);if(n&&!this.canInsertSemicolon()&&this.eat(_.arrow))return this.checkPatternErrors(o,!1),this.checkYieldAwaitInDefaultParams(),this.awaitIdentPos>0&&this.raise(this.awaitIdentPos,"Cannot use 'await' as identifier inside an async function"),this.yieldPos=c,this.awaitPos=h,this.awaitIdentPos=u,this.parseArrowExpression(this.startNodeAt(e,i),l,!0);this.checkExpressionErrors(o,!0),this.yieldPos=c||this.yieldPos,this.awaitPos=h||this.awaitPos,this.awaitIdentPos=u||this.awaitIdentPos;var p=this.startNodeAt(e,i);p.callee=t,p.arguments=l,t=this.finishNode(p,"CallExpression")}else if(this.type===_.backQuote){var f=this.startNodeAt(e,i);f.tag=t,f.quasi=this.parseTemplate({isTagged:!0}),t=this.finishNode(f,"TaggedTemplateExpression")}return t},et.parseExprAtom=function(t){this.type===_.slash&&this.readRegexp();var e,i=this.potentialArrowAt===this.start;switch(this.type){case _._super:return this.allowSuper||this.raise(this.start,"'super' keyword outside a method"),e=this.startNode(),this.next(),this.type!==_.parenL||this.allowDirectSuper||this.raise(e.start,"super() call outside constructor of a subclass"),this.type!==_.dot&&this.type!==_.bracketL&&this.type!==_.parenL&&this.unexpected(),this.finishNode(e,"Super");case _._this:return e=this.startNode(),this.next(),this.finishNode(e,"ThisExpression");case _.name:var r=this.start,n=this.startLoc,s=this.containsEsc,a=this.parseIdent(!1);if(this.options.ecmaVersion>=8&&!s&&"async"===a.name&&!this.canInsertSemicolon()&&this.eat(_._function))return this.parseFunction(this.startNodeAt(r,n),0,!1,!0);if(i&&!this.canInsertSemicolon()){if(this.eat(_.arrow))return this.parseArrowExpression(this.startNodeAt(r,n),[a],!1);if(this.options.ecmaVersion>=8&&"async"===a.name&&this.type===_.name&&!s)return a=this.parseIdent(!1),!this.canInsertSemicolon()&&this.eat(_.arrow)||this.unexpected(),this.parseArrowExpression(this.startNodeAt(r,n),[a],!0)}return a;case _.regexp:var o=this.value;return(e=this.parseLiteral(o.value)).regex={pattern:o.pattern,flags:o.flags},e;case _.num:case _.string:return this.parseLiteral(this.value);case _._null:case _._true:case _._false:return(e=this.startNode()).value=this.type===_._null?null:this.type===_._true,e.raw=this.type.keyword,this.next(),this.finishNode(e,"Literal");case _.parenL:var c=this.start,h=this.parseParenAndDistinguishExpression(i);return t&&(t.parenthesizedAssign<0&&!this.isSimpleAssignTarget(h)&&(t.parenthesizedAssign=c),t.parenthesizedBind<0&&(t.parenthesizedBind=c)),h;case _.bracketL:return e=this.startNode(),this.next(),e.elements=this.parseExprList(_.bracketR,!0,!0,t),this.finishNode(e,"ArrayExpression");case _.braceL:return this.parseObj(!1,t);case _._function:return e=this.startNode(),this.next(),this.parseFunction(e,0);case _._class:return this.parseClass(this.startNode(),!1);case _._new:return this.parseNew();case _.backQuote:return this.parseTemplate();case _._import:return this.options.ecmaVersion>=11?this.parseExprImport():this.unexpected();default:this.unexpected()}},et.parseExprImport=function(){var t=this.startNode();switch(this.next(),this.type){case _.parenL:return this.parseDynamicImport(t);default:this.unexpected()}},et.parseDynamicImport=function(t){if(this.next(),t.source=this.parseMaybeAssign(),!this.eat(_.parenR)){var e=this.start;this.eat(_.comma)&&this.eat(_.parenR)?this.raiseRecoverable(e,"Trailing comma is not allowed in import()"):this.unexpected(e)}return this.finishNode(t,"ImportExpression")},et.parseLiteral=function(t){var e=this.startNode();return e.value=t,e.raw=this.input.slice(this.start,this.end),110===e.raw.charCodeAt(e.raw.length-1)&&(e.bigint=e.raw.slice(0,-1)),this.next(),this.finishNode(e,"Literal")},et.parseParenExpression=function(){this.expect(_.parenL);var t=this.parseExpression();return this.expect(_.parenR),t},et.parseParenAndDistinguishExpression=function(t){var e,i=this.start,r=this.startLoc,n=this.options.ecmaVersion>=8;if(this.options.ecmaVersion>=6){this.next();var s,a=this.start,o=this.startLoc,c=[],h=!0,u=!1,l=new K,p=this.yieldPos,f=this.awaitPos;for(this.yieldPos=0,this.awaitPos=0;this.type!==_.parenR;){if(h?h=!1:this.expect(_.comma),n&&this.afterTrailingComma(_.parenR,!0)){u=!0;break}if(this.type===_.ellipsis){s=this.start,c.push(this.parseParenItem(this.parseRestBinding())),this.type===_.comma&&this.raise(this.start,"Comma is not permitted after the rest element");break}c.push(this.parseMaybeAssign(!1,l,this.parseParenItem))}var d=this.start,m=this.startLoc;if(this.expect(_.parenR),t&&!this.canInsertSemicolon()&&this.eat(_.arrow))return this.checkPatternErrors(l,!1),this.checkYieldAwaitInDefaultParams(),this.yieldPos=p,this.awaitPos=f,this.parseParenArrowList(i,r,c);c.length&&!u||this.unexpected(this.lastTokStart),s&&this.unexpected(s),this.checkExpressionErrors(l,!0),this.yieldPos=p||this.yieldPos,this.awaitPos=f||this.awaitPos,c.length>1?((e=this.startNodeAt(a,o)).expressions=c,this.finishNodeAt(e,"SequenceExpression",d,m)):e=c[0]}else e=this.parseParenExpression();if(this.options.preserveParens){var g=this.startNodeAt(i,r);return g.expression=e,this.finishNode(g,"ParenthesizedExpression")}return e},et.parseParenItem=function(t){return t},et.parseParenArrowList=function(t,e,i){return this.parseArrowExpression(this.startNodeAt(t,e),i)};var it=[];et.parseNew=function(){var t=this.startNode(),e=this.parseIdent(!0);if(this.options.ecmaVersion>=6&&this.eat(_.dot)){t.meta=e;var i=this.containsEsc;return t.property=this.parseIdent(!0),("target"!==t.property.name||i)&&this.raiseRecoverable(t.property.start,"The only valid meta property for new is new.target"),this.inNonArrowFunction()||this.raiseRecoverable(t.start,"new.target can only be used in functions"),this.finishNode(t,"MetaProperty")}var r=this.start,n=this.startLoc,s=this.type===_._import;return t.callee=this.parseSubscripts(this.parseExprAtom(),r,n,!0),s&&"ImportExpression"===t.callee.type&&this.raise(r,"Cannot use new with import()"),this.eat(_.parenL)?t.arguments=this.parseExprList(_.parenR,this.options.ecmaVersion>=8,!1):t.arguments=it,this.finishNode(t,"NewExpression")},et.parseTemplateElement=function(t){var e=t.isTagged,i=this.startNode();return this.type===_.invalidTemplate?(e||this.raiseRecoverable(this.start,"Bad escape sequence in untagged template literal"),i.value={raw:this.value,cooked:null}):i.value={raw:this.input.slice(this.start,this.end).replace(/\r\n?/g,"\n"),cooked:this.value},this.next(),i.tail=this.type===_.backQuote,this.finishNode(i,"TemplateElement")},et.parseTemplate=function(t){void 0===t&&(t={});var e=t.isTagged;void 0===e&&(e=!1);var i=this.startNode();this.next(),i.expressions=[];var r=this.parseTemplateElement({isTagged:e});for(i.quasis=[r];!r.tail;)this.type===_.eof&&this.raise(this.pos,"Unterminated template literal"),this.expect(_.dollarBraceL),i.expressions.push(this.parseExpression()),this.expect(_.braceR),i.quasis.push(r=this.parseTemplateElement({isTagged:e}));return this.next(),this.finishNode(i,"TemplateLiteral")},et.isAsyncProp=function(t){return!t.computed&&"Identifier"===t.key.type&&"async"===t.key.name&&(this.type===_.name||this.type===_.num||this.type===_.string||this.type===_.bracketL||this.type.keyword||this.options.ecmaVersion>=9&&this.type===_.star)&&!w.test(this.input.slice(this.lastTokEnd,this.start))},et.parseObj=function(t,e){var i=this.startNode(),r=!0,n={};for(i.properties=[],this.next();!this.eat(_.braceR);){if(r)r=!1;else if(this.expect(_.comma),this.options.ecmaVersion>=5&&this.afterTrailingComma(_.braceR))break;var s=this.parseProperty(t,e);t||this.checkPropClash(s,n,e),i.properties.push(s)}return this.finishNode(i,t?"ObjectPattern":"ObjectExpression")},et.parseProperty=function(t,e){var i,r,n,s,a=this.startNode();if(this.options.ecmaVersion>=9&&this.eat(_.ellipsis))return t?(a.argument=this.parseIdent(!1),this.type===_.comma&&this.raise(this.start,"Comma is not permitted after the rest element"),this.finishNode(a,"RestElement")):(this.type===_.parenL&&e&&(e.parenthesizedAssign<0&&(e.parenthesizedAssign=this.start),e.parenthesizedBind<0&&(e.parenthesizedBind=this.start)),a.argument=this.parseMaybeAssign(!1,e),this.type===_.comma&&e&&e.trailingComma<0&&(e.trailingComma=this.start),this.finishNode(a,"SpreadElement"));this.options.ecmaVersion>=6&&(a.method=!1,a.shorthand=!1,(t||e)&&(n=this.start,s=this.startLoc),t||(i=this.eat(_.star)));var o=this.containsEsc;return this.parsePropertyName(a),!t&&!o&&this.options.ecmaVersion>=8&&!i&&this.isAsyncProp(a)?(r=!0,i=this.options.ecmaVersion>=9&&this.eat(_.star),this.parsePropertyName(a,e)):r=!1,this.parsePropertyValue(a,t,i,r,n,s,e,o),this.finishNode(a,"Property")},et.parsePropertyValue=function(t,e,i,r,n,s,a,o){if((i||r)&&this.type===_.colon&&this.unexpected(),this.eat(_.colon))t.value=e?this.parseMaybeDefault(this.start,this.startLoc):this.parseMaybeAssign(!1,a),t.kind="init";else if(this.options.ecmaVersion>=6&&this.type===_.parenL)e&&this.unexpected(),t.kind="init",t.method=!0,t.value=this.parseMethod(i,r);else if(e||o||!(this.options.ecmaVersion>=5)||t.computed||"Identifier"!==t.key.type||"get"!==t.key.name&&"set"!==t.key.name||this.type===_.comma||this.type===_.braceR)this.options.ecmaVersion>=6&&!t.computed&&"Identifier"===t.key.type?((i||r)&&this.unexpected(),this.checkUnreserved(t.key),"await"!==t.key.name||this.awaitIdentPos||(this.awaitIdentPos=n),t.kind="init",e?t.value=this.parseMaybeDefault(n,s,t.key):this.type===_.eq&&a?(a.shorthandAssign<0&&(a.shorthandAssign=this.start),t.value=this.parseMaybeDefault(n,s,t.key)):t.value=t.key,t.shorthand=!0):this.unexpected();else{(i||r)&&this.unexpected(),t.kind=t.key.name,this.parsePropertyName(t),t.value=this.parseMethod(!1);var c="get"===t.kind?0:1;if(t.value.params.length!==c){var h=t.value.start;"get"===t.kind?this.raiseRecoverable(h,"getter should have no params"):this.raiseRecoverable(h,"setter should have exactly one param")}else"set"===t.kind&&"RestElement"===t.value.params[0].type&&this.raiseRecoverable(t.value.params[0].start,"Setter cannot use rest params")}},et.parsePropertyName=function(t){if(this.options.ecmaVersion>=6){if(this.eat(_.bracketL))return t.computed=!0,t.key=this.parseMaybeAssign(),this.expect(_.bracketR),t.key;t.computed=!1}return t.key=this.type===_.num||this.type===_.string?this.parseExprAtom():this.parseIdent("never"!==this.options.allowReserved)},et.initFunction=function(t){t.id=null,this.options.ecmaVersion>=6&&(t.generator=t.expression=!1),this.options.ecmaVersion>=8&&(t.async=!1)},et.parseMethod=function(t,e,i){var r=this.startNode(),n=this.yieldPos,s=this.awaitPos,a=this.awaitIdentPos;return this.initFunction(r),this.options.ecmaVersion>=6&&(r.generator=t),this.options.ecmaVersion>=8&&(r.async=!!e),this.yieldPos=0,this.awaitPos=0,this.awaitIdentPos=0,this.enterScope(64|F(e,r.generator)|(i?128:0)),this.expect(_.parenL),r.params=this.parseBindingList(_.parenR,!1,this.options.ecmaVersion>=8),this.checkYieldAwaitInDefaultParams(),this.parseFunctionBody(r,!1,!0),this.yieldPos=n,this.awaitPos=s,this.awaitIdentPos=a,this.finishNode(r,"FunctionExpression")},et.parseArrowExpression=function(t,e,i){var r=this.yieldPos,n=this.awaitPos,s=this.awaitIdentPos;return this.enterScope(16|F(i,!1)),this.initFunction(t),this.options.ecmaVersion>=8&&(t.async=!!i),this.yieldPos=0,this.awaitPos=0,this.awaitIdentPos=0,t.params=this.toAssignableList(e,!0),this.parseFunctionBody(t,!0,!1),this.yieldPos=r,this.awaitPos=n,this.awaitIdentPos=s,this.finishNode(t,"ArrowFunctionExpression")},et.parseFunctionBody=function(t,e,i){var r=e&&this.type!==_.braceL,n=this.strict,s=!1;if(r)t.body=this.parseMaybeAssign(),t.expression=!0,this.checkParams(t,!1);else{var a=this.options.ecmaVersion>=7&&!this.isSimpleParamList(t.params);n&&!a||(s=this.strictDirective(this.end))&&a&&this.raiseRecoverable(t.start,"Illegal 'use strict' directive in function with non-simple parameter list");var o=this.labels;this.labels=[],s&&(this.strict=!0),this.checkParams(t,!n&&!s&&!e&&!i&&this.isSimpleParamList(t.params)),t.body=this.parseBlock(!1),t.expression=!1,this.adaptDirectivePrologue(t.body.body),this.labels=o}this.exitScope(),this.strict&&t.id&&this.checkLVal(t.id,5),this.strict=n},et.isSimpleParamList=function(t){for(var e=0,i=t;e<i.length;e+=1)if("Identifier"!==i[e].type)return!1;return!0},et.checkParams=function(t,e){for(var i={},r=0,n=t.params;r<n.length;r+=1){var s=n[r];this.checkLVal(s,1,e?null:i)}},et.parseExprList=function(t,e,i,r){for(var n=[],s=!0;!this.eat(t);){if(s)s=!1;else if(this.expect(_.comma),e&&this.afterTrailingComma(t))break;var a=void 0;i&&this.type===_.comma?a=null:this.type===_.ellipsis?(a=this.parseSpread(r),r&&this.type===_.comma&&r.trailingComma<0&&(r.trailingComma=this.start)):a=this.parseMaybeAssign(!1,r),n.push(a)}return n},et.checkUnreserved=function(t){var e=t.start,i=t.end,r=t.name;this.inGenerator&&"yield"===r&&this.raiseRecoverable(e,"Cannot use 'yield' as identifier inside a generator"),this.inAsync&&"await"===r&&this.raiseRecoverable(e,"Cannot use 'await' as identifier inside an async function"),this.keywords.test(r)&&this.raise(e,"Unexpected keyword '"+r+"'"),this.options.ecmaVersion<6&&-1!==this.input.slice(e,i).indexOf("\\")||(this.strict?this.reservedWordsStrict:this.reservedWords).test(r)&&(this.inAsync||"await"!==r||this.raiseRecoverable(e,"Cannot use keyword 'await' outside an async function"),this.raiseRecoverable(e,"The keyword '"+r+"' is reserved"))},et.parseIdent=function(t,e){var i=this.startNode();return this.type===_.name?i.name=this.value:this.type.keyword?(i.name=this.type.keyword,"class"!==i.name&&"function"!==i.name||this.lastTokEnd===this.lastTokStart+1&&46===this.input.charCodeAt(this.lastTokStart)||this.context.pop()):this.unexpected(),this.next(),this.finishNode(i,"Identifier"),t||(this.checkUnreserved(i),"await"!==i.name||this.awaitIdentPos||(this.awaitIdentPos=i.start)),i},et.parseYield=function(t){this.yieldPos||(this.yieldPos=this.start);var e=this.startNode();return this.next(),this.type===_.semi||this.canInsertSemicolon()||this.type!==_.star&&!this.type.startsExpr?(e.delegate=!1,e.argument=null):(e.delegate=this.eat(_.star),e.argument=this.parseMaybeAssign(t)),this.finishNode(e,"YieldExpression")},et.parseAwait=function(){this.awaitPos||(this.awaitPos=this.start);var t=this.startNode();return this.next(),t.argument=this.parseMaybeUnary(null,!0),this.finishNode(t,"AwaitExpression")};var rt=G.prototype;rt.raise=function(t,e){var i=M(this.input,t);e+=" ("+i.line+":"+i.column+")";var r=new SyntaxError(e);throw r.pos=t,r.loc=i,r.raisedAt=this.pos,r},rt.raiseRecoverable=rt.raise,rt.curPosition=function(){if(this.options.locations)return new j(this.curLine,this.pos-this.lineStart)};var nt=G.prototype,st=function(t){this.flags=t,this.var=[],this.lexical=[],this.functions=[]};nt.enterScope=function(t){this.scopeStack.push(new st(t))},nt.exitScope=function(){this.scopeStack.pop()},nt.treatFunctionsAsVarInScope=function(t){return t.flags&R||!this.inModule&&1&t.flags},nt.declareName=function(t,e,i){var r=!1;if(2===e){var n=this.currentScope();r=n.lexical.indexOf(t)>-1||n.functions.indexOf(t)>-1||n.var.indexOf(t)>-1,n.lexical.push(t),this.inModule&&1&n.flags&&delete this.undefinedExports[t]}else if(4===e)this.currentScope().lexical.push(t);else if(3===e){var s=this.currentScope();r=this.treatFunctionsAsVar?s.lexical.indexOf(t)>-1:s.lexical.indexOf(t)>-1||s.var.indexOf(t)>-1,s.functions.push(t)}else for(var a=this.scopeStack.length-1;a>=0;--a){var o=this.scopeStack[a];if(o.lexical.indexOf(t)>-1&&!(32&o.flags&&o.lexical[0]===t)||!this.treatFunctionsAsVarInScope(o)&&o.functions.indexOf(t)>-1){r=!0;break}if(o.var.push(t),this.inModule&&1&o.flags&&delete this.undefinedExports[t],o.flags&D)break}r&&this.raiseRecoverable(i,"Identifier '"+t+"' has already been declared")},nt.checkLocalExport=function(t){-1===this.scopeStack[0].lexical.indexOf(t.name)&&-1===this.scopeStack[0].var.indexOf(t.name)&&(this.undefinedExports[t.name]=t)},nt.currentScope=function(){return this.scopeStack[this.scopeStack.length-1]},nt.currentVarScope=function(){for(var t=this.scopeStack.length-1;;t--){var e=this.scopeStack[t];if(e.flags&D)return e}},nt.currentThisScope=function(){for(var t=this.scopeStack.length-1;;t--){var e=this.scopeStack[t];if(e.flags&D&&!(16&e.flags))return e}};var at=function(t,e,i){this.type="",this.start=e,this.end=0,t.options.locations&&(this.loc=new V(t,i)),t.options.directSourceFile&&(this.sourceFile=t.options.directSourceFile),t.options.ranges&&(this.range=[e,0])},ot=G.prototype;function ct(t,e,i,r){return t.type=e,t.end=i,this.options.locations&&(t.loc.end=r),this.options.ranges&&(t.range[1]=i),t}ot.startNode=function(){return new at(this,this.start,this.startLoc)},ot.startNodeAt=function(t,e){return new at(this,t,e)},ot.finishNode=function(t,e){return ct.call(this,t,e,this.lastTokEnd,this.lastTokEndLoc)},ot.finishNodeAt=function(t,e,i,r){return ct.call(this,t,e,i,r)};var ht=function(t,e,i,r,n){this.token=t,this.isExpr=!!e,this.preserveSpace=!!i,this.override=r,this.generator=!!n},ut={b_stat:new ht("{",!1),b_expr:new ht("{",!0),b_tmpl:new ht("${",!1),p_stat:new ht("(",!1),p_expr:new ht("(",!0),q_tmpl:new ht("`",!0,!0,(function(t){return t.tryReadTemplateToken()})),f_stat:new ht("function",!1),f_expr:new ht("function",!0),f_expr_gen:new ht("function",!0,!1,null,!0),f_gen:new ht("function",!1,!1,null,!0)},lt=G.prototype;lt.initialContext=function(){return[ut.b_stat]},lt.braceIsBlock=function(t){var e=this.curContext();return e===ut.f_expr||e===ut.f_stat||(t!==_.colon||e!==ut.b_stat&&e!==ut.b_expr?t===_._return||t===_.name&&this.exprAllowed?w.test(this.input.slice(this.lastTokEnd,this.start)):t===_._else||t===_.semi||t===_.eof||t===_.parenR||t===_.arrow||(t===_.braceL?e===ut.b_stat:t!==_._var&&t!==_._const&&t!==_.name&&!this.exprAllowed):!e.isExpr)},lt.inGeneratorContext=function(){for(var t=this.context.length-1;t>=1;t--){var e=this.context[t];if("function"===e.token)return e.generator}return!1},lt.updateContext=function(t){var e,i=this.type;i.keyword&&t===_.dot?this.exprAllowed=!1:(e=i.updateContext)?e.call(this,t):this.exprAllowed=i.beforeExpr},_.parenR.updateContext=_.braceR.updateContext=function(){if(1!==this.context.length){var t=this.context.pop();t===ut.b_stat&&"function"===this.curContext().token&&(t=this.context.pop()),this.exprAllowed=!t.isExpr}else this.exprAllowed=!0},_.braceL.updateContext=function(t){this.context.push(this.braceIsBlock(t)?ut.b_stat:ut.b_expr),this.exprAllowed=!0},_.dollarBraceL.updateContext=function(){this.context.push(ut.b_tmpl),this.exprAllowed=!0},_.parenL.updateContext=function(t){var e=t===_._if||t===_._for||t===_._with||t===_._while;this.context.push(e?ut.p_stat:ut.p_expr),this.exprAllowed=!0},_.incDec.updateContext=function(){},_._function.updateContext=_._class.updateContext=function(t){!t.beforeExpr||t===_.semi||t===_._else||t===_._return&&w.test(this.input.slice(this.lastTokEnd,this.start))||(t===_.colon||t===_.braceL)&&this.curContext()===ut.b_stat?this.context.push(ut.f_stat):this.context.push(ut.f_expr),this.exprAllowed=!1},_.backQuote.updateContext=function(){this.curContext()===ut.q_tmpl?this.context.pop():this.context.push(ut.q_tmpl),this.exprAllowed=!1},_.star.updateContext=function(t){if(t===_._function){var e=this.context.length-1;this.context[e]===ut.f_expr?this.context[e]=ut.f_expr_gen:this.context[e]=ut.f_gen}this.exprAllowed=!0},_.name.updateContext=function(t){var e=!1;this.options.ecmaVersion>=6&&t!==_.dot&&("of"===this.value&&!this.exprAllowed||"yield"===this.value&&this.inGeneratorContext())&&(e=!0),this.exprAllowed=e};var pt="ASCII ASCII_Hex_Digit AHex Alphabetic Alpha Any Assigned Bidi_Control Bidi_C Bidi_Mirrored Bidi_M Case_Ignorable CI Cased Changes_When_Casefolded CWCF Changes_When_Casemapped CWCM Changes_When_Lowercased CWL Changes_When_NFKC_Casefolded CWKCF Changes_When_Titlecased CWT Changes_When_Uppercased CWU Dash Default_Ignorable_Code_Point DI Deprecated Dep Diacritic Dia Emoji Emoji_Component Emoji_Modifier Emoji_Modifier_Base Emoji_Presentation Extender Ext Grapheme_Base Gr_Base Grapheme_Extend Gr_Ext Hex_Digit Hex IDS_Binary_Operator IDSB IDS_Trinary_Operator IDST ID_Continue IDC ID_Start IDS Ideographic Ideo Join_Control Join_C Logical_Order_Exception LOE Lowercase Lower Math Noncharacter_Code_Point NChar Pattern_Syntax Pat_Syn Pattern_White_Space Pat_WS Quotation_Mark QMark Radical Regional_Indicator RI Sentence_Terminal STerm Soft_Dotted SD Terminal_Punctuation Term Unified_Ideograph UIdeo Uppercase Upper Variation_Selector VS White_Space space XID_Continue XIDC XID_Start XIDS",ft={9:pt,10:"ASCII ASCII_Hex_Digit AHex Alphabetic Alpha Any Assigned Bidi_Control Bidi_C Bidi_Mirrored Bidi_M Case_Ignorable CI Cased Changes_When_Casefolded CWCF Changes_When_Casemapped CWCM Changes_When_Lowercased CWL Changes_When_NFKC_Casefolded CWKCF Changes_When_Titlecased CWT Changes_When_Uppercased CWU Dash Default_Ignorable_Code_Point DI Deprecated Dep Diacritic Dia Emoji Emoji_Component Emoji_Modifier Emoji_Modifier_Base Emoji_Presentation Extender Ext Grapheme_Base Gr_Base Grapheme_Extend Gr_Ext Hex_Digit Hex IDS_Binary_Operator IDSB IDS_Trinary_Operator IDST ID_Continue IDC ID_Start IDS Ideographic Ideo Join_Control Join_C Logical_Order_Exception LOE Lowercase Lower Math Noncharacter_Code_Point NChar Pattern_Syntax Pat_Syn Pattern_White_Space Pat_WS Quotation_Mark QMark Radical Regional_Indicator RI Sentence_Terminal STerm Soft_Dotted SD Terminal_Punctuation Term Unified_Ideograph UIdeo Uppercase Upper Variation_Selector VS White_Space space XID_Continue XIDC XID_Start XIDS Extended_Pictographic",11:"ASCII ASCII_Hex_Digit AHex Alphabetic Alpha Any Assigned Bidi_Control Bidi_C Bidi_Mirrored Bidi_M Case_Ignorable CI Cased Changes_When_Casefolded CWCF Changes_When_Casemapped CWCM Changes_When_Lowercased CWL Changes_When_NFKC_Casefolded CWKCF Changes_When_Titlecased CWT Changes_When_Uppercased CWU Dash Default_Ignorable_Code_Point DI Deprecated Dep Diacritic Dia Emoji Emoji_Component Emoji_Modifier Emoji_Modifier_Base Emoji_Presentation Extender Ext Grapheme_Base Gr_Base Grapheme_Extend Gr_Ext Hex_Digit Hex IDS_Binary_Operator IDSB IDS_Trinary_Operator IDST ID_Continue IDC ID_Start IDS Ideographic Ideo Join_Control Join_C Logical_Order_Exception LOE Lowercase Lower Math Noncharacter_Code_Point NChar Pattern_Syntax Pat_Syn Pattern_White_Space Pat_WS Quotation_Mark QMark Radical Regional_Indicator RI Sentence_Terminal STerm Soft_Dotted SD Terminal_Punctuation Term Unified_Ideograph UIdeo Uppercase Upper Variation_Selector VS White_Space space XID_Continue XIDC XID_Start XIDS Extended_Pictographic"},dt="Cased_Letter LC Close_Punctuation Pe Connector_Punctuation Pc Control Cc cntrl Currency_Symbol Sc Dash_Punctuation Pd Decimal_Number Nd digit Enclosing_Mark Me Final_Punctuation Pf Format Cf Initial_Punctuation Pi Letter L Letter_Number Nl Line_Separator Zl Lowercase_Letter Ll Mark M Combining_Mark Math_Symbol Sm Modifier_Letter Lm Modifier_Symbol Sk Nonspacing_Mark Mn Number N Open_Punctuation Ps Other C Other_Letter Lo Other_Number No Other_Punctuation Po Other_Symbol So Paragraph_Separator Zp Private_Use Co Punctuation P punct Separator Z Space_Separator Zs Spacing_Mark Mc Surrogate Cs Symbol S Titlecase_Letter Lt Unassigned Cn Uppercase_Letter Lu",mt="Adlam Adlm Ahom Ahom Anatolian_Hieroglyphs Hluw Arabic Arab Armenian Armn Avestan Avst Balinese Bali Bamum Bamu Bassa_Vah Bass Batak Batk Bengali Beng Bhaiksuki Bhks Bopomofo Bopo Brahmi Brah Braille Brai Buginese Bugi Buhid Buhd Canadian_Aboriginal Cans Carian Cari Caucasian_Albanian Aghb Chakma Cakm Cham Cham Cherokee Cher Common Zyyy Coptic Copt Qaac Cuneiform Xsux Cypriot Cprt Cyrillic Cyrl Deseret Dsrt Devanagari Deva Duployan Dupl Egyptian_Hieroglyphs Egyp Elbasan Elba Ethiopic Ethi Georgian Geor Glagolitic Glag Gothic Goth Grantha Gran Greek Grek Gujarati Gujr Gurmukhi Guru Han Hani Hangul Hang Hanunoo Hano Hatran Hatr Hebrew Hebr Hiragana Hira Imperial_Aramaic Armi Inherited Zinh Qaai Inscriptional_Pahlavi Phli Inscriptional_Parthian Prti Javanese Java Kaithi Kthi Kannada Knda Katakana Kana Kayah_Li Kali Kharoshthi Khar Khmer Khmr Khojki Khoj Khudawadi Sind Lao Laoo Latin Latn Lepcha Lepc Limbu Limb Linear_A Lina Linear_B Linb Lisu Lisu Lycian Lyci Lydian Lydi Mahajani Mahj Malayalam Mlym Mandaic Mand Manichaean Mani Marchen Marc Masaram_Gondi Gonm Meetei_Mayek Mtei Mende_Kikakui Mend Meroitic_Cursive Merc Meroitic_Hieroglyphs Mero Miao Plrd Modi Modi Mongolian Mong Mro Mroo Multani Mult Myanmar Mymr Nabataean Nbat New_Tai_Lue Talu Newa Newa Nko Nkoo Nushu Nshu Ogham Ogam Ol_Chiki Olck Old_Hungarian Hung Old_Italic Ital Old_North_Arabian Narb Old_Permic Perm Old_Persian Xpeo Old_South_Arabian Sarb Old_Turkic Orkh Oriya Orya Osage Osge Osmanya Osma Pahawh_Hmong Hmng Palmyrene Palm Pau_Cin_Hau Pauc Phags_Pa Phag Phoenician Phnx Psalter_Pahlavi Phlp Rejang Rjng Runic Runr Samaritan Samr Saurashtra Saur Sharada Shrd Shavian Shaw Siddham Sidd SignWriting Sgnw Sinhala Sinh Sora_Sompeng Sora Soyombo Soyo Sundanese Sund Syloti_Nagri Sylo Syriac Syrc Tagalog Tglg Tagbanwa Tagb Tai_Le Tale Tai_Tham Lana Tai_Viet Tavt Takri Takr Tamil Taml Tangut Tang Telugu Telu Thaana Thaa Thai Thai Tibetan Tibt Tifinagh Tfng Tirhuta Tirh Ugaritic Ugar Vai Vaii Warang_Citi Wara Yi Yiii Zanabazar_Square Zanb",gt={9:mt,10:"Adlam Adlm Ahom Ahom Anatolian_Hieroglyphs Hluw Arabic Arab Armenian Armn Avestan Avst Balinese Bali Bamum Bamu Bassa_Vah Bass Batak Batk Bengali Beng Bhaiksuki Bhks Bopomofo Bopo Brahmi Brah Braille Brai Buginese Bugi Buhid Buhd Canadian_Aboriginal Cans Carian Cari Caucasian_Albanian Aghb Chakma Cakm Cham Cham Cherokee Cher Common Zyyy Coptic Copt Qaac Cuneiform Xsux Cypriot Cprt Cyrillic Cyrl Deseret Dsrt Devanagari Deva Duployan Dupl Egyptian_Hieroglyphs Egyp Elbasan Elba Ethiopic Ethi Georgian Geor Glagolitic Glag Gothic Goth Grantha Gran Greek Grek Gujarati Gujr Gurmukhi Guru Han Hani Hangul Hang Hanunoo Hano Hatran Hatr Hebrew Hebr Hiragana Hira Imperial_Aramaic Armi Inherited Zinh Qaai Inscriptional_Pahlavi Phli Inscriptional_Parthian Prti Javanese Java Kaithi Kthi Kannada Knda Katakana Kana Kayah_Li Kali Kharoshthi Khar Khmer Khmr Khojki Khoj Khudawadi Sind Lao Laoo Latin Latn Lepcha Lepc Limbu Limb Linear_A Lina Linear_B Linb Lisu Lisu Lycian Lyci Lydian Lydi Mahajani Mahj Malayalam Mlym Mandaic Mand Manichaean Mani Marchen Marc Masaram_Gondi Gonm Meetei_Mayek Mtei Mende_Kikakui Mend Meroitic_Cursive Merc Meroitic_Hieroglyphs Mero Miao Plrd Modi Modi Mongolian Mong Mro Mroo Multani Mult Myanmar Mymr Nabataean Nbat New_Tai_Lue Talu Newa Newa Nko Nkoo Nushu Nshu Ogham Ogam Ol_Chiki Olck Old_Hungarian Hung Old_Italic Ital Old_North_Arabian Narb Old_Permic Perm Old_Persian Xpeo Old_South_Arabian Sarb Old_Turkic Orkh Oriya Orya Osage Osge Osmanya Osma Pahawh_Hmong Hmng Palmyrene Palm Pau_Cin_Hau Pauc Phags_Pa Phag Phoenician Phnx Psalter_Pahlavi Phlp Rejang Rjng Runic Runr Samaritan Samr Saurashtra Saur Sharada Shrd Shavian Shaw Siddham Sidd SignWriting Sgnw Sinhala Sinh Sora_Sompeng Sora Soyombo Soyo Sundanese Sund Syloti_Nagri Sylo Syriac Syrc Tagalog Tglg Tagbanwa Tagb Tai_Le Tale Tai_Tham Lana Tai_Viet Tavt Takri Takr Tamil Taml Tangut Tang Telugu Telu Thaana Thaa Thai Thai Tibetan Tibt Tifinagh Tfng Tirhuta Tirh Ugaritic Ugar Vai Vaii Warang_Citi Wara Yi Yiii Zanabazar_Square Zanb Dogra Dogr Gunjala_Gondi Gong Hanifi_Rohingya Rohg Makasar Maka Medefaidrin Medf Old_Sogdian Sogo Sogdian Sogd",11:"Adlam Adlm Ahom Ahom Anatolian_Hieroglyphs Hluw Arabic Arab Armenian Armn Avestan Avst Balinese Bali Bamum Bamu Bassa_Vah Bass Batak Batk Bengali Beng Bhaiksuki Bhks Bopomofo Bopo Brahmi Brah Braille Brai Buginese Bugi Buhid Buhd Canadian_Aboriginal Cans Carian Cari Caucasian_Albanian Aghb Chakma Cakm Cham Cham Cherokee Cher Common Zyyy Coptic Copt Qaac Cuneiform Xsux Cypriot Cprt Cyrillic Cyrl Deseret Dsrt Devanagari Deva Duployan Dupl Egyptian_Hieroglyphs Egyp Elbasan Elba Ethiopic Ethi Georgian Geor Glagolitic Glag Gothic Goth Grantha Gran Greek Grek Gujarati Gujr Gurmukhi Guru Han Hani Hangul Hang Hanunoo Hano Hatran Hatr Hebrew Hebr Hiragana Hira Imperial_Aramaic Armi Inherited Zinh Qaai Inscriptional_Pahlavi Phli Inscriptional_Parthian Prti Javanese Java Kaithi Kthi Kannada Knda Katakana Kana Kayah_Li Kali Kharoshthi Khar Khmer Khmr Khojki Khoj Khudawadi Sind Lao Laoo Latin Latn Lepcha Lepc Limbu Limb Linear_A Lina Linear_B Linb Lisu Lisu Lycian Lyci Lydian Lydi Mahajani Mahj Malayalam Mlym Mandaic Mand Manichaean Mani Marchen Marc Masaram_Gondi Gonm Meetei_Mayek Mtei Mende_Kikakui Mend Meroitic_Cursive Merc Meroitic_Hieroglyphs Mero Miao Plrd Modi Modi Mongolian Mong Mro Mroo Multani Mult Myanmar Mymr Nabataean Nbat New_Tai_Lue Talu Newa Newa Nko Nkoo Nushu Nshu Ogham Ogam Ol_Chiki Olck Old_Hungarian Hung Old_Italic Ital Old_North_Arabian Narb Old_Permic Perm Old_Persian Xpeo Old_South_Arabian Sarb Old_Turkic Orkh Oriya Orya Osage Osge Osmanya Osma Pahawh_Hmong Hmng Palmyrene Palm Pau_Cin_Hau Pauc Phags_Pa Phag Phoenician Phnx Psalter_Pahlavi Phlp Rejang Rjng Runic Runr Samaritan Samr Saurashtra Saur Sharada Shrd Shavian Shaw Siddham Sidd SignWriting Sgnw Sinhala Sinh Sora_Sompeng Sora Soyombo Soyo Sundanese Sund Syloti_Nagri Sylo Syriac Syrc Tagalog Tglg Tagbanwa Tagb Tai_Le Tale Tai_Tham Lana Tai_Viet Tavt Takri Takr Tamil Taml Tangut Tang Telugu Telu Thaana Thaa Thai Thai Tibetan Tibt Tifinagh Tfng Tirhuta Tirh Ugaritic Ugar Vai Vaii Warang_Citi Wara Yi Yiii Zanabazar_Square Zanb Dogra Dogr Gunjala_Gondi Gong Hanifi_Rohingya Rohg Makasar Maka Medefaidrin Medf Old_Sogdian Sogo Sogdian Sogd Elymaic Elym Nandinagari Nand Nyiakeng_Puachue_Hmong Hmnp Wancho Wcho"},xt={};function yt(t){var e=xt[t]={binary:N(ft[t]+" "+dt),nonBinary:{General_Category:N(dt),Script:N(gt[t])}};e.nonBinary.Script_Extensions=e.nonBinary.Script,e.nonBinary.gc=e.nonBinary.General_Category,e.nonBinary.sc=e.nonBinary.Script,e.nonBinary.scx=e.nonBinary.Script_Extensions}yt(9),yt(10),yt(11);var vt=G.prototype,bt=function(t){this.parser=t,this.validFlags="gim"+(t.options.ecmaVersion>=6?"uy":"")+(t.options.ecmaVersion>=9?"s":""),this.unicodeProperties=xt[t.options.ecmaVersion>=11?11:t.options.ecmaVersion],this.source="",this.flags="",this.start=0,this.switchU=!1,this.switchN=!1,this.pos=0,this.lastIntValue=0,this.lastStringValue="",this.lastAssertionIsQuantifiable=!1,this.numCapturingParens=0,this.maxBackReference=0,this.groupNames=[],this.backReferenceNames=[]};function kt(t){return t<=65535?String.fromCharCode(t):(t-=65536,String.fromCharCode(55296+(t>>10),56320+(1023&t)))}function _t(t){return 36===t||t>=40&&t<=43||46===t||63===t||t>=91&&t<=94||t>=123&&t<=125}function wt(t){return t>=65&&t<=90||t>=97&&t<=122}function At(t){return wt(t)||95===t}function St(t){return At(t)||Et(t)}function Et(t){return t>=48&&t<=57}function Ct(t){return t>=48&&t<=57||t>=65&&t<=70||t>=97&&t<=102}function Tt(t){return t>=65&&t<=70?t-65+10:t>=97&&t<=102?t-97+10:t-48}function It(t){return t>=48&&t<=55}bt.prototype.reset=function(t,e,i){var r=-1!==i.indexOf("u");this.start=0|t,this.source=e+"",this.flags=i,this.switchU=r&&this.parser.options.ecmaVersion>=6,this.switchN=r&&this.parser.options.ecmaVersion>=9},bt.prototype.raise=function(t){this.parser.raiseRecoverable(this.start,"Invalid regular expression: /"+this.source+"/: "+t)},bt.prototype.at=function(t){var e=this.source,i=e.length;if(t>=i)return-1;var r=e.charCodeAt(t);return!this.switchU||r<=55295||r>=57344||t+1>=i?r:(r<<10)+e.charCodeAt(t+1)-56613888},bt.prototype.nextIndex=function(t){var e=this.source,i=e.length;if(t>=i)return i;var r=e.charCodeAt(t);return!this.switchU||r<=55295||r>=57344||t+1>=i?t+1:t+2},bt.prototype.current=function(){return this.at(this.pos)},bt.prototype.lookahead=function(){return this.at(this.nextIndex(this.pos))},bt.prototype.advance=function(){this.pos=this.nextIndex(this.pos)},bt.prototype.eat=function(t){return this.current()===t&&(this.advance(),!0)},vt.validateRegExpFlags=function(t){for(var e=t.validFlags,i=t.flags,r=0;r<i.length;r++){var n=i.charAt(r);-1===e.indexOf(n)&&this.raise(t.start,"Invalid regular expression flag"),i.indexOf(n,r+1)>-1&&this.raise(t.start,"Duplicate regular expression flag")}},vt.validateRegExpPattern=function(t){this.regexp_pattern(t),!t.switchN&&this.options.ecmaVersion>=9&&t.groupNames.length>0&&(t.switchN=!0,this.regexp_pattern(t))},vt.regexp_pattern=function(t){t.pos=0,t.lastIntValue=0,t.lastStringValue="",t.lastAssertionIsQuantifiable=!1,t.numCapturingParens=0,t.maxBackReference=0,t.groupNames.length=0,t.backReferenceNames.length=0,this.regexp_disjunction(t),t.pos!==t.source.length&&(t.eat(41)&&t.raise("Unmatched ')'"),(t.eat(93)||t.eat(125))&&t.raise("Lone quantifier brackets")),t.maxBackReference>t.numCapturingParens&&t.raise("Invalid escape");for(var e=0,i=t.backReferenceNames;e<i.length;e+=1){var r=i[e];-1===t.groupNames.indexOf(r)&&t.raise("Invalid named capture referenced")}},vt.regexp_disjunction=function(t){for(this.regexp_alternative(t);t.eat(124);)this.regexp_alternative(t);this.regexp_eatQuantifier(t,!0)&&t.raise("Nothing to repeat"),t.eat(123)&&t.raise("Lone quantifier brackets")},vt.regexp_alternative=function(t){for(;t.pos<t.source.length&&this.regexp_eatTerm(t););},vt.regexp_eatTerm=function(t){return this.regexp_eatAssertion(t)?(t.lastAssertionIsQuantifiable&&this.regexp_eatQuantifier(t)&&t.switchU&&t.raise("Invalid quantifier"),!0):!(t.switchU?!this.regexp_eatAtom(t):!this.regexp_eatExtendedAtom(t))&&(this.regexp_eatQuantifier(t),!0)},vt.regexp_eatAssertion=function(t){var e=t.pos;if(t.lastAssertionIsQuantifiable=!1,t.eat(94)||t.eat(36))return!0;if(t.eat(92)){if(t.eat(66)||t.eat(98))return!0;t.pos=e}if(t.eat(40)&&t.eat(63)){var i=!1;if(this.options.ecmaVersion>=9&&(i=t.eat(60)),t.eat(61)||t.eat(33))return this.regexp_disjunction(t),t.eat(41)||t.raise("Unterminated group"),t.lastAssertionIsQuantifiable=!i,!0}return t.pos=e,!1},vt.regexp_eatQuantifier=function(t,e){return void 0===e&&(e=!1),!!this.regexp_eatQuantifierPrefix(t,e)&&(t.eat(63),!0)},vt.regexp_eatQuantifierPrefix=function(t,e){return t.eat(42)||t.eat(43)||t.eat(63)||this.regexp_eatBracedQuantifier(t,e)},vt.regexp_eatBracedQuantifier=function(t,e){var i=t.pos;if(t.eat(123)){var r=0,n=-1;if(this.regexp_eatDecimalDigits(t)&&(r=t.lastIntValue,t.eat(44)&&this.regexp_eatDecimalDigits(t)&&(n=t.lastIntValue),t.eat(125)))return-1!==n&&n<r&&!e&&t.raise("numbers out of order in {} quantifier"),!0;t.switchU&&!e&&t.raise("Incomplete quantifier"),t.pos=i}return!1},vt.regexp_eatAtom=function(t){return this.regexp_eatPatternCharacters(t)||t.eat(46)||this.regexp_eatReverseSolidusAtomEscape(t)||this.regexp_eatCharacterClass(t)||this.regexp_eatUncapturingGroup(t)||this.regexp_eatCapturingGroup(t)},vt.regexp_eatReverseSolidusAtomEscape=function(t){var e=t.pos;if(t.eat(92)){if(this.regexp_eatAtomEscape(t))return!0;t.pos=e}return!1},vt.regexp_eatUncapturingGroup=function(t){var e=t.pos;if(t.eat(40)){if(t.eat(63)&&t.eat(58)){if(this.regexp_disjunction(t),t.eat(41))return!0;t.raise("Unterminated group")}t.pos=e}return!1},vt.regexp_eatCapturingGroup=function(t){if(t.eat(40)){if(this.options.ecmaVersion>=9?this.regexp_groupSpecifier(t):63===t.current()&&t.raise("Invalid group"),this.regexp_disjunction(t),t.eat(41))return t.numCapturingParens+=1,!0;t.raise("Unterminated group")}return!1},vt.regexp_eatExtendedAtom=function(t){return t.eat(46)||this.regexp_eatReverseSolidusAtomEscape(t)||this.regexp_eatCharacterClass(t)||this.regexp_eatUncapturingGroup(t)||this.regexp_eatCapturingGroup(t)||this.regexp_eatInvalidBracedQuantifier(t)||this.regexp_eatExtendedPatternCharacter(t)},vt.regexp_eatInvalidBracedQuantifier=function(t){return this.regexp_eatBracedQuantifier(t,!0)&&t.raise("Nothing to repeat"),!1},vt.regexp_eatSyntaxCharacter=function(t){var e=t.current();return!!_t(e)&&(t.lastIntValue=e,t.advance(),!0)},vt.regexp_eatPatternCharacters=function(t){for(var e=t.pos,i=0;-1!==(i=t.current())&&!_t(i);)t.advance();return t.pos!==e},vt.regexp_eatExtendedPatternCharacter=function(t){var e=t.current();return!(-1===e||36===e||e>=40&&e<=43||46===e||63===e||91===e||94===e||124===e||(t.advance(),0))},vt.regexp_groupSpecifier=function(t){if(t.eat(63)){if(this.regexp_eatGroupName(t))return-1!==t.groupNames.indexOf(t.lastStringValue)&&t.raise("Duplicate capture group name"),void t.groupNames.push(t.lastStringValue);t.raise("Invalid group")}},vt.regexp_eatGroupName=function(t){if(t.lastStringValue="",t.eat(60)){if(this.regexp_eatRegExpIdentifierName(t)&&t.eat(62))return!0;t.raise("Invalid capture group name")}return!1},vt.regexp_eatRegExpIdentifierName=function(t){if(t.lastStringValue="",this.regexp_eatRegExpIdentifierStart(t)){for(t.lastStringValue+=kt(t.lastIntValue);this.regexp_eatRegExpIdentifierPart(t);)t.lastStringValue+=kt(t.lastIntValue);return!0}return!1},vt.regexp_eatRegExpIdentifierStart=function(t){var e=t.pos,i=t.current();return t.advance(),92===i&&this.regexp_eatRegExpUnicodeEscapeSequence(t)&&(i=t.lastIntValue),function(t){return d(t,!0)||36===t||95===t}(i)?(t.lastIntValue=i,!0):(t.pos=e,!1)},vt.regexp_eatRegExpIdentifierPart=function(t){var e=t.pos,i=t.current();return t.advance(),92===i&&this.regexp_eatRegExpUnicodeEscapeSequence(t)&&(i=t.lastIntValue),function(t){return m(t,!0)||36===t||95===t||8204===t||8205===t}(i)?(t.lastIntValue=i,!0):(t.pos=e,!1)},vt.regexp_eatAtomEscape=function(t){return!!(this.regexp_eatBackReference(t)||this.regexp_eatCharacterClassEscape(t)||this.regexp_eatCharacterEscape(t)||t.switchN&&this.regexp_eatKGroupName(t))||(t.switchU&&(99===t.current()&&t.raise("Invalid unicode escape"),t.raise("Invalid escape")),!1)},vt.regexp_eatBackReference=function(t){var e=t.pos;if(this.regexp_eatDecimalEscape(t)){var i=t.lastIntValue;if(t.switchU)return i>t.maxBackReference&&(t.maxBackReference=i),!0;if(i<=t.numCapturingParens)return!0;t.pos=e}return!1},vt.regexp_eatKGroupName=function(t){if(t.eat(107)){if(this.regexp_eatGroupName(t))return t.backReferenceNames.push(t.lastStringValue),!0;t.raise("Invalid named reference")}return!1},vt.regexp_eatCharacterEscape=function(t){return this.regexp_eatControlEscape(t)||this.regexp_eatCControlLetter(t)||this.regexp_eatZero(t)||this.regexp_eatHexEscapeSequence(t)||this.regexp_eatRegExpUnicodeEscapeSequence(t)||!t.switchU&&this.regexp_eatLegacyOctalEscapeSequence(t)||this.regexp_eatIdentityEscape(t)},vt.regexp_eatCControlLetter=function(t){var e=t.pos;if(t.eat(99)){if(this.regexp_eatControlLetter(t))return!0;t.pos=e}return!1},vt.regexp_eatZero=function(t){return 48===t.current()&&!Et(t.lookahead())&&(t.lastIntValue=0,t.advance(),!0)},vt.regexp_eatControlEscape=function(t){var e=t.current();return 116===e?(t.lastIntValue=9,t.advance(),!0):110===e?(t.lastIntValue=10,t.advance(),!0):118===e?(t.lastIntValue=11,t.advance(),!0):102===e?(t.lastIntValue=12,t.advance(),!0):114===e&&(t.lastIntValue=13,t.advance(),!0)},vt.regexp_eatControlLetter=function(t){var e=t.current();return!!wt(e)&&(t.lastIntValue=e%32,t.advance(),!0)},vt.regexp_eatRegExpUnicodeEscapeSequence=function(t){var e,i=t.pos;if(t.eat(117)){if(this.regexp_eatFixedHexDigits(t,4)){var r=t.lastIntValue;if(t.switchU&&r>=55296&&r<=56319){var n=t.pos;if(t.eat(92)&&t.eat(117)&&this.regexp_eatFixedHexDigits(t,4)){var s=t.lastIntValue;if(s>=56320&&s<=57343)return t.lastIntValue=1024*(r-55296)+(s-56320)+65536,!0}t.pos=n,t.lastIntValue=r}return!0}if(t.switchU&&t.eat(123)&&this.regexp_eatHexDigits(t)&&t.eat(125)&&(e=t.lastIntValue)>=0&&e<=1114111)return!0;t.switchU&&t.raise("Invalid unicode escape"),t.pos=i}return!1},vt.regexp_eatIdentityEscape=function(t){if(t.switchU)return!!this.regexp_eatSyntaxCharacter(t)||!!t.eat(47)&&(t.lastIntValue=47,!0);var e=t.current();return!(99===e||t.switchN&&107===e||(t.lastIntValue=e,t.advance(),0))},vt.regexp_eatDecimalEscape=function(t){t.lastIntValue=0;var e=t.current();if(e>=49&&e<=57){do{t.lastIntValue=10*t.lastIntValue+(e-48),t.advance()}while((e=t.current())>=48&&e<=57);return!0}return!1},vt.regexp_eatCharacterClassEscape=function(t){var e=t.current();if(function(t){return 100===t||68===t||115===t||83===t||119===t||87===t}(e))return t.lastIntValue=-1,t.advance(),!0;if(t.switchU&&this.options.ecmaVersion>=9&&(80===e||112===e)){if(t.lastIntValue=-1,t.advance(),t.eat(123)&&this.regexp_eatUnicodePropertyValueExpression(t)&&t.eat(125))return!0;t.raise("Invalid property name")}return!1},vt.regexp_eatUnicodePropertyValueExpression=function(t){var e=t.pos;if(this.regexp_eatUnicodePropertyName(t)&&t.eat(61)){var i=t.lastStringValue;if(this.regexp_eatUnicodePropertyValue(t)){var r=t.lastStringValue;return this.regexp_validateUnicodePropertyNameAndValue(t,i,r),!0}}if(t.pos=e,this.regexp_eatLoneUnicodePropertyNameOrValue(t)){var n=t.lastStringValue;return this.regexp_validateUnicodePropertyNameOrValue(t,n),!0}return!1},vt.regexp_validateUnicodePropertyNameAndValue=function(t,e,i){O(t.unicodeProperties.nonBinary,e)||t.raise("Invalid property name"),t.unicodeProperties.nonBinary[e].test(i)||t.raise("Invalid property value")},vt.regexp_validateUnicodePropertyNameOrValue=function(t,e){t.unicodeProperties.binary.test(e)||t.raise("Invalid property name")},vt.regexp_eatUnicodePropertyName=function(t){var e=0;for(t.lastStringValue="";At(e=t.current());)t.lastStringValue+=kt(e),t.advance();return""!==t.lastStringValue},vt.regexp_eatUnicodePropertyValue=function(t){var e=0;for(t.lastStringValue="";St(e=t.current());)t.lastStringValue+=kt(e),t.advance();return""!==t.lastStringValue},vt.regexp_eatLoneUnicodePropertyNameOrValue=function(t){return this.regexp_eatUnicodePropertyValue(t)},vt.regexp_eatCharacterClass=function(t){if(t.eat(91)){if(t.eat(94),this.regexp_classRanges(t),t.eat(93))return!0;t.raise("Unterminated character class")}return!1},vt.regexp_classRanges=function(t){for(;this.regexp_eatClassAtom(t);){var e=t.lastIntValue;if(t.eat(45)&&this.regexp_eatClassAtom(t)){var i=t.lastIntValue;!t.switchU||-1!==e&&-1!==i||t.raise("Invalid character class"),-1!==e&&-1!==i&&e>i&&t.raise("Range out of order in character class")}}},vt.regexp_eatClassAtom=function(t){var e=t.pos;if(t.eat(92)){if(this.regexp_eatClassEscape(t))return!0;if(t.switchU){var i=t.current();(99===i||It(i))&&t.raise("Invalid class escape"),t.raise("Invalid escape")}t.pos=e}var r=t.current();return 93!==r&&(t.lastIntValue=r,t.advance(),!0)},vt.regexp_eatClassEscape=function(t){var e=t.pos;if(t.eat(98))return t.lastIntValue=8,!0;if(t.switchU&&t.eat(45))return t.lastIntValue=45,!0;if(!t.switchU&&t.eat(99)){if(this.regexp_eatClassControlLetter(t))return!0;t.pos=e}return this.regexp_eatCharacterClassEscape(t)||this.regexp_eatCharacterEscape(t)},vt.regexp_eatClassControlLetter=function(t){var e=t.current();return!(!Et(e)&&95!==e||(t.lastIntValue=e%32,t.advance(),0))},vt.regexp_eatHexEscapeSequence=function(t){var e=t.pos;if(t.eat(120)){if(this.regexp_eatFixedHexDigits(t,2))return!0;t.switchU&&t.raise("Invalid escape"),t.pos=e}return!1},vt.regexp_eatDecimalDigits=function(t){var e=t.pos,i=0;for(t.lastIntValue=0;Et(i=t.current());)t.lastIntValue=10*t.lastIntValue+(i-48),t.advance();return t.pos!==e},vt.regexp_eatHexDigits=function(t){var e=t.pos,i=0;for(t.lastIntValue=0;Ct(i=t.current());)t.lastIntValue=16*t.lastIntValue+Tt(i),t.advance();return t.pos!==e},vt.regexp_eatLegacyOctalEscapeSequence=function(t){if(this.regexp_eatOctalDigit(t)){var e=t.lastIntValue;if(this.regexp_eatOctalDigit(t)){var i=t.lastIntValue;e<=3&&this.regexp_eatOctalDigit(t)?t.lastIntValue=64*e+8*i+t.lastIntValue:t.lastIntValue=8*e+i}else t.lastIntValue=e;return!0}return!1},vt.regexp_eatOctalDigit=function(t){var e=t.current();return It(e)?(t.lastIntValue=e-48,t.advance(),!0):(t.lastIntValue=0,!1)},vt.regexp_eatFixedHexDigits=function(t,e){var i=t.pos;t.lastIntValue=0;for(var r=0;r<e;++r){var n=t.current();if(!Ct(n))return t.pos=i,!1;t.lastIntValue=16*t.lastIntValue+Tt(n),t.advance()}return!0};var Pt=function(t){this.type=t.type,this.value=t.value,this.start=t.start,this.end=t.end,t.options.locations&&(this.loc=new V(t,t.startLoc,t.endLoc)),t.options.ranges&&(this.range=[t.start,t.end])},Ot=G.prototype;function Lt(t){return t<=65535?String.fromCharCode(t):(t-=65536,String.fromCharCode(55296+(t>>10),56320+(1023&t)))}Ot.next=function(){this.options.onToken&&this.options.onToken(new Pt(this)),this.lastTokEnd=this.end,this.lastTokStart=this.start,this.lastTokEndLoc=this.endLoc,this.lastTokStartLoc=this.startLoc,this.nextToken()},Ot.getToken=function(){return this.next(),new Pt(this)},"undefined"!=typeof Symbol&&(Ot[Symbol.iterator]=function(){var t=this;return{next:function(){var e=t.getToken();return{done:e.type===_.eof,value:e}}}}),Ot.curContext=function(){return this.context[this.context.length-1]},Ot.nextToken=function(){var t=this.curContext();return t&&t.preserveSpace||this.skipSpace(),this.start=this.pos,this.options.locations&&(this.startLoc=this.curPosition()),this.pos>=this.input.length?this.finishToken(_.eof):t.override?t.override(this):void this.readToken(this.fullCharCodeAtPos())},Ot.readToken=function(t){return d(t,this.options.ecmaVersion>=6)||92===t?this.readWord():this.getTokenFromCode(t)},Ot.fullCharCodeAtPos=function(){var t=this.input.charCodeAt(this.pos);return t<=55295||t>=57344?t:(t<<10)+this.input.charCodeAt(this.pos+1)-56613888},Ot.skipBlockComment=function(){var t,e=this.options.onComment&&this.curPosition(),i=this.pos,r=this.input.indexOf("*/",this.pos+=2);if(-1===r&&this.raise(this.pos-2,"Unterminated comment"),this.pos=r+2,this.options.locations)for(A.lastIndex=i;(t=A.exec(this.input))&&t.index<this.pos;)++this.curLine,this.lineStart=t.index+t[0].length;this.options.onComment&&this.options.onComment(!0,this.input.slice(i+2,r),i,this.pos,e,this.curPosition())},Ot.skipLineComment=function(t){for(var e=this.pos,i=this.options.onComment&&this.curPosition(),r=this.input.charCodeAt(this.pos+=t);this.pos<this.input.length&&!S(r);)r=this.input.charCodeAt(++this.pos);this.options.onComment&&this.options.onComment(!1,this.input.slice(e+t,this.pos),e,this.pos,i,this.curPosition())},Ot.skipSpace=function(){t:for(;this.pos<this.input.length;){var t=this.input.charCodeAt(this.pos);switch(t){case 32:case 160:++this.pos;break;case 13:10===this.input.charCodeAt(this.pos+1)&&++this.pos;case 10:case 8232:case 8233:++this.pos,this.options.locations&&(++this.curLine,this.lineStart=this.pos);break;case 47:switch(this.input.charCodeAt(this.pos+1)){case 42:this.skipBlockComment();break;case 47:this.skipLineComment(2);break;default:break t}break;default:if(!(t>8&&t<14||t>=5760&&E.test(String.fromCharCode(t))))break t;++this.pos}}},Ot.finishToken=function(t,e){this.end=this.pos,this.options.locations&&(this.endLoc=this.curPosition());var i=this.type;this.type=t,this.value=e,this.updateContext(i)},Ot.readToken_dot=function(){var t=this.input.charCodeAt(this.pos+1);if(t>=48&&t<=57)return this.readNumber(!0);var e=this.input.charCodeAt(this.pos+2);return this.options.ecmaVersion>=6&&46===t&&46===e?(this.pos+=3,this.finishToken(_.ellipsis)):(++this.pos,this.finishToken(_.dot))},Ot.readToken_slash=function(){var t=this.input.charCodeAt(this.pos+1);return this.exprAllowed?(++this.pos,this.readRegexp()):61===t?this.finishOp(_.assign,2):this.finishOp(_.slash,1)},Ot.readToken_mult_modulo_exp=function(t){var e=this.input.charCodeAt(this.pos+1),i=1,r=42===t?_.star:_.modulo;return this.options.ecmaVersion>=7&&42===t&&42===e&&(++i,r=_.starstar,e=this.input.charCodeAt(this.pos+2)),61===e?this.finishOp(_.assign,i+1):this.finishOp(r,i)},Ot.readToken_pipe_amp=function(t){var e=this.input.charCodeAt(this.pos+1);return e===t?this.finishOp(124===t?_.logicalOR:_.logicalAND,2):61===e?this.finishOp(_.assign,2):this.finishOp(124===t?_.bitwiseOR:_.bitwiseAND,1)},Ot.readToken_caret=function(){return 61===this.input.charCodeAt(this.pos+1)?this.finishOp(_.assign,2):this.finishOp(_.bitwiseXOR,1)},Ot.readToken_plus_min=function(t){var e=this.input.charCodeAt(this.pos+1);return e===t?45!==e||this.inModule||62!==this.input.charCodeAt(this.pos+2)||0!==this.lastTokEnd&&!w.test(this.input.slice(this.lastTokEnd,this.pos))?this.finishOp(_.incDec,2):(this.skipLineComment(3),this.skipSpace(),this.nextToken()):61===e?this.finishOp(_.assign,2):this.finishOp(_.plusMin,1)},Ot.readToken_lt_gt=function(t){var e=this.input.charCodeAt(this.pos+1),i=1;return e===t?(i=62===t&&62===this.input.charCodeAt(this.pos+2)?3:2,61===this.input.charCodeAt(this.pos+i)?this.finishOp(_.assign,i+1):this.finishOp(_.bitShift,i)):33!==e||60!==t||this.inModule||45!==this.input.charCodeAt(this.pos+2)||45!==this.input.charCodeAt(this.pos+3)?(61===e&&(i=2),this.finishOp(_.relational,i)):(this.skipLineComment(4),this.skipSpace(),this.nextToken())},Ot.readToken_eq_excl=function(t){var e=this.input.charCodeAt(this.pos+1);return 61===e?this.finishOp(_.equality,61===this.input.charCodeAt(this.pos+2)?3:2):61===t&&62===e&&this.options.ecmaVersion>=6?(this.pos+=2,this.finishToken(_.arrow)):this.finishOp(61===t?_.eq:_.prefix,1)},Ot.getTokenFromCode=function(t){switch(t){case 46:return this.readToken_dot();case 40:return++this.pos,this.finishToken(_.parenL);case 41:return++this.pos,this.finishToken(_.parenR);case 59:return++this.pos,this.finishToken(_.semi);case 44:return++this.pos,this.finishToken(_.comma);case 91:return++this.pos,this.finishToken(_.bracketL);case 93:return++this.pos,this.finishToken(_.bracketR);case 123:return++this.pos,this.finishToken(_.braceL);case 125:return++this.pos,this.finishToken(_.braceR);case 58:return++this.pos,this.finishToken(_.colon);case 63:return++this.pos,this.finishToken(_.question);case 96:if(this.options.ecmaVersion<6)break;return++this.pos,this.finishToken(_.backQuote);case 48:var e=this.input.charCodeAt(this.pos+1);if(120===e||88===e)return this.readRadixNumber(16);if(this.options.ecmaVersion>=6){if(111===e||79===e)return this.readRadixNumber(8);if(98===e||66===e)return this.readRadixNumber(2)}case 49:case 50:case 51:case 52:case 53:case 54:case 55:case 56:case 57:return this.readNumber(!1);case 34:case 39:return this.readString(t);case 47:return this.readToken_slash();case 37:case 42:return this.readToken_mult_modulo_exp(t);case 124:case 38:return this.readToken_pipe_amp(t);case 94:return this.readToken_caret();case 43:case 45:return this.readToken_plus_min(t);case 60:case 62:return this.readToken_lt_gt(t);case 61:case 33:return this.readToken_eq_excl(t);case 126:return this.finishOp(_.prefix,1)}this.raise(this.pos,"Unexpected character '"+Lt(t)+"'")},Ot.finishOp=function(t,e){var i=this.input.slice(this.pos,this.pos+e);return this.pos+=e,this.finishToken(t,i)},Ot.readRegexp=function(){for(var t,e,i=this.pos;;){this.pos>=this.input.length&&this.raise(i,"Unterminated regular expression");var r=this.input.charAt(this.pos);if(w.test(r)&&this.raise(i,"Unterminated regular expression"),t)t=!1;else{if("["===r)e=!0;else if("]"===r&&e)e=!1;else if("/"===r&&!e)break;t="\\"===r}++this.pos}var n=this.input.slice(i,this.pos);++this.pos;var s=this.pos,a=this.readWord1();this.containsEsc&&this.unexpected(s);var o=this.regexpState||(this.regexpState=new bt(this));o.reset(i,n,a),this.validateRegExpFlags(o),this.validateRegExpPattern(o);var c=null;try{c=new RegExp(n,a)}catch(t){}return this.finishToken(_.regexp,{pattern:n,flags:a,value:c})},Ot.readInt=function(t,e){for(var i=this.pos,r=0,n=0,s=null==e?1/0:e;n<s;++n){var a,o=this.input.charCodeAt(this.pos);if((a=o>=97?o-97+10:o>=65?o-65+10:o>=48&&o<=57?o-48:1/0)>=t)break;++this.pos,r=r*t+a}return this.pos===i||null!=e&&this.pos-i!==e?null:r},Ot.readRadixNumber=function(t){var e=this.pos;this.pos+=2;var i=this.readInt(t);return null==i&&this.raise(this.start+2,"Expected number in radix "+t),this.options.ecmaVersion>=11&&110===this.input.charCodeAt(this.pos)?(i="undefined"!=typeof BigInt?BigInt(this.input.slice(e,this.pos)):null,++this.pos):d(this.fullCharCodeAtPos())&&this.raise(this.pos,"Identifier directly after number"),this.finishToken(_.num,i)},Ot.readNumber=function(t){var e=this.pos;t||null!==this.readInt(10)||this.raise(e,"Invalid number");var i=this.pos-e>=2&&48===this.input.charCodeAt(e);i&&this.strict&&this.raise(e,"Invalid number"),i&&/[89]/.test(this.input.slice(e,this.pos))&&(i=!1);var r=this.input.charCodeAt(this.pos);if(!i&&!t&&this.options.ecmaVersion>=11&&110===r){var n=this.input.slice(e,this.pos),s="undefined"!=typeof BigInt?BigInt(n):null;return++this.pos,d(this.fullCharCodeAtPos())&&this.raise(this.pos,"Identifier directly after number"),this.finishToken(_.num,s)}46!==r||i||(++this.pos,this.readInt(10),r=this.input.charCodeAt(this.pos)),69!==r&&101!==r||i||(43!==(r=this.input.charCodeAt(++this.pos))&&45!==r||++this.pos,null===this.readInt(10)&&this.raise(e,"Invalid number")),d(this.fullCharCodeAtPos())&&this.raise(this.pos,"Identifier directly after number");var a=this.input.slice(e,this.pos),o=i?parseInt(a,8):parseFloat(a);return this.finishToken(_.num,o)},Ot.readCodePoint=function(){var t;if(123===this.input.charCodeAt(this.pos)){this.options.ecmaVersion<6&&this.unexpected();var e=++this.pos;t=this.readHexChar(this.input.indexOf("}",this.pos)-this.pos),++this.pos,t>1114111&&this.invalidStringToken(e,"Code point out of bounds")}else t=this.readHexChar(4);return t},Ot.readString=function(t){for(var e="",i=++this.pos;;){this.pos>=this.input.length&&this.raise(this.start,"Unterminated string constant");var r=this.input.charCodeAt(this.pos);if(r===t)break;92===r?(e+=this.input.slice(i,this.pos),e+=this.readEscapedChar(!1),i=this.pos):(S(r,this.options.ecmaVersion>=10)&&this.raise(this.start,"Unterminated string constant"),++this.pos)}return e+=this.input.slice(i,this.pos++),this.finishToken(_.string,e)};var Nt={};Ot.tryReadTemplateToken=function(){this.inTemplateElement=!0;try{this.readTmplToken()}catch(t){if(t!==Nt)throw t;this.readInvalidTemplateToken()}this.inTemplateElement=!1},Ot.invalidStringToken=function(t,e){if(this.inTemplateElement&&this.options.ecmaVersion>=9)throw Nt;this.raise(t,e)},Ot.readTmplToken=function(){for(var t="",e=this.pos;;){this.pos>=this.input.length&&this.raise(this.start,"Unterminated template");var i=this.input.charCodeAt(this.pos);if(96===i||36===i&&123===this.input.charCodeAt(this.pos+1))return this.pos!==this.start||this.type!==_.template&&this.type!==_.invalidTemplate?(t+=this.input.slice(e,this.pos),this.finishToken(_.template,t)):36===i?(this.pos+=2,this.finishToken(_.dollarBraceL)):(++this.pos,this.finishToken(_.backQuote));if(92===i)t+=this.input.slice(e,this.pos),t+=this.readEscapedChar(!0),e=this.pos;else if(S(i)){switch(t+=this.input.slice(e,this.pos),++this.pos,i){case 13:10===this.input.charCodeAt(this.pos)&&++this.pos;case 10:t+="\n";break;default:t+=String.fromCharCode(i)}this.options.locations&&(++this.curLine,this.lineStart=this.pos),e=this.pos}else++this.pos}},Ot.readInvalidTemplateToken=function(){for(;this.pos<this.input.length;this.pos++)switch(this.input[this.pos]){case"\\":++this.pos;break;case"$":if("{"!==this.input[this.pos+1])break;case"`":return this.finishToken(_.invalidTemplate,this.input.slice(this.start,this.pos))}this.raise(this.start,"Unterminated template")},Ot.readEscapedChar=function(t){var e=this.input.charCodeAt(++this.pos);switch(++this.pos,e){case 110:return"\n";case 114:return"\r";case 120:return String.fromCharCode(this.readHexChar(2));case 117:return Lt(this.readCodePoint());case 116:return"\t";case 98:return"\b";case 118:return"\v";case 102:return"\f";case 13:10===this.input.charCodeAt(this.pos)&&++this.pos;case 10:return this.options.locations&&(this.lineStart=this.pos,++this.curLine),"";default:if(e>=48&&e<=55){var i=this.input.substr(this.pos-1,3).match(/^[0-7]+/)[0],r=parseInt(i,8);return r>255&&(i=i.slice(0,-1),r=parseInt(i,8)),this.pos+=i.length-1,e=this.input.charCodeAt(this.pos),"0"===i&&56!==e&&57!==e||!this.strict&&!t||this.invalidStringToken(this.pos-1-i.length,t?"Octal literal in template string":"Octal literal in strict mode"),String.fromCharCode(r)}return S(e)?"":String.fromCharCode(e)}},Ot.readHexChar=function(t){var e=this.pos,i=this.readInt(16,t);return null===i&&this.invalidStringToken(e,"Bad character escape sequence"),i},Ot.readWord1=function(){this.containsEsc=!1;for(var t="",e=!0,i=this.pos,r=this.options.ecmaVersion>=6;this.pos<this.input.length;){var n=this.fullCharCodeAtPos();if(m(n,r))this.pos+=n<=65535?1:2;else{if(92!==n)break;this.containsEsc=!0,t+=this.input.slice(i,this.pos);var s=this.pos;117!==this.input.charCodeAt(++this.pos)&&this.invalidStringToken(this.pos,"Expecting Unicode escape sequence \\uXXXX"),++this.pos;var a=this.readCodePoint();(e?d:m)(a,r)||this.invalidStringToken(s,"Invalid Unicode escape"),t+=Lt(a),i=this.pos}e=!1}return t+this.input.slice(i,this.pos)},Ot.readWord=function(){var t=this.readWord1(),e=_.name;return this.keywords.test(t)&&(this.containsEsc&&this.raiseRecoverable(this.start,"Escape sequence in keyword "+t),e=b[t]),this.finishToken(e,t)};var jt="7.1.0";function Vt(t,e){return G.parse(t,e)}function Mt(t,e,i){return G.parseExpressionAt(t,e,i)}function Bt(t,e){return G.tokenizer(t,e)}G.acorn={Parser:G,version:jt,defaultOptions:B,Position:j,SourceLocation:V,getLineInfo:M,Node:at,TokenType:g,tokTypes:_,keywordTypes:b,TokContext:ht,tokContexts:ut,isIdentifierChar:m,isIdentifierStart:d,Token:Pt,isNewLine:S,lineBreak:w,lineBreakG:A,nonASCIIwhitespace:E}},function(t,e,i){"use strict";var r=i(3),n=/^[\da-fA-F]+$/,s=/^\d+$/,a=new WeakMap;function p(t){t=t.Parser.acorn||t;var e=a.get(t);if(!e){var i=t.tokTypes,r=t.TokContext,n=t.TokenType,s=new r("<tag",!1),o=new r("</tag",!1),c=new r("<tag>...</tag>",!0,!0),h={tc_oTag:s,tc_cTag:o,tc_expr:c},u={jsxName:new n("jsxName"),jsxText:new n("jsxText",{beforeExpr:!0}),jsxTagStart:new n("jsxTagStart"),jsxTagEnd:new n("jsxTagEnd")};u.jsxTagStart.updateContext=function(){this.context.push(c),this.context.push(s),this.exprAllowed=!1},u.jsxTagEnd.updateContext=function(t){var e=this.context.pop();e===s&&t===i.slash||e===o?(this.context.pop(),this.exprAllowed=this.curContext()===c):this.exprAllowed=!0},e={tokContexts:h,tokTypes:u},a.set(t,e)}return e}function f(t){return t?"JSXIdentifier"===t.type?t.name:"JSXNamespacedName"===t.type?t.namespace.name+":"+t.name.name:"JSXMemberExpression"===t.type?f(t.object)+"."+f(t.property):void 0:t}t.exports=function(t){return t=t||{},function(e){return function(t,e){var a=e.acorn||i(1),d=p(a),m=a.tokTypes,g=d.tokTypes,x=a.tokContexts,y=d.tokContexts.tc_oTag,v=d.tokContexts.tc_cTag,b=d.tokContexts.tc_expr,k=a.isNewLine,_=a.isIdentifierStart,w=a.isIdentifierChar;return(function(e){function i(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,i),c(this,u(i).apply(this,arguments))}var a,p,A;return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),e&&l(t,e)}(i,e),a=i,A=[{key:"acornJsx",get:function(){return d}}],(p=[{key:"jsx_readToken",value:function(){for(var t="",e=this.pos;;){this.pos>=this.input.length&&this.raise(this.start,"Unterminated JSX contents");var i=this.input.charCodeAt(this.pos);switch(i){case 60:case 123:return this.pos===this.start?60===i&&this.exprAllowed?(++this.pos,this.finishToken(g.jsxTagStart)):this.getTokenFromCode(i):(t+=this.input.slice(e,this.pos),this.finishToken(g.jsxText,t));case 38:t+=this.input.slice(e,this.pos),t+=this.jsx_readEntity(),e=this.pos;break;default:k(i)?(t+=this.input.slice(e,this.pos),t+=this.jsx_readNewLine(!0),e=this.pos):++this.pos}}}},{key:"jsx_readNewLine",value:function(t){var e,i=this.input.charCodeAt(this.pos);return++this.pos,13===i&&10===this.input.charCodeAt(this.pos)?(++this.pos,e=t?"\n":"\r\n"):e=String.fromCharCode(i),this.options.locations&&(++this.curLine,this.lineStart=this.pos),e}},{key:"jsx_readString",value:function(t){for(var e="",i=++this.pos;;){this.pos>=this.input.length&&this.raise(this.start,"Unterminated string constant");var r=this.input.charCodeAt(this.pos);if(r===t)break;38===r?(e+=this.input.slice(i,this.pos),e+=this.jsx_readEntity(),i=this.pos):k(r)?(e+=this.input.slice(i,this.pos),e+=this.jsx_readNewLine(!1),i=this.pos):++this.pos}return e+=this.input.slice(i,this.pos++),this.finishToken(m.string,e)}},{key:"jsx_readEntity",value:function(){var t,e="",i=0,a=this.input[this.pos];"&"!==a&&this.raise(this.pos,"Entity must start with an ampersand");for(var o=++this.pos;this.pos<this.input.length&&i++<10;){if(";"===(a=this.input[this.pos++])){"#"===e[0]?"x"===e[1]?(e=e.substr(2),n.test(e)&&(t=String.fromCharCode(parseInt(e,16)))):(e=e.substr(1),s.test(e)&&(t=String.fromCharCode(parseInt(e,10)))):t=r[e];break}e+=a}return t||(this.pos=o,"&")}},{key:"jsx_readWord",value:function(){var t,e=this.pos;do{t=this.input.charCodeAt(++this.pos)}while(w(t)||45===t);return this.finishToken(g.jsxName,this.input.slice(e,this.pos))}},{key:"jsx_parseIdentifier",value:function(){var t=this.startNode();return this.type===g.jsxName?t.name=this.value:this.type.keyword?t.name=this.type.keyword:this.unexpected(),this.next(),this.finishNode(t,"JSXIdentifier")}},{key:"jsx_parseNamespacedName",value:function(){var e=this.start,i=this.startLoc,r=this.jsx_parseIdentifier();if(!t.allowNamespaces||!this.eat(m.colon))return r;var n=this.startNodeAt(e,i);return n.namespace=r,n.name=this.jsx_parseIdentifier(),this.finishNode(n,"JSXNamespacedName")}},{key:"jsx_parseElementName",value:function(){if(this.type===g.jsxTagEnd)return"";var e=this.start,i=this.startLoc,r=this.jsx_parseNamespacedName();for(this.type!==m.dot||"JSXNamespacedName"!==r.type||t.allowNamespacedObjects||this.unexpected();this.eat(m.dot);){var n=this.startNodeAt(e,i);n.object=r,n.property=this.jsx_parseIdentifier(),r=this.finishNode(n,"JSXMemberExpression")}return r}},{key:"jsx_parseAttributeValue",value:function(){switch(this.type){case m.braceL:var t=this.jsx_parseExpressionContainer();return"JSXEmptyExpression"===t.expression.type&&this.raise(t.start,"JSX attributes must only be assigned a non-empty expression"),t;case g.jsxTagStart:case m.string:return this.parseExprAtom();default:this.raise(this.start,"JSX value should be either an expression or a quoted JSX text")}}},{key:"jsx_parseEmptyExpression",value:function(){var t=this.startNodeAt(this.lastTokEnd,this.lastTokEndLoc);return this.finishNodeAt(t,"JSXEmptyExpression",this.start,this.startLoc)}},{key:"jsx_parseExpressionContainer",value:function(){var t=this.startNode();return this.next(),t.expression=this.type===m.braceR?this.jsx_parseEmptyExpression():this.parseExpression(),this.expect(m.braceR),this.finishNode(t,"JSXExpressionContainer")}},{key:"jsx_parseAttribute",value:function(){var t=this.startNode();return this.eat(m.braceL)?(this.expect(m.ellipsis),t.argument=this.parseMaybeAssign(),this.expect(m.braceR),this.finishNode(t,"JSXSpreadAttribute")):(t.name=this.jsx_parseNamespacedName(),t.value=this.eat(m.eq)?this.jsx_parseAttributeValue():null,this.finishNode(t,"JSXAttribute"))}},{key:"jsx_parseOpeningElementAt",value:function(t,e){var i=this.startNodeAt(t,e);i.attributes=[];var r=this.jsx_parseElementName();for(r&&(i.name=r);this.type!==m.slash&&this.type!==g.jsxTagEnd;)i.attributes.push(this.jsx_parseAttribute());return i.selfClosing=this.eat(m.slash),this.expect(g.jsxTagEnd),this.finishNode(i,r?"JSXOpeningElement":"JSXOpeningFragment")}},{key:"jsx_parseClosingElementAt",value:function(t,e){var i=this.startNodeAt(t,e),r=this.jsx_parseElementName();return r&&(i.name=r),this.expect(g.jsxTagEnd),this.finishNode(i,r?"JSXClosingElement":"JSXClosingFragment")}},{key:"jsx_parseElementAt",value:function(t,e){var i=this.startNodeAt(t,e),r=[],n=this.jsx_parseOpeningElementAt(t,e),s=null;if(!n.selfClosing){t:for(;;)switch(this.type){case g.jsxTagStart:if(t=this.start,e=this.startLoc,this.next(),this.eat(m.slash)){s=this.jsx_parseClosingElementAt(t,e);break t}r.push(this.jsx_parseElementAt(t,e));break;case g.jsxText:r.push(this.parseExprAtom());break;case m.braceL:r.push(this.jsx_parseExpressionContainer());break;default:this.unexpected()}f(s.name)!==f(n.name)&&this.raise(s.start,"Expected corresponding JSX closing tag for <"+f(n.name)+">")}var a=n.name?"Element":"Fragment";return i["opening"+a]=n,i["closing"+a]=s,i.children=r,this.type===m.relational&&"<"===this.value&&this.raise(this.start,"Adjacent JSX elements must be wrapped in an enclosing tag"),this.finishNode(i,"JSX"+a)}},{key:"jsx_parseText",value:function(t){var e=this.parseLiteral(t);return e.type="JSXText",e}},{key:"jsx_parseElement",value:function(){var t=this.start,e=this.startLoc;return this.next(),this.jsx_parseElementAt(t,e)}},{key:"parseExprAtom",value:function(t){return this.type===g.jsxText?this.jsx_parseText(this.value):this.type===g.jsxTagStart?this.jsx_parseElement():h(u(i.prototype),"parseExprAtom",this).call(this,t)}},{key:"readToken",value:function(t){var e=this.curContext();if(e===b)return this.jsx_readToken();if(e===y||e===v){if(_(t))return this.jsx_readWord();if(62==t)return++this.pos,this.finishToken(g.jsxTagEnd);if((34===t||39===t)&&e==y)return this.jsx_readString(t)}return 60===t&&this.exprAllowed&&33!==this.input.charCodeAt(this.pos+1)?(++this.pos,this.finishToken(g.jsxTagStart)):h(u(i.prototype),"readToken",this).call(this,t)}},{key:"updateContext",value:function(t){if(this.type==m.braceL){var e=this.curContext();e==y?this.context.push(x.b_expr):e==b?this.context.push(x.b_tmpl):h(u(i.prototype),"updateContext",this).call(this,t),this.exprAllowed=!0}else{if(this.type!==m.slash||t!==g.jsxTagStart)return h(u(i.prototype),"updateContext",this).call(this,t);this.context.length-=2,this.context.push(v),this.exprAllowed=!1}}}])&&o(a.prototype,p),A&&o(a,A),i}(e))}({allowNamespaces:!1!==t.allowNamespaces,allowNamespacedObjects:!!t.allowNamespacedObjects},e)}},Object.defineProperty(t.exports,"tokTypes",{get:function(){return p(i(1)).tokTypes},configurable:!0,enumerable:!0})},function(t,e){t.exports={quot:'"',amp:"&",apos:"'",lt:"<",gt:">",nbsp:" ",iexcl:"¡",cent:"¢",pound:"£",curren:"¤",yen:"¥",brvbar:"¦",sect:"§",uml:"¨",copy:"©",ordf:"ª",laquo:"«",not:"¬",shy:"­",reg:"®",macr:"¯",deg:"°",plusmn:"±",sup2:"²",sup3:"³",acute:"´",micro:"µ",para:"¶",middot:"·",cedil:"¸",sup1:"¹",ordm:"º",raquo:"»",frac14:"¼",frac12:"½",frac34:"¾",iquest:"¿",Agrave:"À",Aacute:"Á",Acirc:"Â",Atilde:"Ã",Auml:"Ä",Aring:"Å",AElig:"Æ",Ccedil:"Ç",Egrave:"È",Eacute:"É",Ecirc:"Ê",Euml:"Ë",Igrave:"Ì",Iacute:"Í",Icirc:"Î",Iuml:"Ï",ETH:"Ð",Ntilde:"Ñ",Ograve:"Ò",Oacute:"Ó",Ocirc:"Ô",Otilde:"Õ",Ouml:"Ö",times:"×",Oslash:"Ø",Ugrave:"Ù",Uacute:"Ú",Ucirc:"Û",Uuml:"Ü",Yacute:"Ý",THORN:"Þ",szlig:"ß",agrave:"à",aacute:"á",acirc:"â",atilde:"ã",auml:"ä",aring:"å",aelig:"æ",ccedil:"ç",egrave:"è",eacute:"é",ecirc:"ê",euml:"ë",igrave:"ì",iacute:"í",icirc:"î",iuml:"ï",eth:"ð",ntilde:"ñ",ograve:"ò",oacute:"ó",ocirc:"ô",otilde:"õ",ouml:"ö",divide:"÷",oslash:"ø",ugrave:"ù",uacute:"ú",ucirc:"û",uuml:"ü",yacute:"ý",thorn:"þ",yuml:"ÿ",OElig:"Œ",oelig:"œ",Scaron:"Š",scaron:"š",Yuml:"Ÿ",fnof:"ƒ",circ:"ˆ",tilde:"˜",Alpha:"Α",Beta:"Β",Gamma:"Γ",Delta:"Δ",Epsilon:"Ε",Zeta:"Ζ",Eta:"Η",Theta:"Θ",Iota:"Ι",Kappa:"Κ",Lambda:"Λ",Mu:"Μ",Nu:"Ν",Xi:"Ξ",Omicron:"Ο",Pi:"Π",Rho:"Ρ",Sigma:"Σ",Tau:"Τ",Upsilon:"Υ",Phi:"Φ",Chi:"Χ",Psi:"Ψ",Omega:"Ω",alpha:"α",beta:"β",gamma:"γ",delta:"δ",epsilon:"ε",zeta:"ζ",eta:"η",theta:"θ",iota:"ι",kappa:"κ",lambda:"λ",mu:"μ",nu:"ν",xi:"ξ",omicron:"ο",pi:"π",rho:"ρ",sigmaf:"ς",sigma:"σ",tau:"τ",upsilon:"υ",phi:"φ",chi:"χ",psi:"ψ",omega:"ω",thetasym:"ϑ",upsih:"ϒ",piv:"ϖ",ensp:" ",emsp:" ",thinsp:" ",zwnj:"‌",zwj:"‍",lrm:"‎",rlm:"‏",ndash:"–",mdash:"—",lsquo:"‘",rsquo:"’",sbquo:"‚",ldquo:"“",rdquo:"”",bdquo:"„",dagger:"†",Dagger:"‡",bull:"•",hellip:"…",permil:"‰",prime:"′",Prime:"″",lsaquo:"‹",rsaquo:"›",oline:"‾",frasl:"⁄",euro:"€",image:"ℑ",weierp:"℘",real:"ℜ",trade:"™",alefsym:"ℵ",larr:"←",uarr:"↑",rarr:"→",darr:"↓",harr:"↔",crarr:"↵",lArr:"⇐",uArr:"⇑",rArr:"⇒",dArr:"⇓",hArr:"⇔",forall:"∀",part:"∂",exist:"∃",empty:"∅",nabla:"∇",isin:"∈",notin:"∉",ni:"∋",prod:"∏",sum:"∑",minus:"−",lowast:"∗",radic:"√",prop:"∝",infin:"∞",ang:"∠",and:"∧",or:"∨",cap:"∩",cup:"∪",int:"∫",there4:"∴",sim:"∼",cong:"≅",asymp:"≈",ne:"≠",equiv:"≡",le:"≤",ge:"≥",sub:"⊂",sup:"⊃",nsub:"⊄",sube:"⊆",supe:"⊇",oplus:"⊕",otimes:"⊗",perp:"⊥",sdot:"⋅",lceil:"⌈",rceil:"⌉",lfloor:"⌊",rfloor:"⌋",lang:"〈",rang:"〉",loz:"◊",spades:"♠",clubs:"♣",hearts:"♥",diams:"♦"}},function(t,e,i){"use strict";i.r(e);var r=i(1),n=i(2),s=i.n(n),a=i(0),o=i.n(a),c={class:"className",for:"htmlFor",maxlength:"maxLength",colspan:"colSpan",rowspan:"rowSpan"},h=["area","base","br","col","embed","hr","img","input","keygen","link","menuitem","meta","param","source","track","wbr"],u=["table","tbody","tfoot","thead","tr"],l=function(){return function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"",e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:16,i=String(t),r=0;return i.split("").forEach((function(t){r=(r<<5)-r+t.charCodeAt(0),r&=r})),Math.abs(r).toString(e)}(Math.random().toString())};function f(t,e){var i=Object.keys(t);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(t);e&&(r=r.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),i.push.apply(i,r)}return i}function d(t,e,i){return e in t?Object.defineProperty(t,e,{value:i,enumerable:!0,configurable:!0,writable:!0}):t[e]=i,t}function m(t){return(m="function"==typeof Symbol&&"symbol"==p(Symbol.iterator)?function(t){return p(t)}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":p(t)})(t)}function g(t){switch(m(t)){case"string":return t.split(";").filter((function(t){return t})).reduce((function(t,e){var i=e.slice(0,e.indexOf(":")).trim(),r=e.slice(e.indexOf(":")+1).trim();return function(t){for(var e=1;e<arguments.length;e++){var i=null!=arguments[e]?arguments[e]:{};e%2?f(i,!0).forEach((function(e){d(t,e,i[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(i)):f(i).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(i,e))}))}return t}({},t,d({},i.replace(/([A-Z])([A-Z])/g,"$1 $2").replace(/([a-z])([A-Z])/g,"$1 $2").replace(/[^a-zA-Z\u00C0-\u00ff]/g," ").toLowerCase().split(" ").filter((function(t){return t})).map((function(t,e){return e>0?t[0].toUpperCase()+t.slice(1):t})).join(""),r))}),{});case"object":return t;default:return}}var x=function(t,e){return function t(e,i){var r=function(t){return function(t){if(Array.isArray(t))return t}(t)||function(t){if(Symbol.iterator in Object(t)||"[object Arguments]"===Object.prototype.toString.call(t))return Array.from(t)}(t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}(i),n=r[0],s=r.slice(1);if(null!=e&&null!=n)return 0===s.length?e[n]:t(e[n],s)}(t,function(t){return null==t||""===t?[]:t.split(".")}(e))};function y(t){return(y="function"==typeof Symbol&&"symbol"==p(Symbol.iterator)?function(t){return p(t)}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":p(t)})(t)}function v(t){return(v=Object.setPrototypeOf?Object.getPrototypeOf:function(t){return t.__proto__||Object.getPrototypeOf(t)})(t)}function b(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}function k(t,e){return(k=Object.setPrototypeOf||function(t,e){return t.__proto__=e,t})(t,e)}function _(t,e,i){return e in t?Object.defineProperty(t,e,{value:i,enumerable:!0,configurable:!0,writable:!0}):t[e]=i,t}i.d(e,"default",(function(){return A}));var w=r.Parser.extend(s()()),A=function(t){function e(){var t,i,r;!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);for(var n=arguments.length,s=new Array(n),p=0;p<n;p++)s[p]=arguments[p];return r=(t=v(e)).call.apply(t,[this].concat(s)),i=!r||"object"!==y(r)&&"function"!=typeof r?b(this):r,_(b(i),"parseJSX",(function(t){var e="<root>".concat(t,"</root>"),r=[];try{r=(r=w.parse(e)).body[0].expression.children||[]}catch(t){return i.props.showWarnings&&console.warn(t),i.props.onError&&i.props.onError(t),i.props.renderError?i.props.renderError({error:String(t)}):[]}return r.map(i.parseExpression).filter(Boolean)})),_(b(i),"parseExpression",(function(t){switch(t.type){case"JSXAttribute":return null===t.value||i.parseExpression(t.value);case"JSXElement":return i.parseElement(t);case"JSXExpressionContainer":return i.parseExpression(t.expression);case"JSXText":var e=i.props.disableKeyGeneration?void 0:l();return i.props.disableFragments?t.value:o.a.createElement(a.Fragment,{key:e},t.value);case"ArrayExpression":return t.elements.map(i.parseExpression);case"BinaryExpression":switch(t.operator){case"-":return i.parseExpression(t.left)-i.parseExpression(t.right);case"!=":return i.parseExpression(t.left)!=i.parseExpression(t.right);case"!==":return i.parseExpression(t.left)!==i.parseExpression(t.right);case"*":return i.parseExpression(t.left)*i.parseExpression(t.right);case"**":return Math.pow(i.parseExpression(t.left),i.parseExpression(t.right));case"/":return i.parseExpression(t.left)/i.parseExpression(t.right);case"%":return i.parseExpression(t.left)%i.parseExpression(t.right);case"+":return i.parseExpression(t.left)+i.parseExpression(t.right);case"==":return i.parseExpression(t.left)==i.parseExpression(t.right);case"===":return i.parseExpression(t.left)===i.parseExpression(t.right)}return;case"CallExpression":var r=i.parseExpression(t.callee);return void 0===r?void i.props.onError(new Error("The expression '".concat(t.callee,"' could not be resolved, resulting in an undefined return value."))):r.apply(void 0,function(t){return function(t){if(Array.isArray(t)){for(var e=0,i=new Array(t.length);e<t.length;e++)i[e]=t[e];return i}}(t)||function(t){if(Symbol.iterator in Object(t)||"[object Arguments]"===Object.prototype.toString.call(t))return Array.from(t)}(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}(t.arguments.map(i.parseExpression)));case"ConditionalExpression":return i.parseExpression(t.test)?i.parseExpression(t.consequent):i.parseExpression(t.alternate);case"Identifier":return(i.props.bindings||{})[t.name];case"Literal":return t.value;case"LogicalExpression":var n=i.parseExpression(t.left);return"||"===t.operator&&n?n:!!("&&"===t.operator&&n||"||"===t.operator&&!n)&&i.parseExpression(t.right);case"MemberExpression":var s=i.parseExpression(t.object)||{},c=s[t.property.name];return"function"==typeof c?c.bind(s):c;case"ObjectExpression":var h={};return t.properties.forEach((function(t){h[t.key.name||t.key.value]=i.parseExpression(t.value)})),h;case"UnaryExpression":switch(t.operator){case"+":return t.argument.value;case"-":return-1*t.argument.value;case"!":return!t.argument.value}return}})),_(b(i),"parseName",(function(t){switch(t.type){case"JSXIdentifier":return t.name;case"JSXMemberExpression":return"".concat(i.parseName(t.object),".").concat(i.parseName(t.property))}})),_(b(i),"parseElement",(function(t){var e=i.props,r=e.allowUnknownElements,n=e.components,s=void 0===n?{}:n,a=e.componentsOnly,p=e.onError,f=t.children,d=void 0===f?[]:f,m=t.openingElement,v=m.attributes,b=void 0===v?[]:v,k=i.parseName(m.name);if(k){var _=(i.props.blacklistedAttrs||[]).map((function(t){return t instanceof RegExp?t:new RegExp(t,"i")})),w=(i.props.blacklistedTags||[]).map((function(t){return t.trim().toLowerCase()})).filter(Boolean);if(/^(html|head|body)$/i.test(k))return d.map((function(t){return i.parseElement(t)}));var A=k.trim().toLowerCase();if(-1===w.indexOf(A)){if(!x(s,k)){if(a)return void p(new Error("The componenet <".concat(k,"> is unrecognized, and will not be rendered.")));if(!r&&document.createElement(k)instanceof HTMLUnknownElement)return void p(new Error("The tag <".concat(k,"> is unrecognized in this browser, and will not be rendered.")))}var S,E=x(s,k);(E||function(t){return-1===h.indexOf(t.toLowerCase())}(k))&&(S=d.map(i.parseExpression),E||function(t){return-1!==u.indexOf(t.toLowerCase())}(k)||(S=S.filter((function(t){return"string"!=typeof t||!/^\s*$/.test(t)}))),0===S.length?S=void 0:1===S.length&&(S=function(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){if(Symbol.iterator in Object(t)||"[object Arguments]"===Object.prototype.toString.call(t)){var i=[],r=!0,n=!1,s=void 0;try{for(var a,o=t[Symbol.iterator]();!(r=(a=o.next()).done)&&(i.push(a.value),!e||i.length!==e);r=!0);}catch(t){n=!0,s=t}finally{try{r||null==o.return||o.return()}finally{if(n)throw s}}return i}}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}(S,1)[0]));var C={key:i.props.disableKeyGeneration?void 0:l()};return b.forEach((function(t){if("JSXAttribute"===t.type){var e=t.name.name,r=c[e]||e,n=i.parseExpression(t);0===_.filter((function(t){return t.test(r)})).length&&(C[r]="true"===n||"false"===n?"true"===n:n)}else if("JSXSpreadAttribute"===t.type&&"Identifier"===t.argument.type||"MemberExpression"===t.argument.type){var s=i.parseExpression(t.argument);"object"===y(s)&&Object.keys(s).forEach((function(t){var e=c[t]||t;0===_.filter((function(t){return t.test(e)})).length&&(C[e]=s[t])}))}})),"string"==typeof C.style&&(C.style=g(C.style)),S&&(C.children=S),o.a.createElement(E||k.toLowerCase(),C)}p(new Error("The tag <".concat(k,"> is blacklisted, and will not be rendered.")))}else p(new Error("The <".concat(m.name,"> tag could not be parsed, and will not be rendered.")))})),_(b(i),"render",(function(){var t=(i.props.jsx||"").trim().replace(/<!DOCTYPE([^>]*)>/g,"");return i.ParsedChildren=i.parseJSX(t),i.props.renderInWrapper?o.a.createElement("div",{className:"jsx-parser"},i.ParsedChildren):o.a.createElement(o.a.Fragment,null,i.ParsedChildren)})),i}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),e&&k(t,e)}(e,t),e}(a.Component);_(A,"displayName","JsxParser"),_(A,"defaultProps",{allowUnknownElements:!0,bindings:{},blacklistedAttrs:[/^on.+/i],blacklistedTags:["script"],components:[],componentsOnly:!1,disableFragments:!1,disableKeyGeneration:!1,jsx:"",onError:function(){},showWarnings:!1,renderError:void 0,renderInWrapper:!0})}])},"object"==p(e)&&"object"==p(t)?t.exports=a(i(1)):(n=[i(1)],void 0===(s="function"==typeof(r=a)?r.apply(e,n):r)||(t.exports=s))}).call(this,i(192)(t))},495:function(t,e,i){"use strict";function r(t){return function(t){if(Array.isArray(t)){for(var e=0,i=new Array(t.length);e<t.length;e++)i[e]=t[e];return i}}(t)||function(t){if(Symbol.iterator in Object(t)||"[object Arguments]"===Object.prototype.toString.call(t))return Array.from(t)}(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}var n=i(82),s=i(496),a=i(509),o=i(0),c=i(565),h=i(567),u=i(568),l=i(569),p=i(570),f=i(571),d=i(572),m=i(573),g=i(574),x=Object.keys(m),y=function(t){var e=t.source||t.children||"";if(t.allowedTypes&&t.disallowedTypes)throw new Error("Only one of `allowedTypes` and `disallowedTypes` should be defined");var i=n(m,t.renderers),r=[a].concat(t.plugins||[]).reduce(v,s()).parse(e),o=n(t,{renderers:i,definitions:f(r)}),d=function(t){var e=[p,c()],i=t.disallowedTypes;t.allowedTypes&&(i=x.filter((function(e){return"root"!==e&&-1===t.allowedTypes.indexOf(e)})));var r=t.unwrapDisallowed?"unwrap":"remove";i&&i.length>0&&e.push(u.ofType(i,r));t.allowNode&&e.push(u.ifNotMatch(t.allowNode,r));var n=!t.escapeHtml&&!t.skipHtml,s=(t.astPlugins||[]).some((function(t){return(Array.isArray(t)?t[0]:t).identity===g.HtmlParser}));n&&!s&&e.push(h);return t.astPlugins?e.concat(t.astPlugins):e}(t).reduce((function(t,e){return e(t,o)}),r);return l(d,o)};function v(t,e){return Array.isArray(e)?t.use.apply(t,r(e)):t.use(e)}y.defaultProps={renderers:{},escapeHtml:!0,skipHtml:!1,sourcePos:!1,rawSourcePos:!1,transformLinkUri:d,astPlugins:[],plugins:[]},y.propTypes={className:o.string,source:o.string,children:o.string,sourcePos:o.bool,rawSourcePos:o.bool,escapeHtml:o.bool,skipHtml:o.bool,allowNode:o.func,allowedTypes:o.arrayOf(o.oneOf(x)),disallowedTypes:o.arrayOf(o.oneOf(x)),transformLinkUri:o.oneOfType([o.func,o.bool]),linkTarget:o.oneOfType([o.func,o.string]),transformImageUri:o.func,astPlugins:o.arrayOf(o.func),unwrapDisallowed:o.bool,renderers:o.object,plugins:o.array},y.types=x,y.renderers=m,y.uriTransformer=d,t.exports=y},496:function(t,e,i){"use strict";var r=i(497),n=i(498),s=i(499),a=i(505),o=i(507),c=i(508);t.exports=function t(){var e=[],i=a(),y={},v=!1,b=-1;return k.data=function(t,e){if(o(t))return 2===arguments.length?(m("data",v),y[t]=e,k):u.call(y,t)&&y[t]||null;if(t)return m("data",v),y=t,k;return y},k.freeze=_,k.attachers=e,k.use=function(t){var i;if(m("use",v),null==t);else if("function"==typeof t)o.apply(null,arguments);else{if("object"!=typeof t)throw new Error("Expected usable value, not `"+t+"`");"length"in t?a(t):n(t)}i&&(y.settings=r(y.settings||{},i));return k;function n(t){a(t.plugins),t.settings&&(i=r(i||{},t.settings))}function s(t){if("function"==typeof t)o(t);else{if("object"!=typeof t)throw new Error("Expected usable value, not `"+t+"`");"length"in t?o.apply(null,t):n(t)}}function a(t){var e,i;if(null==t);else{if(!("object"==typeof t&&"length"in t))throw new Error("Expected a list of plugins, not `"+t+"`");for(e=t.length,i=-1;++i<e;)s(t[i])}}function o(t,i){var n=function(t){var i,r=e.length,n=-1;for(;++n<r;)if((i=e[n])[0]===t)return i}(t);n?(c(n[1])&&c(i)&&(i=r(n[1],i)),n[1]=i):e.push(h.call(arguments))}},k.parse=function(t){var e,i=s(t);if(_(),f("parse",e=k.Parser),p(e))return new e(String(i),i).parse();return e(String(i),i)},k.stringify=function(t,e){var i,r=s(e);if(_(),d("stringify",i=k.Compiler),g(t),p(i))return new i(t,r).compile();return i(t,r)},k.run=w,k.runSync=function(t,e){var i,r=!1;return w(t,e,(function(t,e){r=!0,n(t),i=e})),x("runSync","run",r),i},k.process=A,k.processSync=function(t){var e,i=!1;return _(),f("processSync",k.Parser),d("processSync",k.Compiler),A(e=s(t),(function(t){i=!0,n(t)})),x("processSync","process",i),e},k;function k(){for(var i=t(),n=e.length,s=-1;++s<n;)i.use.apply(null,e[s]);return i.data(r(!0,{},y)),i}function _(){var t,r,n,s;if(v)return k;for(;++b<e.length;)r=(t=e[b])[0],null,!1!==(n=t[1])&&(!0===n&&(t[1]=void 0),"function"==typeof(s=r.apply(k,t.slice(1)))&&i.use(s));return v=!0,b=1/0,k}function w(t,e,r){if(g(t),_(),r||"function"!=typeof e||(r=e,e=null),!r)return new Promise(n);function n(n,a){i.run(t,s(e),(function(e,i,s){i=i||t,e?a(e):n?n(i):r(null,i,s)}))}n(null,r)}function A(t,e){if(_(),f("process",k.Parser),d("process",k.Compiler),!e)return new Promise(i);function i(i,r){var n=s(t);l.run(k,{file:n},(function(t){t?r(t):i?i(n):e(null,n)}))}i(null,e)}}().freeze();var h=[].slice,u={}.hasOwnProperty,l=a().use((function(t,e){e.tree=t.parse(e.file)})).use((function(t,e,i){t.run(e.tree,e.file,(function(t,r,n){t?i(t):(e.tree=r,e.file=n,i())}))})).use((function(t,e){e.file.contents=t.stringify(e.tree,e.file)}));function p(t){return"function"==typeof t&&function(t){var e;for(e in t)return!0;return!1}(t.prototype)}function f(t,e){if("function"!=typeof e)throw new Error("Cannot `"+t+"` without `Parser`")}function d(t,e){if("function"!=typeof e)throw new Error("Cannot `"+t+"` without `Compiler`")}function m(t,e){if(e)throw new Error(["Cannot invoke `"+t+"` on a frozen processor.\nCreate a new ","processor first, by invoking it: use `processor()` instead of ","`processor`."].join(""))}function g(t){if(!t||!o(t.type))throw new Error("Expected node, got `"+t+"`")}function x(t,e,i){if(!i)throw new Error("`"+t+"` finished async. Use `"+e+"` instead")}},497:function(t,e,i){"use strict";var r=Object.prototype.hasOwnProperty,n=Object.prototype.toString,s=Object.defineProperty,a=Object.getOwnPropertyDescriptor,o=function(t){return"function"==typeof Array.isArray?Array.isArray(t):"[object Array]"===n.call(t)},c=function(t){if(!t||"[object Object]"!==n.call(t))return!1;var e,i=r.call(t,"constructor"),s=t.constructor&&t.constructor.prototype&&r.call(t.constructor.prototype,"isPrototypeOf");if(t.constructor&&!i&&!s)return!1;for(e in t);return void 0===e||r.call(t,e)},h=function(t,e){s&&"__proto__"===e.name?s(t,e.name,{enumerable:!0,configurable:!0,value:e.newValue,writable:!0}):t[e.name]=e.newValue},u=function(t,e){if("__proto__"===e){if(!r.call(t,e))return;if(a)return a(t,e).value}return t[e]};t.exports=function t(){var e,i,r,n,s,a,l=arguments[0],p=1,f=arguments.length,d=!1;for("boolean"==typeof l&&(d=l,l=arguments[1]||{},p=2),(null==l||"object"!=typeof l&&"function"!=typeof l)&&(l={});p<f;++p)if(null!=(e=arguments[p]))for(i in e)r=u(l,i),l!==(n=u(e,i))&&(d&&n&&(c(n)||(s=o(n)))?(s?(s=!1,a=r&&o(r)?r:[]):a=r&&c(r)?r:{},h(l,{name:i,newValue:t(d,a,n)})):void 0!==n&&h(l,{name:i,newValue:n}));return l}},498:function(t,e,i){"use strict";t.exports=function(t){if(t)throw t}},499:function(t,e,i){"use strict";var r=i(500),n=i(502);t.exports=n;var s=n.prototype;function a(t,e,i){var n=this.path,s=new r(t,e,i);return n&&(s.name=n+":"+s.name,s.file=n),s.fatal=!1,this.messages.push(s),s}s.message=a,s.info=function(){var t=this.message.apply(this,arguments);return t.fatal=null,t},s.fail=function(){var t=this.message.apply(this,arguments);throw t.fatal=!0,t},s.warn=a},500:function(t,e,i){"use strict";var r=i(501);function n(){}t.exports=a,n.prototype=Error.prototype,a.prototype=new n;var s=a.prototype;function a(t,e,i){var n,s,a;"string"==typeof e&&(i=e,e=null),n=function(t){var e,i=[null,null];"string"==typeof t&&(-1===(e=t.indexOf(":"))?i[1]=t:(i[0]=t.slice(0,e),i[1]=t.slice(e+1)));return i}(i),s=r(e)||"1:1",a={start:{line:null,column:null},end:{line:null,column:null}},e&&e.position&&(e=e.position),e&&(e.start?(a=e,e=e.start):a.start=e),t.stack&&(this.stack=t.stack,t=t.message),this.message=t,this.name=s,this.reason=t,this.line=e?e.line:null,this.column=e?e.column:null,this.location=a,this.source=n[0],this.ruleId=n[1]}s.file="",s.name="",s.reason="",s.message="",s.stack="",s.fatal=null,s.column=null,s.line=null},501:function(t,e,i){"use strict";var r={}.hasOwnProperty;function n(t){return t&&"object"==typeof t||(t={}),a(t.line)+":"+a(t.column)}function s(t){return t&&"object"==typeof t||(t={}),n(t.start)+"-"+n(t.end)}function a(t){return t&&"number"==typeof t?t:1}t.exports=function(t){if(!t||"object"!=typeof t)return null;if(r.call(t,"position")||r.call(t,"type"))return s(t.position);if(r.call(t,"start")||r.call(t,"end"))return s(t);if(r.call(t,"line")||r.call(t,"column"))return n(t);return null}},502:function(t,e,i){"use strict";(function(e){var r=i(193),n=i(503),s=i(504);t.exports=h;var a={}.hasOwnProperty,o=h.prototype;o.toString=function(t){var e=this.contents||"";return s(e)?e.toString(t):String(e)};var c=["history","path","basename","stem","extname","dirname"];function h(t){var i,r,n;if(t){if("string"==typeof t||s(t))t={contents:t};else if("message"in t&&"messages"in t)return t}else t={};if(!(this instanceof h))return new h(t);for(this.data={},this.messages=[],this.history=[],this.cwd=e.cwd(),r=-1,n=c.length;++r<n;)i=c[r],a.call(t,i)&&(this[i]=t[i]);for(i in t)-1===c.indexOf(i)&&(this[i]=t[i])}function u(t,e){if(-1!==t.indexOf(r.sep))throw new Error("`"+e+"` cannot be a path: did not expect `"+r.sep+"`")}function l(t,e){if(!t)throw new Error("`"+e+"` cannot be empty")}function p(t,e){if(!t)throw new Error("Setting `"+e+"` requires `path` to be set too")}Object.defineProperty(o,"path",{get:function(){return this.history[this.history.length-1]},set:function(t){l(t,"path"),t!==this.path&&this.history.push(t)}}),Object.defineProperty(o,"dirname",{get:function(){return"string"==typeof this.path?r.dirname(this.path):void 0},set:function(t){p(this.path,"dirname"),this.path=r.join(t||"",this.basename)}}),Object.defineProperty(o,"basename",{get:function(){return"string"==typeof this.path?r.basename(this.path):void 0},set:function(t){l(t,"basename"),u(t,"basename"),this.path=r.join(this.dirname||"",t)}}),Object.defineProperty(o,"extname",{get:function(){return"string"==typeof this.path?r.extname(this.path):void 0},set:function(t){var e=t||"";if(u(e,"extname"),p(this.path,"extname"),e){if("."!==e.charAt(0))throw new Error("`extname` must start with `.`");if(-1!==e.indexOf(".",1))throw new Error("`extname` cannot contain multiple dots")}this.path=n(this.path,e)}}),Object.defineProperty(o,"stem",{get:function(){return"string"==typeof this.path?r.basename(this.path,this.extname):void 0},set:function(t){l(t,"stem"),u(t,"stem"),this.path=r.join(this.dirname||"",t+(this.extname||""))}})}).call(this,i(36))},503:function(t,e,i){"use strict";var r=i(193);t.exports=function(t,e){if("string"!=typeof t)return t;if(0===t.length)return t;var i=r.basename(t,r.extname(t))+e;return r.join(r.dirname(t),i)}},504:function(t,e){function i(t){return!!t.constructor&&"function"==typeof t.constructor.isBuffer&&t.constructor.isBuffer(t)}t.exports=function(t){return null!=t&&(i(t)||function(t){return"function"==typeof t.readFloatLE&&"function"==typeof t.slice&&i(t.slice(0,0))}(t)||!!t._isBuffer)}},505:function(t,e,i){"use strict";var r=i(506);t.exports=s,s.wrap=r;var n=[].slice;function s(){var t=[],e={run:function(){var e=-1,i=n.call(arguments,0,-1),s=arguments[arguments.length-1];if("function"!=typeof s)throw new Error("Expected function as last argument, not "+s);(function a(o){var c=t[++e],h=n.call(arguments,0).slice(1),u=i.length,l=-1;if(o)s(o);else{for(;++l<u;)null!==h[l]&&void 0!==h[l]||(h[l]=i[l]);i=h,c?r(c,a).apply(null,i):s.apply(null,[null].concat(i))}}).apply(null,[null].concat(i))},use:function(i){if("function"!=typeof i)throw new Error("Expected `fn` to be a function, not "+i);return t.push(i),e}};return e}},506:function(t,e,i){"use strict";var r=[].slice;t.exports=function(t,e){var i;return function(){var e,a=r.call(arguments,0),o=t.length>a.length;o&&a.push(n);try{e=t.apply(null,a)}catch(t){if(o&&i)throw t;return n(t)}o||(e&&"function"==typeof e.then?e.then(s,n):e instanceof Error?n(e):s(e))};function n(){i||(i=!0,e.apply(null,arguments))}function s(t){n(null,t)}}},507:function(t,e){var i=Object.prototype.toString;t.exports=function(t){return"[object String]"===i.call(t)}},508:function(t,e,i){"use strict";var r=Object.prototype.toString;t.exports=function(t){var e;return"[object Object]"===r.call(t)&&(null===(e=Object.getPrototypeOf(t))||e===Object.getPrototypeOf({}))}},509:function(t,e,i){"use strict";var r=i(510),n=i(82),s=i(512);function a(t){var e=r(s);e.prototype.options=n(e.prototype.options,this.data("settings"),t),this.Parser=e}t.exports=a,a.Parser=s},510:function(t,e,i){"use strict";var r=i(82),n=i(511);t.exports=function(t){var e,i,s;for(i in n(o,t),n(a,o),e=o.prototype)(s=e[i])&&"object"==typeof s&&(e[i]="concat"in s?s.concat():r(s));return o;function a(e){return t.apply(this,e)}function o(){return this instanceof o?t.apply(this,arguments):new a(arguments)}}},511:function(t,e){"function"==typeof Object.create?t.exports=function(t,e){t.super_=e,t.prototype=Object.create(e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}})}:t.exports=function(t,e){t.super_=e;var i=function(){};i.prototype=e.prototype,t.prototype=new i,t.prototype.constructor=t}},512:function(t,e,i){"use strict";var r=i(82),n=i(513),s=i(514),a=i(515),o=i(516),c=i(522);function h(t,e){this.file=e,this.offset={},this.options=r(this.options),this.setOptions({}),this.inList=!1,this.inBlock=!1,this.inLink=!1,this.atStart=!0,this.toOffset=s(e).toOffset,this.unescape=a(this,"escape"),this.decode=o(this)}t.exports=h;var u=h.prototype;function l(t){var e,i=[];for(e in t)i.push(e);return i}u.setOptions=i(523),u.parse=i(526),u.options=i(195),u.exitStart=n("atStart",!0),u.enterList=n("inList",!1),u.enterLink=n("inLink",!1),u.enterBlock=n("inBlock",!1),u.interruptParagraph=[["thematicBreak"],["atxHeading"],["fencedCode"],["blockquote"],["html"],["setextHeading",{commonmark:!1}],["definition",{commonmark:!1}],["footnote",{commonmark:!1}]],u.interruptList=[["atxHeading",{pedantic:!1}],["fencedCode",{pedantic:!1}],["thematicBreak",{pedantic:!1}],["definition",{commonmark:!1}],["footnote",{commonmark:!1}]],u.interruptBlockquote=[["indentedCode",{commonmark:!0}],["fencedCode",{commonmark:!0}],["atxHeading",{commonmark:!0}],["setextHeading",{commonmark:!0}],["thematicBreak",{commonmark:!0}],["html",{commonmark:!0}],["list",{commonmark:!0}],["definition",{commonmark:!1}],["footnote",{commonmark:!1}]],u.blockTokenizers={newline:i(530),indentedCode:i(531),fencedCode:i(532),blockquote:i(533),atxHeading:i(534),thematicBreak:i(535),list:i(536),setextHeading:i(538),html:i(539),footnote:i(540),definition:i(542),table:i(543),paragraph:i(544)},u.inlineTokenizers={escape:i(545),autoLink:i(547),url:i(548),html:i(550),link:i(551),reference:i(552),strong:i(553),emphasis:i(555),deletion:i(558),code:i(560),break:i(562),text:i(564)},u.blockMethods=l(u.blockTokenizers),u.inlineMethods=l(u.inlineTokenizers),u.tokenizeBlock=c("block"),u.tokenizeInline=c("inline"),u.tokenizeFactory=c},513:function(t,e,i){"use strict";t.exports=function(t,e,i){return function(){var r=i||this,n=r[t];return r[t]=!e,function(){r[t]=n}}}},514:function(t,e,i){"use strict";function r(t){return function(e){var i=-1,r=t.length;if(e<0)return{};for(;++i<r;)if(t[i]>e)return{line:i+1,column:e-(t[i-1]||0)+1,offset:e};return{}}}function n(t){return function(e){var i=e&&e.line,r=e&&e.column;if(!isNaN(i)&&!isNaN(r)&&i-1 in t)return(t[i-2]||0)+r-1||0;return-1}}t.exports=function(t){var e=function(t){var e=[],i=t.indexOf("\n");for(;-1!==i;)e.push(i+1),i=t.indexOf("\n",i+1);return e.push(t.length+1),e}(String(t));return{toPosition:r(e),toOffset:n(e)}}},515:function(t,e,i){"use strict";t.exports=function(t,e){return function(i){var r,n=0,s=i.indexOf("\\"),a=t[e],o=[];for(;-1!==s;)o.push(i.slice(n,s)),n=s+1,(r=i.charAt(n))&&-1!==a.indexOf(r)||o.push("\\"),s=i.indexOf("\\",n);return o.push(i.slice(n)),o.join("")}}},516:function(t,e,i){"use strict";var r=i(82),n=i(152);t.exports=function(t){return s.raw=function(t,s,a){return n(t,r(a,{position:e(s),warning:i}))},s;function e(e){for(var i=t.offset,r=e.line,n=[];++r&&r in i;)n.push((i[r]||0)+1);return{start:e,indent:n}}function i(e,i,r){3!==r&&t.file.message(e,i)}function s(r,s,a){n(r,{position:e(s),warning:i,text:a,reference:a,textContext:t,referenceContext:t})}}},517:function(t){t.exports=JSON.parse('{"AElig":"Æ","AMP":"&","Aacute":"Á","Acirc":"Â","Agrave":"À","Aring":"Å","Atilde":"Ã","Auml":"Ä","COPY":"©","Ccedil":"Ç","ETH":"Ð","Eacute":"É","Ecirc":"Ê","Egrave":"È","Euml":"Ë","GT":">","Iacute":"Í","Icirc":"Î","Igrave":"Ì","Iuml":"Ï","LT":"<","Ntilde":"Ñ","Oacute":"Ó","Ocirc":"Ô","Ograve":"Ò","Oslash":"Ø","Otilde":"Õ","Ouml":"Ö","QUOT":"\\"","REG":"®","THORN":"Þ","Uacute":"Ú","Ucirc":"Û","Ugrave":"Ù","Uuml":"Ü","Yacute":"Ý","aacute":"á","acirc":"â","acute":"´","aelig":"æ","agrave":"à","amp":"&","aring":"å","atilde":"ã","auml":"ä","brvbar":"¦","ccedil":"ç","cedil":"¸","cent":"¢","copy":"©","curren":"¤","deg":"°","divide":"÷","eacute":"é","ecirc":"ê","egrave":"è","eth":"ð","euml":"ë","frac12":"½","frac14":"¼","frac34":"¾","gt":">","iacute":"í","icirc":"î","iexcl":"¡","igrave":"ì","iquest":"¿","iuml":"ï","laquo":"«","lt":"<","macr":"¯","micro":"µ","middot":"·","nbsp":" ","not":"¬","ntilde":"ñ","oacute":"ó","ocirc":"ô","ograve":"ò","ordf":"ª","ordm":"º","oslash":"ø","otilde":"õ","ouml":"ö","para":"¶","plusmn":"±","pound":"£","quot":"\\"","raquo":"»","reg":"®","sect":"§","shy":"­","sup1":"¹","sup2":"²","sup3":"³","szlig":"ß","thorn":"þ","times":"×","uacute":"ú","ucirc":"û","ugrave":"ù","uml":"¨","uuml":"ü","yacute":"ý","yen":"¥","yuml":"ÿ"}')},518:function(t){t.exports=JSON.parse('{"0":"�","128":"€","130":"‚","131":"ƒ","132":"„","133":"…","134":"†","135":"‡","136":"ˆ","137":"‰","138":"Š","139":"‹","140":"Œ","142":"Ž","145":"‘","146":"’","147":"“","148":"”","149":"•","150":"–","151":"—","152":"˜","153":"™","154":"š","155":"›","156":"œ","158":"ž","159":"Ÿ"}')},519:function(t,e,i){"use strict";t.exports=function(t){var e="string"==typeof t?t.charCodeAt(0):t;return e>=97&&e<=102||e>=65&&e<=70||e>=48&&e<=57}},520:function(t,e,i){"use strict";var r=i(194),n=i(121);t.exports=function(t){return r(t)||n(t)}},521:function(t,e,i){"use strict";var r;t.exports=function(t){var e,i="&"+t+";";if((r=r||document.createElement("i")).innerHTML=i,";"===(e=r.textContent).slice(-1)&&"semi"!==t)return!1;return e!==i&&e}},522:function(t,e,i){"use strict";t.exports=function(t){return function(e,i){var s,a,o,c,h,u,l=this,p=l.offset,f=[],d=l[t+"Methods"],m=l[t+"Tokenizers"],g=i.line,x=i.column;if(!e)return f;k.now=v,k.file=l.file,y("");for(;e;){for(s=-1,a=d.length,h=!1;++s<a&&(c=d[s],!(o=m[c])||o.onlyAtStart&&!l.atStart||o.notInList&&l.inList||o.notInBlock&&l.inBlock||o.notInLink&&l.inLink||(u=e.length,o.apply(l,[k,e]),!(h=u!==e.length))););h||l.file.fail(new Error("Infinite loop"),k.now())}return l.eof=v(),f;function y(t){for(var e=-1,i=t.indexOf("\n");-1!==i;)g++,e=i,i=t.indexOf("\n",i+1);-1===e?x+=t.length:x=t.length-e,g in p&&(-1!==e?x+=p[g]:x<=p[g]&&(x=p[g]+1))}function v(){var t={line:g,column:x};return t.offset=l.toOffset(t),t}function b(t){this.start=t,this.end=v()}function k(t){var i,s=function(){var t=[],e=g+1;return function(){for(var i=g+1;e<i;)t.push((p[e]||0)+1),e++;return t}}(),a=(i=v(),function(t,e){var r=t.position,n=r?r.start:i,s=[],a=r&&r.end.line,o=i.line;if(t.position=new b(n),r&&e&&r.indent){if(s=r.indent,a<o){for(;++a<o;)s.push((p[a]||0)+1);s.push(i.column)}e=s.concat(e)}return t.position.indent=e||[],t}),o=v();return function(t){e.substring(0,t.length)!==t&&l.file.fail(new Error("Incorrectly eaten value: please report this warning on http://git.io/vg5Ft"),v())}(t),c.reset=h,h.test=u,c.test=u,e=e.substring(t.length),y(t),s=s(),c;function c(t,e){return a(function(t,e){var i=e?e.children:f,s=i[i.length-1];return s&&t.type===s.type&&t.type in r&&n(s)&&n(t)&&(t=r[t.type].call(l,s,t)),t!==s&&i.push(t),l.atStart&&0!==f.length&&l.exitStart(),t}(a(t),e),s)}function h(){var i=c.apply(null,arguments);return g=o.line,x=o.column,e=t+e,i}function u(){var i=a({});return g=o.line,x=o.column,e=t+e,i.position}}}};var r={text:function(t,e){return t.value+=e.value,t},blockquote:function(t,e){if(this.options.commonmark)return e;return t.children=t.children.concat(e.children),t}};function n(t){var e,i;return"text"!==t.type||!t.position||(e=t.position.start,i=t.position.end,e.line!==i.line||i.column-e.column===t.value.length)}},523:function(t,e,i){"use strict";var r=i(82),n=i(524),s=i(195);t.exports=function(t){var e,i,a=this.options;if(null==t)t={};else{if("object"!=typeof t)throw new Error("Invalid value `"+t+"` for setting `options`");t=r(t)}for(e in s){if(null==(i=t[e])&&(i=a[e]),"blocks"!==e&&"boolean"!=typeof i||"blocks"===e&&"object"!=typeof i)throw new Error("Invalid value `"+i+"` for setting `options."+e+"`");t[e]=i}return this.options=t,this.escape=n(t),this}},524:function(t,e,i){"use strict";t.exports=a;var r=["\\","`","*","{","}","[","]","(",")","#","+","-",".","!","_",">"],n=r.concat(["~","|"]),s=n.concat(["\n",'"',"$","%","&","'",",","/",":",";","<","=","?","@","^"]);function a(t){var e=t||{};return e.commonmark?s:e.gfm?n:r}a.default=r,a.gfm=n,a.commonmark=s},525:function(t){t.exports=JSON.parse('["address","article","aside","base","basefont","blockquote","body","caption","center","col","colgroup","dd","details","dialog","dir","div","dl","dt","fieldset","figcaption","figure","footer","form","frame","frameset","h1","h2","h3","h4","h5","h6","head","header","hgroup","hr","html","iframe","legend","li","link","main","menu","menuitem","meta","nav","noframes","ol","optgroup","option","p","param","pre","section","source","title","summary","table","tbody","td","tfoot","th","thead","title","tr","track","ul"]')},526:function(t,e,i){"use strict";var r=i(82),n=i(527);t.exports=function(){var t,e=String(this.file),i={line:1,column:1,offset:0},o=r(i);65279===(e=e.replace(a,s)).charCodeAt(0)&&(e=e.slice(1),o.column++,o.offset++);t={type:"root",children:this.tokenizeBlock(e,o),position:{start:i,end:this.eof||r(i)}},this.options.position||n(t,!0);return t};var s="\n",a=/\r\n|\r/g},527:function(t,e,i){"use strict";var r=i(122);function n(t){delete t.position}function s(t){t.position=void 0}t.exports=function(t,e){return r(t,e?n:s),t}},528:function(t,e,i){"use strict";t.exports=a;var r=i(529),n="skip",s=!1;function a(t,e,i,a){function o(t,c,h){var u;return(e&&!r(e,t,c,h[h.length-1]||null)||(u=i(t,h))!==s)&&t.children&&u!==n&&function(t,e){var i,r,n=a?-1:1,c=(a?t.length:-1)+n;for(;c>-1&&c<t.length;){if(i=t[c],(r=i&&o(i,c,e))===s)return r;c="number"==typeof r?r:c+n}}(t.children,h.concat(t))===s?s:u}"function"==typeof e&&"function"!=typeof i&&(a=i,i=e,e=null),o(t,null,[])}a.CONTINUE=!0,a.SKIP=n,a.EXIT=s},529:function(t,e,i){"use strict";function r(t){if("string"==typeof t)return function(t){return function(e){return Boolean(e&&e.type===t)}}(t);if(null==t)return a;if("object"==typeof t)return("length"in t?s:n)(t);if("function"==typeof t)return t;throw new Error("Expected function, string, or object as test")}function n(t){return function(e){var i;for(i in t)if(e[i]!==t[i])return!1;return!0}}function s(t){var e=function(t){for(var e=[],i=t.length,n=-1;++n<i;)e[n]=r(t[n]);return e}(t),i=e.length;return function(){var t=-1;for(;++t<i;)if(e[t].apply(this,arguments))return!0;return!1}}function a(){return!0}t.exports=function t(e,i,n,s,a){var o=null!=s,c=null!=n,h=r(e);if(c&&("number"!=typeof n||n<0||n===1/0))throw new Error("Expected positive finite index or child node");if(o&&(!t(null,s)||!s.children))throw new Error("Expected parent node");if(!i||!i.type||"string"!=typeof i.type)return!1;if(o!==c)throw new Error("Expected both parent and index");return Boolean(h.call(a,i,n,s))}},530:function(t,e,i){"use strict";var r=i(74);t.exports=function(t,e,i){var n,s,a,o,c=e.charAt(0);if("\n"!==c)return;if(i)return!0;o=1,n=e.length,s=c,a="";for(;o<n&&(c=e.charAt(o),r(c));)a+=c,"\n"===c&&(s+=a,a=""),o++;t(s)}},531:function(t,e,i){"use strict";var r=i(153),n=i(154);t.exports=function(t,e,i){var r,h,u,l=-1,p=e.length,f="",d="",m="",g="";for(;++l<p;)if(r=e.charAt(l),u)if(u=!1,f+=m,d+=g,m="",g="",r===s)m=r,g=r;else for(f+=r,d+=r;++l<p;){if(!(r=e.charAt(l))||r===s){g=r,m=r;break}f+=r,d+=r}else if(r===o&&e.charAt(l+1)===r&&e.charAt(l+2)===r&&e.charAt(l+3)===r)m+=c,l+=3,u=!0;else if(r===a)m+=r,u=!0;else{for(h="";r===a||r===o;)h+=r,r=e.charAt(++l);if(r!==s)break;m+=h+r,g+=r}if(d)return!!i||t(f)({type:"code",lang:null,value:n(d)})};var s="\n",a="\t",o=" ",c=r(o,4)},532:function(t,e,i){"use strict";var r=i(154);t.exports=function(t,e,i){var l,p,f,d,m,g,x,y,v,b,k,_=this.options,w=e.length+1,A=0,S="";if(!_.gfm)return;for(;A<w&&((f=e.charAt(A))===a||f===s);)S+=f,A++;if(b=A,(f=e.charAt(A))!==o&&f!==c)return;A++,p=f,l=1,S+=f;for(;A<w&&(f=e.charAt(A))===p;)S+=f,l++,A++;if(l<h)return;for(;A<w&&((f=e.charAt(A))===a||f===s);)S+=f,A++;d="",m="";for(;A<w&&(f=e.charAt(A))!==n&&f!==o&&f!==c;)f===a||f===s?m+=f:(d+=m+f,m=""),A++;if((f=e.charAt(A))&&f!==n)return;if(i)return!0;(k=t.now()).column+=S.length,k.offset+=S.length,S+=d,d=this.decode.raw(this.unescape(d),k),m&&(S+=m);m="",y="",v="",g="",x="";for(;A<w;)if(f=e.charAt(A),g+=y,x+=v,y="",v="",f===n){for(g?(y+=f,v+=f):S+=f,m="",A++;A<w&&(f=e.charAt(A))===a;)m+=f,A++;if(y+=m,v+=m.slice(b),!(m.length>=u)){for(m="";A<w&&(f=e.charAt(A))===p;)m+=f,A++;if(y+=m,v+=m,!(m.length<l)){for(m="";A<w&&((f=e.charAt(A))===a||f===s);)y+=f,v+=f,A++;if(!f||f===n)break}}}else g+=f,v+=f,A++;return t(S+=g+y)({type:"code",lang:d||null,value:r(x)})};var n="\n",s="\t",a=" ",o="~",c="`",h=3,u=4},533:function(t,e,i){"use strict";var r=i(101),n=i(155);t.exports=function(t,e,i){var h,u,l,p,f,d,m,g,x,y=this.offset,v=this.blockTokenizers,b=this.interruptBlockquote,k=t.now(),_=k.line,w=e.length,A=[],S=[],E=[],C=0;for(;C<w&&((u=e.charAt(C))===o||u===a);)C++;if(e.charAt(C)!==c)return;if(i)return!0;C=0;for(;C<w;){for(p=e.indexOf(s,C),m=C,g=!1,-1===p&&(p=w);C<w&&((u=e.charAt(C))===o||u===a);)C++;if(e.charAt(C)===c?(C++,g=!0,e.charAt(C)===o&&C++):C=m,f=e.slice(C,p),!g&&!r(f)){C=m;break}if(!g&&(l=e.slice(C),n(b,v,this,[t,l,!0])))break;d=m===C?f:e.slice(m,p),E.push(C-m),A.push(d),S.push(f),C=p+1}C=-1,w=E.length,h=t(A.join(s));for(;++C<w;)y[_]=(y[_]||0)+E[C],_++;return x=this.enterBlock(),S=this.tokenizeBlock(S.join(s),k),x(),h({type:"blockquote",children:S})};var s="\n",a="\t",o=" ",c=">"},534:function(t,e,i){"use strict";t.exports=function(t,e,i){var c,h,u,l=this.options,p=e.length+1,f=-1,d=t.now(),m="",g="";for(;++f<p;){if((c=e.charAt(f))!==s&&c!==n){f--;break}m+=c}u=0;for(;++f<=p;){if((c=e.charAt(f))!==a){f--;break}m+=c,u++}if(u>o)return;if(!u||!l.pedantic&&e.charAt(f+1)===a)return;p=e.length+1,h="";for(;++f<p;){if((c=e.charAt(f))!==s&&c!==n){f--;break}h+=c}if(!l.pedantic&&0===h.length&&c&&c!==r)return;if(i)return!0;m+=h,h="",g="";for(;++f<p&&(c=e.charAt(f))&&c!==r;)if(c===s||c===n||c===a){for(;c===s||c===n;)h+=c,c=e.charAt(++f);for(;c===a;)h+=c,c=e.charAt(++f);for(;c===s||c===n;)h+=c,c=e.charAt(++f);f--}else g+=h+c,h="";return d.column+=m.length,d.offset+=m.length,t(m+=g+h)({type:"heading",depth:u,children:this.tokenizeInline(g,d)})};var r="\n",n="\t",s=" ",a="#",o=6},535:function(t,e,i){"use strict";t.exports=function(t,e,i){var u,l,p,f,d=-1,m=e.length+1,g="";for(;++d<m&&((u=e.charAt(d))===n||u===s);)g+=u;if(u!==a&&u!==c&&u!==o)return;l=u,g+=u,p=1,f="";for(;++d<m;)if((u=e.charAt(d))===l)p++,g+=f+l,f="";else{if(u!==s)return p>=h&&(!u||u===r)?(g+=f,!!i||t(g)({type:"thematicBreak"})):void 0;f+=u}};var r="\n",n="\t",s=" ",a="*",o="_",c="-",h=3},536:function(t,e,i){"use strict";var r=i(101),n=i(153),s=i(121),a=i(196),o=i(537),c=i(155);t.exports=function(t,e,i){var n,a,o,m,x,y,v,b,k,E,C,T,I,P,O,L,N,j,V,M,B,R,D,H,U=this.options.commonmark,F=this.options.pedantic,G=this.blockTokenizers,z=this.interruptList,W=0,q=e.length,K=null,X=0;for(;W<q;){if((m=e.charAt(W))===d)X+=g-X%g;else{if(m!==p)break;X++}W++}if(X>=g)return;if(m=e.charAt(W),n=U?A:w,!0===_[m])x=m,o=!1;else{for(o=!0,a="";W<q&&(m=e.charAt(W),s(m));)a+=m,W++;if(m=e.charAt(W),!a||!0!==n[m])return;K=parseInt(a,10),x=m}if((m=e.charAt(++W))!==p&&m!==d)return;if(i)return!0;W=0,P=[],O=[],L=[];for(;W<q;){for(y=e.indexOf(f,W),v=W,b=!1,H=!1,-1===y&&(y=q),D=W+g,X=0;W<q;){if((m=e.charAt(W))===d)X+=g-X%g;else{if(m!==p)break;X++}W++}if(X>=g&&(H=!0),N&&X>=N.indent&&(H=!0),m=e.charAt(W),k=null,!H){if(!0===_[m])k=m,W++,X++;else{for(a="";W<q&&(m=e.charAt(W),s(m));)a+=m,W++;m=e.charAt(W),W++,a&&!0===n[m]&&(k=m,X+=a.length+1)}if(k)if((m=e.charAt(W))===d)X+=g-X%g,W++;else if(m===p){for(D=W+g;W<D&&e.charAt(W)===p;)W++,X++;W===D&&e.charAt(W)===p&&(W-=g-1,X-=g-1)}else m!==f&&""!==m&&(k=null)}if(k){if(!F&&x!==k)break;b=!0}else U||H||e.charAt(v)!==p?U&&N&&(H=X>=N.indent||X>g):H=!0,b=!1,W=v;if(C=e.slice(v,y),E=v===W?C:e.slice(W,y),(k===h||k===u||k===l)&&G.thematicBreak.call(this,t,C,!0))break;if(T=I,I=!r(E).length,H&&N)N.value=N.value.concat(L,C),O=O.concat(L,C),L=[];else if(b)0!==L.length&&(N.value.push(""),N.trail=L.concat()),N={value:[C],indent:X,trail:[]},P.push(N),O=O.concat(L,C),L=[];else if(I){if(T)break;L.push(C)}else{if(T)break;if(c(z,G,this,[t,C,!0]))break;N.value=N.value.concat(L,C),O=O.concat(L,C),L=[]}W=y+1}B=t(O.join(f)).reset({type:"list",ordered:o,start:K,loose:null,children:[]}),j=this.enterList(),V=this.enterBlock(),M=!1,W=-1,q=P.length;for(;++W<q;)N=P[W].value.join(f),R=t.now(),(N=t(N)(S(this,N,R),B)).loose&&(M=!0),N=P[W].trail.join(f),W!==q-1&&(N+=f),t(N);return j(),V(),B.loose=M,B};var h="*",u="_",l="-",p=" ",f="\n",d="\t",m="x",g=4,x=/\n\n(?!\s*$)/,y=/^\[([ \t]|x|X)][ \t]/,v=/^([ \t]*)([*+-]|\d+[.)])( {1,4}(?! )| |\t|$|(?=\n))([^\n]*)/,b=/^([ \t]*)([*+-]|\d+[.)])([ \t]+)/,k=/^( {1,4}|\t)?/gm,_={};_[h]=!0,_["+"]=!0,_[l]=!0;var w={".":!0},A={};function S(t,e,i){var r,n,s=t.offset,a=null;return e=(t.options.pedantic?E:C).apply(null,arguments),t.options.gfm&&(r=e.match(y))&&(n=r[0].length,a=r[1].toLowerCase()===m,s[i.line]+=n,e=e.slice(n)),{type:"listItem",loose:x.test(e)||e.charAt(e.length-1)===f,checked:a,children:t.tokenizeBlock(e,i)}}function E(t,e,i){var r=t.offset,n=i.line;return e=e.replace(b,s),n=i.line,e.replace(k,s);function s(t){return r[n]=(r[n]||0)+t.length,n++,""}}function C(t,e,i){var r,s,c,h,u,l,d,m=t.offset,g=i.line;for(h=(e=e.replace(v,(function(t,e,i,a,o){s=e+i+a,c=o,Number(i)<10&&s.length%2==1&&(i=p+i);return(r=e+n(p,i.length)+a)+c}))).split(f),(u=o(e,a(r).indent).split(f))[0]=c,m[g]=(m[g]||0)+s.length,g++,l=0,d=h.length;++l<d;)m[g]=(m[g]||0)+h[l].length-u[l].length,g++;return u.join(f)}A["."]=!0,A[")"]=!0},537:function(t,e,i){"use strict";var r=i(101),n=i(153),s=i(196);t.exports=function(t,e){var i,h,u,l,p=t.split(o),f=p.length+1,d=1/0,m=[];p.unshift(n(a,e)+"!");for(;f--;)if(h=s(p[f]),m[f]=h.stops,0!==r(p[f]).length){if(!h.indent){d=1/0;break}h.indent>0&&h.indent<d&&(d=h.indent)}if(d!==1/0)for(f=p.length;f--;){for(u=m[f],i=d;i&&!(i in u);)i--;l=0!==r(p[f]).length&&d&&i!==d?c:"",p[f]=l+p[f].slice(i in u?u[i]+1:0)}return p.shift(),p.join(o)};var a=" ",o="\n",c="\t"},538:function(t,e,i){"use strict";t.exports=function(t,e,i){var c,h,u,l,p,f=t.now(),d=e.length,m=-1,g="";for(;++m<d;){if((u=e.charAt(m))!==s||m>=a){m--;break}g+=u}c="",h="";for(;++m<d;){if((u=e.charAt(m))===r){m--;break}u===s||u===n?h+=u:(c+=h+u,h="")}if(f.column+=g.length,f.offset+=g.length,g+=c+h,u=e.charAt(++m),l=e.charAt(++m),u!==r||!o[l])return;g+=u,h=l,p=o[l];for(;++m<d;){if((u=e.charAt(m))!==l){if(u!==r)return;m--;break}h+=u}if(i)return!0;return t(g+h)({type:"heading",depth:p,children:this.tokenizeInline(c,f)})};var r="\n",n="\t",s=" ",a=3,o={};o["="]=1,o["-"]=2},539:function(t,e,i){"use strict";var r=i(197).openCloseTag;t.exports=function(t,e,i){var c,h,u,l,p,f,d,m=this.options.blocks,g=e.length,x=0,y=[[/^<(script|pre|style)(?=(\s|>|$))/i,/<\/(script|pre|style)>/i,!0],[/^<!--/,/-->/,!0],[/^<\?/,/\?>/,!0],[/^<![A-Za-z]/,/>/,!0],[/^<!\[CDATA\[/,/\]\]>/,!0],[new RegExp("^</?("+m.join("|")+")(?=(\\s|/?>|$))","i"),/^$/,!0],[new RegExp(r.source+"\\s*$"),/^$/,!1]];for(;x<g&&((l=e.charAt(x))===n||l===s);)x++;if(e.charAt(x)!==o)return;c=-1===(c=e.indexOf(a,x+1))?g:c,h=e.slice(x,c),u=-1,p=y.length;for(;++u<p;)if(y[u][0].test(h)){f=y[u];break}if(!f)return;if(i)return f[2];if(x=c,!f[1].test(h))for(;x<g;){if(c=-1===(c=e.indexOf(a,x+1))?g:c,h=e.slice(x+1,c),f[1].test(h)){h&&(x=c);break}x=c}return d=e.slice(0,x),t(d)({type:"html",value:d})};var n="\t",s=" ",a="\n",o="<"},540:function(t,e,i){"use strict";var r=i(74),n=i(156);t.exports=d,d.notInList=!0,d.notInBlock=!0;var s="\\",a="\n",o="\t",c=" ",h="[",u="]",l="^",p=":",f=/^( {4}|\t)?/gm;function d(t,e,i){var d,m,g,x,y,v,b,k,_,w,A,S,E=this.offset;if(this.options.footnotes){for(d=0,m=e.length,g="",x=t.now(),y=x.line;d<m&&(_=e.charAt(d),r(_));)g+=_,d++;if(e.charAt(d)===h&&e.charAt(d+1)===l){for(d=(g+=h+l).length,b="";d<m&&(_=e.charAt(d))!==u;)_===s&&(b+=_,d++,_=e.charAt(d)),b+=_,d++;if(b&&e.charAt(d)===u&&e.charAt(d+1)===p){if(i)return!0;for(w=n(b),d=(g+=b+u+p).length;d<m&&((_=e.charAt(d))===o||_===c);)g+=_,d++;for(x.column+=g.length,x.offset+=g.length,b="",v="",k="";d<m;){if((_=e.charAt(d))===a){for(k=_,d++;d<m&&(_=e.charAt(d))===a;)k+=_,d++;for(b+=k,k="";d<m&&(_=e.charAt(d))===c;)k+=_,d++;if(0===k.length)break;b+=k}b&&(v+=b,b=""),v+=_,d++}return g+=v,v=v.replace(f,(function(t){return E[y]=(E[y]||0)+t.length,y++,""})),A=t(g),S=this.enterBlock(),v=this.tokenizeBlock(v,x),S(),A({type:"footnoteDefinition",identifier:w,children:v})}}}}},541:function(t,e,i){"use strict";t.exports=function(t){return String(t).replace(/\s+/g," ")}},542:function(t,e,i){"use strict";var r=i(74),n=i(156);t.exports=y,y.notInList=!0,y.notInBlock=!0;var s='"',a="'",o="\\",c="\n",h="\t",u=" ",l="[",p="]",f="(",d=")",m=":",g="<",x=">";function y(t,e,i){for(var r,x,y,k,_,w,A,S,E=this.options.commonmark,C=0,T=e.length,I="";C<T&&((k=e.charAt(C))===u||k===h);)I+=k,C++;if((k=e.charAt(C))===l){for(C++,I+=k,y="";C<T&&(k=e.charAt(C))!==p;)k===o&&(y+=k,C++,k=e.charAt(C)),y+=k,C++;if(y&&e.charAt(C)===p&&e.charAt(C+1)===m){for(w=y,C=(I+=y+p+m).length,y="";C<T&&((k=e.charAt(C))===h||k===u||k===c);)I+=k,C++;if(y="",r=I,(k=e.charAt(C))===g){for(C++;C<T&&v(k=e.charAt(C));)y+=k,C++;if((k=e.charAt(C))===v.delimiter)I+=g+y+k,C++;else{if(E)return;C-=y.length+1,y=""}}if(!y){for(;C<T&&b(k=e.charAt(C));)y+=k,C++;I+=y}if(y){for(A=y,y="";C<T&&((k=e.charAt(C))===h||k===u||k===c);)y+=k,C++;if(_=null,(k=e.charAt(C))===s?_=s:k===a?_=a:k===f&&(_=d),_){if(!y)return;for(C=(I+=y+k).length,y="";C<T&&(k=e.charAt(C))!==_;){if(k===c){if(C++,(k=e.charAt(C))===c||k===_)return;y+=c}y+=k,C++}if((k=e.charAt(C))!==_)return;x=I,I+=y+k,C++,S=y,y=""}else y="",C=I.length;for(;C<T&&((k=e.charAt(C))===h||k===u);)I+=k,C++;return(k=e.charAt(C))&&k!==c?void 0:!!i||(r=t(r).test().end,A=this.decode.raw(this.unescape(A),r,{nonTerminated:!1}),S&&(x=t(x).test().end,S=this.decode.raw(this.unescape(S),x)),t(I)({type:"definition",identifier:n(w),title:S||null,url:A}))}}}}function v(t){return t!==x&&t!==l&&t!==p}function b(t){return t!==l&&t!==p&&!r(t)}v.delimiter=x},543:function(t,e,i){"use strict";var r=i(74);t.exports=function(t,e,i){var y,v,b,k,_,w,A,S,E,C,T,I,P,O,L,N,j,V,M,B,R,D,H,U;if(!this.options.gfm)return;y=0,V=0,w=e.length+1,A=[];for(;y<w;){if(D=e.indexOf(u,y),H=e.indexOf(o,y+1),-1===D&&(D=e.length),-1===H||H>D){if(V<f)return;break}A.push(e.slice(y,D)),V++,y=D+1}k=A.join(u),v=A.splice(1,1)[0]||[],y=0,w=v.length,V--,b=!1,T=[];for(;y<w;){if((E=v.charAt(y))===o){if(C=null,!1===b){if(!1===U)return}else T.push(b),b=!1;U=!1}else if(E===a)C=!0,b=b||x;else if(E===c)b=b===d?m:C&&b===x?g:d;else if(!r(E))return;y++}!1!==b&&T.push(b);if(T.length<p)return;if(i)return!0;j=-1,B=[],R=t(k).reset({type:"table",align:T,children:B});for(;++j<V;){for(M=A[j],_={type:"tableRow",children:[]},j&&t(u),t(M).reset(_,R),w=M.length+1,y=0,S="",I="",P=!0,O=null,L=null;y<w;)if((E=M.charAt(y))!==l&&E!==h){if(""===E||E===o)if(P)t(E);else{if(E&&L){S+=E,y++;continue}!I&&!E||P||(k=I,S.length>1&&(E?(k+=S.slice(0,S.length-1),S=S.charAt(S.length-1)):(k+=S,S="")),N=t.now(),t(k)({type:"tableCell",children:this.tokenizeInline(I,N)},_)),t(S+E),S="",I=""}else if(S&&(I+=S,S=""),I+=E,E===n&&y!==w-2&&(I+=M.charAt(y+1),y++),E===s){for(O=1;M.charAt(y+1)===E;)I+=E,y++,O++;L?O>=L&&(L=0):L=O}P=!1,y++}else I?S+=E:t(E),y++;j||t(u+v)}return R};var n="\\",s="`",a="-",o="|",c=":",h=" ",u="\n",l="\t",p=1,f=2,d="left",m="center",g="right",x=null},544:function(t,e,i){"use strict";var r=i(101),n=i(121),s=i(154),a=i(155);t.exports=function(t,e,i){var l,p,f,d,m,g=this.options,x=g.commonmark,y=g.gfm,v=this.blockTokenizers,b=this.interruptParagraph,k=e.indexOf(o),_=e.length;for(;k<_;){if(-1===k){k=_;break}if(e.charAt(k+1)===o)break;if(x){for(d=0,l=k+1;l<_;){if((f=e.charAt(l))===c){d=u;break}if(f!==h)break;d++,l++}if(d>=u){k=e.indexOf(o,k+1);continue}}if(p=e.slice(k+1),a(b,v,this,[t,p,!0]))break;if(v.list.call(this,t,p,!0)&&(this.inList||x||y&&!n(r.left(p).charAt(0))))break;if(l=k,-1!==(k=e.indexOf(o,k+1))&&""===r(e.slice(l,k))){k=l;break}}if(p=e.slice(0,k),""===r(p))return t(p),null;if(i)return!0;return m=t.now(),p=s(p),t(p)({type:"paragraph",children:this.tokenizeInline(p,m)})};var o="\n",c="\t",h=" ",u=4},545:function(t,e,i){"use strict";var r=i(546);function n(t,e,i){var r,n;if("\\"===e.charAt(0)&&(r=e.charAt(1),-1!==this.escape.indexOf(r)))return!!i||(n="\n"===r?{type:"break"}:{type:"text",value:r},t("\\"+r)(n))}t.exports=n,n.locator=r},546:function(t,e,i){"use strict";t.exports=function(t,e){return t.indexOf("\\",e)}},547:function(t,e,i){"use strict";var r=i(74),n=i(152),s=i(198);t.exports=p,p.locator=s,p.notInLink=!0;var a="<",o=">",c="@",h="/",u="mailto:",l=u.length;function p(t,e,i){var s,p,f,d,m,g,x,y,v,b,k;if(e.charAt(0)===a){for(this,s="",p=e.length,f=0,d="",g=!1,x="",f++,s=a;f<p&&(m=e.charAt(f),!(r(m)||m===o||m===c||":"===m&&e.charAt(f+1)===h));)d+=m,f++;if(d){if(x+=d,d="",x+=m=e.charAt(f),f++,m===c)g=!0;else{if(":"!==m||e.charAt(f+1)!==h)return;x+=h,f++}for(;f<p&&(m=e.charAt(f),!r(m)&&m!==o);)d+=m,f++;if(m=e.charAt(f),d&&m===o)return!!i||(v=x+=d,s+=x+m,(y=t.now()).column++,y.offset++,g&&(x.slice(0,l).toLowerCase()===u?(v=v.substr(l),y.column+=l,y.offset+=l):x=u+x),b=this.inlineTokenizers,this.inlineTokenizers={text:b.text},k=this.enterLink(),v=this.tokenizeInline(v,y),this.inlineTokenizers=b,k(),t(s)({type:"link",title:null,url:n(x,{nonTerminated:!1}),children:v}))}}}},548:function(t,e,i){"use strict";var r=i(152),n=i(74),s=i(549);t.exports=m,m.locator=s,m.notInLink=!0;var a="[",o="]",c="(",h=")",u="<",l="@",p="mailto:",f=["http://","https://",p],d=f.length;function m(t,e,i){var s,m,g,x,y,v,b,k,_,w,A,S;if(this.options.gfm){for(s="",x=-1,k=d;++x<k;)if(v=f[x],(b=e.slice(0,v.length)).toLowerCase()===v){s=b;break}if(s){for(x=s.length,k=e.length,_="",w=0;x<k&&(g=e.charAt(x),!n(g)&&g!==u)&&("."!==g&&","!==g&&":"!==g&&";"!==g&&'"'!==g&&"'"!==g&&")"!==g&&"]"!==g||(A=e.charAt(x+1))&&!n(A))&&(g!==c&&g!==a||w++,g!==h&&g!==o||!(--w<0));)_+=g,x++;if(_){if(m=s+=_,v===p){if(-1===(y=_.indexOf(l))||y===k-1)return;m=m.substr(p.length)}return!!i||(S=this.enterLink(),m=this.tokenizeInline(m,t.now()),S(),t(s)({type:"link",title:null,url:r(s,{nonTerminated:!1}),children:m}))}}}}},549:function(t,e,i){"use strict";t.exports=function(t,e){var i,n=r.length,s=-1,a=-1;if(!this.options.gfm)return-1;for(;++s<n;)-1!==(i=t.indexOf(r[s],e))&&(i<a||-1===a)&&(a=i);return a};var r=["https://","http://","mailto:"]},550:function(t,e,i){"use strict";var r=i(194),n=i(198),s=i(197).tag;t.exports=c,c.locator=n;var a=/^<a /i,o=/^<\/a>/i;function c(t,e,i){var n,c,h=e.length;if(!("<"!==e.charAt(0)||h<3)&&(n=e.charAt(1),(r(n)||"?"===n||"!"===n||"/"===n)&&(c=e.match(s))))return!!i||(c=c[0],!this.inLink&&a.test(c)?this.inLink=!0:this.inLink&&o.test(c)&&(this.inLink=!1),t(c)({type:"html",value:c}))}},551:function(t,e,i){"use strict";var r=i(74),n=i(199);t.exports=g,g.locator=n;var s={}.hasOwnProperty,a="\\",o="[",c="]",h="(",u=")",l="<",p=">",f="`",d={'"':'"',"'":"'"},m={};function g(t,e,i){var n,g,x,y,v,b,k,_,w,A,S,E,C,T,I,P,O,L,N,j="",V=0,M=e.charAt(0),B=this.options.pedantic,R=this.options.commonmark,D=this.options.gfm;if("!"===M&&(w=!0,j=M,M=e.charAt(++V)),M===o&&(w||!this.inLink)){for(j+=M,I="",V++,E=e.length,T=0,(O=t.now()).column+=V,O.offset+=V;V<E;){if(b=M=e.charAt(V),M===f){for(g=1;e.charAt(V+1)===f;)b+=M,V++,g++;x?g>=x&&(x=0):x=g}else if(M===a)V++,b+=e.charAt(V);else if(x&&!D||M!==o){if((!x||D)&&M===c){if(!T){if(!B)for(;V<E&&(M=e.charAt(V+1),r(M));)b+=M,V++;if(e.charAt(V+1)!==h)return;b+=h,n=!0,V++;break}T--}}else T++;I+=b,b="",V++}if(n){for(A=I,j+=I+b,V++;V<E&&(M=e.charAt(V),r(M));)j+=M,V++;if(M=e.charAt(V),_=R?m:d,I="",y=j,M===l){for(V++,y+=l;V<E&&(M=e.charAt(V))!==p;){if(R&&"\n"===M)return;I+=M,V++}if(e.charAt(V)!==p)return;j+=l+I+p,P=I,V++}else{for(M=null,b="";V<E&&(M=e.charAt(V),!b||!s.call(_,M));){if(r(M)){if(!B)break;b+=M}else{if(M===h)T++;else if(M===u){if(0===T)break;T--}I+=b,b="",M===a&&(I+=a,M=e.charAt(++V)),I+=M}V++}P=I,V=(j+=I).length}for(I="";V<E&&(M=e.charAt(V),r(M));)I+=M,V++;if(M=e.charAt(V),j+=I,I&&s.call(_,M))if(V++,j+=M,I="",S=_[M],v=j,R){for(;V<E&&(M=e.charAt(V))!==S;)M===a&&(I+=a,M=e.charAt(++V)),V++,I+=M;if((M=e.charAt(V))!==S)return;for(C=I,j+=I+M,V++;V<E&&(M=e.charAt(V),r(M));)j+=M,V++}else for(b="";V<E;){if((M=e.charAt(V))===S)k&&(I+=S+b,b=""),k=!0;else if(k){if(M===u){j+=I+S+b,C=I;break}r(M)?b+=M:(I+=S+b+M,b="",k=!1)}else I+=M;V++}if(e.charAt(V)===u)return!!i||(j+=u,P=this.decode.raw(this.unescape(P),t(y).test().end,{nonTerminated:!1}),C&&(v=t(v).test().end,C=this.decode.raw(this.unescape(C),v)),N={type:w?"image":"link",title:C||null,url:P},w?N.alt=this.decode.raw(this.unescape(A),O)||null:(L=this.enterLink(),N.children=this.tokenizeInline(A,O),L()),t(j)(N))}}}m['"']='"',m["'"]="'",m[h]=u},552:function(t,e,i){"use strict";var r=i(74),n=i(199),s=i(156);t.exports=g,g.locator=n;var a="link",o="image",c="footnote",h="shortcut",u="collapsed",l="full",p="^",f="\\",d="[",m="]";function g(t,e,i){var n,g,x,y,v,b,k,_,w=e.charAt(0),A=0,S=e.length,E="",C="",T=a,I=h;if("!"===w&&(T=o,C=w,w=e.charAt(++A)),w===d){if(A++,C+=w,b="",this.options.footnotes&&e.charAt(A)===p){if(T===o)return;C+=p,A++,T=c}for(_=0;A<S;){if((w=e.charAt(A))===d)k=!0,_++;else if(w===m){if(!_)break;_--}w===f&&(b+=f,w=e.charAt(++A)),b+=w,A++}if(E=b,n=b,(w=e.charAt(A))===m){for(A++,E+=w,b="";A<S&&(w=e.charAt(A),r(w));)b+=w,A++;if(w=e.charAt(A),T!==c&&w===d){for(g="",b+=w,A++;A<S&&(w=e.charAt(A))!==d&&w!==m;)w===f&&(g+=f,w=e.charAt(++A)),g+=w,A++;(w=e.charAt(A))===m?(I=g?l:u,b+=g+w,A++):g="",E+=b,b=""}else{if(!n)return;g=n}if(I===l||!k)return E=C+E,T===a&&this.inLink?null:!!i||(T===c&&-1!==n.indexOf(" ")?t(E)({type:"footnote",children:this.tokenizeInline(n,t.now())}):((x=t.now()).column+=C.length,x.offset+=C.length,y={type:T+"Reference",identifier:s(g=I===l?g:n)},T!==a&&T!==o||(y.referenceType=I),T===a?(v=this.enterLink(),y.children=this.tokenizeInline(n,x),v()):T===o&&(y.alt=this.decode.raw(this.unescape(n),x)||null),t(E)(y)))}}}},553:function(t,e,i){"use strict";var r=i(101),n=i(74),s=i(554);t.exports=c,c.locator=s;var a="*",o="_";function c(t,e,i){var s,c,h,u,l,p,f,d=0,m=e.charAt(d);if(!(m!==a&&m!==o||e.charAt(++d)!==m||(c=this.options.pedantic,l=(h=m)+h,p=e.length,d++,u="",m="",c&&n(e.charAt(d)))))for(;d<p;){if(f=m,!((m=e.charAt(d))!==h||e.charAt(d+1)!==h||c&&n(f))&&(m=e.charAt(d+2))!==h){if(!r(u))return;return!!i||((s=t.now()).column+=2,s.offset+=2,t(l+u+l)({type:"strong",children:this.tokenizeInline(u,s)}))}c||"\\"!==m||(u+=m,m=e.charAt(++d)),u+=m,d++}}},554:function(t,e,i){"use strict";t.exports=function(t,e){var i=t.indexOf("**",e),r=t.indexOf("__",e);if(-1===r)return i;if(-1===i)return r;return r<i?r:i}},555:function(t,e,i){"use strict";var r=i(101),n=i(556),s=i(74),a=i(557);t.exports=h,h.locator=a;var o="*",c="_";function h(t,e,i){var a,h,u,l,p,f,d,m=0,g=e.charAt(m);if(!(g!==o&&g!==c||(h=this.options.pedantic,p=g,u=g,f=e.length,m++,l="",g="",h&&s(e.charAt(m)))))for(;m<f;){if(d=g,!((g=e.charAt(m))!==u||h&&s(d))){if((g=e.charAt(++m))!==u){if(!r(l)||d===u)return;if(!h&&u===c&&n(g)){l+=u;continue}return!!i||((a=t.now()).column++,a.offset++,t(p+l+u)({type:"emphasis",children:this.tokenizeInline(l,a)}))}l+=u}h||"\\"!==g||(l+=g,g=e.charAt(++m)),l+=g,m++}}},556:function(t,e,i){"use strict";t.exports=function(t){return n.test("number"==typeof t?r(t):t.charAt(0))};var r=String.fromCharCode,n=/\w/},557:function(t,e,i){"use strict";t.exports=function(t,e){var i=t.indexOf("*",e),r=t.indexOf("_",e);if(-1===r)return i;if(-1===i)return r;return r<i?r:i}},558:function(t,e,i){"use strict";var r=i(74),n=i(559);t.exports=o,o.locator=n;var s="~",a="~~";function o(t,e,i){var n,o,c,h="",u="",l="",p="";if(this.options.gfm&&e.charAt(0)===s&&e.charAt(1)===s&&!r(e.charAt(2)))for(n=1,o=e.length,(c=t.now()).column+=2,c.offset+=2;++n<o;){if(!((h=e.charAt(n))!==s||u!==s||l&&r(l)))return!!i||t(a+p+a)({type:"delete",children:this.tokenizeInline(p,c)});p+=u,l=u,u=h}}},559:function(t,e,i){"use strict";t.exports=function(t,e){return t.indexOf("~~",e)}},560:function(t,e,i){"use strict";var r=i(74),n=i(561);t.exports=a,a.locator=n;var s="`";function a(t,e,i){for(var n,a,o,c,h,u,l,p,f=e.length,d=0,m="",g="";d<f&&e.charAt(d)===s;)m+=s,d++;if(m){for(h=m,c=d,m="",p=e.charAt(d),o=0;d<f;){if(u=p,p=e.charAt(d+1),u===s?(o++,g+=u):(o=0,m+=u),o&&p!==s){if(o===c){h+=m+g,l=!0;break}m+=g,g=""}d++}if(!l){if(c%2!=0)return;m=""}if(i)return!0;for(n="",a="",f=m.length,d=-1;++d<f;)u=m.charAt(d),r(u)?a+=u:(a&&(n&&(n+=a),a=""),n+=u);return t(h)({type:"inlineCode",value:n})}}},561:function(t,e,i){"use strict";t.exports=function(t,e){return t.indexOf("`",e)}},562:function(t,e,i){"use strict";var r=i(563);t.exports=s,s.locator=r;var n=2;function s(t,e,i){for(var r,s=e.length,a=-1,o="";++a<s;){if("\n"===(r=e.charAt(a))){if(a<n)return;return!!i||t(o+=r)({type:"break"})}if(" "!==r)return;o+=r}}},563:function(t,e,i){"use strict";t.exports=function(t,e){var i=t.indexOf("\n",e);for(;i>e&&" "===t.charAt(i-1);)i--;return i}},564:function(t,e,i){"use strict";t.exports=function(t,e,i){var r,n,s,a,o,c,h,u,l,p;if(i)return!0;r=this.inlineMethods,a=r.length,n=this.inlineTokenizers,s=-1,l=e.length;for(;++s<a;)"text"!==(u=r[s])&&n[u]&&((h=n[u].locator)||t.file.fail("Missing locator: `"+u+"`"),-1!==(c=h.call(this,e,1))&&c<l&&(l=c));o=e.slice(0,l),p=t.now(),this.decode(o,p,(function(e,i,r){t(r||e)({type:"text",value:e})}))}},565:function(t,e,i){var r=i(566);t.exports=function(){return function(t){return r(t,"list",(function(t,e){var i,r,n=0;for(i=0,r=e.length;i<r;i++)"list"===e[i].type&&(n+=1);for(i=0,r=t.children.length;i<r;i++){var s=t.children[i];s.index=i,s.ordered=t.ordered}t.depth=n})),t}}},566:function(t,e,i){"use strict";t.exports=function(t,e,i){var r=[];"function"==typeof e&&(i=e,e=null);function n(t){var s;return e&&t.type!==e||(s=i(t,r.concat())),t.children&&!1!==s?function(t,e){var i,s=t.length,a=-1;r.push(e);for(;++a<s;)if((i=t[a])&&!1===n(i))return!1;return r.pop(),!0}(t.children,t):s}n(t)}},567:function(t,e,i){"use strict";var r=i(122),n="virtualHtml",s=/^<(area|base|br|col|embed|hr|img|input|keygen|link|meta|param|source|track|wbr)\s*\/?>$/i,a=/^<(\/?)([a-z]+)\s*>$/;t.exports=function(t){var e,i;return r(t,"html",(function(t,r,o){i!==o&&(e=[],i=o);var c=function(t){var e=t.value.match(s);return!!e&&e[1]}(t);if(c)return o.children.splice(r,1,{type:n,tag:c,position:t.position}),!0;var h=function(t,e){var i=t.value.match(a);return!!i&&{tag:i[2],opening:!i[1],node:t}}(t);if(!h)return!0;var u=function(t,e){var i=t.length;for(;i--;)if(t[i].tag===e)return t.splice(i,1)[0];return!1}(e,h.tag);return u?o.children.splice(r,0,function(t,e,i){var r=i.children.indexOf(t.node),s=i.children.indexOf(e.node),a=i.children.splice(r,s-r+1).slice(1,-1);return{type:n,children:a,tag:t.tag,position:{start:t.node.position.start,end:e.node.position.end,indent:[]}}}(h,u,o)):h.opening||e.push(h),!0}),!0),t}},568:function(t,e,i){"use strict";var r=i(122);function n(t,e,i,r){if("remove"===r)i.children.splice(e,1);else if("unwrap"===r){var n=[e,1];t.children&&(n=n.concat(t.children)),Array.prototype.splice.apply(i.children,n)}}e.ofType=function(t,e){return function(e){return t.forEach((function(t){return r(e,t,i,!0)})),e};function i(t,i,r){r&&n(t,i,r,e)}},e.ifNotMatch=function(t,e){return function(t){return r(t,i,!0),t};function i(i,r,s){s&&!t(i,r,s)&&n(i,r,s,e)}}},569:function(t,e,i){"use strict";var r=i(1),n=i(82);function s(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},o=arguments.length>3&&void 0!==arguments[3]?arguments[3]:0,c=e.renderers[t.type],h=t.position.start,u=[t.type,h.line,h.column].join("-");if("function"!=typeof c&&"string"!=typeof c&&!function(t){return r.Fragment&&r.Fragment===t}(c))throw new Error("Renderer for type `".concat(t.type,"` not defined or is not renderable"));var l=function(t,e,i,o,c,h){var u={key:e},l="string"==typeof o;i.sourcePos&&t.position&&(u["data-sourcepos"]=function(t){return[t.start.line,":",t.start.column,"-",t.end.line,":",t.end.column].map(String).join("")}(t.position));i.rawSourcePos&&!l&&(u.sourcePosition=t.position);i.includeNodeIndex&&c.node&&c.node.children&&!l&&(u.index=c.node.children.indexOf(t),u.parentChildCount=c.node.children.length);var p=null!==t.identifier&&void 0!==t.identifier?i.definitions[t.identifier]||{}:null;switch(t.type){case"root":a(u,{className:i.className});break;case"text":u.nodeKey=e,u.children=t.value;break;case"heading":u.level=t.depth;break;case"list":u.start=t.start,u.ordered=t.ordered,u.tight=!t.loose,u.depth=t.depth;break;case"listItem":u.checked=t.checked,u.tight=!t.loose,u.ordered=t.ordered,u.index=t.index,u.children=function(t,e){if(t.loose)return t.children;if(e.node&&t.index>0&&e.node.children[t.index-1].loose)return t.children;return function(t){return t.children.reduce((function(t,e){return t.concat("paragraph"===e.type?e.children||[]:[e])}),[])}(t)}(t,c).map((function(e,r){return s(e,i,{node:t,props:u},r)}));break;case"definition":a(u,{identifier:t.identifier,title:t.title,url:t.url});break;case"code":a(u,{language:t.lang&&t.lang.split(/\s/,1)[0]});break;case"inlineCode":u.children=t.value,u.inline=!0;break;case"link":a(u,{title:t.title||void 0,target:"function"==typeof i.linkTarget?i.linkTarget(t.url,t.children,t.title):i.linkTarget,href:i.transformLinkUri?i.transformLinkUri(t.url,t.children,t.title):t.url});break;case"image":a(u,{alt:t.alt||void 0,title:t.title||void 0,src:i.transformImageUri?i.transformImageUri(t.url,t.children,t.title,t.alt):t.url});break;case"linkReference":a(u,n(p,{href:i.transformLinkUri?i.transformLinkUri(p.href):p.href}));break;case"imageReference":a(u,{src:i.transformImageUri&&p.href?i.transformImageUri(p.href,t.children,p.title,t.alt):p.href,title:p.title||void 0,alt:t.alt||void 0});break;case"table":case"tableHead":case"tableBody":u.columnAlignment=t.align;break;case"tableRow":u.isHeader="tableHead"===c.node.type,u.columnAlignment=c.props.columnAlignment;break;case"tableCell":a(u,{isHeader:c.props.isHeader,align:c.props.columnAlignment[h]});break;case"virtualHtml":u.tag=t.tag;break;case"html":u.isBlock=t.position.start.line!==t.position.end.line,u.escapeHtml=i.escapeHtml,u.skipHtml=i.skipHtml;break;case"parsedHtml":u.escapeHtml=i.escapeHtml,u.skipHtml=i.skipHtml,u.element=function(t,e){var i=t.element;if(Array.isArray(i)){var n=r.Fragment||"div";return r.createElement(n,null,i)}var s=(i.props.children||[]).concat(e);return r.cloneElement(i,null,s)}(t,(t.children||[]).map((function(e,r){return s(e,i,{node:t,props:u},r)})));break;default:a(u,n(t,{type:void 0,position:void 0,children:void 0}))}!l&&t.value&&(u.value=t.value);return u}(t,u,e,c,i,o);return r.createElement(c,l,l.children||t.children&&t.children.map((function(i,r){return s(i,e,{node:t,props:l},r)}))||void 0)}function a(t,e){for(var i in e)void 0!==e[i]&&(t[i]=e[i])}t.exports=s},570:function(t,e,i){"use strict";var r=i(122);function n(t){var e=t.children;t.children=[{type:"tableHead",align:t.align,children:[e[0]],position:e[0].position}],e.length>1&&t.children.push({type:"tableBody",align:t.align,children:e.slice(1),position:{start:e[1].position.start,end:e[e.length-1].position.end}})}t.exports=function(t){return r(t,"table",n),t}},571:function(t,e,i){"use strict";t.exports=function t(e){var i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};return(e.children||[]).reduce((function(e,i){return"definition"===i.type&&(e[i.identifier]={href:i.url,title:i.title}),t(i,e)}),i)}},572:function(t,e,i){"use strict";var r=["http","https","mailto","tel"];t.exports=function(t){var e=(t||"").trim(),i=e.charAt(0);if("#"===i||"/"===i)return e;var n=e.indexOf(":");if(-1===n)return e;for(var s=r.length,a=-1;++a<s;){var o=r[a];if(n===o.length&&e.slice(0,o.length).toLowerCase()===o)return e}return-1!==(a=e.indexOf("?"))&&n>a?e:-1!==(a=e.indexOf("#"))&&n>a?e:"javascript:void(0)"}},573:function(t,e,i){"use strict";var r=i(82),n=i(1),s=parseInt((n.version||"16").slice(0,2),10)>=16,a=n.createElement;function o(t,e){return a(t,c(e),e.children)}function c(t){return t["data-sourcepos"]?{"data-sourcepos":t["data-sourcepos"]}:{}}t.exports={break:"br",paragraph:"p",emphasis:"em",strong:"strong",thematicBreak:"hr",blockquote:"blockquote",delete:"del",link:"a",image:"img",linkReference:"a",imageReference:"img",table:o.bind(null,"table"),tableHead:o.bind(null,"thead"),tableBody:o.bind(null,"tbody"),tableRow:o.bind(null,"tr"),tableCell:function(t){var e=t.align?{textAlign:t.align}:void 0,i=c(t);return a(t.isHeader?"th":"td",e?r({style:e},i):i,t.children)},root:function(t){var e=!t.className,i=e&&n.Fragment||"div";return a(i,e?null:t,t.children)},text:function(t){return s?t.children:a("span",null,t.children)},list:function(t){var e=c(t);null!==t.start&&1!==t.start&&(e.start=t.start.toString());return a(t.ordered?"ol":"ul",e,t.children)},listItem:function(t){var e=null;if(null!==t.checked){var i=t.checked;e=a("input",{type:"checkbox",checked:i,readOnly:!0})}return a("li",c(t),e,t.children)},definition:function(){return null},heading:function(t){return a("h".concat(t.level),c(t),t.children)},inlineCode:function(t){return a("code",c(t),t.children)},code:function(t){var e=t.language&&"language-".concat(t.language),i=a("code",e?{className:e}:null,t.value);return a("pre",c(t),i)},html:function(t){if(t.skipHtml)return null;var e=t.isBlock?"div":"span";if(t.escapeHtml){var i=n.Fragment||e;return a(i,null,t.value)}var r={dangerouslySetInnerHTML:{__html:t.value}};return a(e,r)},virtualHtml:function(t){return a(t.tag,c(t),t.children)},parsedHtml:function(t){return t["data-sourcepos"]?n.cloneElement(t.element,{"data-sourcepos":t["data-sourcepos"]}):t.element}}},574:function(t,e,i){"use strict";e.HtmlParser="undefined"==typeof Symbol?"__RMD_HTML_PARSER__":Symbol("__RMD_HTML_PARSER__")},685:function(t,e,i){"use strict";i.r(e);var r=i(1),n=i.n(r),s=i(14),a=i(686),o=i(2),c=Object(o.a)((function(t,e){for(var i={},r=0;r<t.length;)t[r]in e&&(i[t[r]]=e[t[r]]),r+=1;return i})),h=i(494),u=i.n(h),l=i(495),p=i.n(l),f={loadhljs:function(){var t=this;return Promise.resolve(window.hljs||i.e(4).then(i.bind(null,681)).then((function(t){return t.default}))).then((function(e){t.hljs=e,t.hljsResolve(),t.isReady=!0}))}},d=new Promise((function(t){f.hljsResolve=t}));f.isReady=d;var m=f,g=i(22),x=i(20);function y(t){return(y="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t})(t)}function v(t,e){for(var i=0;i<e.length;i++){var r=e[i];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(t,r.key,r)}}function b(t){return(b=Object.setPrototypeOf?Object.getPrototypeOf:function(t){return t.__proto__||Object.getPrototypeOf(t)})(t)}function k(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}function _(t,e){return(_=Object.setPrototypeOf||function(t,e){return t.__proto__=e,t})(t,e)}i.d(e,"default",(function(){return w}));var w=function(t){function e(t){var i,r,n;return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),r=this,n=b(e).call(this,t),i=!n||"object"!==y(n)&&"function"!=typeof n?k(r):n,!0!==m.isReady&&m.isReady.then((function(){i.setState({})})),i.highlightCode=i.highlightCode.bind(k(i)),i.dedent=i.dedent.bind(k(i)),i}var i,r,o;return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),e&&_(t,e)}(e,t),i=e,(r=[{key:"componentDidMount",value:function(){this.highlightCode()}},{key:"componentDidUpdate",value:function(){this.highlightCode()}},{key:"highlightCode",value:function(){if(this.mdContainer){var t=this.mdContainer.querySelectorAll("pre code");if(m.hljs)for(var e=0;e<t.length;e++)m.hljs.highlightBlock(t[e]);else m.loadhljs()}}},{key:"dedent",value:function(t){var e=t.split(/\r\n|\r|\n/),i=null,r=!0,n=!1,s=void 0;try{for(var a,o=e[Symbol.iterator]();!(r=(a=o.next()).done);r=!0){var c=a.value,h=c&&c.match(/^\s*(?=\S)/);if(h){var u=h[0];if(null!==i){for(var l=0;l<i.length;l++)if(u[l]!==i[l]){i=i.substr(0,l);break}}else i=u;if(!i)break}}}catch(t){n=!0,s=t}finally{try{r||null==o.return||o.return()}finally{if(n)throw s}}var p=i?i.length:0;return e.map((function(t){return t.match(/\S/)?t.substr(p):""})).join("\n")}},{key:"render",value:function(){var t=this,e=this.props,i=e.id,r=e.style,o=e.className,h=e.highlight_config,l=e.loading_state,f=e.dangerously_allow_html,d=e.children,m=e.dedent,g="Array"===Object(s.a)(d)?d.join("\n"):d,y=m&&g?this.dedent(g):g,v={dccLink:function(t){return n.a.createElement(x.a,t)},dccMarkdown:function(e){return n.a.createElement(p.a,Object(a.a)(c(["dangerously_allow_html","dedent"],t.props),c(["children"],e)))}};return n.a.createElement("div",{id:i,ref:function(e){t.mdContainer=e},style:r,className:(h&&h.theme||o)&&"".concat(o||""," ").concat(h&&h.theme&&"dark"===h.theme?"hljs-dark":""),"data-dash-is-loading":l&&l.is_loading||void 0},n.a.createElement(p.a,{source:y,escapeHtml:!f,renderers:{html:function(t){return t.escapeHtml?t.value:n.a.createElement(u.a,{jsx:t.value,components:v,renderInWrapper:!1})}}}))}}])&&v(i.prototype,r),o&&v(i,o),e}(r.Component);w.propTypes=g.c,w.defaultProps=g.b},74:function(t,e,i){"use strict";t.exports=function(t){return n.test("number"==typeof t?r(t):t.charAt(0))};var r=String.fromCharCode,n=/\s/},82:function(t,e){t.exports=function(){for(var t={},e=0;e<arguments.length;e++){var r=arguments[e];for(var n in r)i.call(r,n)&&(t[n]=r[n])}return t};var i=Object.prototype.hasOwnProperty}}]);
-//# sourceMappingURL=async-markdown.js.map
\ No newline at end of file
@@ -1,13 +0,0 @@
-(window.webpackJsonpdash_table=window.webpackJsonpdash_table||[]).push([[0],{126:function(e,t,n){"use strict";n.d(t,"a",function(){return o});var r=n(128);function o(e,t){return Object(r.a)(t,e,0)>=0}},127:function(e,t,n){"use strict";n.d(t,"a",function(){return o});var r=n(31);function o(e,t){return function(){var n=arguments.length;if(0===n)return t();var o=arguments[n-1];return Object(r.a)(o)||"function"!=typeof o[e]?t.apply(this,arguments):o[e].apply(o,Array.prototype.slice.call(arguments,0,n-1))}}},128:function(e,t,n){"use strict";var r=n(2);function o(e){for(var t,n=[];!(t=e.next()).done;)n.push(t.value);return n}function a(e,t,n){for(var r=0,o=n.length;r<o;){if(e(t,n[r]))return!0;r+=1}return!1}var i=n(18);var s="function"==typeof Object.is?Object.is:function(e,t){return e===t?0!==e||1/e==1/t:e!=e&&t!=t},l=n(28),c=n(49);function u(e,t,n,r){var i=o(e);function s(e,t){return p(e,t,n.slice(),r.slice())}return!a(function(e,t){return!a(s,t,e)},o(t),i)}function p(e,t,n,r){if(s(e,t))return!0;var o,a,f=Object(c.a)(e);if(f!==Object(c.a)(t))return!1;if(null==e||null==t)return!1;if("function"==typeof e["fantasy-land/equals"]||"function"==typeof t["fantasy-land/equals"])return"function"==typeof e["fantasy-land/equals"]&&e["fantasy-land/equals"](t)&&"function"==typeof t["fantasy-land/equals"]&&t["fantasy-land/equals"](e);if("function"==typeof e.equals||"function"==typeof t.equals)return"function"==typeof e.equals&&e.equals(t)&&"function"==typeof t.equals&&t.equals(e);switch(f){case"Arguments":case"Array":case"Object":if("function"==typeof e.constructor&&"Promise"===(o=e.constructor,null==(a=String(o).match(/^function (\w*)/))?"":a[1]))return e===t;break;case"Boolean":case"Number":case"String":if(typeof e!=typeof t||!s(e.valueOf(),t.valueOf()))return!1;break;case"Date":if(!s(e.valueOf(),t.valueOf()))return!1;break;case"Error":return e.name===t.name&&e.message===t.message;case"RegExp":if(e.source!==t.source||e.global!==t.global||e.ignoreCase!==t.ignoreCase||e.multiline!==t.multiline||e.sticky!==t.sticky||e.unicode!==t.unicode)return!1}for(var d=n.length-1;d>=0;){if(n[d]===e)return r[d]===t;d-=1}switch(f){case"Map":return e.size===t.size&&u(e.entries(),t.entries(),n.concat([e]),r.concat([t]));case"Set":return e.size===t.size&&u(e.values(),t.values(),n.concat([e]),r.concat([t]));case"Arguments":case"Array":case"Object":case"Boolean":case"Number":case"String":case"Date":case"Error":case"RegExp":case"Int8Array":case"Uint8Array":case"Uint8ClampedArray":case"Int16Array":case"Uint16Array":case"Int32Array":case"Uint32Array":case"Float32Array":case"Float64Array":case"ArrayBuffer":break;default:return!1}var h=Object(l.a)(e);if(h.length!==Object(l.a)(t).length)return!1;var b=n.concat([e]),v=r.concat([t]);for(d=h.length-1;d>=0;){var m=h[d];if(!Object(i.a)(m,t)||!p(t[m],e[m],b,v))return!1;d-=1}return!0}var f=Object(r.a)(function(e,t){return p(e,t,[],[])});function d(e,t,n){var r,o;if("function"==typeof e.indexOf)switch(typeof t){case"number":if(0===t){for(r=1/t;n<e.length;){if(0===(o=e[n])&&1/o===r)return n;n+=1}return-1}if(t!=t){for(;n<e.length;){if("number"==typeof(o=e[n])&&o!=o)return n;n+=1}return-1}return e.indexOf(t,n);case"string":case"boolean":case"function":case"undefined":return e.indexOf(t,n);case"object":if(null===t)return e.indexOf(t,n)}for(;n<e.length;){if(f(e[n],t))return n;n+=1}return-1}n.d(t,"a",function(){return d})},160:function(e,t,n){"use strict";var r,o=function(){return void 0===r&&(r=Boolean(window&&document&&document.all&&!window.atob)),r},a=function(){var e={};return function(t){if(void 0===e[t]){var n=document.querySelector(t);if(window.HTMLIFrameElement&&n instanceof window.HTMLIFrameElement)try{n=n.contentDocument.head}catch(e){n=null}e[t]=n}return e[t]}}(),i={};function s(e,t,n){for(var r=0;r<t.length;r++){var o={css:t[r][1],media:t[r][2],sourceMap:t[r][3]};i[e][r]?i[e][r](o):i[e].push(b(o,n))}}function l(e){var t=document.createElement("style"),r=e.attributes||{};if(void 0===r.nonce){var o=n.nc;o&&(r.nonce=o)}if(Object.keys(r).forEach(function(e){t.setAttribute(e,r[e])}),"function"==typeof e.insert)e.insert(t);else{var i=a(e.insert||"head");if(!i)throw new Error("Couldn't find a style target. This probably means that the value for the 'insert' parameter is invalid.");i.appendChild(t)}return t}var c,u=(c=[],function(e,t){return c[e]=t,c.filter(Boolean).join("\n")});function p(e,t,n,r){var o=n?"":r.css;if(e.styleSheet)e.styleSheet.cssText=u(t,o);else{var a=document.createTextNode(o),i=e.childNodes;i[t]&&e.removeChild(i[t]),i.length?e.insertBefore(a,i[t]):e.appendChild(a)}}function f(e,t,n){var r=n.css,o=n.media,a=n.sourceMap;if(o?e.setAttribute("media",o):e.removeAttribute("media"),a&&btoa&&(r+="\n/*# sourceMappingURL=data:application/json;base64,".concat(btoa(unescape(encodeURIComponent(JSON.stringify(a))))," */")),e.styleSheet)e.styleSheet.cssText=r;else{for(;e.firstChild;)e.removeChild(e.firstChild);e.appendChild(document.createTextNode(r))}}var d=null,h=0;function b(e,t){var n,r,o;if(t.singleton){var a=h++;n=d||(d=l(t)),r=p.bind(null,n,a,!1),o=p.bind(null,n,a,!0)}else n=l(t),r=f.bind(null,n,t),o=function(){!function(e){if(null===e.parentNode)return!1;e.parentNode.removeChild(e)}(n)};return r(e),function(t){if(t){if(t.css===e.css&&t.media===e.media&&t.sourceMap===e.sourceMap)return;r(e=t)}else o()}}e.exports=function(e,t,n){return(n=n||{}).singleton||"boolean"==typeof n.singleton||(n.singleton=o()),e=n.base?e+n.base:e,t=t||[],i[e]||(i[e]=[]),s(e,t,n),function(t){if(t=t||[],"[object Array]"===Object.prototype.toString.call(t)){i[e]||(i[e]=[]),s(e,t,n);for(var r=t.length;r<i[e].length;r++)i[e][r]();i[e].length=t.length,0===i[e].length&&delete i[e]}}}},161:function(e,t,n){"use strict";e.exports=function(e){var t=[];return t.toString=function(){return this.map(function(t){var n=function(e,t){var n=e[1]||"",r=e[3];if(!r)return n;if(t&&"function"==typeof btoa){var o=(i=r,s=btoa(unescape(encodeURIComponent(JSON.stringify(i)))),l="sourceMappingURL=data:application/json;charset=utf-8;base64,".concat(s),"/*# ".concat(l," */")),a=r.sources.map(function(e){return"/*# sourceURL=".concat(r.sourceRoot||"").concat(e," */")});return[n].concat(a).concat([o]).join("\n")}var i,s,l;return[n].join("\n")}(t,e);return t[2]?"@media ".concat(t[2]," {").concat(n,"}"):n}).join("")},t.i=function(e,n){"string"==typeof e&&(e=[[null,e,""]]);for(var r=0;r<e.length;r++){var o=[].concat(e[r]);n&&(o[2]?o[2]="".concat(n," and ").concat(o[2]):o[2]=n),t.push(o)}},t}},166:function(e,t,n){"use strict";n.r(t);var r=n(12),o=n.n(r),a=n(2),i=n(18),s=Object(a.a)(function(e,t){if(0===e.length)return!1;for(var n=t,r=0;r<e.length;){if(!Object(i.a)(e[r],n))return!1;n=n[e[r]],r+=1}return!0}),l=Object(a.a)(function(e,t){return s([e],t)}),c=n(5),u=Object(c.a)(function(e){var t,n=[];for(t in e)n[n.length]=t;return n}),p=n(125),f=n(29),d=n(170),h=n(70),b=n(40),v=Object(c.a)(function(e){return function(){return e}}),m=function(e){return{value:e,map:function(t){return m(t(e))}}},y=Object(b.a)(function(e,t,n){return e(function(e){return m(t(e))})(n).value}),g=Object(b.a)(function(e,t,n){return y(e,v(t),n)}),w=n(31),k=Number.isInteger||function(e){return e<<0===e},O=n(163),x=n(162),_=Object(b.a)(function e(t,n,r){if(0===t.length)return n;var o=t[0];if(t.length>1){var a=!Object(x.a)(r)&&Object(i.a)(o,r)?r[o]:k(t[1])?[]:{};n=e(Array.prototype.slice.call(t,1),n,a)}if(k(o)&&Object(w.a)(r)){var s=[].concat(r);return s[o]=n,s}return Object(O.a)(o,n,r)}),E=Object(a.a)(function(e,t){return function(n){return function(r){return Object(h.a)(function(e){return t(e,r)},n(e(r)))}}}),S=n(81),C=Object(c.a)(function(e){return E(Object(S.a)(e),_(e))}),j=Object(a.a)(function(e,t){return t>e?t:e}),A=Object(a.a)(function(e,t){return t<e?t:e}),P=n(351),T=n(352);function M(e){return e}var F=n(23),D=n(72);var R=n(44),I=n(17),N=function(e){var t=function(e){return{"@@transducer/init":I.a.init,"@@transducer/result":function(t){return e["@@transducer/result"](t)},"@@transducer/step":function(t,n){var r=e["@@transducer/step"](t,n);return r["@@transducer/reduced"]?{"@@transducer/value":r,"@@transducer/reduced":!0}:r}}}(e);return{"@@transducer/init":I.a.init,"@@transducer/result":function(e){return t["@@transducer/result"](e)},"@@transducer/step":function(e,n){return Object(D.a)(n)?Object(R.a)(t,e,n):Object(R.a)(t,e,[n])}}},z=Object(a.a)(function(e,t){return Object(h.a)(e,N(t))}),L=Object(a.a)(Object(F.a)(["fantasy-land/chain","chain"],z,function(e,t){return"function"==typeof t?function(n){return e(t(n))(n)}:(n=!1,function e(t){for(var r,o,a,i=[],s=0,l=t.length;s<l;){if(Object(D.a)(t[s]))for(a=0,o=(r=n?e(t[s]):t[s]).length;a<o;)i[i.length]=r[a],a+=1;else i[i.length]=t[s];s+=1}return i})(Object(h.a)(e,t));var n}))(M),B=n(6);function V(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function q(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function W(e,t,n){return t&&q(e.prototype,t),n&&q(e,n),e}var U=function(){function e(t){V(this,e),this.name=t}return W(e,[{key:"addRule",value:function(e,t){this.sheet.addRule?this.sheet.addRule(e,t):this.sheet.insertRule("".concat(e," { ").concat(t," }"),0)}},{key:"deleteRule",value:function(e){this.sheet.deleteRule(e)}},{key:"findRule",value:function(e){var t=this.rules,n=t.findIndex(function(t){return t.selectorText===e});return-1===n?null:{rule:t[n],index:n}}},{key:"rules",get:function(){var e=this.sheet;return Array.from(e.rules||e.cssRules)}},{key:"sheet",get:function(){var e,t=this;return(this.__stylesheet=this.__stylesheet||(e=document.createElement("style"),e.type="text/css",e.id=t.name,document.getElementsByTagName("head")[0].appendChild(e),e)).sheet}}]),e}(),K=function(){function e(t){V(this,e),this.prefix=t,this.stylesheet=new U("".concat(t,"-dynamic-inline.css"))}return W(e,[{key:"deleteRule",value:function(e){e="".concat(this.prefix," ").concat(e);var t=this.stylesheet.findRule(e);t&&this.stylesheet.deleteRule(t.index)}},{key:"setRule",value:function(e,t){e="".concat(this.prefix," ").concat(e);var n=this.stylesheet.findRule(e);if(n){if(n.rule.cssText===t||n.rule.cssText==="".concat(e," { ").concat(t," }"))return;this.stylesheet.deleteRule(n.index)}this.stylesheet.addRule(e,t),B.c.trace("stylesheet",e,t)}}]),e}(),H={MOUSE_LEFT:1,MOUSE_RIGHT:3,MOUSE_MIDDLE:2,BACKSPACE:8,COMMA:188,INSERT:45,DELETE:46,END:35,ENTER:13,ESCAPE:27,CONTROL:17,COMMAND_LEFT:91,COMMAND_RIGHT:93,COMMAND_FIREFOX:224,ALT:18,HOME:36,PAGE_DOWN:34,PAGE_UP:33,PERIOD:190,SPACE:32,SHIFT:16,CAPS_LOCK:20,TAB:9,ARROW_RIGHT:39,ARROW_LEFT:37,ARROW_UP:38,ARROW_DOWN:40,F1:112,F2:113,F3:114,F4:115,F5:116,F6:117,F7:118,F8:119,F9:120,F10:121,F11:122,F12:123,A:65,X:88,C:67,V:86},$=(H.ARROW_DOWN,H.ARROW_UP,H.ARROW_LEFT,H.ARROW_RIGHT,H.HOME,H.END,H.DELETE,H.BACKSPACE,H.F1,H.F2,H.F3,H.F4,H.F5,H.F6,H.F7,H.F8,H.F9,H.F10,H.F11,H.F12,H.TAB,H.PAGE_DOWN,H.PAGE_UP,H.ENTER,H.ESCAPE,H.SHIFT,H.CAPS_LOCK,H.ALT,[H.ARROW_DOWN,H.ARROW_UP,H.ARROW_LEFT,H.ARROW_RIGHT]),G=[].concat($,[H.TAB,H.ENTER]);function Y(e){return-1!==G.indexOf(e)}var Z=function(e){return(e.ctrlKey||e.metaKey)&&!e.altKey},X=n(127),J=Object(b.a)(Object(X.a)("slice",function(e,t,n){return Array.prototype.slice.call(n,e,t)})),Q=n(350),ee=n(167),te=Object(a.a)(function(e,t){for(var n={},r={},o=0,a=e.length;o<a;)r[e[o]]=1,o+=1;for(var i in t)r.hasOwnProperty(i)||(n[i]=t[i]);return n}),ne=n(46),re=Object(a.a)(function(e,t){return Object(ne.a)({},e,t)}),oe=n(353),ae=n(49),ie=n(66);function se(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function le(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ce(e,t,n,r,o){var a=arguments.length>5&&void 0!==arguments[5]&&arguments[5];if(!e.name||Array.isArray(e.name)&&e.name.length<n||!r)return{groupIndexFirst:o,groupIndexLast:o};if(a)for(var i=o;i>=0;--i){var s=t[i];if(!(s.name&&Array.isArray(s.name)&&s.name.length>n&&s.name[n]===e.name[n]))break;o=i}for(var l=o,c=o;c<t.length;++c){var u=t[c];if(!(u.name&&Array.isArray(u.name)&&u.name.length>n&&u.name[n]===e.name[n]))break;l=c}return{groupIndexFirst:o,groupIndexLast:l}}function ue(e,t,n,r){var o=arguments.length>4&&void 0!==arguments[4]&&arguments[4],a=ce(e,t,n,r,t.indexOf(e),o),i=a.groupIndexFirst,s=a.groupIndexLast;return J(i,s+1,Q.a("id",t))}function pe(e,t,n,r,o,a){return{data:fe(e,t,n,r,o,a).data}}function fe(e,t,n,r,o,a){var i=ue(e,n,r,o);return function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?se(Object(n),!0).forEach(function(t){le(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):se(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}({columns:ee.a(function(e){return-1===i.indexOf(e.id)},t),data:h.a(te(i),a)},he)}function de(e,t,n,r){var o=ce(e,t,n,r,t.indexOf(e)),a=o.groupIndexFirst,i=o.groupIndexLast;return h.a(function(e){return e.id},t.slice(a,i+1))}var he={active_cell:void 0,start_cell:void 0,end_cell:void 0,selected_cells:[]};function be(e,t,n,r){var o=window.prompt("Enter a new column name");return null===o?null:function(e,t,n,r,o){var a=t,i=Object(ie.a)(a),s=a.findIndex(function(t){return t.id===e.id});if("string"==typeof e.name&&i>1){var l=Array(i).fill(e.name),c=re(e,{name:l});(a=a.slice(0))[s]=c}var u=ce(e,a,n,r,s,!0),p=u.groupIndexFirst,f=u.groupIndexLast;return oe.a(p,f+1).map(function(e){var t=[e,"name"];"Array"===ae.a(a[e].name)&&t.push(n),a=g(C(t),o,a)}),{columns:a}}(e,t,n,r,o)}var ve=n(4);function me(e,t){var n;t=t||[];var r=(e=e||[]).length,o=t.length,a=[];for(n=0;n<r;)a[a.length]=e[n],n+=1;for(n=0;n<o;)a[a.length]=t[n],n+=1;return a}var ye=n(68),ge=Object(c.a)(function(e){return Object(ye.a)(e.length,function(){var t=0,n=arguments[0],r=arguments[arguments.length-1],o=Array.prototype.slice.call(arguments,0);return o[0]=function(){var e=n.apply(this,me(arguments,[t,r]));return t+=1,e},e.apply(this,o)})});function we(e){return"[object Function]"===Object.prototype.toString.call(e)}var ke=n(69),Oe=n(126),xe=n(79);function _e(e){return'"'+e.replace(/\\/g,"\\\\").replace(/[\b]/g,"\\b").replace(/\f/g,"\\f").replace(/\n/g,"\\n").replace(/\r/g,"\\r").replace(/\t/g,"\\t").replace(/\v/g,"\\v").replace(/\0/g,"\\0").replace(/"/g,'\\"')+'"'}var Ee=function(e){return(e<10?"0":"")+e},Se="function"==typeof Date.prototype.toISOString?function(e){return e.toISOString()}:function(e){return e.getUTCFullYear()+"-"+Ee(e.getUTCMonth()+1)+"-"+Ee(e.getUTCDate())+"T"+Ee(e.getUTCHours())+":"+Ee(e.getUTCMinutes())+":"+Ee(e.getUTCSeconds())+"."+(e.getUTCMilliseconds()/1e3).toFixed(3).slice(2,5)+"Z"},Ce=n(28);var je=Object(a.a)(function(e,t){return Object(ee.a)((n=e,function(){return!n.apply(this,arguments)}),t);var n});var Ae=Object(c.a)(function(e){return function e(t,n){var r=function(r){var o=n.concat([t]);return Object(Oe.a)(r,o)?"<Circular>":e(r,o)},o=function(e,t){return Object(xe.a)(function(t){return _e(t)+": "+r(e[t])},t.slice().sort())};switch(Object.prototype.toString.call(t)){case"[object Arguments]":return"(function() { return arguments; }("+Object(xe.a)(r,t).join(", ")+"))";case"[object Array]":return"["+Object(xe.a)(r,t).concat(o(t,je(function(e){return/^\d+$/.test(e)},Object(Ce.a)(t)))).join(", ")+"]";case"[object Boolean]":return"object"==typeof t?"new Boolean("+r(t.valueOf())+")":t.toString();case"[object Date]":return"new Date("+(isNaN(t.valueOf())?r(NaN):_e(Se(t)))+")";case"[object Null]":return"null";case"[object Number]":return"object"==typeof t?"new Number("+r(t.valueOf())+")":1/t==-1/0?"-0":t.toString(10);case"[object String]":return"object"==typeof t?"new String("+r(t.valueOf())+")":_e(t);case"[object Undefined]":return"undefined";default:if("function"==typeof t.toString){var a=t.toString();if("[object Object]"!==a)return a}return"{"+o(t,Object(Ce.a)(t)).join(", ")+"}"}}(e,[])}),Pe=Object(a.a)(function(e,t){if(Object(w.a)(e)){if(Object(w.a)(t))return e.concat(t);throw new TypeError(Ae(t)+" is not an array")}if(Object(ke.a)(e)){if(Object(ke.a)(t))return e+t;throw new TypeError(Ae(t)+" is not a string")}if(null!=e&&we(e["fantasy-land/concat"]))return e["fantasy-land/concat"](t);if(null!=e&&we(e.concat))return e.concat(t);throw new TypeError(Ae(e)+' does not have a method named "concat" or "fantasy-land/concat"')}),Te=Object(a.a)(function(e,t){for(var n={},r=0;r<e.length;)e[r]in t&&(n[e[r]]=t[e[r]]),r+=1;return n}),Me=Object(c.a)(function(e){for(var t=0,n=[];t<e.length;){for(var r=e[t],o=0;o<r.length;)void 0===n[o]&&(n[o]=[]),n[o].push(r[o]),o+=1;t+=1}return n}),Fe=n(73);function De(e,t,n,r,o,a,i){try{var s=e[a](i),l=s.value}catch(e){return void n(e)}s.done?t(l):Promise.resolve(l).then(r,o)}function Re(e){return function(){var t=this,n=arguments;return new Promise(function(r,o){var a=e.apply(t,n);function i(e){De(a,r,o,i,s,"next",e)}function s(e){De(a,r,o,i,s,"throw",e)}i(void 0)})}}function Ie(e){var t=[],n=ge(P.a),r=ge(P.a);return n(function(e,n){var o={};r(function(e,r){o[e]?r===o[e].e.c+1?o[e].e={r:n,c:r}:(t.push(o[e]),o[e]={s:{r:n,c:r},e:{r:n,c:r}}):o[e]={s:{r:n,c:r},e:{r:n,c:r}}},e);var a=Object.values(o);t=Pe(t,a)},e),ee.a(function(e){return e.s.c!==e.e.c||e.s.r!==e.e.r},t)}function Ne(e,t,n,r,o){return ze.apply(this,arguments)}function ze(){return(ze=Re(regeneratorRuntime.mark(function e(t,n,r,o,a){var i,s,l,c;return regeneratorRuntime.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,Fe.a.xlsx;case 2:return i=e.sent,s=i.utils.aoa_to_sheet([]),n=h.a(Te(r))(n),o===ve.f.Display||o===ve.f.Names||o===ve.f.None?(i.utils.sheet_add_json(s,t,{skipHeader:!0}),l=t.length>0?{header:r,skipHeader:!0,origin:t.length}:{skipHeader:!0},i.utils.sheet_add_json(s,n,l),o===ve.f.Display&&a&&(s["!merges"]=Ie(t))):o===ve.f.Ids&&i.utils.sheet_add_json(s,n,{header:r}),c=i.utils.book_new(),i.utils.book_append_sheet(c,s,"SheetJS"),e.abrupt("return",c);case 9:case"end":return e.stop()}},e)}))).apply(this,arguments)}function Le(e,t){return Be.apply(this,arguments)}function Be(){return(Be=Re(regeneratorRuntime.mark(function e(t,n){var r;return regeneratorRuntime.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,Fe.a.xlsx;case 2:r=e.sent,"xlsx"===n?r.writeFile(t,"Data.xlsx",{bookType:"xlsx",type:"buffer"}):"csv"===n&&r.writeFile(t,"Data.csv",{bookType:"csv",type:"buffer"});case 4:case"end":return e.stop()}},e)}))).apply(this,arguments)}function Ve(e,t){var n=function(e,t){return e.map(function(e){return e instanceof Array&&e.length<t?e.concat(Array(t-e.length).fill("")):0===t||1===t?[e]:e instanceof String||"string"==typeof e?Array(t).fill(e):e})}(e,t);return Me(n)}function qe(e,t,n,r,o,a,i){try{var s=e[a](i),l=s.value}catch(e){return void n(e)}s.done?t(l):Promise.resolve(l).then(r,o)}var We=o.a.memo(function(e){var t=e.columns,n=e.export_columns,r=e.export_format,a=e.virtual_data,i=e.export_headers,s=e.visibleColumns,l=e.merge_duplicate_headers,c=r===ve.e.Csv||r===ve.e.Xlsx,u=n===ve.d.Visible?s:t,p=function(){var e,n=(e=regeneratorRuntime.mark(function e(){var n,o,s,c,p;return regeneratorRuntime.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:return n=u.map(function(e){return e.id}),o=u.map(function(e){return e.name}),s=Object(ie.a)(t),c=i!==ve.f.None?Ve(o,s):[],e.next=6,Ne(c,a.data,n,i,l);case 6:return p=e.sent,e.next=9,Le(p,r);case 9:case"end":return e.stop()}},e)}),function(){var t=this,n=arguments;return new Promise(function(r,o){var a=e.apply(t,n);function i(e){qe(a,r,o,i,s,"next",e)}function s(e){qe(a,r,o,i,s,"throw",e)}i(void 0)})});return function(){return n.apply(this,arguments)}}();return o.a.createElement("div",null,c?o.a.createElement("button",{className:"export",onClick:p},"Export"):null)}),Ue=Object(b.a)(R.a);function Ke(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,a=void 0;try{for(var i,s=e[Symbol.iterator]();!(r=(i=s.next()).done)&&(n.push(i.value),!t||n.length!==t);r=!0);}catch(e){o=!0,a=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw a}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function He(e){var t=Q.a("row",e),n=Q.a("column",e);return{minRow:Ue(A,1/0,t),minCol:Ue(A,1/0,n),maxRow:Ue(j,0,t),maxCol:Ue(j,0,n)}}function $e(e,t){var n=He(t),r=n.minRow,o=n.minCol,a=n.maxRow,i=n.maxCol,s=Ke(e,2),l=s[0],c=s[1],u=[l,c];return l>a&&(u[0]=r,u[1]=c+1>i?o:c+1),l<r&&(u[0]=a,u[1]=c-1<o?i:c-1),c>i&&(u[1]=o,u[0]=l+1>a?r:l+1),c<o&&(u[1]=i,u[0]=l-1<o?a:l-1),u}var Ge=Object(a.a)(function(e,t){for(var n,r=0,o=e.length,a=t.length,i=[];r<o;){for(n=0;n<a;)i[i.length]=[e[r],t[n]],n+=1;r+=1}return i});function Ye(e,t,n,r){var o={row:e,column:t,column_id:n[t].id},a=r.data[e].id;return void 0!==a&&(o.row_id=a),o}function Ze(e,t,n){var r=e.minRow,o=e.maxRow,a=e.minCol,i=e.maxCol;return Object(h.a)(function(e){return Ye(e[0],e[1],t,n)},Ge(Object(oe.a)(r,o+1),Object(oe.a)(a,i+1)))}var Xe=function(){var e=document.createElement("div");e.style.position="absolute",e.style.visibility="hidden",e.style.width="100px",e.style.height="100px",e.style.overflow="scroll";var t=document.createElement("div");return t.style.width="100px",t.style.height="100px",e.appendChild(t),document.body.appendChild(e),new Promise(function(n){setTimeout(function(){var r=t.clientWidth-e.clientWidth;document.body.removeChild(e),n(r)},0)})};function Je(e,t,n){for(var r=e.length,o=new Array(r),a=0;a<r;++a)o[a]=n(e[a],t[a],a);return o}var Qe=n(67),et=function(){function e(e,t){this.xf=t,this.f=e,this.found=!1}return e.prototype["@@transducer/init"]=I.a.init,e.prototype["@@transducer/result"]=function(e){return this.found||(e=this.xf["@@transducer/step"](e,void 0)),this.xf["@@transducer/result"](e)},e.prototype["@@transducer/step"]=function(e,t){return this.f(t)&&(this.found=!0,e=Object(Qe.a)(this.xf["@@transducer/step"](e,t))),e},e}(),tt=Object(a.a)(function(e,t){return new et(e,t)}),nt=Object(a.a)(Object(F.a)(["find"],tt,function(e,t){for(var n=0,r=t.length;n<r;){if(e(t[n]))return t[n];n+=1}}));function rt(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,a=void 0;try{for(var i,s=e[Symbol.iterator]();!(r=(i=s.next()).done)&&(n.push(i.value),!t||n.length!==t);r=!0);}catch(e){o=!0,a=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw a}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function ot(e){return(ot="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function at(e,t){for(var n=[],r=function(){t=t.replace(/^\s+/,"");var r=n.slice(-1)[0],o=r?r.lexeme:null,a=e.filter(function(e){return e.if&&(Array.isArray(e.if)?o?e.if&&-1!==e.if.indexOf(o.type):e.if&&-1!==e.if.indexOf(void 0):e.if(n,r))}),i=nt(function(e){return e.regexp.test(t)},a);if(!i)return{v:{lexemes:n,valid:!1,error:t}};var s=(t.match(i.regexp)||[])[i.regexpMatch||0];n.push({lexeme:i,value:s}),t=t.substring(s.length)};t.length;){var o=r();if("object"===ot(o))return o.v}var a=rt([void 0,void 0].concat(n).slice(-2),2),i=a[0],s=a[1],l=!s||("function"==typeof s.lexeme.terminal?s.lexeme.terminal(n,i):s.lexeme.terminal);return{lexemes:n,valid:l}}var it=Object(c.a)(M);function st(e,t,n){var r,o=typeof e;switch(o){case"string":case"number":return 0===e&&1/e==-1/0?!!n._items["-0"]||(t&&(n._items["-0"]=!0),!1):null!==n._nativeSet?t?(r=n._nativeSet.size,n._nativeSet.add(e),n._nativeSet.size===r):n._nativeSet.has(e):o in n._items?e in n._items[o]||(t&&(n._items[o][e]=!0),!1):(t&&(n._items[o]={},n._items[o][e]=!0),!1);case"boolean":if(o in n._items){var a=e?1:0;return!!n._items[o][a]||(t&&(n._items[o][a]=!0),!1)}return t&&(n._items[o]=e?[!1,!0]:[!0,!1]),!1;case"function":return null!==n._nativeSet?t?(r=n._nativeSet.size,n._nativeSet.add(e),n._nativeSet.size===r):n._nativeSet.has(e):o in n._items?!!Object(Oe.a)(e,n._items[o])||(t&&n._items[o].push(e),!1):(t&&(n._items[o]=[e]),!1);case"undefined":return!!n._items[o]||(t&&(n._items[o]=!0),!1);case"object":if(null===e)return!!n._items.null||(t&&(n._items.null=!0),!1);default:return(o=Object.prototype.toString.call(e))in n._items?!!Object(Oe.a)(e,n._items[o])||(t&&n._items[o].push(e),!1):(t&&(n._items[o]=[e]),!1)}}var lt=function(){function e(){this._nativeSet="function"==typeof Set?new Set:null,this._items={}}return e.prototype.add=function(e){return!st(e,!0,this)},e.prototype.has=function(e){return st(e,!1,this)},e}(),ct=Object(a.a)(function(e,t){for(var n,r,o=new lt,a=[],i=0;i<t.length;)n=e(r=t[i]),o.add(n)&&a.push(r),i+=1;return a})(it),ut=Object(a.a)(function(e,t){var n=e<0?t.length+e:e;return Object(ke.a)(t)?t.charAt(n):t[n]}),pt=ut(0),ft=ut(-1),dt=Object(a.a)(function(e,t){for(var n=e.length,r=[],o=0;o<n;)r[o]=t[e[o]],o+=1;return r}),ht=n(361),bt=n.n(ht);function vt(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}var mt=function(){function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e)}var t,n,r;return t=e,r=[{key:"set",value:function(e,t){e.clipboardData.setData("text/plain",t),e.preventDefault()}},{key:"get",value:function(e){return e.clipboardData?e.clipboardData.getData("text/plain"):void 0}}],(n=null)&&vt(t.prototype,n),r&&vt(t,r),e}(),yt=n(349),gt=Object(b.a)(function(e,t,n){return e=e<n.length&&e>=0?e:n.length,[].concat(Array.prototype.slice.call(n,0,e),t,Array.prototype.slice.call(n,e))}),wt=n(128),kt=Object(a.a)(function(e,t){return"function"!=typeof t.indexOf||Object(w.a)(t)?Object(wt.a)(t,e,0):t.indexOf(e)}),Ot=Object(a.a)(function(e,t){var n,r=Number(t),o=0;if(r<0||isNaN(r))throw new RangeError("n must be a non-negative number");for(n=new Array(r);o<r;)n[o]=e(o),o+=1;return n}),xt=Object(a.a)(function(e,t){return Ot(v(e),t)}),_t=function(e,t){return{success:!0,value:e}},Et=n(396),St=n(355),Ct=n.n(St),jt=function(e,t){var n=Boolean(t&&t.validation&&t.validation.allow_null),r=At(e);return{success:r&&n,value:r?null:e}},At=function(e){return null==e||"number"==typeof e&&(isNaN(e)||!isFinite(e))};function Pt(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Tt(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Mt(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n,r,o={},a=Object.keys(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var Ft=function(e){var t=e.group,n=e.symbol,r=Mt(e,["group","symbol"]);return function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Pt(Object(n),!0).forEach(function(t){Tt(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Pt(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}({currency:n,thousands:t},te(["separate_4digits","symbol"],r))};function Dt(e,t){return Ct()(e)?{success:!0,value:+e}:jt(e,t)}function Rt(e,t){return"number"!=typeof e||At(e)?jt(e,t):{success:!0,value:e}}function It(e,t){return At(e)?jt(e,t):"string"==typeof e?{success:!0,value:e}:{success:!0,value:JSON.stringify(e)}}function Nt(e,t){return"string"==typeof e?{success:!0,value:e}:jt(e,t)}var zt=/^\s*(-?\d{4}|\d{2})(-(\d{1,2})(-(\d{1,2})([ Tt]([01]?\d|2[0-3])(:([0-5]\d)(:([0-5]\d(\.\d+)?))?(Z|z|[+\-]\d{2}:?\d{2})?)?)?)?)?\s*$/m,Lt=(new Date).getFullYear()-70;function Bt(e,t){if("string"!=typeof e)return null;var n=e.match(zt);if(!n)return null;var r=n[1],o=2===r.length;if(o&&(!t||!t.allow_YY))return null;var a=o?(Number(r)+2e3-Lt)%100+Lt:Number(r),i=a<0,s=n[3],l=Number(s||"1")-1,c=n[5],u=Number(c||1),p=n[7],f=Number(p||0),d=n[9],h=Number(d||0),b=n[11],v=new Date(Date.UTC(2e3,l,u,f,h));if(v.setUTCFullYear(a),v.getUTCMonth()!==l||v.getUTCDate()!==u)return null;var m=b?29:d?16:p?13:c?10:s?7:4;return(i?"-":"")+(v.toISOString().substr(i?3:0,17).replace("T"," ")+(b||"")).substr(0,m)}function Vt(e,t){var n=Bt(e,t&&t.validation);return null!==n?{success:!0,value:n}:jt(e,t)}function qt(e,t){return"string"==typeof e&&null!==Bt(e,t&&t.validation)?{success:!0,value:e.trim()}:jt(e,t)}function Wt(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Ut(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Wt(Object(n),!0).forEach(function(t){Kt(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Wt(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Kt(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ht(e,t){var n=t&&t.on_change&&t.on_change.action||ve.a.Coerce;switch(n){case ve.a.Coerce:return Ut({action:n},function(e){switch(e.type){case ve.c.Numeric:return Dt;case ve.c.Text:return It;case ve.c.Datetime:return Vt;case ve.c.Any:default:return _t}}(t)(e,t));case ve.a.None:return{success:!0,value:e,action:n};case ve.a.Validate:return Ut({action:n},function(e){switch(e.type){case ve.c.Numeric:return Rt;case ve.c.Text:return Nt;case ve.c.Datetime:return qt;case ve.c.Any:default:return _t}}(t)(e,t))}}var $t=function(e,t){var n=Ht(e,t);return n.success?n:function(e,t){var n=t&&t.on_change&&t.on_change.failure||ve.b.Reject;if(e.failure=n,n===ve.b.Default){var r=t&&t.validation&&t.validation.default,o=x.a(r)?null:r;e.success=!0,e.value=o}else n===ve.b.Accept&&(e.success=!0);return e}(n,t)};function Gt(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,a=void 0;try{for(var i,s=e[Symbol.iterator]();!(r=(i=s.next()).done)&&(n.push(i.value),!t||n.length!==t);r=!0);}catch(e){o=!0,a=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw a}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}var Yt=function(e,t,n,r,o,a){var i=!(arguments.length>6&&void 0!==arguments[6])||arguments[6],s=!(arguments.length>7&&void 0!==arguments[7])||arguments[7];s||B.c.debug("Clipboard -- Sorting or filtering active, do not create new rows"),i||B.c.debug("Clipboard -- Do not create new columns");var l=yt.a(a),c=r.slice(0),u=o.slice(0);if(i&&e[0].length+t.column>=o.length){for(var p=[],f=function(e){p.push({id:"Column ".concat(e+1),name:"Column ".concat(e+1),type:ve.c.Any,sort_as_null:[]}),l.forEach(function(t){return t["Column ".concat(e)]=""})},d=o.length;d<e[0].length+t.column;d++)f(d);c=gt(kt(ft(o),r)+1,p,c),u=Pe(u,p)}var h=n[t.row];if(s&&e.length+h>=a.length){var b={};o.forEach(function(e){return b[e.id]=""}),l=Pe(l,xt(b,e.length+h-a.length))}var v=n.slice(-1)[0]||0,m=n.length,y=!0,w=!1,k=void 0;try{for(var O,x=e.entries()[Symbol.iterator]();!(y=(O=x.next()).done);y=!0){var _=Gt(O.value,2),E=_[0],S=_[1],j=!0,A=!1,P=void 0;try{for(var T,M=S.entries()[Symbol.iterator]();!(j=(T=M.next()).done);j=!0){var F=Gt(T.value,2),D=F[0],R=F[1],I=t.row+E,N=m>I?n[I]:s?v+(I-m+1):void 0;if(void 0!==N){var z=t.column+D,L=u[z];if(L&&L.editable){var V=$t(R,L);V.success&&(l=g(C([N,L.id]),V.value,l))}}}}catch(e){A=!0,P=e}finally{try{j||null==M.return||M.return()}finally{if(A)throw P}}}}catch(e){w=!0,k=e}finally{try{y||null==x.return||x.return()}finally{if(w)throw k}}return{data:l,columns:c}};function Zt(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}var Xt=function(){function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e)}var t,n,r;return t=e,r=[{key:"toClipboard",value:function(t,n,r,o,a,i){var s=ct(Q.a("row",n).sort(function(e,t){return e-t})),l=ct(Q.a("column",n).sort(function(e,t){return e-t})),c=J(pt(s),ft(s)+1,a).map(function(e){return dt(l,dt(Q.a("id",o),e))}),u=bt.a.prototype.stringify(c);if(e.lastLocalCopy=c,i){var p=Ve(Q.a("name",o),Object(ie.a)(r)),f=h.a(function(e){return h.a(function(t){return e[t]},l)},p).concat(c);u=bt.a.prototype.stringify(f),e.lastLocalCopy=f,e.localCopyWithoutHeaders=c}B.c.trace("TableClipboard -- set clipboard data: ",u),mt.set(t,u)}},{key:"clearClipboard",value:function(){e.lastLocalCopy=[],e.localCopyWithoutHeaders=[]}},{key:"fromClipboard",value:function(t,n,r,o,a,i){var s=!(arguments.length>6&&void 0!==arguments[6])||arguments[6],l=!(arguments.length>7&&void 0!==arguments[7])||arguments[7],c=arguments.length>8?arguments[8]:void 0,u=mt.get(t);if(B.c.trace("TableClipboard -- get clipboard data: ",u),u){var p=bt.a.prototype.stringify(e.lastLocalCopy),f=c?e.localCopyWithoutHeaders:e.lastLocalCopy,d=p===u?f:bt.a.prototype.parse(u);return Yt(d,n,r,o,a,i,s,l)}}}],(n=null)&&Zt(t.prototype,n),r&&Zt(t,r),e}();Xt.lastLocalCopy=[[]],Xt.localCopyWithoutHeaders=[[]];var Jt=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null;if(t=t||function(){for(t=e;t&&"td"!==t.nodeName.toLowerCase();)t=t.parentElement;return t}(),e&&t){for(var n=e;"relative"!==getComputedStyle(n).position&&"sticky"!==getComputedStyle(n).position&&n.parentElement;)n=n.parentElement;for(var r=e;"relative"!==getComputedStyle(r).position&&r.parentElement;)r=r.parentElement;var o=n.getBoundingClientRect(),a=r.getBoundingClientRect(),i=t.getBoundingClientRect(),s=i.left-o.left+n.scrollLeft,l=i.top-o.top+n.scrollTop+i.height;e.style.width="".concat(i.width,"px"),e.style.top="".concat(l,"px"),e.style.left="".concat(s,"px"),e.style.position="absolute",i.top+i.height/2>a.bottom||i.top-i.height/2<a.top||i.left<a.left||i.left+.25*i.width>a.left+a.width?e.style.display="none":e.style.display="block"}},Qt=function(e,t,n){return"last"===n?e===t:"first"===n?0===e:"boolean"==typeof n?n:!!n&&n[e]},en=Object(a.a)(function(e,t){for(var n=[],r=0,o=Math.min(e.length,t.length);r<o;)n[r]=[e[r],t[r]],r+=1;return n}),tn=function(e,t){return h.a(function(n){return e.map(function(e){return x.a(e.name)&&n===t-1?e.id:function(e,t){return Array.isArray(e.name)?e.name[t]:e.name}(e,n)})},oe.a(0,t))},nn=Object(f.b)(function(e,t,n){var r=Object(ie.a)(e),o=tn(t,r),a=function(e,t,n){return h.a(function(t){if(n){var r=[0],o=0;return t.forEach(function(e,n){e!==t[o]&&(r.push(n),o=n)}),r}return oe.a(0,e.length)},t)}(t,o,n);return en(o,a)}),rn=n(169);function on(e){for(var t=e.length,n=new Array(t),r=0;r<t;++r)n[r]=e[r].slice(0);return n}function an(e,t,n){for(var r=e.length,o=t.length,a=0;a<r;++a)for(var i=0;i<o;++i)n(e[a],t[i],a,i)}function sn(e,t,n){for(var r=e.length,o=t.length,a=new Array(r),i=0;i<r;++i){for(var s=new Array(o),l=0;l<o;++l)s[l]=n(e[i],t[l],i,l);a[i]=s}return a}function ln(e,t,n){for(var r=e.length,o=new Array(r),a=0;a<r;++a){for(var i=e[a].length,s=new Array(i),l=0;l<i;++l)s[l]=n(e[a][l],t?t[a][l]:void 0,a,l);o[a]=s}return o}function cn(e,t,n,r){for(var o=e.length,a=new Array(o),i=0;i<o;++i){for(var s=e[i].length,l=new Array(s),c=0;c<s;++c)l[c]=r(e[i][c],t?t[i][c]:void 0,n?n[i][c]:void 0,i,c);a[i]=l}return a}function un(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];var o=n.slice(0,-1);return Ue(function(e,t){return e.get(t)||e.set(t,new Map).get(t)},e,o)}var pn=function(){return function(e){var t=new Map;return{get:function(){for(var n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];var a=r.slice(-1)[0],i=un.apply(void 0,[t].concat(r));return i.get(a)||i.set(a,Object(f.a)(e)).get(a)}}}};function fn(e){return(fn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function dn(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function hn(e,t){return!t||"object"!==fn(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function bn(e){return(bn=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function vn(e,t){return(vn=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var mn,yn=/^children$/,gn=function(e){function t(e){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),hn(this,bn(t).call(this,e))}var n,a,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&vn(e,t)}(t,r["Component"]),n=t,(a=[{key:"render",value:function(){var e=this.propsWithDefaults,t=e.attributes,n=e.classes,r=e.onClick,a=e.onDoubleClick,i=e.onMouseEnter,s=e.onMouseLeave,l=e.onMouseMove,c=e.style;return o.a.createElement("td",Object.assign({ref:"td",children:this.props.children,tabIndex:-1,className:n,onClick:r,onDoubleClick:a,onMouseEnter:i,onMouseLeave:s,onMouseMove:l,onMouseOver:l,style:c},t))}},{key:"shouldComponentUpdate",value:function(e){var t=this.props,n=this.getChildProps(t),r=this.getChildProps(e);return p.a(function(n){return!yn.test(n)&&t[n]!==e[n]},u(t))||p.a(function(e){return n[e]!==r[e]},u(n))}},{key:"getChildProps",value:function(e){return e&&e.children&&e.children[0]&&e.children[0].props}},{key:"propsWithDefaults",get:function(){return this.props}}])&&dn(n.prototype,a),i&&dn(n,i),t}(),wn=function(e,t,n){return!!e&&e.row===t&&e.column===n},kn=function(e,t,n,r){var o=e(),a=o.selected_cells,i=o.active_cell,s=o.setProps,l=o.viewport,c=o.virtualized,u=o.visibleColumns,f=n+c.offset.columns,d=Ye(t,f,u,l);if(!i||t!==i.row||f!==i.column){r.preventDefault();var h,b,v,m=window.getSelection();if(m&&m.removeAllRanges(),!(h=a,b=t,v=f,p.a(function(e){return e.row===b&&e.column===v},h))||r.shiftKey){var y={is_focused:!1,end_cell:d};r.shiftKey&&i?y.selected_cells=Ze({minRow:A(t,i.row),maxRow:j(t,i.row),minCol:A(f,i.column),maxCol:j(f,i.column)},u,l):(y.active_cell=d,y.start_cell=d,y.selected_cells=[d]),s(y)}else s({is_focused:!1,active_cell:d})}},On=function(e,t,n,r){var o=e(),a=o.is_focused,i=o.setProps,s=o.viewport,l=o.virtualized,c=o.visibleColumns;if(c[n].editable){var u=Ye(t,n+l.offset.columns,c,s);if(!a)r.preventDefault(),i({selected_cells:[u],active_cell:u,start_cell:u,end_cell:u,is_focused:!0})}},xn=function(e,t,n,r){var o=e(),a=o.data,i=o.setProps,s=o.virtualized,l=o.visibleColumns[n],c=s.indices[t-s.offset.rows];if(l.editable){var u=$t(r,l);if(u.success)i({data:g(C([c,l.id]),u.value,a)})}},_n=function(e,t,n){var r=e(),o=r.setState,a=r.virtualized,i=r.visibleColumns[n],s=a.indices[t-a.offset.rows];o({currentTooltip:{id:i.id,row:s}})},En=function(e,t,n){(0,e().setState)({currentTooltip:void 0})},Sn=function(e,t,n){var r=e(),o=r.currentTooltip,a=r.setState,i=r.virtualized,s=r.visibleColumns[n],l=i.indices[t-i.offset.rows];o&&o.id===s.id&&o.row===l||a({currentTooltip:{id:s.id,row:l}})},Cn=function(e,t,n,r){var o=e(),a=o.active_cell,i=o.is_focused,s=wn(a,t,n);if(!i&&s){r.preventDefault();var l=r.target;l.setSelectionRange(0,l.value?l.value.length:0)}},jn=function(e,t,n,r){r.preventDefault()};!function(e){e.Change="change",e.Click="click",e.DoubleClick="doubleclick",e.Enter="enter",e.Leave="leave",e.Move="move",e.MouseUp="mouseup",e.Paste="paste"}(mn||(mn={}));var An=function(e){return new Pn(e).get},Pn=function e(t){var n,r,o=this;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.propsFn=t,this.cache=(n=function(e,t,n){switch(e){case mn.Change:return xn.bind(void 0,o.propsFn,t,n);case mn.Click:return kn.bind(void 0,o.propsFn,t,n);case mn.DoubleClick:return On.bind(void 0,o.propsFn,t,n);case mn.Enter:return _n.bind(void 0,o.propsFn,t,n);case mn.Leave:return En.bind(void 0,o.propsFn,t,n);case mn.Move:return Sn.bind(void 0,o.propsFn,t,n);case mn.MouseUp:return Cn.bind(void 0,o.propsFn,t,n);case mn.Paste:return jn.bind(void 0,o.propsFn,t,n);default:throw new Error("unexpected handler ".concat(e))}},r=new Map,{get:function(){for(var e=arguments.length,t=new Array(e),o=0;o<e;o++)t[o]=arguments[o];var a=t.slice(-1)[0],i=un.apply(void 0,[r].concat(t));return i.has(a)?i.get(a):i.set(a,n.apply(void 0,t)).get(a)}}),this.get=function(e,t,n){return o.cache.get(e,t,n)}};function Tn(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}var Mn=function(e){return new Fn(e)},Fn=function(){function e(t){var n=this,r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:An(t);!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.handlers=r,this.partialGet=Object(f.a)(function(e,t,r){return ge(h.a)(function(t,o){return ge(h.a)(function(e,t){return n.getWrapper(!1,!1,o+r.rows,t,e)},e)},t)}),this.get=Object(f.a)(function(e,t,n,r){return e=on(e),P.a(function(r){var a=r.row,i=r.column;if(a-=t.rows,i-=t.columns,!(a<0||i<0||e.length<=a||e[a].length<=i)){var s=e[a][i],l=wn(n,a+t.rows,i+t.columns);e[a][i]=o.a.cloneElement(s,{classes:s.props.classes+" cell--selected"+(l?" focused":"")})}},r),e}),this.wrapper=pn()(function(e,t,n,r,a,i,s,l,c,u){return o.a.createElement(gn,{active:e,attributes:{"data-dash-column":r,"data-dash-row":a},classes:t,key:"column-".concat(n),onClick:c,onDoubleClick:u,onMouseEnter:i,onMouseLeave:s,onMouseMove:l})})}var t,n,r;return t=e,(n=[{key:"getWrapper",value:function(e,t,n,r,o){var a=o.presentation===ve.g.Dropdown,i="dash-cell"+" column-".concat(r)+(e?" focused":"")+(t?" cell--selected":"")+(a?" dropdown":"");return this.wrapper.get(n,r)(e,i,r,o.id,n,this.handlers(mn.Enter,n,r),this.handlers(mn.Leave,n,r),this.handlers(mn.Move,n,r),this.handlers(mn.Click,n,r),this.handlers(mn.DoubleClick,n,r))}}])&&Tn(t.prototype,n),r&&Tn(t,r),e}();function Dn(e){return(Dn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Rn(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function In(e,t){return!t||"object"!==Dn(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function Nn(e){return(Nn=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function zn(e,t){return(zn=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Ln=function(e){function t(e){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=In(this,Nn(t).call(this,e))).propagateChange=function(){n.state.value!==n.props.value&&(0,n.props.onChange)(n.state.value)},n.handleChange=function(e){n.setState({value:e.target.value})},n.handleKeyDown=function(e){var t=n.props.focused;t&&e.keyCode!==H.TAB&&e.keyCode!==H.ENTER||(t||Y(e.keyCode))&&n.propagateChange()},n.state={value:e.value},n}var n,a,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&zn(e,t)}(t,r["PureComponent"]),n=t,(a=[{key:"render",value:function(){var e=this.props,t=e.className,n=e.onMouseUp,r=e.onPaste,a=e.value,i=null===this.state.value?void 0:this.state.value;return o.a.createElement("div",{className:"dash-input-cell-value-container dash-cell-value-container"},o.a.createElement("div",{className:"input-cell-value-shadow cell-value-shadow"},a),o.a.createElement("input",{ref:"textInput",type:"text",className:t,onBlur:this.propagateChange,onChange:this.handleChange,onKeyDown:this.handleKeyDown,onMouseUp:n,onPaste:r,value:i}))}},{key:"componentWillReceiveProps",value:function(e){var t=e.value;this.state.value!==t&&this.setState({value:t})}},{key:"componentDidUpdate",value:function(){this.setFocus()}},{key:"componentDidMount",value:function(){this.setFocus()}},{key:"setFocus",value:function(){var e=this.props,t=e.active,n=e.applyFocus;if(t){var r=this.refs.textInput;n&&r&&document.activeElement!==r&&(r.focus(),r.setSelectionRange(0,r.value?r.value.length:0))}}}])&&Rn(n.prototype,a),i&&Rn(n,i),t}();function Bn(e){return(Bn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Vn(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function qn(e,t){return!t||"object"!==Bn(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function Wn(e){return(Wn=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Un(e,t){return(Un=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Kn=function(e){function t(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),qn(this,Wn(t).apply(this,arguments))}var n,a,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Un(e,t)}(t,r["PureComponent"]),n=t,(a=[{key:"render",value:function(){var e=this.props,t=e.className,n=e.value;return o.a.createElement("div",{ref:"el",className:t,tabIndex:-1},"boolean"==typeof n?n.toString():n)}},{key:"componentDidUpdate",value:function(){this.setFocus()}},{key:"componentDidMount",value:function(){this.setFocus()}},{key:"setFocus",value:function(){var e=this.props,t=e.active,n=e.applyFocus;if(t){var r=this.refs.el;n&&r&&document.activeElement!==r&&r.focus()}}}])&&Vn(n.prototype,a),i&&Vn(n,i),t}(),Hn=n(363),$n=n.n(Hn),Gn=n(364),Yn=n.n(Gn),Zn=n(0),Xn=n.n(Zn),Jn=n(98),Qn=n.n(Jn),er=function(e){var t=e.onMouseDown;return o.a.createElement("span",{className:"Select-arrow",onMouseDown:t})};er.propTypes={onMouseDown:Xn.a.func};var tr=[{base:"A",letters:/[\u0041\u24B6\uFF21\u00C0\u00C1\u00C2\u1EA6\u1EA4\u1EAA\u1EA8\u00C3\u0100\u0102\u1EB0\u1EAE\u1EB4\u1EB2\u0226\u01E0\u00C4\u01DE\u1EA2\u00C5\u01FA\u01CD\u0200\u0202\u1EA0\u1EAC\u1EB6\u1E00\u0104\u023A\u2C6F]/g},{base:"AA",letters:/[\uA732]/g},{base:"AE",letters:/[\u00C6\u01FC\u01E2]/g},{base:"AO",letters:/[\uA734]/g},{base:"AU",letters:/[\uA736]/g},{base:"AV",letters:/[\uA738\uA73A]/g},{base:"AY",letters:/[\uA73C]/g},{base:"B",letters:/[\u0042\u24B7\uFF22\u1E02\u1E04\u1E06\u0243\u0182\u0181]/g},{base:"C",letters:/[\u0043\u24B8\uFF23\u0106\u0108\u010A\u010C\u00C7\u1E08\u0187\u023B\uA73E]/g},{base:"D",letters:/[\u0044\u24B9\uFF24\u1E0A\u010E\u1E0C\u1E10\u1E12\u1E0E\u0110\u018B\u018A\u0189\uA779]/g},{base:"DZ",letters:/[\u01F1\u01C4]/g},{base:"Dz",letters:/[\u01F2\u01C5]/g},{base:"E",letters:/[\u0045\u24BA\uFF25\u00C8\u00C9\u00CA\u1EC0\u1EBE\u1EC4\u1EC2\u1EBC\u0112\u1E14\u1E16\u0114\u0116\u00CB\u1EBA\u011A\u0204\u0206\u1EB8\u1EC6\u0228\u1E1C\u0118\u1E18\u1E1A\u0190\u018E]/g},{base:"F",letters:/[\u0046\u24BB\uFF26\u1E1E\u0191\uA77B]/g},{base:"G",letters:/[\u0047\u24BC\uFF27\u01F4\u011C\u1E20\u011E\u0120\u01E6\u0122\u01E4\u0193\uA7A0\uA77D\uA77E]/g},{base:"H",letters:/[\u0048\u24BD\uFF28\u0124\u1E22\u1E26\u021E\u1E24\u1E28\u1E2A\u0126\u2C67\u2C75\uA78D]/g},{base:"I",letters:/[\u0049\u24BE\uFF29\u00CC\u00CD\u00CE\u0128\u012A\u012C\u0130\u00CF\u1E2E\u1EC8\u01CF\u0208\u020A\u1ECA\u012E\u1E2C\u0197]/g},{base:"J",letters:/[\u004A\u24BF\uFF2A\u0134\u0248]/g},{base:"K",letters:/[\u004B\u24C0\uFF2B\u1E30\u01E8\u1E32\u0136\u1E34\u0198\u2C69\uA740\uA742\uA744\uA7A2]/g},{base:"L",letters:/[\u004C\u24C1\uFF2C\u013F\u0139\u013D\u1E36\u1E38\u013B\u1E3C\u1E3A\u0141\u023D\u2C62\u2C60\uA748\uA746\uA780]/g},{base:"LJ",letters:/[\u01C7]/g},{base:"Lj",letters:/[\u01C8]/g},{base:"M",letters:/[\u004D\u24C2\uFF2D\u1E3E\u1E40\u1E42\u2C6E\u019C]/g},{base:"N",letters:/[\u004E\u24C3\uFF2E\u01F8\u0143\u00D1\u1E44\u0147\u1E46\u0145\u1E4A\u1E48\u0220\u019D\uA790\uA7A4]/g},{base:"NJ",letters:/[\u01CA]/g},{base:"Nj",letters:/[\u01CB]/g},{base:"O",letters:/[\u004F\u24C4\uFF2F\u00D2\u00D3\u00D4\u1ED2\u1ED0\u1ED6\u1ED4\u00D5\u1E4C\u022C\u1E4E\u014C\u1E50\u1E52\u014E\u022E\u0230\u00D6\u022A\u1ECE\u0150\u01D1\u020C\u020E\u01A0\u1EDC\u1EDA\u1EE0\u1EDE\u1EE2\u1ECC\u1ED8\u01EA\u01EC\u00D8\u01FE\u0186\u019F\uA74A\uA74C]/g},{base:"OI",letters:/[\u01A2]/g},{base:"OO",letters:/[\uA74E]/g},{base:"OU",letters:/[\u0222]/g},{base:"P",letters:/[\u0050\u24C5\uFF30\u1E54\u1E56\u01A4\u2C63\uA750\uA752\uA754]/g},{base:"Q",letters:/[\u0051\u24C6\uFF31\uA756\uA758\u024A]/g},{base:"R",letters:/[\u0052\u24C7\uFF32\u0154\u1E58\u0158\u0210\u0212\u1E5A\u1E5C\u0156\u1E5E\u024C\u2C64\uA75A\uA7A6\uA782]/g},{base:"S",letters:/[\u0053\u24C8\uFF33\u1E9E\u015A\u1E64\u015C\u1E60\u0160\u1E66\u1E62\u1E68\u0218\u015E\u2C7E\uA7A8\uA784]/g},{base:"T",letters:/[\u0054\u24C9\uFF34\u1E6A\u0164\u1E6C\u021A\u0162\u1E70\u1E6E\u0166\u01AC\u01AE\u023E\uA786]/g},{base:"TZ",letters:/[\uA728]/g},{base:"U",letters:/[\u0055\u24CA\uFF35\u00D9\u00DA\u00DB\u0168\u1E78\u016A\u1E7A\u016C\u00DC\u01DB\u01D7\u01D5\u01D9\u1EE6\u016E\u0170\u01D3\u0214\u0216\u01AF\u1EEA\u1EE8\u1EEE\u1EEC\u1EF0\u1EE4\u1E72\u0172\u1E76\u1E74\u0244]/g},{base:"V",letters:/[\u0056\u24CB\uFF36\u1E7C\u1E7E\u01B2\uA75E\u0245]/g},{base:"VY",letters:/[\uA760]/g},{base:"W",letters:/[\u0057\u24CC\uFF37\u1E80\u1E82\u0174\u1E86\u1E84\u1E88\u2C72]/g},{base:"X",letters:/[\u0058\u24CD\uFF38\u1E8A\u1E8C]/g},{base:"Y",letters:/[\u0059\u24CE\uFF39\u1EF2\u00DD\u0176\u1EF8\u0232\u1E8E\u0178\u1EF6\u1EF4\u01B3\u024E\u1EFE]/g},{base:"Z",letters:/[\u005A\u24CF\uFF3A\u0179\u1E90\u017B\u017D\u1E92\u1E94\u01B5\u0224\u2C7F\u2C6B\uA762]/g},{base:"a",letters:/[\u0061\u24D0\uFF41\u1E9A\u00E0\u00E1\u00E2\u1EA7\u1EA5\u1EAB\u1EA9\u00E3\u0101\u0103\u1EB1\u1EAF\u1EB5\u1EB3\u0227\u01E1\u00E4\u01DF\u1EA3\u00E5\u01FB\u01CE\u0201\u0203\u1EA1\u1EAD\u1EB7\u1E01\u0105\u2C65\u0250]/g},{base:"aa",letters:/[\uA733]/g},{base:"ae",letters:/[\u00E6\u01FD\u01E3]/g},{base:"ao",letters:/[\uA735]/g},{base:"au",letters:/[\uA737]/g},{base:"av",letters:/[\uA739\uA73B]/g},{base:"ay",letters:/[\uA73D]/g},{base:"b",letters:/[\u0062\u24D1\uFF42\u1E03\u1E05\u1E07\u0180\u0183\u0253]/g},{base:"c",letters:/[\u0063\u24D2\uFF43\u0107\u0109\u010B\u010D\u00E7\u1E09\u0188\u023C\uA73F\u2184]/g},{base:"d",letters:/[\u0064\u24D3\uFF44\u1E0B\u010F\u1E0D\u1E11\u1E13\u1E0F\u0111\u018C\u0256\u0257\uA77A]/g},{base:"dz",letters:/[\u01F3\u01C6]/g},{base:"e",letters:/[\u0065\u24D4\uFF45\u00E8\u00E9\u00EA\u1EC1\u1EBF\u1EC5\u1EC3\u1EBD\u0113\u1E15\u1E17\u0115\u0117\u00EB\u1EBB\u011B\u0205\u0207\u1EB9\u1EC7\u0229\u1E1D\u0119\u1E19\u1E1B\u0247\u025B\u01DD]/g},{base:"f",letters:/[\u0066\u24D5\uFF46\u1E1F\u0192\uA77C]/g},{base:"g",letters:/[\u0067\u24D6\uFF47\u01F5\u011D\u1E21\u011F\u0121\u01E7\u0123\u01E5\u0260\uA7A1\u1D79\uA77F]/g},{base:"h",letters:/[\u0068\u24D7\uFF48\u0125\u1E23\u1E27\u021F\u1E25\u1E29\u1E2B\u1E96\u0127\u2C68\u2C76\u0265]/g},{base:"hv",letters:/[\u0195]/g},{base:"i",letters:/[\u0069\u24D8\uFF49\u00EC\u00ED\u00EE\u0129\u012B\u012D\u00EF\u1E2F\u1EC9\u01D0\u0209\u020B\u1ECB\u012F\u1E2D\u0268\u0131]/g},{base:"j",letters:/[\u006A\u24D9\uFF4A\u0135\u01F0\u0249]/g},{base:"k",letters:/[\u006B\u24DA\uFF4B\u1E31\u01E9\u1E33\u0137\u1E35\u0199\u2C6A\uA741\uA743\uA745\uA7A3]/g},{base:"l",letters:/[\u006C\u24DB\uFF4C\u0140\u013A\u013E\u1E37\u1E39\u013C\u1E3D\u1E3B\u017F\u0142\u019A\u026B\u2C61\uA749\uA781\uA747]/g},{base:"lj",letters:/[\u01C9]/g},{base:"m",letters:/[\u006D\u24DC\uFF4D\u1E3F\u1E41\u1E43\u0271\u026F]/g},{base:"n",letters:/[\u006E\u24DD\uFF4E\u01F9\u0144\u00F1\u1E45\u0148\u1E47\u0146\u1E4B\u1E49\u019E\u0272\u0149\uA791\uA7A5]/g},{base:"nj",letters:/[\u01CC]/g},{base:"o",letters:/[\u006F\u24DE\uFF4F\u00F2\u00F3\u00F4\u1ED3\u1ED1\u1ED7\u1ED5\u00F5\u1E4D\u022D\u1E4F\u014D\u1E51\u1E53\u014F\u022F\u0231\u00F6\u022B\u1ECF\u0151\u01D2\u020D\u020F\u01A1\u1EDD\u1EDB\u1EE1\u1EDF\u1EE3\u1ECD\u1ED9\u01EB\u01ED\u00F8\u01FF\u0254\uA74B\uA74D\u0275]/g},{base:"oi",letters:/[\u01A3]/g},{base:"ou",letters:/[\u0223]/g},{base:"oo",letters:/[\uA74F]/g},{base:"p",letters:/[\u0070\u24DF\uFF50\u1E55\u1E57\u01A5\u1D7D\uA751\uA753\uA755]/g},{base:"q",letters:/[\u0071\u24E0\uFF51\u024B\uA757\uA759]/g},{base:"r",letters:/[\u0072\u24E1\uFF52\u0155\u1E59\u0159\u0211\u0213\u1E5B\u1E5D\u0157\u1E5F\u024D\u027D\uA75B\uA7A7\uA783]/g},{base:"s",letters:/[\u0073\u24E2\uFF53\u00DF\u015B\u1E65\u015D\u1E61\u0161\u1E67\u1E63\u1E69\u0219\u015F\u023F\uA7A9\uA785\u1E9B]/g},{base:"t",letters:/[\u0074\u24E3\uFF54\u1E6B\u1E97\u0165\u1E6D\u021B\u0163\u1E71\u1E6F\u0167\u01AD\u0288\u2C66\uA787]/g},{base:"tz",letters:/[\uA729]/g},{base:"u",letters:/[\u0075\u24E4\uFF55\u00F9\u00FA\u00FB\u0169\u1E79\u016B\u1E7B\u016D\u00FC\u01DC\u01D8\u01D6\u01DA\u1EE7\u016F\u0171\u01D4\u0215\u0217\u01B0\u1EEB\u1EE9\u1EEF\u1EED\u1EF1\u1EE5\u1E73\u0173\u1E77\u1E75\u0289]/g},{base:"v",letters:/[\u0076\u24E5\uFF56\u1E7D\u1E7F\u028B\uA75F\u028C]/g},{base:"vy",letters:/[\uA761]/g},{base:"w",letters:/[\u0077\u24E6\uFF57\u1E81\u1E83\u0175\u1E87\u1E85\u1E98\u1E89\u2C73]/g},{base:"x",letters:/[\u0078\u24E7\uFF58\u1E8B\u1E8D]/g},{base:"y",letters:/[\u0079\u24E8\uFF59\u1EF3\u00FD\u0177\u1EF9\u0233\u1E8F\u00FF\u1EF7\u1E99\u1EF5\u01B4\u024F\u1EFF]/g},{base:"z",letters:/[\u007A\u24E9\uFF5A\u017A\u1E91\u017C\u017E\u1E93\u1E95\u01B6\u0225\u0240\u2C6C\uA763]/g}],nr=function(e){for(var t=0;t<tr.length;t++)e=e.replace(tr[t].letters,tr[t].base);return e},rr=function(e){return null!=e&&""!==e},or=function(e,t,n,r){return r.ignoreAccents&&(t=nr(t)),r.ignoreCase&&(t=t.toLowerCase()),r.trimFilter&&(t=t.replace(/^\s+|\s+$/g,"")),n&&(n=n.map(function(e){return e[r.valueKey]})),e.filter(function(e){if(n&&n.indexOf(e[r.valueKey])>-1)return!1;if(r.filterOption)return r.filterOption.call(void 0,e,t);if(!t)return!0;var o=e[r.valueKey],a=e[r.labelKey],i=rr(o),s=rr(a);if(!i&&!s)return!1;var l=i?String(o):null,c=s?String(a):null;return r.ignoreAccents&&(l&&"label"!==r.matchProp&&(l=nr(l)),c&&"value"!==r.matchProp&&(c=nr(c))),r.ignoreCase&&(l&&"label"!==r.matchProp&&(l=l.toLowerCase()),c&&"value"!==r.matchProp&&(c=c.toLowerCase())),"start"===r.matchPos?l&&"label"!==r.matchProp&&l.substr(0,t.length)===t||c&&"value"!==r.matchProp&&c.substr(0,t.length)===t:l&&"label"!==r.matchProp&&l.indexOf(t)>=0||c&&"value"!==r.matchProp&&c.indexOf(t)>=0})},ar=function(e){var t=e.focusedOption,n=e.focusOption,r=e.inputValue,a=e.instancePrefix,i=e.onFocus,s=e.onOptionRef,l=e.onSelect,c=e.optionClassName,u=e.optionComponent,p=e.optionRenderer,f=e.options,d=e.removeValue,h=e.selectValue,b=e.valueArray,v=e.valueKey,m=u;return f.map(function(e,u){var f=b&&b.some(function(t){return t[v]===e[v]}),y=e===t,g=Yn()(c,{"Select-option":!0,"is-selected":f,"is-focused":y,"is-disabled":e.disabled});return o.a.createElement(m,{className:g,focusOption:n,inputValue:r,instancePrefix:a,isDisabled:e.disabled,isFocused:y,isSelected:f,key:"option-"+u+"-"+e[v],onFocus:i,onSelect:l,option:e,optionIndex:u,ref:function(e){s(e,y)},removeValue:d,selectValue:h},p(e,u,r))})};ar.propTypes={focusOption:Xn.a.func,focusedOption:Xn.a.object,inputValue:Xn.a.string,instancePrefix:Xn.a.string,onFocus:Xn.a.func,onOptionRef:Xn.a.func,onSelect:Xn.a.func,optionClassName:Xn.a.string,optionComponent:Xn.a.func,optionRenderer:Xn.a.func,options:Xn.a.array,removeValue:Xn.a.func,selectValue:Xn.a.func,valueArray:Xn.a.array,valueKey:Xn.a.string};var ir=function(e){e.preventDefault(),e.stopPropagation(),"A"===e.target.tagName&&"href"in e.target&&(e.target.target?window.open(e.target.href,e.target.target):window.location.href=e.target.href)},sr="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},lr=(function(){function e(e){this.value=e}function t(t){var n,r;function o(n,r){try{var i=t[n](r),s=i.value;s instanceof e?Promise.resolve(s.value).then(function(e){o("next",e)},function(e){o("throw",e)}):a(i.done?"return":"normal",i.value)}catch(e){a("throw",e)}}function a(e,t){switch(e){case"return":n.resolve({value:t,done:!0});break;case"throw":n.reject(t);break;default:n.resolve({value:t,done:!1})}(n=n.next)?o(n.key,n.arg):r=null}this._invoke=function(e,t){return new Promise(function(a,i){var s={key:e,arg:t,resolve:a,reject:i,next:null};r?r=r.next=s:(n=r=s,o(e,t))})},"function"!=typeof t.return&&(this.return=void 0)}"function"==typeof Symbol&&Symbol.asyncIterator&&(t.prototype[Symbol.asyncIterator]=function(){return this}),t.prototype.next=function(e){return this._invoke("next",e)},t.prototype.throw=function(e){return this._invoke("throw",e)},t.prototype.return=function(e){return this._invoke("return",e)}}(),function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}),cr=function(){function e(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}return function(t,n,r){return n&&e(t.prototype,n),r&&e(t,r),t}}(),ur=function(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e},pr=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},fr=function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function, not "+typeof t);e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,enumerable:!1,writable:!0,configurable:!0}}),t&&(Object.setPrototypeOf?Object.setPrototypeOf(e,t):e.__proto__=t)},dr=function(e,t){var n={};for(var r in e)t.indexOf(r)>=0||Object.prototype.hasOwnProperty.call(e,r)&&(n[r]=e[r]);return n},hr=function(e,t){if(!e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!t||"object"!=typeof t&&"function"!=typeof t?e:t},br=function(e){function t(e){lr(this,t);var n=hr(this,(t.__proto__||Object.getPrototypeOf(t)).call(this,e));return n.handleMouseDown=n.handleMouseDown.bind(n),n.handleMouseEnter=n.handleMouseEnter.bind(n),n.handleMouseMove=n.handleMouseMove.bind(n),n.handleTouchStart=n.handleTouchStart.bind(n),n.handleTouchEnd=n.handleTouchEnd.bind(n),n.handleTouchMove=n.handleTouchMove.bind(n),n.onFocus=n.onFocus.bind(n),n}return fr(t,e),cr(t,[{key:"handleMouseDown",value:function(e){e.preventDefault(),e.stopPropagation(),this.props.onSelect(this.props.option,e)}},{key:"handleMouseEnter",value:function(e){this.onFocus(e)}},{key:"handleMouseMove",value:function(e){this.onFocus(e)}},{key:"handleTouchEnd",value:function(e){this.dragging||this.handleMouseDown(e)}},{key:"handleTouchMove",value:function(){this.dragging=!0}},{key:"handleTouchStart",value:function(){this.dragging=!1}},{key:"onFocus",value:function(e){this.props.isFocused||this.props.onFocus(this.props.option,e)}},{key:"render",value:function(){var e=this.props,t=e.option,n=e.instancePrefix,r=e.optionIndex,a=Yn()(this.props.className,t.className);return t.disabled?o.a.createElement("div",{className:a,onMouseDown:ir,onClick:ir},this.props.children):o.a.createElement("div",{className:a,style:t.style,role:"option","aria-label":t.label,onMouseDown:this.handleMouseDown,onMouseEnter:this.handleMouseEnter,onMouseMove:this.handleMouseMove,onTouchStart:this.handleTouchStart,onTouchMove:this.handleTouchMove,onTouchEnd:this.handleTouchEnd,id:n+"-option-"+r,title:t.title},this.props.children)}}]),t}(o.a.Component);br.propTypes={children:Xn.a.node,className:Xn.a.string,instancePrefix:Xn.a.string.isRequired,isDisabled:Xn.a.bool,isFocused:Xn.a.bool,isSelected:Xn.a.bool,onFocus:Xn.a.func,onSelect:Xn.a.func,onUnfocus:Xn.a.func,option:Xn.a.object.isRequired,optionIndex:Xn.a.number};var vr=function(e){function t(e){lr(this,t);var n=hr(this,(t.__proto__||Object.getPrototypeOf(t)).call(this,e));return n.handleMouseDown=n.handleMouseDown.bind(n),n.onRemove=n.onRemove.bind(n),n.handleTouchEndRemove=n.handleTouchEndRemove.bind(n),n.handleTouchMove=n.handleTouchMove.bind(n),n.handleTouchStart=n.handleTouchStart.bind(n),n}return fr(t,e),cr(t,[{key:"handleMouseDown",value:function(e){if("mousedown"!==e.type||0===e.button)return this.props.onClick?(e.stopPropagation(),void this.props.onClick(this.props.value,e)):void(this.props.value.href&&e.stopPropagation())}},{key:"onRemove",value:function(e){e.preventDefault(),e.stopPropagation(),this.props.onRemove(this.props.value)}},{key:"handleTouchEndRemove",value:function(e){this.dragging||this.onRemove(e)}},{key:"handleTouchMove",value:function(){this.dragging=!0}},{key:"handleTouchStart",value:function(){this.dragging=!1}},{key:"renderRemoveIcon",value:function(){if(!this.props.disabled&&this.props.onRemove)return o.a.createElement("span",{className:"Select-value-icon","aria-hidden":"true",onMouseDown:this.onRemove,onTouchEnd:this.handleTouchEndRemove,onTouchStart:this.handleTouchStart,onTouchMove:this.handleTouchMove},"×")}},{key:"renderLabel",value:function(){return this.props.onClick||this.props.value.href?o.a.createElement("a",{className:"Select-value-label",href:this.props.value.href,target:this.props.value.target,onMouseDown:this.handleMouseDown,onTouchEnd:this.handleMouseDown},this.props.children):o.a.createElement("span",{className:"Select-value-label",role:"option","aria-selected":"true",id:this.props.id},this.props.children)}},{key:"render",value:function(){return o.a.createElement("div",{className:Yn()("Select-value",this.props.value.disabled?"Select-value-disabled":"",this.props.value.className),style:this.props.value.style,title:this.props.value.title},this.renderRemoveIcon(),this.renderLabel())}}]),t}(o.a.Component);vr.propTypes={children:Xn.a.node,disabled:Xn.a.bool,id:Xn.a.string,onClick:Xn.a.func,onRemove:Xn.a.func,value:Xn.a.object.isRequired};
-/*!
-  Copyright (c) 2018 Jed Watson.
-  Licensed under the MIT License (MIT), see
-  http://jedwatson.github.io/react-select
-*/
-var mr=function(e){return"string"==typeof e?e:null!==e&&JSON.stringify(e)||""},yr=Xn.a.oneOfType([Xn.a.string,Xn.a.node]),gr=Xn.a.oneOfType([Xn.a.string,Xn.a.number]),wr=1,kr=function(e,t){var n=void 0===e?"undefined":sr(e);if("string"!==n&&"number"!==n&&"boolean"!==n)return e;var r=t.options,o=t.valueKey;if(r)for(var a=0;a<r.length;a++)if(String(r[a][o])===String(e))return r[a]},Or=function(e,t){return!e||(t?0===e.length:0===Object.keys(e).length)},xr=function(e){function t(e){lr(this,t);var n=hr(this,(t.__proto__||Object.getPrototypeOf(t)).call(this,e));return["clearValue","focusOption","getOptionLabel","handleInputBlur","handleInputChange","handleInputFocus","handleInputValueChange","handleKeyDown","handleMenuScroll","handleMouseDown","handleMouseDownOnArrow","handleMouseDownOnMenu","handleTouchEnd","handleTouchEndClearValue","handleTouchMove","handleTouchOutside","handleTouchStart","handleValueClick","onOptionRef","removeValue","selectValue"].forEach(function(e){return n[e]=n[e].bind(n)}),n.state={inputValue:"",isFocused:!1,isOpen:!1,isPseudoFocused:!1,required:!1},n}return fr(t,e),cr(t,[{key:"componentWillMount",value:function(){this._instancePrefix="react-select-"+(this.props.instanceId||++wr)+"-";var e=this.getValueArray(this.props.value);this.props.required&&this.setState({required:Or(e[0],this.props.multi)})}},{key:"componentDidMount",value:function(){void 0!==this.props.autofocus&&"undefined"!=typeof console&&console.warn("Warning: The autofocus prop has changed to autoFocus, support will be removed after react-select@1.0"),(this.props.autoFocus||this.props.autofocus)&&this.focus()}},{key:"componentWillReceiveProps",value:function(e){var t=this.getValueArray(e.value,e);e.required?this.setState({required:Or(t[0],e.multi)}):this.props.required&&this.setState({required:!1}),this.state.inputValue&&this.props.value!==e.value&&e.onSelectResetsInput&&this.setState({inputValue:this.handleInputValueChange("")})}},{key:"componentDidUpdate",value:function(e,t){if(this.menu&&this.focused&&this.state.isOpen&&!this.hasScrolledToOption){var n=Object(Jn.findDOMNode)(this.focused),r=Object(Jn.findDOMNode)(this.menu),o=r.scrollTop,a=o+r.offsetHeight,i=n.offsetTop,s=i+n.offsetHeight;(o>i||a<s)&&(r.scrollTop=n.offsetTop),this.hasScrolledToOption=!0}else this.state.isOpen||(this.hasScrolledToOption=!1);if(this._scrollToFocusedOptionOnUpdate&&this.focused&&this.menu){this._scrollToFocusedOptionOnUpdate=!1;var l=Object(Jn.findDOMNode)(this.focused),c=Object(Jn.findDOMNode)(this.menu),u=l.getBoundingClientRect(),p=c.getBoundingClientRect();u.bottom>p.bottom?c.scrollTop=l.offsetTop+l.clientHeight-c.offsetHeight:u.top<p.top&&(c.scrollTop=l.offsetTop)}if(this.props.scrollMenuIntoView&&this.menuContainer){var f=this.menuContainer.getBoundingClientRect();window.innerHeight<f.bottom+this.props.menuBuffer&&window.scrollBy(0,f.bottom+this.props.menuBuffer-window.innerHeight)}if(e.disabled!==this.props.disabled&&(this.setState({isFocused:!1}),this.closeMenu()),t.isOpen!==this.state.isOpen){this.toggleTouchOutsideEvent(this.state.isOpen);var d=this.state.isOpen?this.props.onOpen:this.props.onClose;d&&d()}}},{key:"componentWillUnmount",value:function(){this.toggleTouchOutsideEvent(!1)}},{key:"toggleTouchOutsideEvent",value:function(e){var t=e?document.addEventListener?"addEventListener":"attachEvent":document.removeEventListener?"removeEventListener":"detachEvent",n=document.addEventListener?"":"on";document[t](n+"touchstart",this.handleTouchOutside),document[t](n+"mousedown",this.handleTouchOutside)}},{key:"handleTouchOutside",value:function(e){this.wrapper&&!this.wrapper.contains(e.target)&&this.closeMenu()}},{key:"focus",value:function(){this.input&&this.input.focus()}},{key:"blurInput",value:function(){this.input&&this.input.blur()}},{key:"handleTouchMove",value:function(){this.dragging=!0}},{key:"handleTouchStart",value:function(){this.dragging=!1}},{key:"handleTouchEnd",value:function(e){this.dragging||this.handleMouseDown(e)}},{key:"handleTouchEndClearValue",value:function(e){this.dragging||this.clearValue(e)}},{key:"handleMouseDown",value:function(e){if(!(this.props.disabled||"mousedown"===e.type&&0!==e.button))if("INPUT"!==e.target.tagName){if(e.preventDefault(),!this.props.searchable)return this.focus(),this.setState({isOpen:!this.state.isOpen,focusedOption:null});if(this.state.isFocused){this.focus();var t=this.input,n=!0;"function"==typeof t.getInput&&(t=t.getInput()),t.value="",this._focusAfterClear&&(n=!1,this._focusAfterClear=!1),this.setState({isOpen:n,isPseudoFocused:!1,focusedOption:null})}else this._openAfterFocus=this.props.openOnClick,this.focus(),this.setState({focusedOption:null})}else this.state.isFocused?this.state.isOpen||this.setState({isOpen:!0,isPseudoFocused:!1,focusedOption:null}):(this._openAfterFocus=this.props.openOnClick,this.focus())}},{key:"handleMouseDownOnArrow",value:function(e){this.props.disabled||"mousedown"===e.type&&0!==e.button||(this.state.isOpen?(e.stopPropagation(),e.preventDefault(),this.closeMenu()):this.setState({isOpen:!0}))}},{key:"handleMouseDownOnMenu",value:function(e){this.props.disabled||"mousedown"===e.type&&0!==e.button||(e.stopPropagation(),e.preventDefault(),this._openAfterFocus=!0,this.focus())}},{key:"closeMenu",value:function(){this.props.onCloseResetsInput?this.setState({inputValue:this.handleInputValueChange(""),isOpen:!1,isPseudoFocused:this.state.isFocused&&!this.props.multi}):this.setState({isOpen:!1,isPseudoFocused:this.state.isFocused&&!this.props.multi}),this.hasScrolledToOption=!1}},{key:"handleInputFocus",value:function(e){if(!this.props.disabled){var t=this.state.isOpen||this._openAfterFocus||this.props.openOnFocus;t=!this._focusAfterClear&&t,this.props.onFocus&&this.props.onFocus(e),this.setState({isFocused:!0,isOpen:!!t}),this._focusAfterClear=!1,this._openAfterFocus=!1}}},{key:"handleInputBlur",value:function(e){if(!this.menu||this.menu!==document.activeElement&&!this.menu.contains(document.activeElement)){this.props.onBlur&&this.props.onBlur(e);var t={isFocused:!1,isOpen:!1,isPseudoFocused:!1};this.props.onBlurResetsInput&&(t.inputValue=this.handleInputValueChange("")),this.setState(t)}else this.focus()}},{key:"handleInputChange",value:function(e){var t=e.target.value;this.state.inputValue!==e.target.value&&(t=this.handleInputValueChange(t)),this.setState({inputValue:t,isOpen:!0,isPseudoFocused:!1})}},{key:"setInputValue",value:function(e){if(this.props.onInputChange){var t=this.props.onInputChange(e);null!=t&&"object"!==(void 0===t?"undefined":sr(t))&&(e=""+t)}this.setState({inputValue:e})}},{key:"handleInputValueChange",value:function(e){if(this.props.onInputChange){var t=this.props.onInputChange(e);null!=t&&"object"!==(void 0===t?"undefined":sr(t))&&(e=""+t)}return e}},{key:"handleKeyDown",value:function(e){if(!(this.props.disabled||"function"==typeof this.props.onInputKeyDown&&(this.props.onInputKeyDown(e),e.defaultPrevented)))switch(e.keyCode){case 8:!this.state.inputValue&&this.props.backspaceRemoves&&(e.preventDefault(),this.popValue());break;case 9:if(e.shiftKey||!this.state.isOpen||!this.props.tabSelectsValue)break;e.preventDefault(),this.selectFocusedOption();break;case 13:e.preventDefault(),e.stopPropagation(),this.state.isOpen?this.selectFocusedOption():this.focusNextOption();break;case 27:e.preventDefault(),this.state.isOpen?(this.closeMenu(),e.stopPropagation()):this.props.clearable&&this.props.escapeClearsValue&&(this.clearValue(e),e.stopPropagation());break;case 32:if(this.props.searchable)break;if(e.preventDefault(),!this.state.isOpen){this.focusNextOption();break}e.stopPropagation(),this.selectFocusedOption();break;case 38:e.preventDefault(),this.focusPreviousOption();break;case 40:e.preventDefault(),this.focusNextOption();break;case 33:e.preventDefault(),this.focusPageUpOption();break;case 34:e.preventDefault(),this.focusPageDownOption();break;case 35:if(e.shiftKey)break;e.preventDefault(),this.focusEndOption();break;case 36:if(e.shiftKey)break;e.preventDefault(),this.focusStartOption();break;case 46:!this.state.inputValue&&this.props.deleteRemoves&&(e.preventDefault(),this.popValue())}}},{key:"handleValueClick",value:function(e,t){this.props.onValueClick&&this.props.onValueClick(e,t)}},{key:"handleMenuScroll",value:function(e){if(this.props.onMenuScrollToBottom){var t=e.target;t.scrollHeight>t.offsetHeight&&t.scrollHeight-t.offsetHeight-t.scrollTop<=0&&this.props.onMenuScrollToBottom()}}},{key:"getOptionLabel",value:function(e){return e[this.props.labelKey]}},{key:"getValueArray",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:void 0,n="object"===(void 0===t?"undefined":sr(t))?t:this.props;if(n.multi){if("string"==typeof e&&(e=e.split(n.delimiter)),!Array.isArray(e)){if(null==e)return[];e=[e]}return e.map(function(e){return kr(e,n)}).filter(function(e){return e})}var r=kr(e,n);return r?[r]:[]}},{key:"setValue",value:function(e){var t=this;if(this.props.autoBlur&&this.blurInput(),this.props.required){var n=Or(e,this.props.multi);this.setState({required:n})}this.props.simpleValue&&e&&(e=this.props.multi?e.map(function(e){return e[t.props.valueKey]}).join(this.props.delimiter):e[this.props.valueKey]),this.props.onChange&&this.props.onChange(e)}},{key:"selectValue",value:function(e){var t=this;this.props.closeOnSelect&&(this.hasScrolledToOption=!1);var n=this.props.onSelectResetsInput?"":this.state.inputValue;this.props.multi?this.setState({focusedIndex:null,inputValue:this.handleInputValueChange(n),isOpen:!this.props.closeOnSelect},function(){t.getValueArray(t.props.value).some(function(n){return n[t.props.valueKey]===e[t.props.valueKey]})?t.removeValue(e):t.addValue(e)}):this.setState({inputValue:this.handleInputValueChange(n),isOpen:!this.props.closeOnSelect,isPseudoFocused:this.state.isFocused},function(){t.setValue(e)})}},{key:"addValue",value:function(e){var t=this.getValueArray(this.props.value),n=this._visibleOptions.filter(function(e){return!e.disabled}),r=n.indexOf(e);this.setValue(t.concat(e)),this.props.closeOnSelect&&(n.length-1===r?this.focusOption(n[r-1]):n.length>r&&this.focusOption(n[r+1]))}},{key:"popValue",value:function(){var e=this.getValueArray(this.props.value);e.length&&!1!==e[e.length-1].clearableValue&&this.setValue(this.props.multi?e.slice(0,e.length-1):null)}},{key:"removeValue",value:function(e){var t=this,n=this.getValueArray(this.props.value);this.setValue(n.filter(function(n){return n[t.props.valueKey]!==e[t.props.valueKey]})),this.focus()}},{key:"clearValue",value:function(e){e&&"mousedown"===e.type&&0!==e.button||(e.preventDefault(),this.setValue(this.getResetValue()),this.setState({inputValue:this.handleInputValueChange(""),isOpen:!1},this.focus),this._focusAfterClear=!0)}},{key:"getResetValue",value:function(){return void 0!==this.props.resetValue?this.props.resetValue:this.props.multi?[]:null}},{key:"focusOption",value:function(e){this.setState({focusedOption:e})}},{key:"focusNextOption",value:function(){this.focusAdjacentOption("next")}},{key:"focusPreviousOption",value:function(){this.focusAdjacentOption("previous")}},{key:"focusPageUpOption",value:function(){this.focusAdjacentOption("page_up")}},{key:"focusPageDownOption",value:function(){this.focusAdjacentOption("page_down")}},{key:"focusStartOption",value:function(){this.focusAdjacentOption("start")}},{key:"focusEndOption",value:function(){this.focusAdjacentOption("end")}},{key:"focusAdjacentOption",value:function(e){var t=this._visibleOptions.map(function(e,t){return{option:e,index:t}}).filter(function(e){return!e.option.disabled});if(this._scrollToFocusedOptionOnUpdate=!0,!this.state.isOpen){var n={focusedOption:this._focusedOption||(t.length?t["next"===e?0:t.length-1].option:null),isOpen:!0};return this.props.onSelectResetsInput&&(n.inputValue=""),void this.setState(n)}if(t.length){for(var r=-1,o=0;o<t.length;o++)if(this._focusedOption===t[o].option){r=o;break}if("next"===e&&-1!==r)r=(r+1)%t.length;else if("previous"===e)r>0?r-=1:r=t.length-1;else if("start"===e)r=0;else if("end"===e)r=t.length-1;else if("page_up"===e){var a=r-this.props.pageSize;r=a<0?0:a}else if("page_down"===e){var i=r+this.props.pageSize;r=i>t.length-1?t.length-1:i}-1===r&&(r=0),this.setState({focusedIndex:t[r].index,focusedOption:t[r].option})}}},{key:"getFocusedOption",value:function(){return this._focusedOption}},{key:"selectFocusedOption",value:function(){if(this._focusedOption)return this.selectValue(this._focusedOption)}},{key:"renderLoading",value:function(){if(this.props.isLoading)return o.a.createElement("span",{className:"Select-loading-zone","aria-hidden":"true"},o.a.createElement("span",{className:"Select-loading"}))}},{key:"renderValue",value:function(e,t){var n=this,r=this.props.valueRenderer||this.getOptionLabel,a=this.props.valueComponent;if(!e.length)return function(e,t,n){var r=e.inputValue,o=e.isPseudoFocused,a=e.isFocused,i=t.onSelectResetsInput;return!r||!i&&!n&&!o&&!a}(this.state,this.props,t)?o.a.createElement("div",{className:"Select-placeholder"},this.props.placeholder):null;var i,s,l,c,u,p,f=this.props.onValueClick?this.handleValueClick:null;return this.props.multi?e.map(function(t,i){return o.a.createElement(a,{disabled:n.props.disabled||!1===t.clearableValue,id:n._instancePrefix+"-value-"+i,instancePrefix:n._instancePrefix,key:"value-"+i+"-"+t[n.props.valueKey],onClick:f,onRemove:n.removeValue,placeholder:n.props.placeholder,value:t,values:e},r(t,i),o.a.createElement("span",{className:"Select-aria-only"}," "))}):(i=this.state,s=this.props,l=i.inputValue,c=i.isPseudoFocused,u=i.isFocused,p=s.onSelectResetsInput,l&&(p||!u&&c||u&&!c)?void 0:(t&&(f=null),o.a.createElement(a,{disabled:this.props.disabled,id:this._instancePrefix+"-value-item",instancePrefix:this._instancePrefix,onClick:f,placeholder:this.props.placeholder,value:e[0]},r(e[0]))))}},{key:"renderInput",value:function(e,t){var n,r=this,a=Yn()("Select-input",this.props.inputProps.className),i=this.state.isOpen,s=Yn()((ur(n={},this._instancePrefix+"-list",i),ur(n,this._instancePrefix+"-backspace-remove-message",this.props.multi&&!this.props.disabled&&this.state.isFocused&&!this.state.inputValue),n)),l=this.state.inputValue;!l||this.props.onSelectResetsInput||this.state.isFocused||(l="");var c=pr({},this.props.inputProps,{"aria-activedescendant":i?this._instancePrefix+"-option-"+t:this._instancePrefix+"-value","aria-describedby":this.props["aria-describedby"],"aria-expanded":""+i,"aria-haspopup":""+i,"aria-label":this.props["aria-label"],"aria-labelledby":this.props["aria-labelledby"],"aria-owns":s,onBlur:this.handleInputBlur,onChange:this.handleInputChange,onFocus:this.handleInputFocus,ref:function(e){return r.input=e},role:"combobox",required:this.state.required,tabIndex:this.props.tabIndex,value:l});if(this.props.inputRenderer)return this.props.inputRenderer(c);if(this.props.disabled||!this.props.searchable){var u=dr(this.props.inputProps,[]),p=Yn()(ur({},this._instancePrefix+"-list",i));return o.a.createElement("div",pr({},u,{"aria-expanded":i,"aria-owns":p,"aria-activedescendant":i?this._instancePrefix+"-option-"+t:this._instancePrefix+"-value","aria-disabled":""+this.props.disabled,"aria-label":this.props["aria-label"],"aria-labelledby":this.props["aria-labelledby"],className:a,onBlur:this.handleInputBlur,onFocus:this.handleInputFocus,ref:function(e){return r.input=e},role:"combobox",style:{border:0,width:1,display:"inline-block"},tabIndex:this.props.tabIndex||0}))}return this.props.autosize?o.a.createElement($n.a,pr({id:this.props.id},c,{className:a,minWidth:"5"})):o.a.createElement("div",{className:a,key:"input-wrap",style:{display:"inline-block"}},o.a.createElement("input",pr({id:this.props.id},c)))}},{key:"renderClear",value:function(){var e=this.getValueArray(this.props.value);if(this.props.clearable&&e.length&&!this.props.disabled&&!this.props.isLoading){var t=this.props.multi?this.props.clearAllText:this.props.clearValueText,n=this.props.clearRenderer();return o.a.createElement("span",{"aria-label":t,className:"Select-clear-zone",onMouseDown:this.clearValue,onTouchEnd:this.handleTouchEndClearValue,onTouchMove:this.handleTouchMove,onTouchStart:this.handleTouchStart,title:t},n)}}},{key:"renderArrow",value:function(){if(this.props.arrowRenderer){var e=this.handleMouseDownOnArrow,t=this.state.isOpen,n=this.props.arrowRenderer({onMouseDown:e,isOpen:t});return n?o.a.createElement("span",{className:"Select-arrow-zone",onMouseDown:e},n):null}}},{key:"filterOptions",value:function(e){var t=this.state.inputValue,n=this.props.options||[];if(this.props.filterOptions){var r="function"==typeof this.props.filterOptions?this.props.filterOptions:or;return r(n,t,e,{filterOption:this.props.filterOption,ignoreAccents:this.props.ignoreAccents,ignoreCase:this.props.ignoreCase,labelKey:this.props.labelKey,matchPos:this.props.matchPos,matchProp:this.props.matchProp,trimFilter:this.props.trimFilter,valueKey:this.props.valueKey})}return n}},{key:"onOptionRef",value:function(e,t){t&&(this.focused=e)}},{key:"renderMenu",value:function(e,t,n){return e&&e.length?this.props.menuRenderer({focusedOption:n,focusOption:this.focusOption,inputValue:this.state.inputValue,instancePrefix:this._instancePrefix,labelKey:this.props.labelKey,onFocus:this.focusOption,onOptionRef:this.onOptionRef,onSelect:this.selectValue,optionClassName:this.props.optionClassName,optionComponent:this.props.optionComponent,optionRenderer:this.props.optionRenderer||this.getOptionLabel,options:e,removeValue:this.removeValue,selectValue:this.selectValue,valueArray:t,valueKey:this.props.valueKey}):this.props.noResultsText?o.a.createElement("div",{className:"Select-noresults"},this.props.noResultsText):null}},{key:"renderHiddenField",value:function(e){var t=this;if(this.props.name){if(this.props.joinValues){var n=e.map(function(e){return mr(e[t.props.valueKey])}).join(this.props.delimiter);return o.a.createElement("input",{disabled:this.props.disabled,name:this.props.name,ref:function(e){return t.value=e},type:"hidden",value:n})}return e.map(function(e,n){return o.a.createElement("input",{disabled:t.props.disabled,key:"hidden."+n,name:t.props.name,ref:"value"+n,type:"hidden",value:mr(e[t.props.valueKey])})})}}},{key:"getFocusableOptionIndex",value:function(e){var t=this._visibleOptions;if(!t.length)return null;var n=this.props.valueKey,r=this.state.focusedOption||e;if(r&&!r.disabled){var o=-1;if(t.some(function(e,t){var a=e[n]===r[n];return a&&(o=t),a}),-1!==o)return o}for(var a=0;a<t.length;a++)if(!t[a].disabled)return a;return null}},{key:"renderOuter",value:function(e,t,n){var r=this,a=this.renderMenu(e,t,n);return a?o.a.createElement("div",{ref:function(e){return r.menuContainer=e},className:"Select-menu-outer",style:this.props.menuContainerStyle},o.a.createElement("div",{className:"Select-menu",id:this._instancePrefix+"-list",onMouseDown:this.handleMouseDownOnMenu,onScroll:this.handleMenuScroll,ref:function(e){return r.menu=e},role:"listbox",style:this.props.menuStyle,tabIndex:-1},a)):null}},{key:"render",value:function(){var e=this,t=this.getValueArray(this.props.value),n=this._visibleOptions=this.filterOptions(this.props.multi&&this.props.removeSelected?t:null),r=this.state.isOpen;this.props.multi&&!n.length&&t.length&&!this.state.inputValue&&(r=!1);var a=this.getFocusableOptionIndex(t[0]),i=null;i=this._focusedOption=null!==a?n[a]:null;var s=Yn()("Select",this.props.className,{"has-value":t.length,"is-clearable":this.props.clearable,"is-disabled":this.props.disabled,"is-focused":this.state.isFocused,"is-loading":this.props.isLoading,"is-open":r,"is-pseudo-focused":this.state.isPseudoFocused,"is-searchable":this.props.searchable,"Select--multi":this.props.multi,"Select--rtl":this.props.rtl,"Select--single":!this.props.multi}),l=null;return this.props.multi&&!this.props.disabled&&t.length&&!this.state.inputValue&&this.state.isFocused&&this.props.backspaceRemoves&&(l=o.a.createElement("span",{id:this._instancePrefix+"-backspace-remove-message",className:"Select-aria-only","aria-live":"assertive"},this.props.backspaceToRemoveMessage.replace("{label}",t[t.length-1][this.props.labelKey]))),o.a.createElement("div",{ref:function(t){return e.wrapper=t},className:s,style:this.props.wrapperStyle},this.renderHiddenField(t),o.a.createElement("div",{ref:function(t){return e.control=t},className:"Select-control",onKeyDown:this.handleKeyDown,onMouseDown:this.handleMouseDown,onTouchEnd:this.handleTouchEnd,onTouchMove:this.handleTouchMove,onTouchStart:this.handleTouchStart,style:this.props.style},o.a.createElement("div",{className:"Select-multi-value-wrapper",id:this._instancePrefix+"-value"},this.renderValue(t,r),this.renderInput(t,a)),l,this.renderLoading(),this.renderClear(),this.renderArrow()),r?this.renderOuter(n,t,i):null)}}]),t}(o.a.Component);xr.propTypes={"aria-describedby":Xn.a.string,"aria-label":Xn.a.string,"aria-labelledby":Xn.a.string,arrowRenderer:Xn.a.func,autoBlur:Xn.a.bool,autoFocus:Xn.a.bool,autofocus:Xn.a.bool,autosize:Xn.a.bool,backspaceRemoves:Xn.a.bool,backspaceToRemoveMessage:Xn.a.string,className:Xn.a.string,clearAllText:yr,clearRenderer:Xn.a.func,clearValueText:yr,clearable:Xn.a.bool,closeOnSelect:Xn.a.bool,deleteRemoves:Xn.a.bool,delimiter:Xn.a.string,disabled:Xn.a.bool,escapeClearsValue:Xn.a.bool,filterOption:Xn.a.func,filterOptions:Xn.a.any,id:Xn.a.string,ignoreAccents:Xn.a.bool,ignoreCase:Xn.a.bool,inputProps:Xn.a.object,inputRenderer:Xn.a.func,instanceId:Xn.a.string,isLoading:Xn.a.bool,joinValues:Xn.a.bool,labelKey:Xn.a.string,matchPos:Xn.a.string,matchProp:Xn.a.string,menuBuffer:Xn.a.number,menuContainerStyle:Xn.a.object,menuRenderer:Xn.a.func,menuStyle:Xn.a.object,multi:Xn.a.bool,name:Xn.a.string,noResultsText:yr,onBlur:Xn.a.func,onBlurResetsInput:Xn.a.bool,onChange:Xn.a.func,onClose:Xn.a.func,onCloseResetsInput:Xn.a.bool,onFocus:Xn.a.func,onInputChange:Xn.a.func,onInputKeyDown:Xn.a.func,onMenuScrollToBottom:Xn.a.func,onOpen:Xn.a.func,onSelectResetsInput:Xn.a.bool,onValueClick:Xn.a.func,openOnClick:Xn.a.bool,openOnFocus:Xn.a.bool,optionClassName:Xn.a.string,optionComponent:Xn.a.func,optionRenderer:Xn.a.func,options:Xn.a.array,pageSize:Xn.a.number,placeholder:yr,removeSelected:Xn.a.bool,required:Xn.a.bool,resetValue:Xn.a.any,rtl:Xn.a.bool,scrollMenuIntoView:Xn.a.bool,searchable:Xn.a.bool,simpleValue:Xn.a.bool,style:Xn.a.object,tabIndex:gr,tabSelectsValue:Xn.a.bool,trimFilter:Xn.a.bool,value:Xn.a.any,valueComponent:Xn.a.func,valueKey:Xn.a.string,valueRenderer:Xn.a.func,wrapperStyle:Xn.a.object},xr.defaultProps={arrowRenderer:er,autosize:!0,backspaceRemoves:!0,backspaceToRemoveMessage:"Press backspace to remove {label}",clearable:!0,clearAllText:"Clear all",clearRenderer:function(){return o.a.createElement("span",{className:"Select-clear",dangerouslySetInnerHTML:{__html:"&times;"}})},clearValueText:"Clear value",closeOnSelect:!0,deleteRemoves:!0,delimiter:",",disabled:!1,escapeClearsValue:!0,filterOptions:or,ignoreAccents:!0,ignoreCase:!0,inputProps:{},isLoading:!1,joinValues:!1,labelKey:"label",matchPos:"any",matchProp:"any",menuBuffer:0,menuRenderer:ar,multi:!1,noResultsText:"No results found",onBlurResetsInput:!0,onCloseResetsInput:!0,onSelectResetsInput:!0,openOnClick:!0,optionComponent:br,pageSize:5,placeholder:"Select...",removeSelected:!0,required:!1,rtl:!1,scrollMenuIntoView:!0,searchable:!0,simpleValue:!1,tabSelectsValue:!0,trimFilter:!0,valueComponent:vr,valueKey:"value"};var _r={autoload:Xn.a.bool.isRequired,cache:Xn.a.any,children:Xn.a.func.isRequired,ignoreAccents:Xn.a.bool,ignoreCase:Xn.a.bool,loadOptions:Xn.a.func.isRequired,loadingPlaceholder:Xn.a.oneOfType([Xn.a.string,Xn.a.node]),multi:Xn.a.bool,noResultsText:Xn.a.oneOfType([Xn.a.string,Xn.a.node]),onChange:Xn.a.func,onInputChange:Xn.a.func,options:Xn.a.array.isRequired,placeholder:Xn.a.oneOfType([Xn.a.string,Xn.a.node]),searchPromptText:Xn.a.oneOfType([Xn.a.string,Xn.a.node]),value:Xn.a.any},Er={},Sr={autoload:!0,cache:Er,children:function(e){return o.a.createElement(xr,e)},ignoreAccents:!0,ignoreCase:!0,loadingPlaceholder:"Loading...",options:[],searchPromptText:"Type to search"},Cr=function(e){function t(e,n){lr(this,t);var r=hr(this,(t.__proto__||Object.getPrototypeOf(t)).call(this,e,n));return r._cache=e.cache===Er?{}:e.cache,r.state={inputValue:"",isLoading:!1,options:e.options},r.onInputChange=r.onInputChange.bind(r),r}return fr(t,e),cr(t,[{key:"componentDidMount",value:function(){this.props.autoload&&this.loadOptions("")}},{key:"componentWillReceiveProps",value:function(e){e.options!==this.props.options&&this.setState({options:e.options})}},{key:"componentWillUnmount",value:function(){this._callback=null}},{key:"loadOptions",value:function(e){var t=this,n=this.props.loadOptions,r=this._cache;if(r&&Object.prototype.hasOwnProperty.call(r,e))return this._callback=null,void this.setState({isLoading:!1,options:r[e]});var o=function n(o,a){var i=a&&a.options||[];r&&(r[e]=i),n===t._callback&&(t._callback=null,t.setState({isLoading:!1,options:i}))};this._callback=o;var a=n(e,o);a&&a.then(function(e){return o(0,e)},function(e){return o()}),this._callback&&!this.state.isLoading&&this.setState({isLoading:!0})}},{key:"onInputChange",value:function(e){var t=this.props,n=t.ignoreAccents,r=t.ignoreCase,o=t.onInputChange,a=e;if(o){var i=o(a);null!=i&&"object"!==(void 0===i?"undefined":sr(i))&&(a=""+i)}var s=a;return n&&(s=nr(s)),r&&(s=s.toLowerCase()),this.setState({inputValue:a}),this.loadOptions(s),a}},{key:"noResultsText",value:function(){var e=this.props,t=e.loadingPlaceholder,n=e.noResultsText,r=e.searchPromptText,o=this.state,a=o.inputValue;return o.isLoading?t:a&&n?n:r}},{key:"focus",value:function(){this.select.focus()}},{key:"render",value:function(){var e=this,t=this.props,n=t.children,r=t.loadingPlaceholder,o=t.placeholder,a=this.state,i=a.isLoading,s=a.options,l={noResultsText:this.noResultsText(),placeholder:i?r:o,options:i&&r?[]:s,ref:function(t){return e.select=t}};return n(pr({},this.props,l,{isLoading:i,onInputChange:this.onInputChange}))}}]),t}(r.Component);Cr.propTypes=_r,Cr.defaultProps=Sr;var jr=function(e){function t(e,n){lr(this,t);var r=hr(this,(t.__proto__||Object.getPrototypeOf(t)).call(this,e,n));return r.filterOptions=r.filterOptions.bind(r),r.menuRenderer=r.menuRenderer.bind(r),r.onInputKeyDown=r.onInputKeyDown.bind(r),r.onInputChange=r.onInputChange.bind(r),r.onOptionSelect=r.onOptionSelect.bind(r),r}return fr(t,e),cr(t,[{key:"createNewOption",value:function(){var e=this.props,t=e.isValidNewOption,n=e.newOptionCreator,r=e.onNewOptionClick,o=e.options,a=void 0===o?[]:o;if(t({label:this.inputValue})){var i=n({label:this.inputValue,labelKey:this.labelKey,valueKey:this.valueKey});this.isOptionUnique({option:i,options:a})&&(r?r(i):(a.unshift(i),this.select.selectValue(i)))}}},{key:"filterOptions",value:function(){var e=this.props,t=e.filterOptions,n=e.isValidNewOption,r=e.promptTextCreator,o=e.showNewOptionAtTop,a=(arguments.length<=2?void 0:arguments[2])||[],i=t.apply(void 0,arguments)||[];if(n({label:this.inputValue})){var s=this.props.newOptionCreator,l=s({label:this.inputValue,labelKey:this.labelKey,valueKey:this.valueKey}),c=this.isOptionUnique({option:l,options:a.concat(i)});if(c){var u=r(this.inputValue);this._createPlaceholderOption=s({label:u,labelKey:this.labelKey,valueKey:this.valueKey}),o?i.unshift(this._createPlaceholderOption):i.push(this._createPlaceholderOption)}}return i}},{key:"isOptionUnique",value:function(e){var t=e.option,n=e.options,r=this.props.isOptionUnique;return n=n||this.props.options,r({labelKey:this.labelKey,option:t,options:n,valueKey:this.valueKey})}},{key:"menuRenderer",value:function(e){var t=this.props.menuRenderer;return t(pr({},e,{onSelect:this.onOptionSelect,selectValue:this.onOptionSelect}))}},{key:"onInputChange",value:function(e){var t=this.props.onInputChange;return this.inputValue=e,t&&(this.inputValue=t(e)),this.inputValue}},{key:"onInputKeyDown",value:function(e){var t=this.props,n=t.shouldKeyDownEventCreateNewOption,r=t.onInputKeyDown,o=this.select.getFocusedOption();o&&o===this._createPlaceholderOption&&n(e)?(this.createNewOption(),e.preventDefault()):r&&r(e)}},{key:"onOptionSelect",value:function(e){e===this._createPlaceholderOption?this.createNewOption():this.select.selectValue(e)}},{key:"focus",value:function(){this.select.focus()}},{key:"render",value:function(){var e=this,t=this.props,n=t.ref,r=dr(t,["ref"]),o=this.props.children;return o||(o=Ar),o(pr({},r,{allowCreate:!0,filterOptions:this.filterOptions,menuRenderer:this.menuRenderer,onInputChange:this.onInputChange,onInputKeyDown:this.onInputKeyDown,ref:function(t){e.select=t,t&&(e.labelKey=t.props.labelKey,e.valueKey=t.props.valueKey),n&&n(t)}}))}}]),t}(o.a.Component),Ar=function(e){return o.a.createElement(xr,e)},Pr=function(e){var t=e.option,n=e.options,r=e.labelKey,o=e.valueKey;return!n||!n.length||0===n.filter(function(e){return e[r]===t[r]||e[o]===t[o]}).length},Tr=function(e){return!!e.label},Mr=function(e){var t=e.label,n=e.labelKey,r={};return r[e.valueKey]=t,r[n]=t,r.className="Select-create-option-placeholder",r},Fr=function(e){return'Create option "'+e+'"'},Dr=function(e){switch(e.keyCode){case 9:case 13:case 188:return!0;default:return!1}};jr.isOptionUnique=Pr,jr.isValidNewOption=Tr,jr.newOptionCreator=Mr,jr.promptTextCreator=Fr,jr.shouldKeyDownEventCreateNewOption=Dr,jr.defaultProps={filterOptions:or,isOptionUnique:Pr,isValidNewOption:Tr,menuRenderer:ar,newOptionCreator:Mr,promptTextCreator:Fr,shouldKeyDownEventCreateNewOption:Dr,showNewOptionAtTop:!0},jr.propTypes={children:Xn.a.func,filterOptions:Xn.a.any,isOptionUnique:Xn.a.func,isValidNewOption:Xn.a.func,menuRenderer:Xn.a.any,newOptionCreator:Xn.a.func,onInputChange:Xn.a.func,onInputKeyDown:Xn.a.func,onNewOptionClick:Xn.a.func,options:Xn.a.array,promptTextCreator:Xn.a.func,ref:Xn.a.func,shouldKeyDownEventCreateNewOption:Xn.a.func,showNewOptionAtTop:Xn.a.bool};var Rr=function(e){function t(){return lr(this,t),hr(this,(t.__proto__||Object.getPrototypeOf(t)).apply(this,arguments))}return fr(t,e),cr(t,[{key:"focus",value:function(){this.select.focus()}},{key:"render",value:function(){var e=this;return o.a.createElement(Cr,this.props,function(t){var n=t.ref,r=dr(t,["ref"]),a=n;return o.a.createElement(jr,r,function(t){var n=t.ref,r=dr(t,["ref"]),o=n;return e.props.children(pr({},r,{ref:function(t){o(t),a(t),e.select=t}}))})})}}]),t}(o.a.Component);Rr.propTypes={children:Xn.a.func.isRequired},Rr.defaultProps={children:function(e){return o.a.createElement(xr,e)}},xr.Async=Cr,xr.AsyncCreatable=Rr,xr.Creatable=jr,xr.Value=vr,xr.Option=br;var Ir=xr;function Nr(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}var zr=function(){function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e)}var t,n,r;return t=e,r=[{key:"getFirstParentOfType",value:function(e,t){t=t.toUpperCase();for(var n=e;n;){if(n.tagName.toUpperCase()===t)return n;if(null===n.parentElement)return;n=n.parentElement}}},{key:"getParentById",value:function(e,t){for(var n=e;n;){if(n.id===t)return n;if(null===n.parentElement)return;n=n.parentElement}}}],(n=null)&&Nr(t.prototype,n),r&&Nr(t,r),e}();function Lr(e){return(Lr="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Br(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Vr(e,t){return!t||"object"!==Lr(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function qr(e){return(qr=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Wr(e,t){return(Wr=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Ur,Kr=function(e){function t(){var e;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(e=Vr(this,qr(t).apply(this,arguments))).handleOpenDropdown=function(){var t=e.refs.dropdown;Jt(t.wrapper.querySelector(".Select-menu-outer"))},e}var n,a,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Wr(e,t)}(t,r["PureComponent"]),n=t,(a=[{key:"render",value:function(){var e=this.props,t=e.clearable,n=e.dropdown,r=e.onChange,a=e.value,i=e.disabled;return o.a.createElement("div",{className:"dash-dropdown-cell-value-container dash-cell-value-container",onClick:this.handleClick},o.a.createElement("div",{className:"dropdown-cell-value-shadow cell-value-shadow"},(n&&n.find(function(e){return e.value===a})||{label:void 0}).label),o.a.createElement(Ir,{ref:"dropdown",clearable:t,onChange:function(e){r(e?e.value:e)},onOpen:this.handleOpenDropdown,options:n,placeholder:"",value:a,disabled:i}))}},{key:"componentDidUpdate",value:function(){this.setFocus()}},{key:"componentDidMount",value:function(){this.setFocus()}},{key:"handleClick",value:function(e){e.stopPropagation()}},{key:"setFocus",value:function(){var e=this.props,t=e.active,n=e.applyFocus;if(t){var r=this.refs.dropdown;if(n&&r&&document.activeElement!==r){var o=zr.getFirstParentOfType(r.wrapper,"td");o&&o.focus()}}}}])&&Br(n.prototype,a),i&&Br(n,i),t}(),Hr=function(e){return e},$r=function(e){var t;switch(e.type){case ve.c.Numeric:t=function(e){if(!e)return function(e){return e};var t=Object(Et.a)(Ft(e.locale)),n=e.prefix?t.formatPrefix(e.specifier,e.prefix):t.format(e.specifier),r=e.locale.separate_4digits?e.specifier:e.specifier.replace(/,/,""),o=e.prefix?t.formatPrefix(r,e.prefix):t.format(r);return function(t){return"number"!=typeof(t=At(t)?e.nully:t)?t:Math.abs(t)<1e4?o(t):n(t)}}(e.format)}return t||Hr};function Gr(e){return(Ur=Ur||document.createElement("textarea")).innerHTML="&"+e,Ur.value}var Yr=Object.prototype.hasOwnProperty;function Zr(e,t){return!!e&&Yr.call(e,t)}function Xr(e){return[].slice.call(arguments,1).forEach(function(t){if(t){if("object"!=typeof t)throw new TypeError(t+"must be object");Object.keys(t).forEach(function(n){e[n]=t[n]})}}),e}var Jr=/\\([\\!"#$%&'()*+,.\/:;<=>?@[\]^_`{|}~-])/g;function Qr(e){return e.indexOf("\\")<0?e:e.replace(Jr,"$1")}function eo(e){return!(e>=55296&&e<=57343)&&(!(e>=64976&&e<=65007)&&(65535!=(65535&e)&&65534!=(65535&e)&&(!(e>=0&&e<=8)&&(11!==e&&(!(e>=14&&e<=31)&&(!(e>=127&&e<=159)&&!(e>1114111)))))))}function to(e){if(e>65535){var t=55296+((e-=65536)>>10),n=56320+(1023&e);return String.fromCharCode(t,n)}return String.fromCharCode(e)}var no=/&([a-z#][a-z0-9]{1,31});/gi,ro=/^#((?:x[a-f0-9]{1,8}|[0-9]{1,8}))/i;function oo(e,t){var n=0,r=Gr(t);return t!==r?r:35===t.charCodeAt(0)&&ro.test(t)&&eo(n="x"===t[1].toLowerCase()?parseInt(t.slice(2),16):parseInt(t.slice(1),10))?to(n):e}function ao(e){return e.indexOf("&")<0?e:e.replace(no,oo)}var io=/[&<>"]/,so=/[&<>"]/g,lo={"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;"};function co(e){return lo[e]}function uo(e){return io.test(e)?e.replace(so,co):e}var po={};po.blockquote_open=function(){return"<blockquote>\n"},po.blockquote_close=function(e,t){return"</blockquote>"+fo(e,t)},po.code=function(e,t){return e[t].block?"<pre><code>"+uo(e[t].content)+"</code></pre>"+fo(e,t):"<code>"+uo(e[t].content)+"</code>"},po.fence=function(e,t,n,r,o){var a,i,s=e[t],l="",c=n.langPrefix;if(s.params){if(i=(a=s.params.split(/\s+/g)).join(" "),Zr(o.rules.fence_custom,a[0]))return o.rules.fence_custom[a[0]](e,t,n,r,o);l=' class="'+c+uo(ao(Qr(i)))+'"'}return"<pre><code"+l+">"+(n.highlight&&n.highlight.apply(n.highlight,[s.content].concat(a))||uo(s.content))+"</code></pre>"+fo(e,t)},po.fence_custom={},po.heading_open=function(e,t){return"<h"+e[t].hLevel+">"},po.heading_close=function(e,t){return"</h"+e[t].hLevel+">\n"},po.hr=function(e,t,n){return(n.xhtmlOut?"<hr />":"<hr>")+fo(e,t)},po.bullet_list_open=function(){return"<ul>\n"},po.bullet_list_close=function(e,t){return"</ul>"+fo(e,t)},po.list_item_open=function(){return"<li>"},po.list_item_close=function(){return"</li>\n"},po.ordered_list_open=function(e,t){var n=e[t];return"<ol"+(n.order>1?' start="'+n.order+'"':"")+">\n"},po.ordered_list_close=function(e,t){return"</ol>"+fo(e,t)},po.paragraph_open=function(e,t){return e[t].tight?"":"<p>"},po.paragraph_close=function(e,t){var n=!(e[t].tight&&t&&"inline"===e[t-1].type&&!e[t-1].content);return(e[t].tight?"":"</p>")+(n?fo(e,t):"")},po.link_open=function(e,t,n){var r=e[t].title?' title="'+uo(ao(e[t].title))+'"':"",o=n.linkTarget?' target="'+n.linkTarget+'"':"";return'<a href="'+uo(e[t].href)+'"'+r+o+">"},po.link_close=function(){return"</a>"},po.image=function(e,t,n){var r=' src="'+uo(e[t].src)+'"',o=e[t].title?' title="'+uo(ao(e[t].title))+'"':"";return"<img"+r+(' alt="'+(e[t].alt?uo(ao(Qr(e[t].alt))):"")+'"')+o+(n.xhtmlOut?" /":"")+">"},po.table_open=function(){return"<table>\n"},po.table_close=function(){return"</table>\n"},po.thead_open=function(){return"<thead>\n"},po.thead_close=function(){return"</thead>\n"},po.tbody_open=function(){return"<tbody>\n"},po.tbody_close=function(){return"</tbody>\n"},po.tr_open=function(){return"<tr>"},po.tr_close=function(){return"</tr>\n"},po.th_open=function(e,t){var n=e[t];return"<th"+(n.align?' style="text-align:'+n.align+'"':"")+">"},po.th_close=function(){return"</th>"},po.td_open=function(e,t){var n=e[t];return"<td"+(n.align?' style="text-align:'+n.align+'"':"")+">"},po.td_close=function(){return"</td>"},po.strong_open=function(){return"<strong>"},po.strong_close=function(){return"</strong>"},po.em_open=function(){return"<em>"},po.em_close=function(){return"</em>"},po.del_open=function(){return"<del>"},po.del_close=function(){return"</del>"},po.ins_open=function(){return"<ins>"},po.ins_close=function(){return"</ins>"},po.mark_open=function(){return"<mark>"},po.mark_close=function(){return"</mark>"},po.sub=function(e,t){return"<sub>"+uo(e[t].content)+"</sub>"},po.sup=function(e,t){return"<sup>"+uo(e[t].content)+"</sup>"},po.hardbreak=function(e,t,n){return n.xhtmlOut?"<br />\n":"<br>\n"},po.softbreak=function(e,t,n){return n.breaks?n.xhtmlOut?"<br />\n":"<br>\n":"\n"},po.text=function(e,t){return uo(e[t].content)},po.htmlblock=function(e,t){return e[t].content},po.htmltag=function(e,t){return e[t].content},po.abbr_open=function(e,t){return'<abbr title="'+uo(ao(e[t].title))+'">'},po.abbr_close=function(){return"</abbr>"},po.footnote_ref=function(e,t){var n=Number(e[t].id+1).toString(),r="fnref"+n;return e[t].subId>0&&(r+=":"+e[t].subId),'<sup class="footnote-ref"><a href="#fn'+n+'" id="'+r+'">['+n+"]</a></sup>"},po.footnote_block_open=function(e,t,n){return(n.xhtmlOut?'<hr class="footnotes-sep" />\n':'<hr class="footnotes-sep">\n')+'<section class="footnotes">\n<ol class="footnotes-list">\n'},po.footnote_block_close=function(){return"</ol>\n</section>\n"},po.footnote_open=function(e,t){return'<li id="fn'+Number(e[t].id+1).toString()+'"  class="footnote-item">'},po.footnote_close=function(){return"</li>\n"},po.footnote_anchor=function(e,t){var n="fnref"+Number(e[t].id+1).toString();return e[t].subId>0&&(n+=":"+e[t].subId),' <a href="#'+n+'" class="footnote-backref">↩</a>'},po.dl_open=function(){return"<dl>\n"},po.dt_open=function(){return"<dt>"},po.dd_open=function(){return"<dd>"},po.dl_close=function(){return"</dl>\n"},po.dt_close=function(){return"</dt>\n"},po.dd_close=function(){return"</dd>\n"};var fo=po.getBreak=function(e,t){return(t=function e(t,n){return++n>=t.length-2?n:"paragraph_open"===t[n].type&&t[n].tight&&"inline"===t[n+1].type&&0===t[n+1].content.length&&"paragraph_close"===t[n+2].type&&t[n+2].tight?e(t,n+2):n}(e,t))<e.length&&"list_item_close"===e[t].type?"":"\n"};function ho(){this.rules=Xr({},po),this.getBreak=po.getBreak}function bo(){this.__rules__=[],this.__cache__=null}function vo(e,t,n,r,o){this.src=e,this.env=r,this.options=n,this.parser=t,this.tokens=o,this.pos=0,this.posMax=this.src.length,this.level=0,this.pending="",this.pendingLevel=0,this.cache=[],this.isInLabel=!1,this.linkLevel=0,this.linkContent="",this.labelUnmatchedScopes=0}function mo(e,t){var n,r,o,a=-1,i=e.posMax,s=e.pos,l=e.isInLabel;if(e.isInLabel)return-1;if(e.labelUnmatchedScopes)return e.labelUnmatchedScopes--,-1;for(e.pos=t+1,e.isInLabel=!0,n=1;e.pos<i;){if(91===(o=e.src.charCodeAt(e.pos)))n++;else if(93===o&&0===--n){r=!0;break}e.parser.skipToken(e)}return r?(a=e.pos,e.labelUnmatchedScopes=0):e.labelUnmatchedScopes=n-1,e.pos=s,e.isInLabel=l,a}function yo(e,t,n,r){var o,a,i,s,l,c;if(42!==e.charCodeAt(0))return-1;if(91!==e.charCodeAt(1))return-1;if(-1===e.indexOf("]:"))return-1;if((a=mo(o=new vo(e,t,n,r,[]),1))<0||58!==e.charCodeAt(a+1))return-1;for(s=o.posMax,i=a+2;i<s&&10!==o.src.charCodeAt(i);i++);return l=e.slice(2,a),0===(c=e.slice(a+2,i).trim()).length?-1:(r.abbreviations||(r.abbreviations={}),void 0===r.abbreviations[":"+l]&&(r.abbreviations[":"+l]=c),i)}function go(e){var t=ao(e);try{t=decodeURI(t)}catch(e){}return encodeURI(t)}function wo(e,t){var n,r,o,a=t,i=e.posMax;if(60===e.src.charCodeAt(t)){for(t++;t<i;){if(10===(n=e.src.charCodeAt(t)))return!1;if(62===n)return o=go(Qr(e.src.slice(a+1,t))),!!e.parser.validateLink(o)&&(e.pos=t+1,e.linkContent=o,!0);92===n&&t+1<i?t+=2:t++}return!1}for(r=0;t<i&&32!==(n=e.src.charCodeAt(t))&&!(n<32||127===n);)if(92===n&&t+1<i)t+=2;else{if(40===n&&++r>1)break;if(41===n&&--r<0)break;t++}return a!==t&&(o=Qr(e.src.slice(a,t)),!!e.parser.validateLink(o)&&(e.linkContent=o,e.pos=t,!0))}function ko(e,t){var n,r=t,o=e.posMax,a=e.src.charCodeAt(t);if(34!==a&&39!==a&&40!==a)return!1;for(t++,40===a&&(a=41);t<o;){if((n=e.src.charCodeAt(t))===a)return e.pos=t+1,e.linkContent=Qr(e.src.slice(r+1,t)),!0;92===n&&t+1<o?t+=2:t++}return!1}function Oo(e){return e.trim().replace(/\s+/g," ").toUpperCase()}function xo(e,t,n,r){var o,a,i,s,l,c,u,p,f;if(91!==e.charCodeAt(0))return-1;if(-1===e.indexOf("]:"))return-1;if((a=mo(o=new vo(e,t,n,r,[]),0))<0||58!==e.charCodeAt(a+1))return-1;for(s=o.posMax,i=a+2;i<s&&(32===(l=o.src.charCodeAt(i))||10===l);i++);if(!wo(o,i))return-1;for(u=o.linkContent,c=i=o.pos,i+=1;i<s&&(32===(l=o.src.charCodeAt(i))||10===l);i++);for(i<s&&c!==i&&ko(o,i)?(p=o.linkContent,i=o.pos):(p="",i=c);i<s&&32===o.src.charCodeAt(i);)i++;return i<s&&10!==o.src.charCodeAt(i)?-1:(f=Oo(e.slice(1,a)),void 0===r.references[f]&&(r.references[f]={title:p,href:u}),i)}ho.prototype.renderInline=function(e,t,n){for(var r=this.rules,o=e.length,a=0,i="";o--;)i+=r[e[a].type](e,a++,t,n,this);return i},ho.prototype.render=function(e,t,n){for(var r=this.rules,o=e.length,a=-1,i="";++a<o;)"inline"===e[a].type?i+=this.renderInline(e[a].children,t,n):i+=r[e[a].type](e,a,t,n,this);return i},bo.prototype.__find__=function(e){for(var t=this.__rules__.length,n=-1;t--;)if(this.__rules__[++n].name===e)return n;return-1},bo.prototype.__compile__=function(){var e=this,t=[""];e.__rules__.forEach(function(e){e.enabled&&e.alt.forEach(function(e){t.indexOf(e)<0&&t.push(e)})}),e.__cache__={},t.forEach(function(t){e.__cache__[t]=[],e.__rules__.forEach(function(n){n.enabled&&(t&&n.alt.indexOf(t)<0||e.__cache__[t].push(n.fn))})})},bo.prototype.at=function(e,t,n){var r=this.__find__(e),o=n||{};if(-1===r)throw new Error("Parser rule not found: "+e);this.__rules__[r].fn=t,this.__rules__[r].alt=o.alt||[],this.__cache__=null},bo.prototype.before=function(e,t,n,r){var o=this.__find__(e),a=r||{};if(-1===o)throw new Error("Parser rule not found: "+e);this.__rules__.splice(o,0,{name:t,enabled:!0,fn:n,alt:a.alt||[]}),this.__cache__=null},bo.prototype.after=function(e,t,n,r){var o=this.__find__(e),a=r||{};if(-1===o)throw new Error("Parser rule not found: "+e);this.__rules__.splice(o+1,0,{name:t,enabled:!0,fn:n,alt:a.alt||[]}),this.__cache__=null},bo.prototype.push=function(e,t,n){var r=n||{};this.__rules__.push({name:e,enabled:!0,fn:t,alt:r.alt||[]}),this.__cache__=null},bo.prototype.enable=function(e,t){e=Array.isArray(e)?e:[e],t&&this.__rules__.forEach(function(e){e.enabled=!1}),e.forEach(function(e){var t=this.__find__(e);if(t<0)throw new Error("Rules manager: invalid rule name "+e);this.__rules__[t].enabled=!0},this),this.__cache__=null},bo.prototype.disable=function(e){(e=Array.isArray(e)?e:[e]).forEach(function(e){var t=this.__find__(e);if(t<0)throw new Error("Rules manager: invalid rule name "+e);this.__rules__[t].enabled=!1},this),this.__cache__=null},bo.prototype.getRules=function(e){return null===this.__cache__&&this.__compile__(),this.__cache__[e]||[]},vo.prototype.pushPending=function(){this.tokens.push({type:"text",content:this.pending,level:this.pendingLevel}),this.pending=""},vo.prototype.push=function(e){this.pending&&this.pushPending(),this.tokens.push(e),this.pendingLevel=this.level},vo.prototype.cacheSet=function(e,t){for(var n=this.cache.length;n<=e;n++)this.cache.push(0);this.cache[e]=t},vo.prototype.cacheGet=function(e){return e<this.cache.length?this.cache[e]:0};var _o=" \n()[]'\".,!?-";function Eo(e){return e.replace(/([-()\[\]{}+?*.$\^|,:#<!\\])/g,"\\$1")}var So=/\+-|\.\.|\?\?\?\?|!!!!|,,|--/,Co=/\((c|tm|r|p)\)/gi,jo={c:"©",r:"®",p:"§",tm:"™"};var Ao=/['"]/,Po=/['"]/g,To=/[-\s()\[\]]/,Mo="’";function Fo(e,t){return!(t<0||t>=e.length)&&!To.test(e[t])}function Do(e,t,n){return e.substr(0,t)+n+e.substr(t+1)}var Ro=[["block",function(e){e.inlineMode?e.tokens.push({type:"inline",content:e.src.replace(/\n/g," ").trim(),level:0,lines:[0,1],children:[]}):e.block.parse(e.src,e.options,e.env,e.tokens)}],["abbr",function(e){var t,n,r,o,a=e.tokens;if(!e.inlineMode)for(t=1,n=a.length-1;t<n;t++)if("paragraph_open"===a[t-1].type&&"inline"===a[t].type&&"paragraph_close"===a[t+1].type){for(r=a[t].content;r.length&&!((o=yo(r,e.inline,e.options,e.env))<0);)r=r.slice(o).trim();a[t].content=r,r.length||(a[t-1].tight=!0,a[t+1].tight=!0)}}],["references",function(e){var t,n,r,o,a=e.tokens;if(e.env.references=e.env.references||{},!e.inlineMode)for(t=1,n=a.length-1;t<n;t++)if("inline"===a[t].type&&"paragraph_open"===a[t-1].type&&"paragraph_close"===a[t+1].type){for(r=a[t].content;r.length&&!((o=xo(r,e.inline,e.options,e.env))<0);)r=r.slice(o).trim();a[t].content=r,r.length||(a[t-1].tight=!0,a[t+1].tight=!0)}}],["inline",function(e){var t,n,r,o=e.tokens;for(n=0,r=o.length;n<r;n++)"inline"===(t=o[n]).type&&e.inline.parse(t.content,e.options,e.env,t.children)}],["footnote_tail",function(e){var t,n,r,o,a,i,s,l,c,u=0,p=!1,f={};if(e.env.footnotes&&(e.tokens=e.tokens.filter(function(e){return"footnote_reference_open"===e.type?(p=!0,l=[],c=e.label,!1):"footnote_reference_close"===e.type?(p=!1,f[":"+c]=l,!1):(p&&l.push(e),!p)}),e.env.footnotes.list)){for(i=e.env.footnotes.list,e.tokens.push({type:"footnote_block_open",level:u++}),t=0,n=i.length;t<n;t++){for(e.tokens.push({type:"footnote_open",id:t,level:u++}),i[t].tokens?((s=[]).push({type:"paragraph_open",tight:!1,level:u++}),s.push({type:"inline",content:"",level:u,children:i[t].tokens}),s.push({type:"paragraph_close",tight:!1,level:--u})):i[t].label&&(s=f[":"+i[t].label]),e.tokens=e.tokens.concat(s),a="paragraph_close"===e.tokens[e.tokens.length-1].type?e.tokens.pop():null,o=i[t].count>0?i[t].count:1,r=0;r<o;r++)e.tokens.push({type:"footnote_anchor",id:t,subId:r,level:u});a&&e.tokens.push(a),e.tokens.push({type:"footnote_close",level:--u})}e.tokens.push({type:"footnote_block_close",level:--u})}}],["abbr2",function(e){var t,n,r,o,a,i,s,l,c,u,p,f,d=e.tokens;if(e.env.abbreviations)for(e.env.abbrRegExp||(f="(^|["+_o.split("").map(Eo).join("")+"])("+Object.keys(e.env.abbreviations).map(function(e){return e.substr(1)}).sort(function(e,t){return t.length-e.length}).map(Eo).join("|")+")($|["+_o.split("").map(Eo).join("")+"])",e.env.abbrRegExp=new RegExp(f,"g")),u=e.env.abbrRegExp,n=0,r=d.length;n<r;n++)if("inline"===d[n].type)for(t=(o=d[n].children).length-1;t>=0;t--)if("text"===(a=o[t]).type){for(l=0,i=a.content,u.lastIndex=0,c=a.level,s=[];p=u.exec(i);)u.lastIndex>l&&s.push({type:"text",content:i.slice(l,p.index+p[1].length),level:c}),s.push({type:"abbr_open",title:e.env.abbreviations[":"+p[2]],level:c++}),s.push({type:"text",content:p[2],level:c}),s.push({type:"abbr_close",level:--c}),l=u.lastIndex-p[3].length;s.length&&(l<i.length&&s.push({type:"text",content:i.slice(l),level:c}),d[n].children=o=[].concat(o.slice(0,t),s,o.slice(t+1)))}}],["replacements",function(e){var t,n,r,o,a,i;if(e.options.typographer)for(a=e.tokens.length-1;a>=0;a--)if("inline"===e.tokens[a].type)for(t=(o=e.tokens[a].children).length-1;t>=0;t--)"text"===(n=o[t]).type&&(r=n.content,r=(i=r).indexOf("(")<0?i:i.replace(Co,function(e,t){return jo[t.toLowerCase()]}),So.test(r)&&(r=r.replace(/\+-/g,"±").replace(/\.{2,}/g,"…").replace(/([?!])…/g,"$1..").replace(/([?!]){4,}/g,"$1$1$1").replace(/,{2,}/g,",").replace(/(^|[^-])---([^-]|$)/gm,"$1—$2").replace(/(^|\s)--(\s|$)/gm,"$1–$2").replace(/(^|[^-\s])--([^-\s]|$)/gm,"$1–$2")),n.content=r)}],["smartquotes",function(e){var t,n,r,o,a,i,s,l,c,u,p,f,d,h,b,v,m;if(e.options.typographer)for(m=[],b=e.tokens.length-1;b>=0;b--)if("inline"===e.tokens[b].type)for(v=e.tokens[b].children,m.length=0,t=0;t<v.length;t++)if("text"===(n=v[t]).type&&!Ao.test(n.text)){for(s=v[t].level,d=m.length-1;d>=0&&!(m[d].level<=s);d--);m.length=d+1,a=0,i=(r=n.content).length;e:for(;a<i&&(Po.lastIndex=a,o=Po.exec(r));)if(l=!Fo(r,o.index-1),a=o.index+1,h="'"===o[0],(c=!Fo(r,a))||l){if(p=!c,f=!l)for(d=m.length-1;d>=0&&(u=m[d],!(m[d].level<s));d--)if(u.single===h&&m[d].level===s){u=m[d],h?(v[u.token].content=Do(v[u.token].content,u.pos,e.options.quotes[2]),n.content=Do(n.content,o.index,e.options.quotes[3])):(v[u.token].content=Do(v[u.token].content,u.pos,e.options.quotes[0]),n.content=Do(n.content,o.index,e.options.quotes[1])),m.length=d;continue e}p?m.push({token:t,pos:o.index,single:h,level:s}):f&&h&&(n.content=Do(n.content,o.index,Mo))}else h&&(n.content=Do(n.content,o.index,Mo))}}]];function Io(){this.options={},this.ruler=new bo;for(var e=0;e<Ro.length;e++)this.ruler.push(Ro[e][0],Ro[e][1])}function No(e,t,n,r,o){var a,i,s,l,c,u,p;for(this.src=e,this.parser=t,this.options=n,this.env=r,this.tokens=o,this.bMarks=[],this.eMarks=[],this.tShift=[],this.blkIndent=0,this.line=0,this.lineMax=0,this.tight=!1,this.parentType="root",this.ddIndent=-1,this.level=0,this.result="",u=0,p=!1,s=l=u=0,c=(i=this.src).length;l<c;l++){if(a=i.charCodeAt(l),!p){if(32===a){u++;continue}p=!0}10!==a&&l!==c-1||(10!==a&&l++,this.bMarks.push(s),this.eMarks.push(l),this.tShift.push(u),p=!1,u=0,s=l+1)}this.bMarks.push(i.length),this.eMarks.push(i.length),this.tShift.push(0),this.lineMax=this.bMarks.length-1}function zo(e,t){var n,r,o;return(r=e.bMarks[t]+e.tShift[t])>=(o=e.eMarks[t])?-1:42!==(n=e.src.charCodeAt(r++))&&45!==n&&43!==n?-1:r<o&&32!==e.src.charCodeAt(r)?-1:r}function Lo(e,t){var n,r=e.bMarks[t]+e.tShift[t],o=e.eMarks[t];if(r+1>=o)return-1;if((n=e.src.charCodeAt(r++))<48||n>57)return-1;for(;;){if(r>=o)return-1;if(!((n=e.src.charCodeAt(r++))>=48&&n<=57)){if(41===n||46===n)break;return-1}}return r<o&&32!==e.src.charCodeAt(r)?-1:r}Io.prototype.process=function(e){var t,n,r;for(t=0,n=(r=this.ruler.getRules("")).length;t<n;t++)r[t](e)},No.prototype.isEmpty=function(e){return this.bMarks[e]+this.tShift[e]>=this.eMarks[e]},No.prototype.skipEmptyLines=function(e){for(var t=this.lineMax;e<t&&!(this.bMarks[e]+this.tShift[e]<this.eMarks[e]);e++);return e},No.prototype.skipSpaces=function(e){for(var t=this.src.length;e<t&&32===this.src.charCodeAt(e);e++);return e},No.prototype.skipChars=function(e,t){for(var n=this.src.length;e<n&&this.src.charCodeAt(e)===t;e++);return e},No.prototype.skipCharsBack=function(e,t,n){if(e<=n)return e;for(;e>n;)if(t!==this.src.charCodeAt(--e))return e+1;return e},No.prototype.getLines=function(e,t,n,r){var o,a,i,s,l,c=e;if(e>=t)return"";if(c+1===t)return a=this.bMarks[c]+Math.min(this.tShift[c],n),i=r?this.eMarks[c]+1:this.eMarks[c],this.src.slice(a,i);for(s=new Array(t-e),o=0;c<t;c++,o++)(l=this.tShift[c])>n&&(l=n),l<0&&(l=0),a=this.bMarks[c]+l,i=c+1<t||r?this.eMarks[c]+1:this.eMarks[c],s[o]=this.src.slice(a,i);return s.join("")};var Bo={};["article","aside","button","blockquote","body","canvas","caption","col","colgroup","dd","div","dl","dt","embed","fieldset","figcaption","figure","footer","form","h1","h2","h3","h4","h5","h6","header","hgroup","hr","iframe","li","map","object","ol","output","p","pre","progress","script","section","style","table","tbody","td","textarea","tfoot","th","tr","thead","ul","video"].forEach(function(e){Bo[e]=!0});var Vo=/^<([a-zA-Z]{1,15})[\s\/>]/,qo=/^<\/([a-zA-Z]{1,15})[\s>]/;function Wo(e,t){var n=e.bMarks[t]+e.blkIndent,r=e.eMarks[t];return e.src.substr(n,r-n)}function Uo(e,t){var n,r,o=e.bMarks[t]+e.tShift[t],a=e.eMarks[t];return o>=a?-1:126!==(r=e.src.charCodeAt(o++))&&58!==r?-1:o===(n=e.skipSpaces(o))?-1:n>=a?-1:n}var Ko=[["code",function(e,t,n){var r,o;if(e.tShift[t]-e.blkIndent<4)return!1;for(o=r=t+1;r<n;)if(e.isEmpty(r))r++;else{if(!(e.tShift[r]-e.blkIndent>=4))break;o=++r}return e.line=r,e.tokens.push({type:"code",content:e.getLines(t,o,4+e.blkIndent,!0),block:!0,lines:[t,e.line],level:e.level}),!0}],["fences",function(e,t,n,r){var o,a,i,s,l,c=!1,u=e.bMarks[t]+e.tShift[t],p=e.eMarks[t];if(u+3>p)return!1;if(126!==(o=e.src.charCodeAt(u))&&96!==o)return!1;if(l=u,(a=(u=e.skipChars(u,o))-l)<3)return!1;if((i=e.src.slice(u,p).trim()).indexOf("`")>=0)return!1;if(r)return!0;for(s=t;!(++s>=n)&&!((u=l=e.bMarks[s]+e.tShift[s])<(p=e.eMarks[s])&&e.tShift[s]<e.blkIndent);)if(e.src.charCodeAt(u)===o&&!(e.tShift[s]-e.blkIndent>=4||(u=e.skipChars(u,o))-l<a||(u=e.skipSpaces(u))<p)){c=!0;break}return a=e.tShift[t],e.line=s+(c?1:0),e.tokens.push({type:"fence",params:i,content:e.getLines(t+1,s,a,!0),lines:[t,e.line],level:e.level}),!0},["paragraph","blockquote","list"]],["blockquote",function(e,t,n,r){var o,a,i,s,l,c,u,p,f,d,h,b=e.bMarks[t]+e.tShift[t],v=e.eMarks[t];if(b>v)return!1;if(62!==e.src.charCodeAt(b++))return!1;if(e.level>=e.options.maxNesting)return!1;if(r)return!0;for(32===e.src.charCodeAt(b)&&b++,l=e.blkIndent,e.blkIndent=0,s=[e.bMarks[t]],e.bMarks[t]=b,a=(b=b<v?e.skipSpaces(b):b)>=v,i=[e.tShift[t]],e.tShift[t]=b-e.bMarks[t],p=e.parser.ruler.getRules("blockquote"),o=t+1;o<n&&!((b=e.bMarks[o]+e.tShift[o])>=(v=e.eMarks[o]));o++)if(62!==e.src.charCodeAt(b++)){if(a)break;for(h=!1,f=0,d=p.length;f<d;f++)if(p[f](e,o,n,!0)){h=!0;break}if(h)break;s.push(e.bMarks[o]),i.push(e.tShift[o]),e.tShift[o]=-1337}else 32===e.src.charCodeAt(b)&&b++,s.push(e.bMarks[o]),e.bMarks[o]=b,a=(b=b<v?e.skipSpaces(b):b)>=v,i.push(e.tShift[o]),e.tShift[o]=b-e.bMarks[o];for(c=e.parentType,e.parentType="blockquote",e.tokens.push({type:"blockquote_open",lines:u=[t,0],level:e.level++}),e.parser.tokenize(e,t,o),e.tokens.push({type:"blockquote_close",level:--e.level}),e.parentType=c,u[1]=e.line,f=0;f<i.length;f++)e.bMarks[f+t]=s[f],e.tShift[f+t]=i[f];return e.blkIndent=l,!0},["paragraph","blockquote","list"]],["hr",function(e,t,n,r){var o,a,i,s=e.bMarks[t],l=e.eMarks[t];if((s+=e.tShift[t])>l)return!1;if(42!==(o=e.src.charCodeAt(s++))&&45!==o&&95!==o)return!1;for(a=1;s<l;){if((i=e.src.charCodeAt(s++))!==o&&32!==i)return!1;i===o&&a++}return!(a<3)&&(!!r||(e.line=t+1,e.tokens.push({type:"hr",lines:[t,e.line],level:e.level}),!0))},["paragraph","blockquote","list"]],["list",function(e,t,n,r){var o,a,i,s,l,c,u,p,f,d,h,b,v,m,y,g,w,k,O,x,_,E=!0;if((p=Lo(e,t))>=0)b=!0;else{if(!((p=zo(e,t))>=0))return!1;b=!1}if(e.level>=e.options.maxNesting)return!1;if(h=e.src.charCodeAt(p-1),r)return!0;for(m=e.tokens.length,b?(u=e.bMarks[t]+e.tShift[t],d=Number(e.src.substr(u,p-u-1)),e.tokens.push({type:"ordered_list_open",order:d,lines:g=[t,0],level:e.level++})):e.tokens.push({type:"bullet_list_open",lines:g=[t,0],level:e.level++}),o=t,y=!1,k=e.parser.ruler.getRules("list");!(!(o<n)||((f=(v=e.skipSpaces(p))>=e.eMarks[o]?1:v-p)>4&&(f=1),f<1&&(f=1),a=p-e.bMarks[o]+f,e.tokens.push({type:"list_item_open",lines:w=[t,0],level:e.level++}),s=e.blkIndent,l=e.tight,i=e.tShift[t],c=e.parentType,e.tShift[t]=v-e.bMarks[t],e.blkIndent=a,e.tight=!0,e.parentType="list",e.parser.tokenize(e,t,n,!0),e.tight&&!y||(E=!1),y=e.line-t>1&&e.isEmpty(e.line-1),e.blkIndent=s,e.tShift[t]=i,e.tight=l,e.parentType=c,e.tokens.push({type:"list_item_close",level:--e.level}),o=t=e.line,w[1]=o,v=e.bMarks[t],o>=n)||e.isEmpty(o)||e.tShift[o]<e.blkIndent);){for(_=!1,O=0,x=k.length;O<x;O++)if(k[O](e,o,n,!0)){_=!0;break}if(_)break;if(b){if((p=Lo(e,o))<0)break}else if((p=zo(e,o))<0)break;if(h!==e.src.charCodeAt(p-1))break}return e.tokens.push({type:b?"ordered_list_close":"bullet_list_close",level:--e.level}),g[1]=o,e.line=o,E&&function(e,t){var n,r,o=e.level+2;for(n=t+2,r=e.tokens.length-2;n<r;n++)e.tokens[n].level===o&&"paragraph_open"===e.tokens[n].type&&(e.tokens[n+2].tight=!0,e.tokens[n].tight=!0,n+=2)}(e,m),!0},["paragraph","blockquote"]],["footnote",function(e,t,n,r){var o,a,i,s,l,c=e.bMarks[t]+e.tShift[t],u=e.eMarks[t];if(c+4>u)return!1;if(91!==e.src.charCodeAt(c))return!1;if(94!==e.src.charCodeAt(c+1))return!1;if(e.level>=e.options.maxNesting)return!1;for(s=c+2;s<u;s++){if(32===e.src.charCodeAt(s))return!1;if(93===e.src.charCodeAt(s))break}return s!==c+2&&(!(s+1>=u||58!==e.src.charCodeAt(++s))&&(!!r||(s++,e.env.footnotes||(e.env.footnotes={}),e.env.footnotes.refs||(e.env.footnotes.refs={}),l=e.src.slice(c+2,s-2),e.env.footnotes.refs[":"+l]=-1,e.tokens.push({type:"footnote_reference_open",label:l,level:e.level++}),o=e.bMarks[t],a=e.tShift[t],i=e.parentType,e.tShift[t]=e.skipSpaces(s)-s,e.bMarks[t]=s,e.blkIndent+=4,e.parentType="footnote",e.tShift[t]<e.blkIndent&&(e.tShift[t]+=e.blkIndent,e.bMarks[t]-=e.blkIndent),e.parser.tokenize(e,t,n,!0),e.parentType=i,e.blkIndent-=4,e.tShift[t]=a,e.bMarks[t]=o,e.tokens.push({type:"footnote_reference_close",level:--e.level}),!0)))},["paragraph"]],["heading",function(e,t,n,r){var o,a,i,s=e.bMarks[t]+e.tShift[t],l=e.eMarks[t];if(s>=l)return!1;if(35!==(o=e.src.charCodeAt(s))||s>=l)return!1;for(a=1,o=e.src.charCodeAt(++s);35===o&&s<l&&a<=6;)a++,o=e.src.charCodeAt(++s);return!(a>6||s<l&&32!==o)&&(!!r||(l=e.skipCharsBack(l,32,s),(i=e.skipCharsBack(l,35,s))>s&&32===e.src.charCodeAt(i-1)&&(l=i),e.line=t+1,e.tokens.push({type:"heading_open",hLevel:a,lines:[t,e.line],level:e.level}),s<l&&e.tokens.push({type:"inline",content:e.src.slice(s,l).trim(),level:e.level+1,lines:[t,e.line],children:[]}),e.tokens.push({type:"heading_close",hLevel:a,level:e.level}),!0))},["paragraph","blockquote"]],["lheading",function(e,t,n){var r,o,a,i=t+1;return!(i>=n)&&(!(e.tShift[i]<e.blkIndent)&&(!(e.tShift[i]-e.blkIndent>3)&&(!((o=e.bMarks[i]+e.tShift[i])>=(a=e.eMarks[i]))&&((45===(r=e.src.charCodeAt(o))||61===r)&&(o=e.skipChars(o,r),!((o=e.skipSpaces(o))<a)&&(o=e.bMarks[t]+e.tShift[t],e.line=i+1,e.tokens.push({type:"heading_open",hLevel:61===r?1:2,lines:[t,e.line],level:e.level}),e.tokens.push({type:"inline",content:e.src.slice(o,e.eMarks[t]).trim(),level:e.level+1,lines:[t,e.line-1],children:[]}),e.tokens.push({type:"heading_close",hLevel:61===r?1:2,level:e.level}),!0))))))}],["htmlblock",function(e,t,n,r){var o,a,i,s=e.bMarks[t],l=e.eMarks[t],c=e.tShift[t];if(s+=c,!e.options.html)return!1;if(c>3||s+2>=l)return!1;if(60!==e.src.charCodeAt(s))return!1;if(33===(o=e.src.charCodeAt(s+1))||63===o){if(r)return!0}else{if(47!==o&&!function(e){var t=32|e;return t>=97&&t<=122}(o))return!1;if(47===o){if(!(a=e.src.slice(s,l).match(qo)))return!1}else if(!(a=e.src.slice(s,l).match(Vo)))return!1;if(!0!==Bo[a[1].toLowerCase()])return!1;if(r)return!0}for(i=t+1;i<e.lineMax&&!e.isEmpty(i);)i++;return e.line=i,e.tokens.push({type:"htmlblock",level:e.level,lines:[t,e.line],content:e.getLines(t,i,0,!0)}),!0},["paragraph","blockquote"]],["table",function(e,t,n,r){var o,a,i,s,l,c,u,p,f,d,h;if(t+2>n)return!1;if(l=t+1,e.tShift[l]<e.blkIndent)return!1;if((i=e.bMarks[l]+e.tShift[l])>=e.eMarks[l])return!1;if(124!==(o=e.src.charCodeAt(i))&&45!==o&&58!==o)return!1;if(a=Wo(e,t+1),!/^[-:| ]+$/.test(a))return!1;if((c=a.split("|"))<=2)return!1;for(p=[],s=0;s<c.length;s++){if(!(f=c[s].trim())){if(0===s||s===c.length-1)continue;return!1}if(!/^:?-+:?$/.test(f))return!1;58===f.charCodeAt(f.length-1)?p.push(58===f.charCodeAt(0)?"center":"right"):58===f.charCodeAt(0)?p.push("left"):p.push("")}if(-1===(a=Wo(e,t).trim()).indexOf("|"))return!1;if(c=a.replace(/^\||\|$/g,"").split("|"),p.length!==c.length)return!1;if(r)return!0;for(e.tokens.push({type:"table_open",lines:d=[t,0],level:e.level++}),e.tokens.push({type:"thead_open",lines:[t,t+1],level:e.level++}),e.tokens.push({type:"tr_open",lines:[t,t+1],level:e.level++}),s=0;s<c.length;s++)e.tokens.push({type:"th_open",align:p[s],lines:[t,t+1],level:e.level++}),e.tokens.push({type:"inline",content:c[s].trim(),lines:[t,t+1],level:e.level,children:[]}),e.tokens.push({type:"th_close",level:--e.level});for(e.tokens.push({type:"tr_close",level:--e.level}),e.tokens.push({type:"thead_close",level:--e.level}),e.tokens.push({type:"tbody_open",lines:h=[t+2,0],level:e.level++}),l=t+2;l<n&&!(e.tShift[l]<e.blkIndent)&&-1!==(a=Wo(e,l).trim()).indexOf("|");l++){for(c=a.replace(/^\||\|$/g,"").split("|"),e.tokens.push({type:"tr_open",level:e.level++}),s=0;s<c.length;s++)e.tokens.push({type:"td_open",align:p[s],level:e.level++}),u=c[s].substring(124===c[s].charCodeAt(0)?1:0,124===c[s].charCodeAt(c[s].length-1)?c[s].length-1:c[s].length).trim(),e.tokens.push({type:"inline",content:u,level:e.level,children:[]}),e.tokens.push({type:"td_close",level:--e.level});e.tokens.push({type:"tr_close",level:--e.level})}return e.tokens.push({type:"tbody_close",level:--e.level}),e.tokens.push({type:"table_close",level:--e.level}),d[1]=h[1]=l,e.line=l,!0},["paragraph"]],["deflist",function(e,t,n,r){var o,a,i,s,l,c,u,p,f,d,h,b,v,m;if(r)return!(e.ddIndent<0)&&Uo(e,t)>=0;if(u=t+1,e.isEmpty(u)&&++u>n)return!1;if(e.tShift[u]<e.blkIndent)return!1;if((o=Uo(e,u))<0)return!1;if(e.level>=e.options.maxNesting)return!1;c=e.tokens.length,e.tokens.push({type:"dl_open",lines:l=[t,0],level:e.level++}),i=t,a=u;e:for(;;){for(m=!0,v=!1,e.tokens.push({type:"dt_open",lines:[i,i],level:e.level++}),e.tokens.push({type:"inline",content:e.getLines(i,i+1,e.blkIndent,!1).trim(),level:e.level+1,lines:[i,i],children:[]}),e.tokens.push({type:"dt_close",level:--e.level});;){if(e.tokens.push({type:"dd_open",lines:s=[u,0],level:e.level++}),b=e.tight,f=e.ddIndent,p=e.blkIndent,h=e.tShift[a],d=e.parentType,e.blkIndent=e.ddIndent=e.tShift[a]+2,e.tShift[a]=o-e.bMarks[a],e.tight=!0,e.parentType="deflist",e.parser.tokenize(e,a,n,!0),e.tight&&!v||(m=!1),v=e.line-a>1&&e.isEmpty(e.line-1),e.tShift[a]=h,e.tight=b,e.parentType=d,e.blkIndent=p,e.ddIndent=f,e.tokens.push({type:"dd_close",level:--e.level}),s[1]=u=e.line,u>=n)break e;if(e.tShift[u]<e.blkIndent)break e;if((o=Uo(e,u))<0)break;a=u}if(u>=n)break;if(i=u,e.isEmpty(i))break;if(e.tShift[i]<e.blkIndent)break;if((a=i+1)>=n)break;if(e.isEmpty(a)&&a++,a>=n)break;if(e.tShift[a]<e.blkIndent)break;if((o=Uo(e,a))<0)break}return e.tokens.push({type:"dl_close",level:--e.level}),l[1]=u,e.line=u,m&&function(e,t){var n,r,o=e.level+2;for(n=t+2,r=e.tokens.length-2;n<r;n++)e.tokens[n].level===o&&"paragraph_open"===e.tokens[n].type&&(e.tokens[n+2].tight=!0,e.tokens[n].tight=!0,n+=2)}(e,c),!0},["paragraph"]],["paragraph",function(e,t){var n,r,o,a,i,s,l=t+1;if(l<(n=e.lineMax)&&!e.isEmpty(l))for(s=e.parser.ruler.getRules("paragraph");l<n&&!e.isEmpty(l);l++)if(!(e.tShift[l]-e.blkIndent>3)){for(o=!1,a=0,i=s.length;a<i;a++)if(s[a](e,l,n,!0)){o=!0;break}if(o)break}return r=e.getLines(t,l,e.blkIndent,!1).trim(),e.line=l,r.length&&(e.tokens.push({type:"paragraph_open",tight:!1,lines:[t,e.line],level:e.level}),e.tokens.push({type:"inline",content:r,level:e.level+1,lines:[t,e.line],children:[]}),e.tokens.push({type:"paragraph_close",tight:!1,level:e.level})),!0}]];function Ho(){this.ruler=new bo;for(var e=0;e<Ko.length;e++)this.ruler.push(Ko[e][0],Ko[e][1],{alt:(Ko[e][2]||[]).slice()})}Ho.prototype.tokenize=function(e,t,n){for(var r,o=this.ruler.getRules(""),a=o.length,i=t,s=!1;i<n&&(e.line=i=e.skipEmptyLines(i),!(i>=n))&&!(e.tShift[i]<e.blkIndent);){for(r=0;r<a&&!o[r](e,i,n,!1);r++);if(e.tight=!s,e.isEmpty(e.line-1)&&(s=!0),(i=e.line)<n&&e.isEmpty(i)){if(s=!0,++i<n&&"list"===e.parentType&&e.isEmpty(i))break;e.line=i}}};var $o=/[\n\t]/g,Go=/\r[\n\u0085]|[\u2424\u2028\u0085]/g,Yo=/\u00a0/g;function Zo(e){switch(e){case 10:case 92:case 96:case 42:case 95:case 94:case 91:case 93:case 33:case 38:case 60:case 62:case 123:case 125:case 36:case 37:case 64:case 126:case 43:case 61:case 58:return!0;default:return!1}}Ho.prototype.parse=function(e,t,n,r){var o,a=0,i=0;if(!e)return[];(e=(e=e.replace(Yo," ")).replace(Go,"\n")).indexOf("\t")>=0&&(e=e.replace($o,function(t,n){var r;return 10===e.charCodeAt(n)?(a=n+1,i=0,t):(r="    ".slice((n-a-i)%4),i=n-a+1,r)})),o=new No(e,this,t,n,r),this.tokenize(o,o.line,o.lineMax)};for(var Xo=[],Jo=0;Jo<256;Jo++)Xo.push(0);function Qo(e){return e>=48&&e<=57||e>=65&&e<=90||e>=97&&e<=122}function ea(e,t){var n,r,o,a=t,i=!0,s=!0,l=e.posMax,c=e.src.charCodeAt(t);for(n=t>0?e.src.charCodeAt(t-1):-1;a<l&&e.src.charCodeAt(a)===c;)a++;return a>=l&&(i=!1),(o=a-t)>=4?i=s=!1:(32!==(r=a<l?e.src.charCodeAt(a):-1)&&10!==r||(i=!1),32!==n&&10!==n||(s=!1),95===c&&(Qo(n)&&(i=!1),Qo(r)&&(s=!1))),{can_open:i,can_close:s,delims:o}}"\\!\"#$%&'()*+,./:;<=>?@[]^_`{|}~-".split("").forEach(function(e){Xo[e.charCodeAt(0)]=1});var ta=/\\([ \\!"#$%&'()*+,.\/:;<=>?@[\]^_`{|}~-])/g;var na=/\\([ \\!"#$%&'()*+,.\/:;<=>?@[\]^_`{|}~-])/g;var ra=["coap","doi","javascript","aaa","aaas","about","acap","cap","cid","crid","data","dav","dict","dns","file","ftp","geo","go","gopher","h323","http","https","iax","icap","im","imap","info","ipp","iris","iris.beep","iris.xpc","iris.xpcs","iris.lwz","ldap","mailto","mid","msrp","msrps","mtqp","mupdate","news","nfs","ni","nih","nntp","opaquelocktoken","pop","pres","rtsp","service","session","shttp","sieve","sip","sips","sms","snmp","soap.beep","soap.beeps","tag","tel","telnet","tftp","thismessage","tn3270","tip","tv","urn","vemmi","ws","wss","xcon","xcon-userid","xmlrpc.beep","xmlrpc.beeps","xmpp","z39.50r","z39.50s","adiumxtra","afp","afs","aim","apt","attachment","aw","beshare","bitcoin","bolo","callto","chrome","chrome-extension","com-eventbrite-attendee","content","cvs","dlna-playsingle","dlna-playcontainer","dtn","dvb","ed2k","facetime","feed","finger","fish","gg","git","gizmoproject","gtalk","hcp","icon","ipn","irc","irc6","ircs","itms","jar","jms","keyparc","lastfm","ldaps","magnet","maps","market","message","mms","ms-help","msnim","mumble","mvn","notes","oid","palm","paparazzi","platform","proxy","psyc","query","res","resource","rmi","rsync","rtmp","secondlife","sftp","sgn","skype","smb","soldat","spotify","ssh","steam","svn","teamspeak","things","udp","unreal","ut2004","ventrilo","view-source","webcal","wtai","wyciwyg","xfire","xri","ymsgr"],oa=/^<([a-zA-Z0-9.!#$%&'*+\/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*)>/,aa=/^<([a-zA-Z.\-]{1,25}):([^<>\x00-\x20]*)>/;function ia(e,t){return e=e.source,t=t||"",function n(r,o){return r?(o=o.source||o,e=e.replace(r,o),n):new RegExp(e,t)}}var sa=ia(/(?:unquoted|single_quoted|double_quoted)/)("unquoted",/[^"'=<>`\x00-\x20]+/)("single_quoted",/'[^']*'/)("double_quoted",/"[^"]*"/)(),la=ia(/(?:\s+attr_name(?:\s*=\s*attr_value)?)/)("attr_name",/[a-zA-Z_:][a-zA-Z0-9:._-]*/)("attr_value",sa)(),ca=ia(/<[A-Za-z][A-Za-z0-9]*attribute*\s*\/?>/)("attribute",la)(),ua=ia(/^(?:open_tag|close_tag|comment|processing|declaration|cdata)/)("open_tag",ca)("close_tag",/<\/[A-Za-z][A-Za-z0-9]*\s*>/)("comment",/<!---->|<!--(?:-?[^>-])(?:-?[^-])*-->/)("processing",/<[?].*?[?]>/)("declaration",/<![A-Z]+\s+[^>]*>/)("cdata",/<!\[CDATA\[[\s\S]*?\]\]>/)();var pa=/^&#((?:x[a-f0-9]{1,8}|[0-9]{1,8}));/i,fa=/^&([a-z][a-z0-9]{1,31});/i;var da=[["text",function(e,t){for(var n=e.pos;n<e.posMax&&!Zo(e.src.charCodeAt(n));)n++;return n!==e.pos&&(t||(e.pending+=e.src.slice(e.pos,n)),e.pos=n,!0)}],["newline",function(e,t){var n,r,o=e.pos;if(10!==e.src.charCodeAt(o))return!1;if(n=e.pending.length-1,r=e.posMax,!t)if(n>=0&&32===e.pending.charCodeAt(n))if(n>=1&&32===e.pending.charCodeAt(n-1)){for(var a=n-2;a>=0;a--)if(32!==e.pending.charCodeAt(a)){e.pending=e.pending.substring(0,a+1);break}e.push({type:"hardbreak",level:e.level})}else e.pending=e.pending.slice(0,-1),e.push({type:"softbreak",level:e.level});else e.push({type:"softbreak",level:e.level});for(o++;o<r&&32===e.src.charCodeAt(o);)o++;return e.pos=o,!0}],["escape",function(e,t){var n,r=e.pos,o=e.posMax;if(92!==e.src.charCodeAt(r))return!1;if(++r<o){if((n=e.src.charCodeAt(r))<256&&0!==Xo[n])return t||(e.pending+=e.src[r]),e.pos+=2,!0;if(10===n){for(t||e.push({type:"hardbreak",level:e.level}),r++;r<o&&32===e.src.charCodeAt(r);)r++;return e.pos=r,!0}}return t||(e.pending+="\\"),e.pos++,!0}],["backticks",function(e,t){var n,r,o,a,i,s=e.pos;if(96!==e.src.charCodeAt(s))return!1;for(n=s,s++,r=e.posMax;s<r&&96===e.src.charCodeAt(s);)s++;for(o=e.src.slice(n,s),a=i=s;-1!==(a=e.src.indexOf("`",i));){for(i=a+1;i<r&&96===e.src.charCodeAt(i);)i++;if(i-a===o.length)return t||e.push({type:"code",content:e.src.slice(s,a).replace(/[ \n]+/g," ").trim(),block:!1,level:e.level}),e.pos=i,!0}return t||(e.pending+=o),e.pos+=o.length,!0}],["del",function(e,t){var n,r,o,a,i,s=e.posMax,l=e.pos;if(126!==e.src.charCodeAt(l))return!1;if(t)return!1;if(l+4>=s)return!1;if(126!==e.src.charCodeAt(l+1))return!1;if(e.level>=e.options.maxNesting)return!1;if(a=l>0?e.src.charCodeAt(l-1):-1,i=e.src.charCodeAt(l+2),126===a)return!1;if(126===i)return!1;if(32===i||10===i)return!1;for(r=l+2;r<s&&126===e.src.charCodeAt(r);)r++;if(r>l+3)return e.pos+=r-l,t||(e.pending+=e.src.slice(l,r)),!0;for(e.pos=l+2,o=1;e.pos+1<s;){if(126===e.src.charCodeAt(e.pos)&&126===e.src.charCodeAt(e.pos+1)&&(a=e.src.charCodeAt(e.pos-1),126!==(i=e.pos+2<s?e.src.charCodeAt(e.pos+2):-1)&&126!==a&&(32!==a&&10!==a?o--:32!==i&&10!==i&&o++,o<=0))){n=!0;break}e.parser.skipToken(e)}return n?(e.posMax=e.pos,e.pos=l+2,t||(e.push({type:"del_open",level:e.level++}),e.parser.tokenize(e),e.push({type:"del_close",level:--e.level})),e.pos=e.posMax+2,e.posMax=s,!0):(e.pos=l,!1)}],["ins",function(e,t){var n,r,o,a,i,s=e.posMax,l=e.pos;if(43!==e.src.charCodeAt(l))return!1;if(t)return!1;if(l+4>=s)return!1;if(43!==e.src.charCodeAt(l+1))return!1;if(e.level>=e.options.maxNesting)return!1;if(a=l>0?e.src.charCodeAt(l-1):-1,i=e.src.charCodeAt(l+2),43===a)return!1;if(43===i)return!1;if(32===i||10===i)return!1;for(r=l+2;r<s&&43===e.src.charCodeAt(r);)r++;if(r!==l+2)return e.pos+=r-l,t||(e.pending+=e.src.slice(l,r)),!0;for(e.pos=l+2,o=1;e.pos+1<s;){if(43===e.src.charCodeAt(e.pos)&&43===e.src.charCodeAt(e.pos+1)&&(a=e.src.charCodeAt(e.pos-1),43!==(i=e.pos+2<s?e.src.charCodeAt(e.pos+2):-1)&&43!==a&&(32!==a&&10!==a?o--:32!==i&&10!==i&&o++,o<=0))){n=!0;break}e.parser.skipToken(e)}return n?(e.posMax=e.pos,e.pos=l+2,t||(e.push({type:"ins_open",level:e.level++}),e.parser.tokenize(e),e.push({type:"ins_close",level:--e.level})),e.pos=e.posMax+2,e.posMax=s,!0):(e.pos=l,!1)}],["mark",function(e,t){var n,r,o,a,i,s=e.posMax,l=e.pos;if(61!==e.src.charCodeAt(l))return!1;if(t)return!1;if(l+4>=s)return!1;if(61!==e.src.charCodeAt(l+1))return!1;if(e.level>=e.options.maxNesting)return!1;if(a=l>0?e.src.charCodeAt(l-1):-1,i=e.src.charCodeAt(l+2),61===a)return!1;if(61===i)return!1;if(32===i||10===i)return!1;for(r=l+2;r<s&&61===e.src.charCodeAt(r);)r++;if(r!==l+2)return e.pos+=r-l,t||(e.pending+=e.src.slice(l,r)),!0;for(e.pos=l+2,o=1;e.pos+1<s;){if(61===e.src.charCodeAt(e.pos)&&61===e.src.charCodeAt(e.pos+1)&&(a=e.src.charCodeAt(e.pos-1),61!==(i=e.pos+2<s?e.src.charCodeAt(e.pos+2):-1)&&61!==a&&(32!==a&&10!==a?o--:32!==i&&10!==i&&o++,o<=0))){n=!0;break}e.parser.skipToken(e)}return n?(e.posMax=e.pos,e.pos=l+2,t||(e.push({type:"mark_open",level:e.level++}),e.parser.tokenize(e),e.push({type:"mark_close",level:--e.level})),e.pos=e.posMax+2,e.posMax=s,!0):(e.pos=l,!1)}],["emphasis",function(e,t){var n,r,o,a,i,s,l,c=e.posMax,u=e.pos,p=e.src.charCodeAt(u);if(95!==p&&42!==p)return!1;if(t)return!1;if(n=(l=ea(e,u)).delims,!l.can_open)return e.pos+=n,t||(e.pending+=e.src.slice(u,e.pos)),!0;if(e.level>=e.options.maxNesting)return!1;for(e.pos=u+n,s=[n];e.pos<c;)if(e.src.charCodeAt(e.pos)!==p)e.parser.skipToken(e);else{if(r=(l=ea(e,e.pos)).delims,l.can_close){for(a=s.pop(),i=r;a!==i;){if(i<a){s.push(a-i);break}if(i-=a,0===s.length)break;e.pos+=a,a=s.pop()}if(0===s.length){n=a,o=!0;break}e.pos+=r;continue}l.can_open&&s.push(r),e.pos+=r}return o?(e.posMax=e.pos,e.pos=u+n,t||(2!==n&&3!==n||e.push({type:"strong_open",level:e.level++}),1!==n&&3!==n||e.push({type:"em_open",level:e.level++}),e.parser.tokenize(e),1!==n&&3!==n||e.push({type:"em_close",level:--e.level}),2!==n&&3!==n||e.push({type:"strong_close",level:--e.level})),e.pos=e.posMax+n,e.posMax=c,!0):(e.pos=u,!1)}],["sub",function(e,t){var n,r,o=e.posMax,a=e.pos;if(126!==e.src.charCodeAt(a))return!1;if(t)return!1;if(a+2>=o)return!1;if(e.level>=e.options.maxNesting)return!1;for(e.pos=a+1;e.pos<o;){if(126===e.src.charCodeAt(e.pos)){n=!0;break}e.parser.skipToken(e)}return n&&a+1!==e.pos?(r=e.src.slice(a+1,e.pos)).match(/(^|[^\\])(\\\\)*\s/)?(e.pos=a,!1):(e.posMax=e.pos,e.pos=a+1,t||e.push({type:"sub",level:e.level,content:r.replace(ta,"$1")}),e.pos=e.posMax+1,e.posMax=o,!0):(e.pos=a,!1)}],["sup",function(e,t){var n,r,o=e.posMax,a=e.pos;if(94!==e.src.charCodeAt(a))return!1;if(t)return!1;if(a+2>=o)return!1;if(e.level>=e.options.maxNesting)return!1;for(e.pos=a+1;e.pos<o;){if(94===e.src.charCodeAt(e.pos)){n=!0;break}e.parser.skipToken(e)}return n&&a+1!==e.pos?(r=e.src.slice(a+1,e.pos)).match(/(^|[^\\])(\\\\)*\s/)?(e.pos=a,!1):(e.posMax=e.pos,e.pos=a+1,t||e.push({type:"sup",level:e.level,content:r.replace(na,"$1")}),e.pos=e.posMax+1,e.posMax=o,!0):(e.pos=a,!1)}],["links",function(e,t){var n,r,o,a,i,s,l,c,u=!1,p=e.pos,f=e.posMax,d=e.pos,h=e.src.charCodeAt(d);if(33===h&&(u=!0,h=e.src.charCodeAt(++d)),91!==h)return!1;if(e.level>=e.options.maxNesting)return!1;if(n=d+1,(r=mo(e,d))<0)return!1;if((s=r+1)<f&&40===e.src.charCodeAt(s)){for(s++;s<f&&(32===(c=e.src.charCodeAt(s))||10===c);s++);if(s>=f)return!1;for(d=s,wo(e,s)?(a=e.linkContent,s=e.pos):a="",d=s;s<f&&(32===(c=e.src.charCodeAt(s))||10===c);s++);if(s<f&&d!==s&&ko(e,s))for(i=e.linkContent,s=e.pos;s<f&&(32===(c=e.src.charCodeAt(s))||10===c);s++);else i="";if(s>=f||41!==e.src.charCodeAt(s))return e.pos=p,!1;s++}else{if(e.linkLevel>0)return!1;for(;s<f&&(32===(c=e.src.charCodeAt(s))||10===c);s++);if(s<f&&91===e.src.charCodeAt(s)&&(d=s+1,(s=mo(e,s))>=0?o=e.src.slice(d,s++):s=d-1),o||(void 0===o&&(s=r+1),o=e.src.slice(n,r)),!(l=e.env.references[Oo(o)]))return e.pos=p,!1;a=l.href,i=l.title}return t||(e.pos=n,e.posMax=r,u?e.push({type:"image",src:a,title:i,alt:e.src.substr(n,r-n),level:e.level}):(e.push({type:"link_open",href:a,title:i,level:e.level++}),e.linkLevel++,e.parser.tokenize(e),e.linkLevel--,e.push({type:"link_close",level:--e.level}))),e.pos=s,e.posMax=f,!0}],["footnote_inline",function(e,t){var n,r,o,a,i=e.posMax,s=e.pos;return!(s+2>=i)&&(94===e.src.charCodeAt(s)&&(91===e.src.charCodeAt(s+1)&&(!(e.level>=e.options.maxNesting)&&(n=s+2,!((r=mo(e,s+1))<0)&&(t||(e.env.footnotes||(e.env.footnotes={}),e.env.footnotes.list||(e.env.footnotes.list=[]),o=e.env.footnotes.list.length,e.pos=n,e.posMax=r,e.push({type:"footnote_ref",id:o,level:e.level}),e.linkLevel++,a=e.tokens.length,e.parser.tokenize(e),e.env.footnotes.list[o]={tokens:e.tokens.splice(a)},e.linkLevel--),e.pos=r+1,e.posMax=i,!0)))))}],["footnote_ref",function(e,t){var n,r,o,a,i=e.posMax,s=e.pos;if(s+3>i)return!1;if(!e.env.footnotes||!e.env.footnotes.refs)return!1;if(91!==e.src.charCodeAt(s))return!1;if(94!==e.src.charCodeAt(s+1))return!1;if(e.level>=e.options.maxNesting)return!1;for(r=s+2;r<i;r++){if(32===e.src.charCodeAt(r))return!1;if(10===e.src.charCodeAt(r))return!1;if(93===e.src.charCodeAt(r))break}return r!==s+2&&(!(r>=i)&&(r++,n=e.src.slice(s+2,r-1),void 0!==e.env.footnotes.refs[":"+n]&&(t||(e.env.footnotes.list||(e.env.footnotes.list=[]),e.env.footnotes.refs[":"+n]<0?(o=e.env.footnotes.list.length,e.env.footnotes.list[o]={label:n,count:0},e.env.footnotes.refs[":"+n]=o):o=e.env.footnotes.refs[":"+n],a=e.env.footnotes.list[o].count,e.env.footnotes.list[o].count++,e.push({type:"footnote_ref",id:o,subId:a,level:e.level})),e.pos=r,e.posMax=i,!0)))}],["autolink",function(e,t){var n,r,o,a,i,s=e.pos;return 60===e.src.charCodeAt(s)&&(!((n=e.src.slice(s)).indexOf(">")<0)&&((r=n.match(aa))?!(ra.indexOf(r[1].toLowerCase())<0)&&(i=go(a=r[0].slice(1,-1)),!!e.parser.validateLink(a)&&(t||(e.push({type:"link_open",href:i,level:e.level}),e.push({type:"text",content:a,level:e.level+1}),e.push({type:"link_close",level:e.level})),e.pos+=r[0].length,!0)):!!(o=n.match(oa))&&(i=go("mailto:"+(a=o[0].slice(1,-1))),!!e.parser.validateLink(i)&&(t||(e.push({type:"link_open",href:i,level:e.level}),e.push({type:"text",content:a,level:e.level+1}),e.push({type:"link_close",level:e.level})),e.pos+=o[0].length,!0))))}],["htmltag",function(e,t){var n,r,o,a=e.pos;return!!e.options.html&&(o=e.posMax,!(60!==e.src.charCodeAt(a)||a+2>=o)&&(!(33!==(n=e.src.charCodeAt(a+1))&&63!==n&&47!==n&&!function(e){var t=32|e;return t>=97&&t<=122}(n))&&(!!(r=e.src.slice(a).match(ua))&&(t||e.push({type:"htmltag",content:e.src.slice(a,a+r[0].length),level:e.level}),e.pos+=r[0].length,!0))))}],["entity",function(e,t){var n,r,o=e.pos,a=e.posMax;if(38!==e.src.charCodeAt(o))return!1;if(o+1<a)if(35===e.src.charCodeAt(o+1)){if(r=e.src.slice(o).match(pa))return t||(n="x"===r[1][0].toLowerCase()?parseInt(r[1].slice(1),16):parseInt(r[1],10),e.pending+=eo(n)?to(n):to(65533)),e.pos+=r[0].length,!0}else if(r=e.src.slice(o).match(fa)){var i=Gr(r[1]);if(r[1]!==i)return t||(e.pending+=i),e.pos+=r[0].length,!0}return t||(e.pending+="&"),e.pos++,!0}]];function ha(){this.ruler=new bo;for(var e=0;e<da.length;e++)this.ruler.push(da[e][0],da[e][1]);this.validateLink=ba}function ba(e){var t=e.trim().toLowerCase();return-1===(t=ao(t)).indexOf(":")||-1===["vbscript","javascript","file","data"].indexOf(t.split(":")[0])}ha.prototype.skipToken=function(e){var t,n,r=this.ruler.getRules(""),o=r.length,a=e.pos;if((n=e.cacheGet(a))>0)e.pos=n;else{for(t=0;t<o;t++)if(r[t](e,!0))return void e.cacheSet(a,e.pos);e.pos++,e.cacheSet(a,e.pos)}},ha.prototype.tokenize=function(e){for(var t,n,r=this.ruler.getRules(""),o=r.length,a=e.posMax;e.pos<a;){for(n=0;n<o&&!(t=r[n](e,!1));n++);if(t){if(e.pos>=a)break}else e.pending+=e.src[e.pos++]}e.pending&&e.pushPending()},ha.prototype.parse=function(e,t,n,r){var o=new vo(e,this,t,n,r);this.tokenize(o)};var va={default:{options:{html:!1,xhtmlOut:!1,breaks:!1,langPrefix:"language-",linkTarget:"",typographer:!1,quotes:"“”‘’",highlight:null,maxNesting:20},components:{core:{rules:["block","inline","references","replacements","smartquotes","references","abbr2","footnote_tail"]},block:{rules:["blockquote","code","fences","footnote","heading","hr","htmlblock","lheading","list","paragraph","table"]},inline:{rules:["autolink","backticks","del","emphasis","entity","escape","footnote_ref","htmltag","links","newline","text"]}}},full:{options:{html:!1,xhtmlOut:!1,breaks:!1,langPrefix:"language-",linkTarget:"",typographer:!1,quotes:"“”‘’",highlight:null,maxNesting:20},components:{core:{},block:{},inline:{}}},commonmark:{options:{html:!0,xhtmlOut:!0,breaks:!1,langPrefix:"language-",linkTarget:"",typographer:!1,quotes:"“”‘’",highlight:null,maxNesting:20},components:{core:{rules:["block","inline","references","abbr2"]},block:{rules:["blockquote","code","fences","heading","hr","htmlblock","lheading","list","paragraph"]},inline:{rules:["autolink","backticks","emphasis","entity","escape","htmltag","links","newline","text"]}}}};function ma(e,t,n){this.src=t,this.env=n,this.options=e.options,this.tokens=[],this.inlineMode=!1,this.inline=e.inline,this.block=e.block,this.renderer=e.renderer,this.typographer=e.typographer}function ya(e,t){"string"!=typeof e&&(t=e,e="default"),t&&null!=t.linkify&&console.warn("linkify option is removed. Use linkify plugin instead:\n\nimport Remarkable from 'remarkable';\nimport linkify from 'remarkable/linkify';\nnew Remarkable().use(linkify)\n"),this.inline=new ha,this.block=new Ho,this.core=new Io,this.renderer=new ho,this.ruler=new bo,this.options={},this.configure(va[e]),this.set(t||{})}function ga(e,t,n,r,o,a,i){try{var s=e[a](i),l=s.value}catch(e){return void n(e)}s.done?t(l):Promise.resolve(l).then(r,o)}function wa(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}ya.prototype.set=function(e){Xr(this.options,e)},ya.prototype.configure=function(e){var t=this;if(!e)throw new Error("Wrong `remarkable` preset, check name/content");e.options&&t.set(e.options),e.components&&Object.keys(e.components).forEach(function(n){e.components[n].rules&&t[n].ruler.enable(e.components[n].rules,!0)})},ya.prototype.use=function(e,t){return e(this,t),this},ya.prototype.parse=function(e,t){var n=new ma(this,e,t);return this.core.process(n),n.tokens},ya.prototype.render=function(e,t){return t=t||{},this.renderer.render(this.parse(e,t),this.options,t)},ya.prototype.parseInline=function(e,t){var n=new ma(this,e,t);return n.inlineMode=!0,this.core.process(n),n.tokens},ya.prototype.renderInline=function(e,t){return t=t||{},this.renderer.render(this.parseInline(e,t),this.options,t)};var ka=function(){function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e)}var t,n,r,o,a;return t=e,n=null,r=[{key:"loadhljs",value:(o=regeneratorRuntime.mark(function t(){return regeneratorRuntime.wrap(function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,Fe.a.hljs;case 2:e.hljs=t.sent,e.hljsResolve(),e.isReady=!0;case 5:case"end":return t.stop()}},t)}),a=function(){var e=this,t=arguments;return new Promise(function(n,r){var a=o.apply(e,t);function i(e){ga(a,n,r,i,s,"next",e)}function s(e){ga(a,n,r,i,s,"throw",e)}i(void 0)})},function(){return a.apply(this,arguments)})}],n&&wa(t.prototype,n),r&&wa(t,r),e}();function Oa(e){return(Oa="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function xa(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function _a(e,t){return!t||"object"!==Oa(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function Ea(e){return(Ea=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Sa(e,t){return(Sa=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}ka.isReady=new Promise(function(e){ka.hljsResolve=e}),ka.render=function(e){return ka.md.render(e)},ka.md=new ya({highlight:function(e,t){if(ka.hljs){if(t&&ka.hljs.getLanguage(t))try{return ka.hljs.highlight(t,e).value}catch(e){}try{return ka.hljs.highlightAuto(e).value}catch(e){}}else ka.loadhljs();return""}});var Ca=function(e){function t(e){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=_a(this,Ea(t).call(this,e))).getMarkdown=Object(f.a)(function(e,t){return{dangerouslySetInnerHTML:{__html:ka.render(String(e))}}}),!0!==ka.isReady&&ka.isReady.then(function(){n.setState({})}),n}var n,a,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Sa(e,t)}(t,r["PureComponent"]),n=t,(a=[{key:"componentDidUpdate",value:function(){this.setFocus()}},{key:"componentDidMount",value:function(){this.setFocus()}},{key:"render",value:function(){var e=this.props,t=e.className,n=e.value;return o.a.createElement("div",Object.assign({ref:"el",className:[t,"cell-markdown"].join(" ")},this.getMarkdown(n,ka.isReady)))}},{key:"setFocus",value:function(){var e=this.props,t=e.active,n=e.applyFocus;if(t){var r=this.refs.el;if(n&&r&&document.activeElement!==r){var o=zr.getFirstParentOfType(r,"td");o&&o.focus()}}}}])&&xa(n.prototype,a),i&&xa(n,i),t}();function ja(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}function Aa(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}var Pa,Ta=ge(h.a),Ma=ge(h.a);!function(e){e[e.Dropdown=0]="Dropdown",e[e.DropdownLabel=1]="DropdownLabel",e[e.Input=2]="Input",e[e.Label=3]="Label",e[e.Markdown=4]="Markdown"}(Pa||(Pa={}));var Fa=function(e){return new Da(e)},Da=function(){function e(t){var n=this,r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:An(t);!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.handlers=r,this.partialGet=Object(f.a)(function(e,t,r,o,a,i){var s=h.a($r,e);return Ta(function(t,r){return Ma(function(e,l){return n.getContent(!1,!1,o,e,a&&a[r][l],l,r,t,s,i)},e)},t)}),this.get=Object(f.a)(function(e,t,r,o,a,i,s,l,c){if(!t)return e;var u=t.row,p=t.column,f=u-i.rows,d=p-i.columns;if(f<0||d<0||a.length<=f||o.length<=d)return e;var b=h.a($r,o);return(e=on(e))[f][d]=n.getContent(!0,r||!1,s,o[d],l&&l[f][d],p,u,a[f],b,c),e})}var t,n,r;return t=e,(n=[{key:"getContent",value:function(e,t,n,r,a,i,s,l,c,u){var p=[].concat(ja(e?["input-active"]:[]),[n?"focused":"unfocused","dash-cell-value"]).join(" "),f=function(e,t,n,r,o){switch(r){case ve.g.Input:return e&&t&&!o?Pa.Input:Pa.Label;case ve.g.Dropdown:return n&&t?Pa.Dropdown:Pa.DropdownLabel;case ve.g.Markdown:return Pa.Markdown;default:return e&&t&&!o?Pa.Input:Pa.Label}}(e,r.editable,a&&a.options,r.presentation,u);switch(f){case Pa.Dropdown:return o.a.createElement(Kr,{key:"column-".concat(i),active:e,applyFocus:t,clearable:a&&a.clearable,dropdown:a&&a.options,onChange:this.handlers(mn.Change,s,i),value:l[r.id],disabled:u});case Pa.Input:return o.a.createElement(Ln,{key:"column-".concat(i),active:e,applyFocus:t,className:p,focused:n,onChange:this.handlers(mn.Change,s,i),onMouseUp:this.handlers(mn.MouseUp,s,i),onPaste:this.handlers(mn.Paste,s,i),type:r.type,value:l[r.id]});case Pa.Markdown:return o.a.createElement(Ca,{active:e,applyFocus:t,className:p,value:l[r.id]});case Pa.DropdownLabel:case Pa.Label:default:var d=f===Pa.DropdownLabel?this.resolveDropdownLabel(a,l[r.id]):c[i](l[r.id]);return o.a.createElement(Kn,{active:e,applyFocus:t,className:p,key:"column-".concat(i),value:d})}}},{key:"resolveDropdownLabel",value:function(e,t){var n=e&&e.options&&e.options.find(function(e){return e.value===t});return n?n.label:t}}])&&Aa(t.prototype,n),r&&Aa(t,r),e}(),Ra=Object(b.a)(function(e,t,n){var r=Array.prototype.slice.call(n,0);return r.splice(e,t),r}),Ia=Object(a.a)(function(e,t){return null!=t&&t.constructor===e||t instanceof e}),Na=Object(c.a)(function(e){return Object(ye.a)(e.length,function(t,n){var r=Array.prototype.slice.call(arguments,0);return r[0]=n,r[1]=t,e.apply(this,r)})}),za=Object(a.a)(function(e,t){return je(Na(Oe.a)(e),t)}),La=Object(b.a)(function(e,t,n){return Object(ye.a)(Math.max(e.length,t.length,n.length),function(){return e.apply(this,arguments)?t.apply(this,arguments):n.apply(this,arguments)})}),Ba=Object(a.a)(function(e,t){return me(t,[e])});function Va(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}function qa(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Wa(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ua(e,t,n){var r=function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?qa(Object(n),!0).forEach(function(t){Wa(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):qa(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}({data:Ra(e,1,t)},he);return Ia(Array,n)&&p.a(function(t){return t>=e},n)&&(r.selected_rows=h.a(function(t){return t>e?t-1:t},za([e],n)),r.selected_row_ids=h.a(function(e){return r.data[e].id},r.selected_rows)),r}function Ka(e,t,n,r,a,i){return o.a.createElement("td",{key:"select",className:"dash-select-cell",style:{width:"30px",maxWidth:"30px",minWidth:"30px",textAlign:"center"}},o.a.createElement("input",{type:"single"===n?"radio":"checkbox",style:{verticalAlign:"middle"},name:"row-select-".concat(e),checked:T.a(t,r),onChange:function(){var e="single"===n?[t]:La(T.a(t),za([t]),Ba(t))(r);a({selected_rows:e,selected_row_ids:h.a(function(e){return i[e].id},e)})}}))}var Ha=Object(f.b)(function(e,t,n,r,a,i,s,l){return ge(h.a)(function(n,c){return[].concat(Va(i?[(u=function(){return l(Ua(r[c],t,s))},o.a.createElement("td",{key:"delete",className:"dash-delete-cell",onClick:function(){return u()},style:{width:"30px",maxWidth:"30px",minWidth:"30px"}},"×"))]:[]),Va(a?[Ka(e,r[c],a,s,l,t)]:[]));var u},n)}),$a=Object(c.a)(function(e){var t=[];for(var n in e)Object(i.a)(n,e)&&(t[t.length]=[n,e[n]]);return t}),Ga=function(e){return e.join("-")},Ya=function(e){return e.join("_")},Za=[],Xa=[];[["align","content"],["align","items"],["alignment","adjust"],["alignment","baseline"],["align","self"],["animation","delay"],["animation","direction"],["animation","iteration","count"],["animation","name"],["animation","play","state"],["appearance"],["backface","visibility"],["background"],["background","attachment"],["background","blend","mode"],["background","color"],["background","composite"],["background","image"],["background","origin"],["background","position"],["background","repeat"],["baseline","shift"],["behavior"],["border"],["border","bottom"],["border","bottom","color"],["border","bottom","left","radius"],["border","bottom","right","radius"],["border","bottom","style"],["border","bottom","width"],["border","collapse"],["border","color"],["border","corner","shape"],["border","image","source"],["border","image","width"],["border","left"],["border","left","color"],["border","left","style"],["border","left","width"],["border","radius"],["border","right"],["border","right","color"],["border","right","style"],["border","right","width"],["border","spacing"],["border","style"],["border","top"],["border","top","color"],["border","top","left","radius"],["border","top","right","radius"],["border","top","style"],["border","top","width"],["border","width"],["bottom"],["box","align"],["box","decoration","break"],["box","direction"],["box","flex"],["box","flex","group"],["box","line","progression"],["box","lines"],["box","ordinal","group"],["box","shadow"],["break","after"],["break","before"],["break","inside"],["clear"],["clip"],["clip","rule"],["color"],["column","count"],["column","fill"],["column","gap"],["column","rule"],["column","rule","color"],["column","rule","width"],["columns"],["column","span"],["column","width"],["counter","increment"],["counter","reset"],["cue"],["cue","after"],["cursor"],["direction"],["display"],["fill"],["fill","opacity"],["fill","rule"],["filter"],["flex"],["flex","align"],["flex","basis"],["flex","direction"],["flex","flow"],["flex","grow"],["flex","item","align"],["flex","line","pack"],["flex","order"],["flex","shrink"],["flex","wrap"],["float"],["flow","from"],["font"],["font","family"],["font","kerning"],["font","size"],["font","size","adjust"],["font","stretch"],["font","style"],["font","synthesis"],["font","variant"],["font","variant","alternates"],["font","weight"],["grid","area"],["grid","column"],["grid","column","end"],["grid","column","start"],["grid","row"],["grid","row","end"],["grid","row","position"],["grid","row","span"],["grid","template","areas"],["grid","template","columns"],["grid","template","rows"],["height"],["hyphenate","limit","chars"],["hyphenate","limit","lines"],["hyphenate","limit","zone"],["hyphens"],["ime","mode"],["justify","content"],["layout","grid"],["layout","grid","char"],["layout","grid","line"],["layout","grid","mode"],["layout","grid","type"],["left"],["letter","spacing"],["line","break"],["line","clamp"],["line","height"],["list","style"],["list","style","image"],["list","style","position"],["list","style","type"],["margin"],["margin","bottom"],["margin","left"],["margin","right"],["margin","top"],["marquee","direction"],["marquee","style"],["mask"],["mask","border"],["mask","border","repeat"],["mask","border","slice"],["mask","border","source"],["mask","border","width"],["mask","clip"],["mask","origin"],["max","font","size"],["max","height"],["max","width"],["min","height"],["min","width"],["opacity"],["order"],["orphans"],["outline"],["outline","color"],["outline","offset"],["overflow"],["overflow","style"],["overflow","x"],["overflow","y"],["padding"],["padding","bottom"],["padding","left"],["padding","right"],["padding","top"],["page","break","after"],["page","break","before"],["page","break","inside"],["pause"],["pause","after"],["pause","before"],["perspective"],["perspective","origin"],["pointer","events"],["position"],["punctuation","trim"],["quotes"],["region","fragment"],["rest","after"],["rest","before"],["right"],["ruby","align"],["ruby","position"],["shape","image","threshold"],["shape","inside"],["shape","margin"],["shape","outside"],["speak"],["speak","as"],["stroke","opacity"],["stroke","width"],["table","layout"],["tab","size"],["text","align"],["text","align","last"],["text","decoration"],["text","decoration","color"],["text","decoration","line"],["text","decoration","line","through"],["text","decoration","none"],["text","decoration","overline"],["text","decoration","skip"],["text","decoration","style"],["text","decoration","underline"],["text","emphasis"],["text","emphasis","color"],["text","emphasis","style"],["text","height"],["text","indent"],["text","justify","trim"],["text","kashida","space"],["text","line","through"],["text","line","through","color"],["text","line","through","mode"],["text","line","through","style"],["text","line","through","width"],["text","overflow"],["text","overline"],["text","overline","color"],["text","overline","mode"],["text","overline","style"],["text","overline","width"],["text","rendering"],["text","script"],["text","shadow"],["text","transform"],["text","underline","position"],["text","underline","style"],["top"],["touch","action"],["transform"],["transform","origin"],["transform","origin","z"],["transform","style"],["transition"],["transition","delay"],["transition","duration"],["transition","property"],["transition","timing","function"],["unicode","bidi"],["unicode","range"],["user","focus"],["user","input"],["vertical","align"],["visibility"],["voice","balance"],["voice","duration"],["voice","family"],["voice","pitch"],["voice","range"],["voice","rate"],["voice","stress"],["voice","volume"],["white","space"],["white","space","treatment"],["widows"],["width"],["word","break"],["word","spacing"],["word","wrap"],["wrap","flow"],["wrap","margin"],["wrap","option"],["writing","mode"],["z","index"],["zoom"]].forEach(function(e){var t=function(e){return e.map(function(e,t){return t?e.charAt(0).toUpperCase()+e.substring(1):e}).join("")}(e);Za.push(t),Xa.push([t,t]),Xa.push([Ga(e),t]),Xa.push([Ya(e),t])});var Ja,Qa=new Map(Xa),ei=Za;function ti(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ni(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ri(e){return function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?ti(Object(n),!0).forEach(function(t){ni(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ti(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}({},e,{if:function(){return!1},terminal:!1})}!function(e){e.BlockClose="close-block",e.BlockOpen="open-block",e.LogicalOperator="logical-operator",e.RelationalOperator="relational-operator",e.UnaryOperator="unary-operator",e.Expression="expression"}(Ja||(Ja={}));var oi=function e(t){var n=0,r=t.map(function(e){var t=Object.assign({},e,{nesting:n});return n+=e.lexeme.nesting||0,t}),o=r.filter(function(e){return 0===e.nesting&&"number"==typeof e.lexeme.priority}).sort(function(e,t){return(t.lexeme.priority||-1)-(e.lexeme.priority||-1)})[0];B.c.trace("parser -> pivot",o,t);var a=r.indexOf(o);if(o.lexeme.syntaxer){var i=o.lexeme.syntaxer(t,o,a);return Array.isArray(i.left)&&(i.left=e(i.left)),Array.isArray(i.right)&&(i.right=e(i.right)),Array.isArray(i.block)&&(i.block=e(i.block)),i}throw new Error(o.lexeme.type)},ai=function(e){var t=e.lexemes;if(!e.valid)return{valid:!1,error:"lexer -- ".concat(e.error)};if(0===e.lexemes.length)return{valid:!0};try{return{tree:oi(t),valid:!0}}catch(e){return{valid:!1,error:e}}};function ii(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}var si,li=function(){function e(t,n){var r=this,o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:function(e){return e};!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.lexicon=t,this.query=n,this.evaluate=function(e){if(!r.isValid){var t="unable to evaluate target: syntax tree is invalid for query=".concat(r.query);throw B.c.error(t),new Error(t)}return!(r.tree&&r.tree.lexeme&&r.tree.lexeme.evaluate)||r.tree.lexeme.evaluate(e,r.tree)},this.filter=function(e){return e.filter(r.evaluate)},this.lexerResult=o(at(this.lexicon,this.query)),this.syntaxerResult=ai(this.lexerResult)}var t,n,r;return t=e,(n=[{key:"toQueryString",value:function(){return this.lexerResult.valid?h.a(function(e){return e.lexeme.transform?e.lexeme.transform(e.value):e.value},this.lexerResult.lexemes).join(" "):""}},{key:"toStructure",value:function(){return this.isValid&&this.syntaxerResult.tree?function e(t){var n=t.block,r=t.left,o=t.lexeme,a=t.right,i=t.value,s={subType:o.subType,type:o.type,value:o.present?o.present(t):i};return n&&(s.block=e(n)),r&&(s.left=e(r)),a&&(s.right=e(a)),s}(this.syntaxerResult.tree):null}},{key:"isValid",get:function(){return this.syntaxerResult.valid}},{key:"tree",get:function(){return this.syntaxerResult.tree}}])&&ii(t.prototype,n),r&&ii(t,r),e}(),ci=/^{(([^{}\\]|\\.)+)}/,ui=/^(('([^'\\]|\\.)*')|("([^"\\]|\\.)*")|(`([^`\\]|\\.)*`))/,pi=function(e){return e.slice(1,e.length-1).replace(/\\(.)/g,"$1")},fi={present:function(e){return pi(e.value)},resolve:function(e,t){if(ci.test(t.value))return e[pi(t.value)];throw new Error},regexp:ci,subType:"field",type:Ja.Expression},di=function(e){return e.slice(1,e.length-1).replace(/\\(.)/g,"$1")},hi={present:function(e){return di(e.value)},resolve:function(e,t){if(ui.test(t.value))return di(t.value);throw new Error},regexp:ui,subType:"value",type:Ja.Expression},bi=function(e,t){var n=function(e){return function(t){return t=t.match(e)[1],Ct()(t)?+t:t.replace(/\\(.)/g,"$1")}}(e);return{present:function(e){return n(e.value)},resolve:function(t,r){if(e.test(r.value))return n(r.value);throw new Error},regexp:e,regexpMatch:1,subType:"value",transform:t,type:Ja.Expression}},vi=bi(/^(([^\s'"`{}()\\]|\\.)+)(?:[\s)]|$)/),mi=bi(/^(([^'"`{}()\\]|\\.)+)$/,function(e){return"string"==typeof e&&-1!==e.indexOf(" ")?'"'.concat(e,'"'):e});!function(e){e.And="&&",e.Or="||"}(si||(si={}));var yi,gi={evaluate:function(e,t){B.c.trace("evaluate -> &&",e,t);var n=t,r=n.left.lexeme.evaluate(e,n.left),o=n.right.lexeme.evaluate(e,n.right);return r&&o},type:Ja.LogicalOperator,priority:2,regexp:/^(and\s|&&)/i,subType:si.And,syntaxer:function(e,t,n){return Object.assign({left:e.slice(0,n),right:e.slice(n+1)},t)}},wi={evaluate:function(e,t){B.c.trace("evaluate -> ||",e,t);var n=t;return n.left.lexeme.evaluate(e,n.left)||n.right.lexeme.evaluate(e,n.right)},type:Ja.LogicalOperator,subType:si.Or,priority:3,regexp:/^(or\s|\|\|)/i,syntaxer:function(e,t,n){return Object.assign({left:e.slice(0,n),right:e.slice(n+1)},t)}};function ki(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,a=void 0;try{for(var i,s=e[Symbol.iterator]();!(r=(i=s.next()).done)&&(n.push(i.value),!t||n.length!==t);r=!0);}catch(e){o=!0,a=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw a}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function Oi(e){return function(t,n){return e(function(e,t){B.c.trace("evaluate -> relational",e,t);var n=t,r=n.left.lexeme.resolve(e,n.left),o=n.right.lexeme.resolve(e,n.right);return B.c.trace("opValue: ".concat(r,", expValue: ").concat(o)),[r,o]}(t,n))}}!function(e){e.Contains="contains",e.DateStartsWith="datestartswith",e.Equal="=",e.GreaterOrEqual=">=",e.GreaterThan=">",e.LessOrEqual="<=",e.LessThan="<",e.NotEqual="!="}(yi||(yi={}));var xi={priority:0,syntaxer:function(e){var t=ki(e,3),n=t[0],r=t[1],o=t[2];return Object.assign({left:n,right:o},r)},type:Ja.RelationalOperator},_i=rn.a({evaluate:Oi(function(e){var t=ki(e,2),n=t[0],r=t[1];return!(x.a(r)||x.a(n)||"String"!==ae.a(r)&&"String"!==ae.a(n)||-1===n.toString().indexOf(r.toString()))}),subType:yi.Contains,regexp:/^((contains)(?=\s|$))/i,regexpMatch:1},xi),Ei=rn.a({evaluate:Oi(function(e){var t=ki(e,2),n=t[0],r=t[1];return Ct()(n)&&Ct()(r)?+n==+r:n===r}),subType:yi.Equal,regexp:/^(=|(eq)(?=\s|$))/i,regexpMatch:1},xi),Si=rn.a({evaluate:Oi(function(e){var t=ki(e,2);return t[0]>=t[1]}),subType:yi.GreaterOrEqual,regexp:/^(>=|(ge)(?=\s|$))/i,regexpMatch:1},xi),Ci=rn.a({evaluate:Oi(function(e){var t=ki(e,2);return t[0]>t[1]}),subType:yi.GreaterThan,regexp:/^(>|(gt)(?=\s|$))/i,regexpMatch:1},xi),ji={allow_YY:!0},Ai=rn.a({evaluate:Oi(function(e){var t=ki(e,2),n=t[0],r=t[1];n="number"==typeof n?n.toString():n,r="number"==typeof r?r.toString():r;var o=Bt(n,ji),a=Bt(r,ji);return!x.a(o)&&!x.a(a)&&0===o.indexOf(a)}),subType:yi.DateStartsWith,regexp:/^((datestartswith)(?=\s|$))/i,regexpMatch:1},xi),Pi=rn.a({evaluate:Oi(function(e){var t=ki(e,2);return t[0]<=t[1]}),subType:yi.LessOrEqual,regexp:/^(<=|(le)(?=\s|$))/i,regexpMatch:1},xi),Ti=rn.a({evaluate:Oi(function(e){var t=ki(e,2);return t[0]<t[1]}),subType:yi.LessThan,regexp:/^(<|(lt)(?=\s|$))/i,regexpMatch:1},xi),Mi=rn.a({evaluate:Oi(function(e){var t=ki(e,2);return t[0]!==t[1]}),subType:yi.NotEqual,regexp:/^(!=|(ne)(?=\s|$))/i,regexpMatch:1},xi);function Fi(e){return(Fi="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Di(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,a=void 0;try{for(var i,s=e[Symbol.iterator]();!(r=(i=s.next()).done)&&(n.push(i.value),!t||n.length!==t);r=!0);}catch(e){o=!0,a=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw a}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}var Ri;function Ii(e){return function(t,n){return e(function(e,t){B.c.trace("evaluate -> unary",e,t),B.c.trace("evaluate -> unary",e,t);var n=t;return n.left.lexeme.resolve(e,n.left)}(t,n))}}!function(e){e.Not="!"}(Ri||(Ri={}));var Ni={present:function(e){return e.value},priority:0,syntaxer:function(e){var t=Di(e,2),n=t[0],r=t[1];return Object.assign({left:n},r)},type:Ja.UnaryOperator},zi={evaluate:function(e,t){B.c.trace("evaluate -> unary not",e,t);var n=t;return!n.right.lexeme.evaluate(e,n.right)},type:Ja.UnaryOperator,subType:Ri.Not,priority:1.5,regexp:/^!/,syntaxer:function(e){return Object.assign({right:e.slice(1,e.length)},e[0])}},Li=rn.a({evaluate:Ii(function(e){return"boolean"==typeof e}),regexp:/^(is bool)/i},Ni),Bi=rn.a({evaluate:Ii(function(e){return"number"==typeof e&&e%2==0}),regexp:/^(is even)/i},Ni),Vi=rn.a({evaluate:Ii(function(e){return null==e||""===e}),regexp:/^(is blank)/i},Ni),qi=rn.a({evaluate:Ii(function(e){return null==e}),regexp:/^(is nil)/i},Ni),Wi=rn.a({evaluate:Ii(function(e){return"number"==typeof e}),regexp:/^(is num)/i},Ni),Ui=rn.a({evaluate:Ii(function(e){return null!==e&&"object"===Fi(e)}),regexp:/^(is object)/i},Ni),Ki=rn.a({evaluate:Ii(function(e){return"number"==typeof e&&e%2==1}),regexp:/^(is odd)/i},Ni),Hi=rn.a({evaluate:Ii(function(e){return"number"==typeof e&&function(e){if(2===e)return!0;if(e<2||e%2==0)return!1;for(var t=3;t*t<=e;t+=2)if(e%t==0)return!1;return!0}(e)}),regexp:/^(is prime)/i},Ni),$i=rn.a({evaluate:Ii(function(e){return"string"==typeof e}),regexp:/^(is str)/i},Ni),Gi=Ue(function(e,t){return e+(t.lexeme.nesting||0)}),Yi=function(e,t){return 0===Gi(0,e)},Zi=function(e,t){return Yi(e)&&!!t&&T.a(t.lexeme.type,[Ja.RelationalOperator])},Xi=function(e,t){return!t||T.a(t.lexeme.type,[Ja.BlockOpen,Ja.LogicalOperator,Ja.RelationalOperator])},Ji=function(e,t){return!t},Qi=function(e,t){return!!t&&T.a(t.lexeme.type,[Ja.BlockClose,Ja.Expression,Ja.UnaryOperator])},es=function(e,t){return!!t&&T.a(t.lexeme.type,[Ja.Expression])},ts=es;function ns(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function rs(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?ns(Object(n),!0).forEach(function(t){os(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ns(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function os(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function as(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}var is=[rs({},gi,{if:Qi,terminal:!1})].concat(as([_i,Ai,Ei,Si,Ci,Pi,Ti,Mi].map(function(e){return rs({},e,{if:es,terminal:!1})})),as([Vi,Li,Bi,qi,Wi,Ui,Ki,Hi,$i].map(function(e){return rs({},e,{if:ts,terminal:!0})})),as([fi,hi,vi].map(function(e){return rs({},e,{if:Xi,terminal:Zi})})));function ss(e){return(ss="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function ls(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function cs(e,t){return!t||"object"!==ss(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function us(e,t,n){return(us="undefined"!=typeof Reflect&&Reflect.get?Reflect.get:function(e,t,n){var r=function(e,t){for(;!Object.prototype.hasOwnProperty.call(e,t)&&null!==(e=ps(e)););return e}(e,t);if(r){var o=Object.getOwnPropertyDescriptor(r,t);return o.get?o.get.call(n):o.value}})(e,t,n||e)}function ps(e){return(ps=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function fs(e,t){return(fs=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var ds=function(e){function t(e){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),cs(this,ps(t).call(this,is,e))}var n,r,o;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&fs(e,t)}(t,li),n=t,(r=[{key:"respectsBasicSyntax",value:function(){var e=h.a(function(e){return e.value},ee.a(function(e){return e.lexeme.type===Ja.Expression&&"field"===e.lexeme.subType},this.lexerResult.lexemes)),t=ct(e);return e.length===t.length}},{key:"isValid",get:function(){return us(ps(t.prototype),"isValid",this)&&this.respectsBasicSyntax()}},{key:"statements",get:function(){if(this.syntaxerResult.tree){for(var e=[],t=[this.syntaxerResult.tree];t.length;){var n=t.pop();n&&(e.push(n),n.left&&t.push(n.left),n.block&&t.push(n.block),n.right&&t.push(n.right))}return e}}}])&&ls(n.prototype,r),o&&ls(n,o),t}(),hs={nesting:-1,regexp:/^\)/,type:Ja.BlockClose},bs={evaluate:function(e,t){B.c.trace("evaluate -> ()",e,t);var n=t;return n.block.lexeme.evaluate(e,n.block)},type:Ja.BlockOpen,nesting:1,subType:"()",priority:1,regexp:/^\(/,syntaxer:function(e){return Object.assign({block:e.slice(1,e.length-1)},e[0])}};function vs(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ms(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?vs(Object(n),!0).forEach(function(t){ys(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):vs(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function ys(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function gs(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}var ws=[].concat(gs([gi,wi].map(function(e){return ms({},e,{if:Qi,terminal:!1})})),[ms({},hs,{if:function(e,t){return!!t&&T.a(t.lexeme.type,[Ja.BlockClose,Ja.BlockOpen,Ja.Expression,Ja.UnaryOperator])&&Gi(0,e)>0},terminal:Yi}),ms({},bs,{if:function(e,t){return!t||T.a(t.lexeme.type,[Ja.BlockOpen,Ja.LogicalOperator,Ja.UnaryOperator])},terminal:!1})],gs([_i,Ai,Ei,Si,Ci,Pi,Ti,Mi].map(function(e){return ms({},e,{if:es,terminal:!1})})),gs([Vi,Li,Bi,qi,Wi,Ui,Ki,Hi,$i].map(function(e){return ms({},e,{if:ts,terminal:Yi})})),[ms({},zi,{if:function(e,t){return!t||T.a(t.lexeme.type,[Ja.LogicalOperator,Ja.UnaryOperator])},terminal:!1})],gs([fi,hi,vi].map(function(e){return ms({},e,{if:Xi,terminal:Zi})})));function ks(e){return(ks="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Os(e,t){return!t||"object"!==ks(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function xs(e){return(xs=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function _s(e,t){return(_s=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Es=function(e){function t(e){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),Os(this,xs(t).call(this,ws,e))}return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&_s(e,t)}(t,li),t}();function Ss(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Cs(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Ss(Object(n),!0).forEach(function(t){js(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ss(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function js(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function As(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}var Ps=[].concat(As([_i,Ai,Ei,Si,Ci,Pi,Ti,Mi].map(function(e){return Cs({},e,{if:Ji,terminal:!1})})),As([Vi,Li,Bi,qi,Wi,Ui,Ki,Hi,$i].map(function(e){return Cs({},e,{if:Ji,terminal:!0})})),As([fi,mi,hi].map(function(e){return Cs({},e,{if:Xi,terminal:!0})})));function Ts(e){return(Ts="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Ms(e,t){return!t||"object"!==Ts(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function Fs(e){return(Fs=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Ds(e,t){return(Ds=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}function Rs(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}function Is(){switch(arguments.length>0&&void 0!==arguments[0]?arguments[0]:ve.c.Any){case ve.c.Any:case ve.c.Text:return{lexeme:ri(_i),value:yi.Contains};case ve.c.Datetime:return{lexeme:ri(Ai),value:yi.DateStartsWith};case ve.c.Numeric:return{lexeme:ri(Ei),value:yi.Equal}}}function Ns(e,t){return t.valid?(2===t.lexemes.length||function(e){return 1===e.length&&e[0].lexeme.type===Ja.UnaryOperator}(t.lexemes)?t.lexemes=[{lexeme:ri(fi),value:"{".concat(e.id,"}")}].concat(Rs(t.lexemes)):function(e){return 1===e.length&&e[0].lexeme.type===Ja.Expression}(t.lexemes)&&(t.lexemes=[{lexeme:ri(fi),value:"{".concat(e.id,"}")},Is(e.type)].concat(Rs(t.lexemes))),t):t}var zs=function(e){function t(e,n){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),Ms(this,Fs(t).call(this,Ps,e,Ns.bind(void 0,n)))}return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Ds(e,t)}(t,li),t}(),Ls=function(e){return h.a(function(e){return e.toQueryString()},ee.a(function(e){return e&&e.isValid&&""!==e.query},e)).join(" && ")};function Bs(e,t){return!e||void 0===e.column_id||e.column_id===t}var Vs=function(e,t,n){return ee.a(function(r){return r.matchesRow(t)&&r.matchesColumn(n)&&r.matchesFilter(e)})},qs=function(e){return ee.a(function(t){return t.matchesColumn(e)})},Ws=function(e,t){return ee.a(function(n){return n.matchesRow(e)&&n.matchesColumn(t)})},Us=function(e,t){return ee.a(function(n){return!n.checksColumn()&&n.matchesRow(t)&&n.matchesFilter(e)})},Ks=ee.a(function(e){return!e.checksColumn()}),Hs=function(e){return ee.a(function(t){return t.matchesRow(e)&&!t.checksColumn()})};function $s(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function Gs(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Ys(e,t,n){return t&&Gs(e.prototype,t),n&&Gs(e,n),e}var Zs=["borderBottom","borderLeft","borderRight","borderTop"],Xs=ee.a(function(e){return 0===e.indexOf("border")},ei),Js=function(){function e(t,n,r){var o=this;if($s(this,e),this.getEdge=function(e,t){return o.edges[e][t]},this.getEdges=function(){return o.edges},this.getWeight=function(e,t){return o.weights[e][t]},this.isDefault=function(e,t){return o.weights[e][t]===-1/0},this.clone=function(){return new e(o)},"number"==typeof t&&void 0!==n){var a=t;this.rows=a,this.columns=n,this.defaultEdge=r,this.weights=h.a(function(){return new Array(n).fill(-1/0)},oe.a(0,a)),this.edges=h.a(function(){return new Array(n).fill(r)},oe.a(0,a))}else{var i=t;this.rows=i.rows,this.columns=i.columns,this.defaultEdge=i.defaultEdge,this.weights=on(i.weights),this.edges=on(i.edges)}}return Ys(e,[{key:"setEdge",value:function(e,t,n,r){var o=arguments.length>4&&void 0!==arguments[4]&&arguments[4];e<0||t<0||e>=this.rows||t>=this.columns||!o&&(x.a(n)||r<=this.weights[e][t])||(this.weights[e][t]=r,this.edges[e][t]=n)}}]),e}(),Qs=function(){function e(t,n,r,o,a){var i=this;if($s(this,e),this.getEdges=function(){return{horizontal:i.horizontal.getEdges(),vertical:i.vertical.getEdges()}},this.getMatrices=function(){return{horizontal:i.horizontal,vertical:i.vertical}},this.getStyle=function(e,t){return{borderBottom:i.horizontal.getEdge(e+1,t)||null,borderTop:i.horizontal.getEdge(e,t)||null,borderLeft:i.vertical.getEdge(e,t)||null,borderRight:i.vertical.getEdge(e,t+1)||null}},this.clone=function(){return new e(i)},"number"==typeof t&&void 0!==n){var s=t;this.rows=s,this.columns=n,this.defaultEdge=r,this.horizontalEdges=x.a(o)||o,this.verticalEdges=x.a(a)||a,this.horizontal=new Js(s+1,n,this.horizontalEdges?r:void 0),this.vertical=new Js(s,n+1,this.verticalEdges?r:void 0)}else{var l=t;this.rows=l.rows,this.columns=l.columns,this.defaultEdge=l.defaultEdge,this.horizontal=l.horizontal.clone(),this.vertical=l.vertical.clone(),this.horizontalEdges=l.horizontalEdges,this.verticalEdges=l.verticalEdges}}return Ys(e,[{key:"setEdges",value:function(e,t,n){this.horizontalEdges&&(n.borderTop&&this.horizontal.setEdge(e,t,n.borderTop[0],n.borderTop[1]),n.borderBottom&&this.horizontal.setEdge(e+1,t,n.borderBottom[0],n.borderBottom[1])),this.verticalEdges&&(n.borderLeft&&this.vertical.setEdge(e,t,n.borderLeft[0],n.borderLeft[1]),n.borderRight&&this.vertical.setEdge(e,t+1,n.borderRight[0],n.borderRight[1]))}}]),e}();function el(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,a=void 0;try{for(var i,s=e[Symbol.iterator]();!(r=(i=s.next()).done)&&(n.push(i.value),!t||n.length!==t);r=!0);}catch(e){o=!0,a=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw a}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function tl(e){var t,n=e.if&&(e.if.header_index||e.if.row_index);return{checksColumn:function(){return!(x.a(e.if)||x.a(e.if.column_id)&&x.a(e.if.column_type)&&x.a(e.if.column_editable))},checksRow:function(){return!x.a(n)},checksFilter:function(){return!x.a(e.if)&&!x.a(e.if.filter_query)},matchesColumn:function(t){return!e.if||!x.a(t)&&Bs(e.if,t&&t.id)&&(n=e.if,r=t&&t.type,!n||void 0===n.column_type||n.column_type===(r||ve.c.Any))&&function(e,t){return!e||void 0===e.column_editable||t===e.column_editable}(e.if,t&&t.editable);var n,r},matchesRow:function(e){return void 0===n||("number"==typeof n?e===n:!x.a(e)&&("odd"===n?e%2==1:e%2==0))},matchesFilter:function(n){return!e.if||void 0===e.if.filter_query||(t=t||new Es(e.if.filter_query)).evaluate(n)},style:nl(e)}}function nl(e){return Ue(function(e,t){var n=el(t,2),r=n[0],o=n[1];return Qa.has(r)&&(e[Qa.get(r)]=o),e},{},$a(e))}var rl=Object(f.b)(function(e,t,n,r){return L([e?[tl(e)]:[],h.a(tl,n||[]),t?[tl(t)]:[],h.a(tl,r||[])])}),ol=Object(f.b)(function(e,t,n,r){return L([e?[tl(e)]:[],h.a(tl,n||[]),t?[tl(t)]:[],h.a(tl,r||[])])}),al=Object(f.b)(function(e,t,n,r){return L([e?[tl(e)]:[],h.a(tl,n||[]),t?[tl(t)]:[],h.a(tl,r||[])])}),il=Object(f.b)(function(e,t){return[nl(e),nl(t)]});function sl(e){for(var t={},n=0;n<e.length;++n)Object.assign(t,e[n].style);return te(Xs,t)}var ll={backgroundColor:"var(--selected-background)"},cl=Object(f.b)(function(e,t,n,r){return sn(n,e,function(e,n,o){return function(e,t,n){return function(r){return sl(Vs(e,t,n)(r))}}(e,o+r.rows,n)(t)})}),ul=Object(f.b)(function(e,t,n){return e=on(e),P.a(function(n){var r=n.row,o=n.column;r-=t.rows,o-=t.columns,r<0||o<0||e.length<=r||e[r].length<=o||(e[r][o]=rn.a(e[r][o],ll))},n),e}),pl=Object(f.b)(function(e,t,n,r){return sn(n,oe.a(0,e),function(e,n,o){return function(e,t){return function(n){return sl(Us(e,t)(n))}}(e,o+r.rows)(t)})}),fl=function(){function e(e,t){this.xf=t,this.f=e}return e.prototype["@@transducer/init"]=I.a.init,e.prototype["@@transducer/result"]=function(e){return this.xf["@@transducer/result"](this.xf["@@transducer/step"](e,this.last))},e.prototype["@@transducer/step"]=function(e,t){return this.f(t)&&(this.last=t),e},e}(),dl=Object(a.a)(function(e,t){return new fl(e,t)}),hl=Object(a.a)(Object(F.a)([],dl,function(e,t){for(var n=t.length-1;n>=0;){if(e(t[n]))return t[n];n-=1}}));function bl(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,a=void 0;try{for(var i,s=e[Symbol.iterator]();!(r=(i=s.next()).done)&&(n.push(i.value),!t||n.length!==t);r=!0);}catch(e){o=!0,a=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw a}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}var vl=ge(h.a),ml=function(){return(new yl).get},yl=function e(){var t=this;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.get=Object(f.a)(function(e,n,r,o,a,i){return vl(function(n,s){return h.a(function(e){var l=r[s],c=i&&i.length>l&&i[l]&&i[l][e.id]||a[e.id];return t.dropdown.get(e.id,s)(c,o,e,n)},e)},n)}),this.dropdown=pn()(function(e,n,r,o){var a=hl(function(e){var n=bl(e,2),a=n[0],i=n[1];return Bs(a.if,r.id)&&(x.a(a.if)||x.a(a.if.filter_query)||t.evaluation.get(r.id,i)(t.ast.get(r.id,i)(a.if.filter_query),o))},ge(h.a)(function(e,t){return[e,t]},n));return a&&a[0]||e||void 0}),this.ast=pn()(function(e){return new Es(e)}),this.evaluation=pn()(function(e,t){return e.evaluate(t)})};function gl(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}var wl=function(){function e(t){var n=this,r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Fa(t),a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:ml(),i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:Ha(),s=arguments.length>4&&void 0!==arguments[4]?arguments[4]:cl(),l=arguments.length>5&&void 0!==arguments[5]?arguments[5]:ul(),c=arguments.length>6&&void 0!==arguments[6]?arguments[6]:pl(),u=arguments.length>7&&void 0!==arguments[7]?arguments[7]:Mn(t),p=arguments.length>8&&void 0!==arguments[8]?arguments[8]:rl();!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.propsFn=t,this.cellContents=r,this.cellDropdowns=a,this.cellOperations=i,this.dataPartialStyles=s,this.dataStyles=l,this.dataOpStyles=c,this.cellWrappers=u,this.relevantStyles=p,this.getCells=Object(f.a)(function(e,t){return Je(e,t,function(e,t){return e.length?e.concat(t):t})}),this.getDataOpCell=pn()(function(e,t,n,r,a,i){return o.a.cloneElement(e,{style:d.a([{borderBottom:n,borderLeft:r,borderRight:a,borderTop:i},t,e.props.style])})}),this.getDataOpCells=Object(f.a)(function(e,t,r){return ln(e,t,function(e,t,o,a){var i=r&&r.getStyle(o,a);return n.getDataOpCell.get(o,a)(e,t,i&&i.borderBottom,i&&i.borderLeft,i&&i.borderRight,i&&i.borderTop)})}),this.getDataCell=pn()(function(e,t,n,r,a,i,s){return o.a.cloneElement(e,{children:[t],style:rn.a(n,{borderBottom:r,borderLeft:a,borderRight:i,borderTop:s})})}),this.getDataCells=Object(f.a)(function(e,t,r,o){return cn(e,r,t,function(e,t,r,a,i){var s=o&&o.getStyle(a,i);return n.getDataCell.get(a,i)(e,r,t,s&&s.borderBottom,s&&s.borderLeft,s&&s.borderRight,s&&s.borderTop)})})}var t,n,r;return t=e,(n=[{key:"createCells",value:function(e,t){var n=this.props,r=n.active_cell,o=n.applyFocus,a=n.dropdown_conditional,i=n.dropdown,s=n.data,l=n.dropdown_data,c=n.id,u=n.is_focused,p=n.loading_state,f=n.row_deletable,d=n.row_selectable,h=n.selected_cells,b=n.selected_rows,v=n.setProps,m=n.style_cell,y=n.style_cell_conditional,g=n.style_data,w=n.style_data_conditional,k=n.virtualized,O=n.visibleColumns,x=this.relevantStyles(m,g,y,w),_=this.dataPartialStyles(O,x,k.data,k.offset),E=this.dataStyles(_,k.offset,h),S=this.dataOpStyles((d?1:0)+(f?1:0),x,k.data,k.offset),C=this.cellDropdowns(O,k.data,k.indices,a,i,l),j=this.cellOperations(c,s,k.data,k.indices,d,f,b,v),A=this.cellWrappers.partialGet(O,k.data,k.offset),P=this.cellWrappers.get(A,k.offset,r,h),T=this.cellContents.partialGet(O,k.data,k.offset,!!u,C,p),M=this.cellContents.get(T,r,o||!1,O,k.data,k.offset,!!u,C,p),F=this.getDataOpCells(j,S,t),D=this.getDataCells(P,M,E,e);return this.getCells(F,D)}},{key:"props",get:function(){return this.propsFn()}}])&&gl(t.prototype,n),r&&gl(t,r),e}(),kl=n(24);function Ol(e){var t={};return an(e,Zs,function(e,n,r){var o=e.style[n]||e.style.border;o&&(t[n]=[o,r])}),t}var xl=Object(f.b)(function(e,t,n,r,o,a){if(0!==n.length&&0!==e.length){var i=new Qs(n.length,e.length,kl.a.defaultEdge,!0,!a);return an(n,e,function(e,n,o,a){return i.setEdges(o,a,function(e,t,n){return function(r){return Ol(Vs(e,t,n)(r))}}(e,o+r.rows,n)(t))}),o&&i.setEdges(o.row-r.rows,o.column-r.columns,{borderBottom:[kl.a.activeEdge,1/0],borderLeft:[kl.a.activeEdge,1/0],borderRight:[kl.a.activeEdge,1/0],borderTop:[kl.a.activeEdge,1/0]}),i}}),_l=Object(f.b)(function(e,t,n,r,o){if(0!==n.length&&0!==e){var a=new Qs(n.length,e,kl.a.defaultEdge,!0,!o);return an(n,oe.a(0,e),function(e,n,o,i){return a.setEdges(o,i,function(e,t){return function(n){return Ol(Us(e,t)(n))}}(e,o+r.rows)(t))}),a}}),El=Object(f.b)(function(e,t,n,r,o){if(t&&0!==e.length){var a=new Qs(1,e.length,kl.a.defaultEdge,!0,!o);return an(oe.a(0,1),e,function(e,t,o,i){a.setEdges(o,i,function(e){return function(t){return Ol(qs(e)(t))}}(t)(r));var s=n.get(t.id.toString());s&&!s.isValid&&a.setEdges(o,i,{borderBottom:[kl.a.activeEdge,1/0],borderLeft:[kl.a.activeEdge,1/0],borderRight:[kl.a.activeEdge,1/0],borderTop:[kl.a.activeEdge,1/0]})}),a}}),Sl=Object(f.b)(function(e,t,n,r){if(t&&0!==e){var o=new Qs(1,e,kl.a.defaultEdge,!0,!r);return an(oe.a(0,1),oe.a(0,e),function(e,t){return o.setEdges(e,t,function(e){return Ol(Ks(e))}(n))}),o}}),Cl=Object(f.b)(function(e,t,n,r){if(0!==t&&0!==e.length){var o=new Qs(t,e.length,kl.a.defaultEdge,!0,!r);return an(oe.a(0,t),e,function(e,t,r,a){return o.setEdges(r,a,function(e,t){return function(n){return Ol(Ws(e,t)(n))}}(r,t)(n))}),o}}),jl=Object(f.b)(function(e,t,n,r){if(0!==t&&0!==e){var o=new Qs(t,e,kl.a.defaultEdge,!0,!r);return an(oe.a(0,t),oe.a(0,e),function(e,t){return o.setEdges(e,t,function(e){return function(t){return Ol(Hs(e)(t))}}(e)(n))}),o}});function Al(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}var Pl=function(){function e(t){var n=this;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.propsFn=t,this.dataStyles=rl(),this.filterStyles=ol(),this.headerStyles=al(),this.getDataEdges=xl(),this.getDataOpEdges=_l(),this.getFilterEdges=El(),this.getFilterOpEdges=Sl(),this.getHeaderEdges=Cl(),this.getHeaderOpEdges=jl(),this.memoizedCreateEdges=Object(f.a)(function(t,r,o,a,i,s,l,c,u,p,f,d,h,b,v,m,y,g,w){var k=n.dataStyles(p,d,f,h),O=n.filterStyles(p,b,f,v),x=n.headerStyles(p,m,f,y),_=Object(ie.a)(r),E=n.getDataEdges(o,k,g,w,t,u),S=n.getDataOpEdges(a,k,g,w,u),C=n.getFilterEdges(o,i,s,O,u),j=n.getFilterOpEdges(a,i,O,u),A=n.getHeaderEdges(o,_,x,u),P=n.getHeaderOpEdges(a,_,x,u),T=(p?1:0)+f.length-1;return A=e.clone(A),P=e.clone(P),C=e.clone(C),j=e.clone(j),E=e.clone(E),S=e.clone(S),n.hReconcile(A,C||E,T),n.hReconcile(P,j||S,T),n.hReconcile(C,E,T),n.hReconcile(j,S,T),n.vReconcile(P,A,T),n.vReconcile(j,C,T),n.vReconcile(S,E,T),c===_?i?(n.hOverride(A,C,T),n.hOverride(P,j,T)):(n.hOverride(A,E,T),n.hOverride(P,S,T)):i&&c===_+1&&(n.hOverride(C,E,T),n.hOverride(j,S,T)),l===a&&(n.vOverride(P,A,T),n.vOverride(j,C,T),n.vOverride(S,E,T)),{dataEdges:E,dataOpEdges:S,filterEdges:C,filterOpEdges:j,headerEdges:A,headerOpEdges:P}})}var t,n,r;return t=e,r=[{key:"clone",value:function(e){return e&&e.clone()}},{key:"hasPrecedence",value:function(e,t,n){return(t<=n||e===1/0)&&t<=e}}],(n=[{key:"hOverride",value:function(t,n,r){if(t&&n){var o=t.getMatrices().horizontal,a=n.getMatrices().horizontal,i=o.rows-1;P.a(function(t){e.hasPrecedence(o.getWeight(i,t),a.getWeight(0,t),r)&&a.setEdge(0,t,o.getEdge(i,t),1/0,!0),o.setEdge(i,t,"none",-1/0,!0)},oe.a(0,o.columns))}}},{key:"vOverride",value:function(t,n,r){if(t&&n){var o=t.getMatrices().vertical,a=n.getMatrices().vertical,i=o.columns-1;P.a(function(t){e.hasPrecedence(o.getWeight(t,i),a.getWeight(t,0),r)&&a.setEdge(t,0,o.getEdge(t,i),1/0,!0),o.setEdge(t,i,"none",-1/0,!0)},oe.a(0,o.rows))}}},{key:"hReconcile",value:function(t,n,r){if(t&&n){var o=n.getMatrices().horizontal,a=t.getMatrices().horizontal,i=a.rows-1;P.a(function(t){return!e.hasPrecedence(a.getWeight(i,t),o.getWeight(0,t),r)&&a.setEdge(i,t,"none",-1/0,!0)},oe.a(0,a.columns))}}},{key:"vReconcile",value:function(t,n,r){if(t&&n){var o=n.getMatrices().vertical,a=t.getMatrices().vertical,i=a.columns-1;P.a(function(t){return!e.hasPrecedence(a.getWeight(t,i),o.getWeight(t,0),r)&&a.setEdge(t,i,"none",-1/0,!0)},oe.a(0,a.rows))}}},{key:"createEdges",value:function(){var e=this.props,t=e.active_cell,n=e.columns,r=e.filter_action,o=e.workFilter,a=e.fixed_columns,i=e.fixed_rows,s=e.row_deletable,l=e.row_selectable,c=e.style_as_list_view,u=e.style_cell,p=e.style_cell_conditional,f=e.style_data,d=e.style_data_conditional,h=e.style_filter,b=e.style_filter_conditional,v=e.style_header,m=e.style_header_conditional,y=e.virtualized,g=e.visibleColumns;return this.memoizedCreateEdges(t,n,g,(s?1:0)+(l?1:0),r!==ve.i.None,o.map,a,i,c,u,p,f,d,h,b,v,m,y.data,y.offset)}},{key:"props",get:function(){return this.propsFn()}}])&&Al(t.prototype,n),r&&Al(t,r),e}();function Tl(e){return(Tl="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Ml(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Fl(e,t){return!t||"object"!==Tl(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function Dl(e){return(Dl=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Rl(e,t){return(Rl=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Il=function(e){function t(e){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=Fl(this,Dl(t).call(this,e))).handleKeyDown=function(e){var t=n.propsWithDefaults,r=t.stopPropagation,o=t.updateOnEnter;r&&e.stopPropagation(),o&&e.keyCode===H.ENTER&&n.submit()},n.handleChange=function(e){n.setState({value:e.target.value})},n.submit=function(){return n.state.value!==n.props.value&&n.props.submit(n.state.value)},n.state={value:e.value},n}var n,a,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Rl(e,t)}(t,r["PureComponent"]),n=t,(a=[{key:"componentWillReceiveProps",value:function(e){var t=this.props.value,n=e.value;t!==n&&this.setState({value:n})}},{key:"render",value:function(){var e=this.propsWithDefaults,t=e.onCopy,n=e.onPaste,r=e.placeholder,a=e.updateOnBlur,i=e.updateOnSubmit,s={onBlur:a?this.submit:void 0,onKeyDown:this.handleKeyDown,onSubmit:i?this.submit:void 0};return o.a.createElement("input",Object.assign({ref:"input",type:"text",value:this.state.value||"",onChange:this.handleChange,onCopy:t,onPaste:n,placeholder:r},s))}},{key:"propsWithDefaults",get:function(){return this.props}}])&&Ml(n.prototype,a),i&&Ml(n,i),t}();function Nl(e){return(Nl="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function zl(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Ll(e,t){return!t||"object"!==Nl(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function Bl(e){return(Bl=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Vl(e,t){return(Vl=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}Il.defaultProps={stopPropagation:!1,updateOnEnter:!0,updateOnBlur:!0,updateOnSubmit:!0};var ql=function(e){function t(e){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=Ll(this,Bl(t).call(this,e))).submit=function(e){(0,n.props.setFilter)({target:{value:e}})},n.state={value:e.value},n}var n,a,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Vl(e,t)}(t,r["PureComponent"]),n=t,(a=[{key:"render",value:function(){var e=this.props,t=e.classes,n=e.columnId,r=e.isValid,a=e.style,i=e.value;return o.a.createElement("th",{className:t+(r?"":" invalid"),"data-dash-column":n,style:a},o.a.createElement(Il,{onCopy:function(e){e.stopPropagation(),Xt.clearClipboard()},onPaste:function(e){e.stopPropagation()},value:i,placeholder:"filter data...",stopPropagation:!0,submit:this.submit}))}}])&&zl(n.prototype,a),i&&zl(n,i),t}(),Wl=Object(f.b)(function(e,t){return h.a(function(e){return function(e){return function(t){return sl(qs(e)(t))}}(e)(t)},e)}),Ul=Object(f.b)(function(e,t,n){return sn(oe.a(0,e),oe.a(0,t),function(){return sl(Ks(n))})});function Kl(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}var Hl=Object(f.b)(function(e,t,n){return ge(h.a)(function(){return[].concat(Kl(n?[o.a.createElement("th",{key:"delete",className:"expanded-row--empty-cell dash-delete-header",style:{width:"30px",maxWidth:"30px",minWidth:"30px"}})]:[]),Kl(t?[o.a.createElement("th",{key:"select",className:"expanded-row--empty-cell dash-select-header",style:{width:"30px",maxWidth:"30px",minWidth:"30px"}})]:[]))},oe.a(0,e))}),$l=function(e,t){return e===t?new Map(t):e},Gl=Object(f.b)(function(e,t,n){var r=function(e,t){if(e.isValid){var n=new Map,r=e.statements;return r?(P.a(function(e){if(e.lexeme.type===Ja.UnaryOperator&&e.left){var r=e.left.lexeme.present?e.left.lexeme.present(e.left):e.left.value,o=nt(function(e){return e.id.toString()===r},t);if(!o)throw new Error("column ".concat(r," not found"));n.set(r,new zs(e.value,o))}else if(e.lexeme.type===Ja.RelationalOperator&&e.left&&e.right){var a=e.left.lexeme.present?e.left.lexeme.present(e.left):e.left.value,i=nt(function(e){return e.id.toString()===a},t);if(!i)throw new Error("column ".concat(a," not found"));e.lexeme.present&&e.lexeme.present(e)===yi.Equal?n.set(a,new zs("".concat(e.right.value),i)):n.set(a,new zs("".concat(e.value," ").concat(e.right.value),i))}},r),n):n}}(new ds(t),n);if(!r)return e;var o=e,a=ct(Pe(Array.from(e.keys()),Array.from(r.keys())));return P.a(function(t){var n=e.get(t),a=r.get(t);x.a(a)?(o=$l(o,e)).delete(t):(x.a(n)||a.toQueryString()!==n.toQueryString())&&(o=$l(o,e)).set(t,a)},a),o});function Yl(e,t,n){var r=t.id.toString(),o=new Map(e);return n&&n.length?o.set(r,new zs(n,t)):o.delete(r),o}function Zl(e,t){var n=Array.from(e.values());t(Ls(n),h.a(function(e){return e.query||""},ee.a(function(e){return Boolean(e)},n)).join(" && "),e)}var Xl=function(e,t,n,r){Zl(e=Yl(e,t,n),r)};function Jl(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}var Ql=[],ec=function(){function e(t){var n=this;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.propsFn=t,this.filterStyles=Wl(),this.filterOpStyles=Ul(),this.relevantStyles=ol(),this.headerOperations=Hl(),this.onChange=function(e,t,n,r){B.c.debug("Filter -- onChange",e.id,r.target.value&&r.target.value.trim());var o=r.target.value.trim();Xl(t,e,o,n)},this.filter=pn()(function(e,t,r,a){var i=r.get(e.id.toString());return o.a.createElement(ql,{key:"column-".concat(t),classes:"dash-filter column-".concat(t),columnId:e.id,isValid:!i||i.isValid,setFilter:n.onChange.bind(n,e,r,a),value:i&&i.query})}),this.wrapperStyles=Object(f.a)(function(e,t){return function(e,t){for(var n=e.length,r=new Array(n),o=0;o<n;++o)r[o]=t(e[o],o);return r}(e,function(e,n){return rn.a(e,t&&t.getStyle(0,n))})}),this.getCells=Object(f.a)(function(e,t){return[e.concat(t)]}),this.getFilterCells=Object(f.a)(function(e,t,n){return Je(e,t,function(e,t,r){return o.a.cloneElement(e,{style:d.a([n&&n.getStyle(0,r),t,e.props.style])})})}),this.getOpFilterCells=Object(f.a)(function(e,t,n){return Je(e,t,function(e,t,r){return o.a.cloneElement(e,{style:d.a([n&&n.getStyle(0,r),t,e.props.style])})})})}var t,n,r;return t=e,(n=[{key:"createFilters",value:function(e,t){var n=this,r=this.props,o=r.filter_action,a=r.map,i=r.row_deletable,s=r.row_selectable,l=r.setFilter,c=r.style_cell,u=r.style_cell_conditional,p=r.style_filter,f=r.style_filter_conditional,d=r.visibleColumns;if(o===ve.i.None)return Ql;var b=this.relevantStyles(c,p,u,f),v=this.wrapperStyles(this.filterStyles(d,b),e),m=this.filterOpStyles(1,(s?1:0)+(i?1:0),b)[0],y=ge(h.a)(function(e,t){return n.filter.get(e.id,t)(e,t,a,l)},d),g=this.getFilterCells(y,v,e),w=this.headerOperations(1,s,i)[0],k=this.getOpFilterCells(w,m,t);return this.getCells(k,g)}},{key:"props",get:function(){return this.propsFn()}}])&&Jl(t.prototype,n),r&&Jl(t,r),e}(),tc=n(80),nc=Object(a.a)(function(e,t){var n,r;return e.length>t.length?(n=e,r=t):(n=t,r=e),ct(Object(tc.a)(Na(Oe.a)(n),r))}),rc=n(19);function oc(e,t){return function(){return t.call(this,e.apply(this,arguments))}}var ac=Object(c.a)(Object(X.a)("tail",J(1,1/0)));function ic(){if(0===arguments.length)throw new Error("pipe requires at least one argument");return Object(rc.a)(arguments[0].length,Ue(oc,arguments[0],ac(arguments)))}var sc=Object(c.a)(function(e){return Object(ke.a)(e)?e.split("").reverse().join(""):Array.prototype.slice.call(e,0).reverse()});function lc(){if(0===arguments.length)throw new Error("compose requires at least one argument");return ic.apply(this,sc(arguments))}var cc,uc=Object(a.a)(lc(ct,me)),pc=function(){function e(e,t){this.xf=t,this.f=e,this.all=!0}return e.prototype["@@transducer/init"]=I.a.init,e.prototype["@@transducer/result"]=function(e){return this.all&&(e=this.xf["@@transducer/step"](e,!0)),this.xf["@@transducer/result"](e)},e.prototype["@@transducer/step"]=function(e,t){return this.f(t)||(this.all=!1,e=Object(Qe.a)(this.xf["@@transducer/step"](e,!1))),e},e}(),fc=Object(a.a)(function(e,t){return new pc(e,t)}),dc=Object(a.a)(Object(F.a)(["all"],fc,function(e,t){for(var n=0;n<t.length;){if(!e(t[n]))return!1;n+=1}return!0})),hc=Object(a.a)(function(e,t){return Array.prototype.slice.call(t,0).sort(function(t,n){for(var r=0,o=0;0===r&&o<e.length;)r=e[o](t,n),o+=1;return r})}),bc=Object(c.a)(function(e){return function(t,n){return e(t,n)?-1:e(n,t)?1:0}});!function(e){e.Ascending="asc",e.Descending="desc",e.None="none"}(cc||(cc={}));var vc=function(e,t){return x.a(e)},mc=function(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:vc;return t.length?hc(h.a(function(e){return e.direction===cc.Descending?bc(function(t,r){var o=e.column_id,a=t[o],i=r[o];return!n(a,e.column_id)&&(!!n(i,e.column_id)||a>i)}):bc(function(t,r){var o=e.column_id,a=t[o],i=r[o];return!n(a,e.column_id)&&(!!n(i,e.column_id)||a<i)})},t),e):e},yc=function(){function e(e,t){this.xf=t,this.f=e,this.idx=-1,this.found=!1}return e.prototype["@@transducer/init"]=I.a.init,e.prototype["@@transducer/result"]=function(e){return this.found||(e=this.xf["@@transducer/step"](e,-1)),this.xf["@@transducer/result"](e)},e.prototype["@@transducer/step"]=function(e,t){return this.idx+=1,this.f(t)&&(this.found=!0,e=Object(Qe.a)(this.xf["@@transducer/step"](e,this.idx))),e},e}(),gc=Object(a.a)(function(e,t){return new yc(e,t)}),wc=Object(a.a)(Object(F.a)([],gc,function(e,t){for(var n=0,r=t.length;n<r;){if(e(t[n]))return n;n+=1}return-1})),kc=function(e,t){if(B.c.trace("multi - update sortBy",e,t),e=yt.a(e),t.direction===cc.None){var n=wc(function(e){return e.column_id===t.column_id},e);-1!==n&&e.splice(n,1)}else{var r=nt(function(e){return e.column_id===t.column_id},e);r?r.direction=t.direction:e.push(t)}return e},Oc=function(e,t){return B.c.trace("single - update sortBy",e,t),t.direction===cc.None?[]:[t]},xc=n(357);function _c(e){return(_c="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Ec(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Sc(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{},r=Object.keys(n);"function"==typeof Object.getOwnPropertySymbols&&(r=r.concat(Object.getOwnPropertySymbols(n).filter(function(e){return Object.getOwnPropertyDescriptor(n,e).enumerable}))),r.forEach(function(t){Ec(e,t,n[t])})}return e}function Cc(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n,r,o={},a=Object.keys(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function jc(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}function Ac(e){return t=e,(t-=0)==t?e:(e=e.replace(/[\-_\s]+(.)?/g,function(e,t){return t?t.toUpperCase():""})).substr(0,1).toLowerCase()+e.substr(1);var t}var Pc=!1;try{Pc=!0}catch(e){}function Tc(e){return null===e?null:"object"===_c(e)&&e.prefix&&e.iconName?e:Array.isArray(e)&&2===e.length?{prefix:e[0],iconName:e[1]}:"string"==typeof e?{prefix:"fas",iconName:e}:void 0}function Mc(e,t){return Array.isArray(t)&&t.length>0||!Array.isArray(t)&&t?Ec({},e,t):{}}function Fc(e){var t=e.icon,n=e.mask,r=e.symbol,o=e.className,a=e.title,i=Tc(t),s=Mc("classes",[].concat(jc(function(e){var t,n=e.spin,r=e.pulse,o=e.fixedWidth,a=e.inverse,i=e.border,s=e.listItem,l=e.flip,c=e.size,u=e.rotation,p=e.pull,f=(Ec(t={"fa-spin":n,"fa-pulse":r,"fa-fw":o,"fa-inverse":a,"fa-border":i,"fa-li":s,"fa-flip-horizontal":"horizontal"===l||"both"===l,"fa-flip-vertical":"vertical"===l||"both"===l},"fa-".concat(c),null!=c),Ec(t,"fa-rotate-".concat(u),null!=u),Ec(t,"fa-pull-".concat(p),null!=p),Ec(t,"fa-swap-opacity",e.swapOpacity),t);return Object.keys(f).map(function(e){return f[e]?e:null}).filter(function(e){return e})}(e)),jc(o.split(" ")))),l=Mc("transform","string"==typeof e.transform?xc.c.transform(e.transform):e.transform),c=Mc("mask",Tc(n)),u=Object(xc.a)(i,Sc({},s,l,c,{symbol:r,title:a}));if(!u)return function(){var e;!Pc&&console&&"function"==typeof console.error&&(e=console).error.apply(e,arguments)}("Could not find icon",i),null;var p=u.abstract,f={};return Object.keys(e).forEach(function(t){Fc.defaultProps.hasOwnProperty(t)||(f[t]=e[t])}),Dc(p[0],f)}Fc.displayName="FontAwesomeIcon",Fc.propTypes={border:Xn.a.bool,className:Xn.a.string,mask:Xn.a.oneOfType([Xn.a.object,Xn.a.array,Xn.a.string]),fixedWidth:Xn.a.bool,inverse:Xn.a.bool,flip:Xn.a.oneOf(["horizontal","vertical","both"]),icon:Xn.a.oneOfType([Xn.a.object,Xn.a.array,Xn.a.string]),listItem:Xn.a.bool,pull:Xn.a.oneOf(["right","left"]),pulse:Xn.a.bool,rotation:Xn.a.oneOf([90,180,270]),size:Xn.a.oneOf(["lg","xs","sm","1x","2x","3x","4x","5x","6x","7x","8x","9x","10x"]),spin:Xn.a.bool,symbol:Xn.a.oneOfType([Xn.a.bool,Xn.a.string]),title:Xn.a.string,transform:Xn.a.oneOfType([Xn.a.string,Xn.a.object]),swapOpacity:Xn.a.bool},Fc.defaultProps={border:!1,className:"",mask:null,fixedWidth:!1,inverse:!1,flip:null,icon:null,listItem:!1,pull:null,pulse:!1,rotation:null,size:null,spin:!1,symbol:!1,title:"",transform:null,swapOpacity:!1};var Dc=function e(t,n){var r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};if("string"==typeof n)return n;var o=(n.children||[]).map(function(n){return e(t,n)}),a=Object.keys(n.attributes||{}).reduce(function(e,t){var r=n.attributes[t];switch(t){case"class":e.attrs.className=r,delete n.attributes.class;break;case"style":e.attrs.style=r.split(";").map(function(e){return e.trim()}).filter(function(e){return e}).reduce(function(e,t){var n,r=t.indexOf(":"),o=Ac(t.slice(0,r)),a=t.slice(r+1).trim();return o.startsWith("webkit")?e[(n=o,n.charAt(0).toUpperCase()+n.slice(1))]=a:e[o]=a,e},{});break;default:0===t.indexOf("aria-")||0===t.indexOf("data-")?e.attrs[t.toLowerCase()]=r:e.attrs[Ac(t)]=r}return e},{attrs:{}}),i=r.style,s=void 0===i?{}:i,l=Cc(r,["style"]);return a.attrs.style=Sc({},a.attrs.style,s),t.apply(void 0,[n.tag,Sc({},a.attrs,l)].concat(jc(o)))}.bind(null,o.a.createElement);function Rc(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,a=void 0;try{for(var i,s=e[Symbol.iterator]();!(r=(i=s.next()).done)&&(n.push(i.value),!t||n.length!==t);r=!0);}catch(e){o=!0,a=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw a}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function Ic(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Nc(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var zc=function(e,t,n,r,o,a,i,s,l,c,u){return function(){var p=e(n,r,o,a,i,u),f=ue(n,r,a,i);e===fe&&nc(t,f).length>0&&(p.selected_columns=za(f,t)),l(p);var d=[];P.a(function(e){var t=r.find(function(t){return t.id===e});t&&d.push(t)},f),function(e,t,n){P.a(function(t){e=Yl(e,t,"")},t),Zl(e,n)}(c,d,s)}};function Lc(e,t,n,r){return function(){var o;switch(qc(e,t)){case cc.Descending:o=cc.None;break;case cc.Ascending:o=cc.Descending;break;case cc.None:default:o=cc.Ascending}var a=n===ve.h.Single?Oc:kc;r(function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Ic(Object(n),!0).forEach(function(t){Nc(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ic(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}({sort_by:a(t,{column_id:e,direction:o})},he))}}function Bc(e,t,n,r,o){return function(){var a=be(e,t,n,o);a&&r(a)}}function Vc(e,t,n,r,o,a,i,s){if(i&&!s)return function(){};var l=ue(t,n,r,a,!0);return i?function(){return o({selected_columns:l})}:s?function(){return o({selected_columns:uc(e,l)})}:function(){return o({selected_columns:za(l,e)})}}function qc(e,t){var n=nt(function(t){return t.column_id===e},t);return n?n.direction:cc.None}function Wc(e,t){switch(qc(e,t)){case cc.Descending:return"sort-down";case cc.Ascending:return"sort-up";case cc.None:default:return"sort"}}var Uc=Object(f.b)(function(e,t,n,r,a,i,s,l,c,u,p,f,d,b,v,m){return ge(h.a)(function(y,g){var w=Rc(y,2),k=w[0],O=w[1],x=i.length-1,_=g===x;return ge(h.a)(function(i,h){var y,w=t[i];y=m?i===ft(O)?k.length-i:O[h+1]-i:1;var E=d!==ve.i.Custom&&Qt(g,x,w.clearable),S=d!==ve.i.Custom&&Qt(g,x,w.deletable),C=Qt(g,x,w.hideable),j=Qt(g,x,w.renamable),A=Qt(g,x,w.selectable),P=t.length===y,T=ue(w,n,g,m,!0),M=A&&("single"!==l||c.length===T.length)&&dc(function(e){return-1!==c.indexOf(e)},T);return o.a.createElement("div",null,l&&A?o.a.createElement("span",{className:"column-header--select"},o.a.createElement("input",{checked:M,onChange:Vc(c,w,n,g,v,m,"single"===l,!M),name:"column-select-".concat(e),type:"single"===l?"radio":"checkbox"})):null,u!==ve.i.None&&_?o.a.createElement("span",{className:"column-header--sort",onClick:Lc(w.id,f,p,v)},o.a.createElement(Fc,{icon:Wc(w.id,f)})):null,j?o.a.createElement("span",{className:"column-header--edit",onClick:Bc(w,n,g,v,m)},o.a.createElement(Fc,{icon:"pencil-alt"})):null,E?o.a.createElement("span",{className:"column-header--clear",onClick:zc(pe,c,w,n,t,g,m,b,v,s,a)},o.a.createElement(Fc,{icon:"eraser"})):null,S?o.a.createElement("span",{className:"column-header--delete"+(P?" disabled":""),onClick:P?void 0:zc(fe,c,w,n,t,g,m,b,v,s,a)},o.a.createElement(Fc,{icon:["far","trash-alt"]})):null,C?o.a.createElement("span",{className:"column-header--hide"+(P?" disabled":""),onClick:P?void 0:function(){var e=de(w,t,g,m),n=r?uc(r,e):e;v({hidden_columns:n})}},o.a.createElement(Fc,{icon:["far","eye-slash"]})):null,o.a.createElement("span",{className:"column-header-name"},k[i]))},O)},i)});function Kc(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,a=void 0;try{for(var i,s=e[Symbol.iterator]();!(r=(i=s.next()).done)&&(n.push(i.value),!t||n.length!==t);r=!0);}catch(e){o=!0,a=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw a}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}var Hc=Object(f.b)(function(e,t,n){return h.a(function(t){var r=Kc(t,2),a=r[0],i=r[1];return ge(h.a)(function(t,r){var s,l=e[t];return s=n?t===ft(i)?a.length-t:i[r+1]-t:1,o.a.createElement("th",{key:"header-cell-".concat(t),"data-dash-column":l.id,colSpan:s,className:"dash-header "+"column-".concat(t," ")+(t===e.length-1||t===ft(i)?"cell--right-last ":"")})},i)},t)}),$c=Object(f.b)(function(e,t,n){return sn(oe.a(0,t),e,function(e,t){return function(e,t){return function(n){return sl(Ws(e,t)(n))}}(e,t)(n)})}),Gc=Object(f.b)(function(e,t,n){return sn(oe.a(0,e),oe.a(0,t),function(e){return function(e){return function(t){return sl(Hs(e)(t))}}(e)(n)})});function Yc(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}var Zc=function(){function e(t){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.propsFn=t,this.headerContent=Uc(),this.headerOperations=Hl(),this.headerStyles=$c(),this.headerOpStyles=Gc(),this.headerWrappers=Hc(),this.relevantStyles=al(),this.labelsAndIndices=nn(),this.getCells=Object(f.a)(function(e,t){return Je(e,t,function(e,t){return Array.prototype.concat(e,t)})}),this.getHeaderOpCells=Object(f.a)(function(e,t,n){return ln(e,t,function(e,t,r,a){return o.a.cloneElement(e,{style:d.a([n&&n.getStyle(r,a),t,e.props.style])})})}),this.getHeaderCells=Object(f.a)(function(e,t,n,r){return cn(e,n,t,function(e,t,n,a,i){return o.a.cloneElement(e,{children:[n],style:d.a([t,r&&r.getStyle(a,i)])})})})}var t,n,r;return t=e,(n=[{key:"createHeaders",value:function(e,t){var n=this.props,r=n.column_selectable,o=n.columns,a=n.data,i=n.hidden_columns,s=n.id,l=n.map,c=n.merge_duplicate_headers,u=n.page_action,p=n.row_deletable,f=n.row_selectable,d=n.selected_columns,h=n.setFilter,b=n.setProps,v=n.sort_action,m=n.sort_by,y=n.sort_mode,g=n.style_cell,w=n.style_cell_conditional,k=n.style_header,O=n.style_header_conditional,x=n.visibleColumns,_=this.labelsAndIndices(o,x,c),E=_.length,S=this.relevantStyles(g,k,w,O),C=this.headerOperations(E,f,p),j=this.headerStyles(x,E,S),A=this.headerOpStyles(E,(f?1:0)+(p?1:0),S),P=this.headerWrappers(x,_,c),T=this.headerContent(s,x,o,i,a,_,l,r,d,v,y,m,u,h,b,c),M=this.getHeaderOpCells(C,A,t),F=this.getHeaderCells(P,T,j,e);return this.getCells(M,F)}},{key:"props",get:function(){return this.propsFn()}}])&&Yc(t.prototype,n),r&&Yc(t,r),e}();function Xc(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}function Jc(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Qc(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var eu=function(e,t,n,r,o){e(function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Jc(Object(n),!0).forEach(function(t){Qc(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Jc(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}({filter_query:n},he)),t({workFilter:{map:o,value:n},rawFilterQuery:r})};var tu=function(e){var t=Object(f.a)(function(e,t){return eu.bind(void 0,e,t)}),n=new wl(e),r=function(){var n=e();return function(e,t){var n=e();return rn.a(n,{map:n.workFilter.map,setFilter:t})}(e,t(n.setProps,n.setState))},o=new ec(r),a=new Zc(r),i=new Pl(e),s=Object(f.a)(function(e,t,n){var r=[];return r.push.apply(r,Xc(n)),r.push.apply(r,Xc(t)),r.push.apply(r,Xc(e)),r});return function(){var e=i.createEdges(),t=n.createCells(e.dataEdges,e.dataOpEdges),r=o.createFilters(e.filterEdges,e.filterOpEdges),l=a.createHeaders(e.headerEdges,e.headerOpEdges);return s(t,r,l)}},nu=n(78),ru=Object(nu.a)(4,[],function(e,t,n,r){return Object(R.a)(function(n,r){return e(n,r)?t(n,r):Object(Qe.a)(n)},n,r)});function ou(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return e?o.a.createElement("table",{tabIndex:-1},o.a.createElement("tbody",null,e.map(function(e,n){return o.a.createElement("tr",{key:"row-".concat(n+t)},e)}))):null}var au=function(e){return!e||0===e.length||0===e[0].length},iu=Object(f.b)(function(e,t,n,r){var o=e?h.a(function(t){return t.slice(0,ru(function(t){return t.count<e},function(e,t){return e.cells++,e.count+=t.props.colSpan||1,e},{cells:0,count:0},t).cells)},n):null;n=ge(h.a)(function(e,t){return e.slice(o&&o[t].length||0)},n);var a=t?n.slice(0,t):null;n=n.slice(t);var i=t&&o?o.slice(0,t):null;return o=o&&o.slice(t),{grid:[[ou(i),ou(a)],[ou(o),ou(n,r)]],empty:[[au(i),au(a)],[au(o),au(n)]]}}),su=Ue(Object(a.a)(function(e,t){return Number(e)+Number(t)}),0),lu=n(32),cu=2147483647;function uu(e,t,n,r,o){if(e){var a=e.id,i=e.row;if(void 0!==a&&void 0!==i){var s=t&&t.length>i&&t[i]&&t[i][a]||r[a],l=ee.a(function(e){return!e.if||Bs(e.if,a)&&function(e,t){if(!e||void 0===e.row_index)return!0;var n=e.row_index;return"number"==typeof n?t===n:"odd"===n?t%2==1:t%2==0}(e.if,i)&&(t=e.if,n=o.data[i-o.offset.rows],!t||void 0===t.filter_query||function(e,t){return e.isValid&&e.evaluate(t)}(new Es(t.filter_query),n));var t,n},n);return l.length?l.slice(-1)[0]:s}}}function pu(e){return"number"==typeof e?e:0}function fu(e){return"number"==typeof e?e:cu}var du,hu=Object(f.a)(function(e,t,n,r,o,a,i){var s,l=uu(e,t,n,r,o),c=pu(a),u=fu(i),p=lu.a.Text;return l&&("string"==typeof l?s=l:(c=function(e,t){return"number"==typeof e||null===e?pu(e):t}(l.delay,c),u=function(e,t){return"number"==typeof e||null===e?fu(e):t}(l.duration,u),p=l.type||lu.a.Text,s=l.value)),{delay:c,duration:u,type:p,value:s}}),bu=n(45);function vu(e){return(vu="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function mu(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function yu(e,t){return!t||"object"!==vu(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function gu(e){return(gu=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function wu(e,t){return(wu=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}!function(e){e.Bottom="bottom",e.Left="left",e.Right="right",e.Top="top"}(du||(du={}));var ku=function(e){function t(e){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=yu(this,gu(t).call(this,e))).state={md:new ya},n}var n,a,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&wu(e,t)}(t,r["PureComponent"]),n=t,(a=[{key:"componentWillReceiveProps",value:function(e){var t=this,n=e.tooltip,r=n.delay,o=n.duration;Object(bu.a)(te(["arrow"],this.props),te(["arrow"],e))||this.setState({display:!1,displayTooltipId:Boolean(clearTimeout(this.state.displayTooltipId))||setTimeout(function(){return t.setState({display:!0})},r),hideTooltipId:Boolean(clearTimeout(this.state.hideTooltipId))||setTimeout(function(){return t.setState({display:!1})},Math.min(r+o,cu))})}},{key:"render",value:function(){var e=this.props,t=e.arrow,n=e.className,r=this.props.tooltip,a=r.type,i=r.value,s=this.state.md;if(!a||!i)return null;var l=a===lu.a.Text?{children:i}:{dangerouslySetInnerHTML:{__html:s.render(i)}},c=this.state.display;return o.a.createElement("div",{className:"dash-tooltip","data-attr-anchor":t,style:{visibility:c?"visible":"hidden"}},o.a.createElement("div",Object.assign({className:n},l)))}}])&&mu(n.prototype,a),i&&mu(n,i),t}();function Ou(e){return(Ou="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function xu(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function _u(e,t){return!t||"object"!==Ou(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function Eu(e){return(Eu=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Su(e,t){return(Su=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Cu=function(e){function t(e){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=_u(this,Eu(t).call(this,e))).updateBounds=function(e){n.setState({cell:e})},n.state={arrow:du.Bottom},n}var n,a,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Su(e,t)}(t,r["Component"]),n=t,(a=[{key:"shouldComponentUpdate",value:function(e,t){return this.adjustPosition(),!Object(bu.a)(this.props,e)||!Object(bu.a)(this.state,t)}},{key:"componentDidUpdate",value:function(){this.adjustPosition()}},{key:"render",value:function(){var e=this.state.arrow;return o.a.createElement(ku,Object.assign({key:"tooltip",ref:"tooltip",arrow:e},this.props))}},{key:"adjustPosition",value:function(){var e=this.state.cell,t=Qn.a.findDOMNode(this.refs.tooltip),n=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null;if(t=t||function(){for(t=e;t&&"td"!==t.nodeName.toLowerCase();)t=t.parentElement;return t}(),!e||!t)return{};for(var n=e;"relative"!==getComputedStyle(n).position&&"sticky"!==getComputedStyle(n).position&&n.parentElement;)n=n.parentElement;for(var r=e;"relative"!==getComputedStyle(r).position&&r.parentElement;)r=r.parentElement;return{positionalParent:n,parent:t}}(t,e),r=n.positionalParent,o=n.parent;if(r&&o&&t){var a=r.getBoundingClientRect(),i=o.getBoundingClientRect(),s=t.clientWidth,l=t.clientHeight,c=Math.max(parseFloat(getComputedStyle(t,":before").borderWidth||"0"),parseFloat(getComputedStyle(t,":after").borderWidth||"0")),u=(i.width-s)/2,p=i.left-a.left+r.scrollLeft+u,f=i.top-a.top+r.scrollTop+i.height,d=document.body,h=d.scrollLeft,b=d.scrollTop,v=d.clientWidth,m=d.clientHeight,y=du.Top,g=0;p<h&&(g=h-p,p=h),p+s>h+v&&(g=h+v-s-p,p=h+v-s),f+l>b+m&&(f=i.top-a.top+r.scrollTop-(l+c),y=du.Bottom),(g=Math.abs(g))>o.clientWidth/2&&(y=void 0),t.style.top="".concat(f,"px"),t.style.left="".concat(p,"px"),t.style.position="absolute",this.state.arrow!==y&&this.setState({arrow:y})}}}])&&xu(n.prototype,a),i&&xu(n,i),t}();function ju(e){return(ju="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Au(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Pu(e,t){return!t||"object"!==ju(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function Tu(e){return(Tu=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Mu(e,t){return(Mu=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Fu=function(e){function t(e){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=Pu(this,Tu(t).call(this,e))).goToPage=function(e){var t=n.props.paginator,r=parseInt(e,10);isNaN(r)||t.loadPage(r-1)},n}var n,a,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Mu(e,t)}(t,r["Component"]),n=t,(a=[{key:"render",value:function(){var e=this,t=this.props,n=t.paginator,r=t.page_current;return void 0!==n.lastPage&&n.lastPage<=0?null:o.a.createElement("div",{className:"previous-next-container"},o.a.createElement("button",{className:"first-page",onClick:n.loadFirst,disabled:!n.hasPrevious()},o.a.createElement(Fc,{icon:"angle-double-left"})),o.a.createElement("button",{className:"previous-page",onClick:n.loadPrevious,disabled:!n.hasPrevious()},o.a.createElement(Fc,{icon:"angle-left"})),o.a.createElement("div",{className:"page-number"},o.a.createElement("input",{type:"text",className:"current-page",onBlur:function(t){e.goToPage(t.target.value),t.target.value=""},onKeyDown:function(e){e.keyCode===H.ENTER&&e.currentTarget.blur()},placeholder:(r+1).toString(),defaultValue:""}),void 0!==n.lastPage?" / ":"",void 0!==n.lastPage?o.a.createElement("div",{className:"last-page"},n.lastPage+1):""),o.a.createElement("button",{className:"next-page",onClick:n.loadNext,disabled:!n.hasNext()},o.a.createElement(Fc,{icon:"angle-right"})),o.a.createElement("button",{className:"last-page",onClick:n.loadLast,disabled:void 0===n.lastPage||n.isLast()},o.a.createElement(Fc,{icon:"angle-double-right"})))}}])&&Au(n.prototype,a),i&&Au(n,i),t}();function Du(e){return(Du="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Ru(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,a=void 0;try{for(var i,s=e[Symbol.iterator]();!(r=(i=s.next()).done)&&(n.push(i.value),!t||n.length!==t);r=!0);}catch(e){o=!0,a=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw a}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function Iu(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}function Nu(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function zu(e,t){return!t||"object"!==Du(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function Lu(e){return(Lu=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Bu(e,t){return(Bu=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Vu={width:"100%"},qu={minHeight:"100%",minWidth:"100%"},Wu=function(e){function t(e){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=zu(this,Lu(t).call(this,e))).menuRef=o.a.createRef(),n.stylesheet=new K("#".concat(n.props.id)),n.tableFn=tu(function(){return n.props}),n.tableFragments=iu(),n.tableStyle=il(),n.labelsAndIndices=nn(),n.calculateTableStyle=Object(f.a)(function(e){return d.a(n.tableStyle(Vu,e))}),n.getLexerResult=Object(f.a)(at.bind(void 0,ws)),n.handleClick=function(e){var t=n.$el;t&&!t.contains(e.target)&&n.props.is_focused&&n.props.setProps({is_focused:!1});var r=n.menuRef;n.props.activeMenu&&r&&r.current&&!r.current.contains(e.target)&&n.props.setState({activeMenu:void 0})},n.handlePaste=function(e){var t=n.$el;t&&t.contains(document.activeElement)&&n.onPaste(e)},n.forceHandleResize=function(){return n.handleResize(!0)},n.handleResize=function(){var e=arguments.length>0&&void 0!==arguments[0]&&arguments[0],t=n.props,r=t.forcedResizeOnly,o=t.setState;if(!r||e){e||o({forcedResizeOnly:!0}),n.updateStylesheet(),Xe().then(function(e){return o({scrollbarWidth:e})});var a=n.refs,i=a.r0c0,s=a.r0c1,l=a.r1c0,c=a.r1c1,u=s.querySelectorAll("tr");Array.from(i.querySelectorAll("tr")).forEach(function(e,t){var n=u[t];e.style.height="".concat(n.clientHeight,"px")});var p=c.querySelectorAll("tr > th:first-of-type");Array.from(l.querySelectorAll("tr > th:first-of-type")).forEach(function(e,t){var n=p[t].parentElement;e.parentElement.style.height=getComputedStyle(n).height});var f=c.querySelector("tr > td:first-of-type");if(f){var d=f.parentElement;n.stylesheet.setRule(".dash-fixed-column tr","height: ".concat(getComputedStyle(d).height,";"))}}},n.handleKeyDown=function(e){var t=n.props,r=t.setProps,o=t.is_focused;if(B.c.trace("handleKeyDown: ".concat(e.key)),a=e.keyCode,![H.CONTROL,H.COMMAND_LEFT,H.COMMAND_RIGHT,H.COMMAND_FIREFOX].includes(a)){var a,i=Z(e);i&&e.keyCode===H.V||e.keyCode===H.C&&i&&!o||(e.keyCode!==H.ESCAPE?(!o&&Y(e.keyCode)&&n.switchCell(e),o&&!Y(e.keyCode)||(e.keyCode!==H.TAB&&e.keyCode!==H.ENTER?e.keyCode!==H.BACKSPACE&&e.keyCode!==H.DELETE||n.deleteCell(e):n.switchCell(e))):r({is_focused:!1}))}},n.switchCell=function(e){var t=e,r=n.props,o=r.active_cell,a=r.selected_cells,i=r.start_cell,s=r.end_cell,l=r.setProps,c=r.viewport,u=r.visibleColumns;if(e.preventDefault(),o){n.$el.focus();var p=a.length>1,f=t.keyCode===H.ENTER||t.keyCode===H.TAB;if(p&&f)l({is_focused:!1,active_cell:n.getNextCell(t,{currentCell:o,restrictToSelection:!0})});else if(t.shiftKey){var d=He(a),h=d.minRow,b=d.minCol,v=d.maxRow,m=d.maxCol,y=t.keyCode===H.ARROW_DOWN||t.keyCode===H.ENTER,g=t.keyCode===H.ARROW_UP,w=t.keyCode===H.ARROW_RIGHT||t.keyCode===H.TAB,k=t.keyCode===H.ARROW_LEFT,O=i&&i.row,x=i&&i.column,_=s&&s.row,E=s&&s.column;if(y)o.row>h?_=++h:v<c.data.length-1&&(_=++v);else if(g)o.row<v?_=--v:h>0&&(_=--h);else if(w)o.column>b?E=++b:m<u.length-1&&(E=++m);else{if(!k)return;o.column<m?E=--m:b>0&&(E=--b)}var S=Ze({minRow:h,maxRow:v,minCol:b,maxCol:m},u,c),C={is_focused:!1,end_cell:Ye(_,E,u,c),selected_cells:S},j=_===h?v:h,A=E===b?m:b;O===j&&x===A||(C.start_cell=Ye(j,A,u,c)),l(C)}else{var P=n.getNextCell(t,{currentCell:o,restrictToSelection:!1});l({is_focused:!1,selected_cells:[P],active_cell:P,start_cell:P,end_cell:P})}}else B.c.warning("Trying to change cell, but no cell is active.")},n.deleteCell=function(e){var t=n.props,r=t.data,o=t.selected_cells,a=t.setProps,i=t.viewport,s=t.visibleColumns;e.preventDefault();var l=r;h.a(function(e){return[i.indices[e.row],e.column]},o).forEach(function(e){var t=s[e[1]];if(t.editable){var n=$t(null,t);l=g(C([e[0],t.id]),n.success?n.value:"",l)}}),a({data:l})},n.getNextCell=function(e,t){var r,o=t.restrictToSelection,a=t.currentCell,i=n.props,s=i.selected_cells,l=i.viewport,c=i.visibleColumns,u=e,p=a.row,f=a.column;switch(u.keyCode){case H.ARROW_LEFT:r=o?$e([p,f-1],s):[p,j(0,f-1)];break;case H.ARROW_RIGHT:case H.TAB:r=o?$e([p,f+1],s):[p,A(c.length-1,f+1)];break;case H.ARROW_UP:r=o?$e([p-1,f],s):[j(0,p-1),f];break;case H.ARROW_DOWN:case H.ENTER:r=o?$e([p+1,f],s):[A(l.data.length-1,p+1),f];break;default:throw new Error("Table.getNextCell: unknown navigation keycode ".concat(u.keyCode))}return Ye(r[0],r[1],c,l)},n.onCopy=function(e){var t=n.props,r=t.selected_cells,o=t.viewport,a=t.columns,i=t.visibleColumns,s=t.include_headers_on_copy_paste;Xt.toClipboard(e,r,a,i,o.data,s),n.$el.focus()},n.onPaste=function(e){var t=n.props,r=t.active_cell,o=t.columns,a=t.data,i=t.editable,s=t.filter_query,l=t.loading_state,c=t.setProps,u=t.sort_by,p=t.viewport,f=t.visibleColumns,d=t.include_headers_on_copy_paste;if(i&&r&&!l){var h=Xt.fromClipboard(e,r,p.indices,o,f,a,!0,!u.length||!s.length,d);h&&c(h)}},n.applyStyle=function(){var e=n.props,t=e.fixed_columns,r=e.fixed_rows,o=e.row_deletable,a=e.row_selectable,i=n.refs,s=i.r1c0,l=i.r1c1;n.updateUiViewport(),o&&n.stylesheet.setRule(".dash-spreadsheet-inner td.dash-delete-cell","width: 30px; max-width: 30px; min-width: 30px;"),a&&n.stylesheet.setRule(".dash-spreadsheet-inner td.dash-select-cell","width: 30px; max-width: 30px; min-width: 30px;"),r&&Array.from(l.querySelectorAll("tr:first-of-type td.dash-cell, tr:first-of-type th.dash-header")).forEach(function(e){var t=e.className.split(" ")[1],r=getComputedStyle(e).width;n.stylesheet.setRule(".dash-fixed-row:not(.dash-fixed-column) th.".concat(t),"width: ".concat(r," !important; min-width: ").concat(r," !important; max-width: ").concat(r," !important;"))}),t&&r&&Array.from(s.querySelectorAll("tr:first-of-type td.dash-cell, tr:first-of-type th.dash-header")).forEach(function(e){var t=e.className.split(" ")[1],r=getComputedStyle(e).width;n.stylesheet.setRule(".dash-fixed-column.dash-fixed-row th.".concat(t),"width: ".concat(r," !important; min-width: ").concat(r," !important; max-width: ").concat(r," !important;"))});var c=r&&!t?l:s;o&&Array.from(c.querySelectorAll("tr:first-of-type td.dash-delete-cell")).forEach(function(e){var t=getComputedStyle(e).width;n.stylesheet.setRule("th.dash-delete-header","width: ".concat(t," !important; min-width: ").concat(t," !important; max-width: ").concat(t," !important;"))}),a&&Array.from(c.querySelectorAll("tr:first-of-type td.dash-select-cell")).forEach(function(e){var t=getComputedStyle(e).width;n.stylesheet.setRule("th.dash-select-header","width: ".concat(t," !important; min-width: ").concat(t," !important; max-width: ").concat(t," !important;"))})},n.handleDropdown=function(){var e=n.refs.r1c1;Jt(e.querySelector(".Select-menu-outer"))},n.onScroll=function(e){var t=n.refs.r0c1;B.c.trace("ControlledTable fragment scrolled to (left,top)=(".concat(e.target.scrollLeft,",").concat(e.target.scrollTop,")")),t.style.marginLeft="".concat(-e.target.scrollLeft,"px"),n.updateUiViewport(),n.handleDropdown(),n.adjustTooltipPosition()},n.toggleColumn=function(e,t,r){var o=n.props,a=o.columns,i=o.hidden_columns,s=o.setProps,l=de(e,a,t,r),c=i?i.slice(0):[];P.a(function(e){var t=c.indexOf(e);t>=0?c.splice(t,1):c.push(e)},l),s({hidden_columns:c})},n.updateStylesheet(),n}var n,a,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Bu(e,t)}(t,r["PureComponent"]),n=t,(a=[{key:"updateStylesheet",value:function(){var e=this,t=this.props.css;P.a(function(t){var n=t.selector,r=t.rule;e.stylesheet.setRule(n,r)},t)}},{key:"updateUiViewport",value:function(){var e=this.props,t=e.setState,n=e.uiViewport;if(e.virtualization){var r=this.refs.r1c1.parentElement;n&&n.scrollLeft===r.scrollLeft&&n.scrollTop===r.scrollTop&&n.height===r.clientHeight&&n.width===r.clientWidth||t({uiViewport:{scrollLeft:r.scrollLeft,scrollTop:r.scrollTop,height:r.clientHeight,width:r.clientWidth}})}}},{key:"componentDidMount",value:function(){var e=this.props,t=e.active_cell,n=e.selected_cells,r=e.setProps;n.length&&t&&!T.a(t,n)&&r({active_cell:n[0]}),this.applyStyle(),this.handleResize()}},{key:"componentWillMount",value:function(){window.addEventListener("resize",this.forceHandleResize),document.addEventListener("mousedown",this.handleClick),document.addEventListener("paste",this.handlePaste)}},{key:"componentWillUnmount",value:function(){window.removeEventListener("resize",this.forceHandleResize),document.removeEventListener("mousedown",this.handleClick),document.removeEventListener("paste",this.handlePaste)}},{key:"componentWillUpdate",value:function(){this.updateStylesheet()}},{key:"componentDidUpdate",value:function(){this.applyStyle(),this.handleResize(),this.handleDropdown(),this.adjustTooltipPosition();var e=this.props,t=e.setState,n=e.uiCell;if(e.virtualization&&!n){var r=this.refs.r1c1,o=r.querySelector("tr > td:first-of-type");if(o){var a=r.querySelectorAll("tr th:first-of-type");t({uiCell:{height:o.clientHeight},uiHeaders:h.a(function(e){return{height:e.clientHeight}},Array.from(a))})}}}},{key:"render",value:function(){var e=this,t=this.props,n=t.columns,r=t.id,a=t.tooltip_conditional,i=t.tooltip,s=t.currentTooltip,l=t.fill_width,c=t.filter_action,u=t.fixed_columns,p=t.fixed_rows,f=t.loading_state,d=t.scrollbarWidth,b=t.style_as_list_view,v=t.style_table,m=t.tooltip_delay,y=t.tooltip_duration,g=t.tooltip_data,w=t.uiCell,k=t.uiHeaders,O=t.uiViewport,x=t.viewport,_=t.virtualized,E=t.virtualization,S=t.visibleColumns,C=[[p&&u?"dash-fixed-row dash-fixed-column":"",p?"dash-fixed-row":""],[u?"dash-fixed-column":"","dash-fixed-content"]],j=this.tableFn(),A=this.tableFragments(u,p,j,_.offset.rows),P=A.grid,T=A.empty,M=["dash-spreadsheet"].concat(Iu(E?["dash-virtualized"]:[]),Iu(p?["dash-freeze-top"]:[]),Iu(u?["dash-freeze-left"]:[]),Iu(b?["dash-list-view"]:[]),Iu(T[0][1]?["dash-empty-01"]:[]),Iu(T[1][1]?["dash-empty-11"]:[]),Iu(S.length?[]:["dash-no-columns"]),Iu(_.data.length?[]:["dash-no-data"]),Iu(c!==ve.i.None?[]:["dash-no-filter"]),Iu(l?["dash-fill-width"]:[]),Iu(f?["dash-loading"]:[])),F=["dash-spreadsheet-container"].concat(Iu(M)),D=["dash-spreadsheet-inner"].concat(Iu(M)),R=this.calculateTableStyle(v),I=function(e,t,n,r,o,a,i){var s=[{},{fragment:{marginRight:i}}];if(!e||!t||!r)return[s,[{},{}]];var l=t.height*o.data.length,c=(Math.floor(r.scrollTop/t.height)-a.before)*t.height,u=su(h.a(function(e){return e.height},n||[])),p=e&&r&&t?Math.max(c-u,0):0;return[s,[{cell:{marginTop:p}},{fragment:{height:Math.max(l-p,0),marginTop:p}}]]}(E,w,k,O,x,_.padding.rows,d),N=hu(s,g,a,i,_,m,y),z=this.props,L=z.export_columns,B=z.export_format,V=z.export_headers,q=z.virtual,W=z.merge_duplicate_headers,U=z.paginator,K=z.page_current,H=z.page_count,$={export_columns:L,export_format:B,virtual_data:q,columns:n,visibleColumns:S,export_headers:V,merge_duplicate_headers:W};return o.a.createElement("div",{id:r,className:"dash-table-container",onCopy:this.onCopy,onKeyDown:this.handleKeyDown,onPaste:this.onPaste,style:{position:"relative"}},o.a.createElement(Cu,{key:"tooltip",ref:"tooltip",className:"dash-table-tooltip",tooltip:N}),o.a.createElement("div",{className:"dash-spreadsheet-menu"},this.renderMenu(),o.a.createElement(We,Object.assign({},$))),o.a.createElement("div",{className:F.join(" "),style:R},o.a.createElement("div",{ref:"table",className:D.join(" "),style:qu},P.map(function(t,n){return o.a.createElement("div",{key:"r".concat(n),ref:"r".concat(n),className:"row row-".concat(n),onScroll:e.onScroll},function(e,t,n,r){for(var o=e.length,a=new Array(o),i=0;i<o;++i)a[i]=r(e[i],t[i],n[i],i);return a}(t,I[n],C[n],function(e,t,r,a){return o.a.createElement("div",{style:t.fragment,key:a,ref:"r".concat(n,"c").concat(a),className:"cell cell-".concat(n,"-").concat(a," ").concat(r)},e?o.a.cloneElement(e,{style:t.cell}):e)}))}))),this.displayPagination?o.a.createElement(Fu,{paginator:U,page_current:K,page_count:H}):null)}},{key:"renderMenu",value:function(){var e=this;if(!this.showToggleColumns)return null;var t=this.props,n=t.activeMenu,r=t.columns,a=t.hidden_columns,i=t.merge_duplicate_headers,s=t.setState,l=this.labelsAndIndices(r,r,i),c=l.length-1;return o.a.createElement("div",{className:"dash-spreadsheet-menu-item",ref:this.menuRef},o.a.createElement("button",{className:"show-hide",onClick:function(){return s({activeMenu:"show/hide"===n?void 0:"show/hide"})}},"Toggle Columns"),"show/hide"!==n?null:o.a.createElement("div",{className:"show-hide-menu"},L(l.map(function(t,n){var s=Ru(t,2)[1];return s.map(function(t,l){var u=1===s.length,p=r[t],f=!a||a.indexOf(p.id)<0,d=Qt(n,c,p.hideable),h=u&&f||!d&&f;return{i:t,j:l,component:d?o.a.createElement("div",{className:"show-hide-menu-item"},o.a.createElement("input",{type:"checkbox",checked:f,disabled:h,onClick:e.toggleColumn.bind(e,p,n,i)}),o.a.createElement("label",null,p.name?"string"==typeof p.name?p.name:p.name.slice(0,n+1).filter(function(e){return 0!==e.length}).join(" | "):p.id)):null}})})).filter(function(e){return!x.a(e)}).sort(function(e,t){return e.i-t.i||e.j-t.j}).map(function(e){return e.component})))}},{key:"adjustTooltipPosition",value:function(){var e=this.props.currentTooltip;if(e){var t=e.id,n=e.row,r=this.refs,o=r.table;if(r.tooltip){var a=o.querySelector('td[data-dash-column="'.concat(t,'"][data-dash-row="').concat(n,'"]'));this.refs.tooltip.updateBounds(a)}}}},{key:"lexerResult",get:function(){var e=this.props.filter_query;return this.getLexerResult(e)}},{key:"$el",get:function(){return document.getElementById(this.props.id)}},{key:"displayPagination",get:function(){var e=this.props,t=e.data,n=e.page_action,r=e.page_size;return n===ve.i.Native&&r<t.length||n===ve.i.Custom}},{key:"showToggleColumns",get:function(){var e=this.props,t=e.columns,n=e.hidden_columns;return n&&n.length>0||p.a(function(e){return!!e.hideable},t)}}])&&Nu(n.prototype,a),i&&Nu(n,i),t}(),Uu=(n(367),n(369),{prefix:"far",iconName:"eye-slash",icon:[640,512,[],"f070","M634 471L36 3.51A16 16 0 0 0 13.51 6l-10 12.49A16 16 0 0 0 6 41l598 467.49a16 16 0 0 0 22.49-2.49l10-12.49A16 16 0 0 0 634 471zM296.79 146.47l134.79 105.38C429.36 191.91 380.48 144 320 144a112.26 112.26 0 0 0-23.21 2.47zm46.42 219.07L208.42 260.16C210.65 320.09 259.53 368 320 368a113 113 0 0 0 23.21-2.46zM320 112c98.65 0 189.09 55 237.93 144a285.53 285.53 0 0 1-44 60.2l37.74 29.5a333.7 333.7 0 0 0 52.9-75.11 32.35 32.35 0 0 0 0-29.19C550.29 135.59 442.93 64 320 64c-36.7 0-71.71 7-104.63 18.81l46.41 36.29c18.94-4.3 38.34-7.1 58.22-7.1zm0 288c-98.65 0-189.08-55-237.93-144a285.47 285.47 0 0 1 44.05-60.19l-37.74-29.5a333.6 333.6 0 0 0-52.89 75.1 32.35 32.35 0 0 0 0 29.19C89.72 376.41 197.08 448 320 448c36.7 0 71.71-7.05 104.63-18.81l-46.41-36.28C359.28 397.2 339.89 400 320 400z"]}),Ku={prefix:"far",iconName:"trash-alt",icon:[448,512,[],"f2ed","M268 416h24a12 12 0 0 0 12-12V188a12 12 0 0 0-12-12h-24a12 12 0 0 0-12 12v216a12 12 0 0 0 12 12zM432 80h-82.41l-34-56.7A48 48 0 0 0 274.41 0H173.59a48 48 0 0 0-41.16 23.3L98.41 80H16A16 16 0 0 0 0 96v16a16 16 0 0 0 16 16h16v336a48 48 0 0 0 48 48h288a48 48 0 0 0 48-48V128h16a16 16 0 0 0 16-16V96a16 16 0 0 0-16-16zM171.84 50.91A6 6 0 0 1 177 48h94a6 6 0 0 1 5.15 2.91L293.61 80H154.39zM368 464H80V128h288zm-212-48h24a12 12 0 0 0 12-12V188a12 12 0 0 0-12-12h-24a12 12 0 0 0-12 12v216a12 12 0 0 0 12 12z"]},Hu={prefix:"fas",iconName:"angle-double-left",icon:[448,512,[],"f100","M223.7 239l136-136c9.4-9.4 24.6-9.4 33.9 0l22.6 22.6c9.4 9.4 9.4 24.6 0 33.9L319.9 256l96.4 96.4c9.4 9.4 9.4 24.6 0 33.9L393.7 409c-9.4 9.4-24.6 9.4-33.9 0l-136-136c-9.5-9.4-9.5-24.6-.1-34zm-192 34l136 136c9.4 9.4 24.6 9.4 33.9 0l22.6-22.6c9.4-9.4 9.4-24.6 0-33.9L127.9 256l96.4-96.4c9.4-9.4 9.4-24.6 0-33.9L201.7 103c-9.4-9.4-24.6-9.4-33.9 0l-136 136c-9.5 9.4-9.5 24.6-.1 34z"]},$u={prefix:"fas",iconName:"angle-double-right",icon:[448,512,[],"f101","M224.3 273l-136 136c-9.4 9.4-24.6 9.4-33.9 0l-22.6-22.6c-9.4-9.4-9.4-24.6 0-33.9l96.4-96.4-96.4-96.4c-9.4-9.4-9.4-24.6 0-33.9L54.3 103c9.4-9.4 24.6-9.4 33.9 0l136 136c9.5 9.4 9.5 24.6.1 34zm192-34l-136-136c-9.4-9.4-24.6-9.4-33.9 0l-22.6 22.6c-9.4 9.4-9.4 24.6 0 33.9l96.4 96.4-96.4 96.4c-9.4 9.4-9.4 24.6 0 33.9l22.6 22.6c9.4 9.4 24.6 9.4 33.9 0l136-136c9.4-9.2 9.4-24.4 0-33.8z"]},Gu={prefix:"fas",iconName:"angle-left",icon:[256,512,[],"f104","M31.7 239l136-136c9.4-9.4 24.6-9.4 33.9 0l22.6 22.6c9.4 9.4 9.4 24.6 0 33.9L127.9 256l96.4 96.4c9.4 9.4 9.4 24.6 0 33.9L201.7 409c-9.4 9.4-24.6 9.4-33.9 0l-136-136c-9.5-9.4-9.5-24.6-.1-34z"]},Yu={prefix:"fas",iconName:"angle-right",icon:[256,512,[],"f105","M224.3 273l-136 136c-9.4 9.4-24.6 9.4-33.9 0l-22.6-22.6c-9.4-9.4-9.4-24.6 0-33.9l96.4-96.4-96.4-96.4c-9.4-9.4-9.4-24.6 0-33.9L54.3 103c9.4-9.4 24.6-9.4 33.9 0l136 136c9.5 9.4 9.5 24.6.1 34z"]},Zu={prefix:"fas",iconName:"eraser",icon:[512,512,[],"f12d","M497.941 273.941c18.745-18.745 18.745-49.137 0-67.882l-160-160c-18.745-18.745-49.136-18.746-67.883 0l-256 256c-18.745 18.745-18.745 49.137 0 67.882l96 96A48.004 48.004 0 0 0 144 480h356c6.627 0 12-5.373 12-12v-40c0-6.627-5.373-12-12-12H355.883l142.058-142.059zm-302.627-62.627l137.373 137.373L265.373 416H150.628l-80-80 124.686-124.686z"]},Xu={prefix:"fas",iconName:"pencil-alt",icon:[512,512,[],"f303","M497.9 142.1l-46.1 46.1c-4.7 4.7-12.3 4.7-17 0l-111-111c-4.7-4.7-4.7-12.3 0-17l46.1-46.1c18.7-18.7 49.1-18.7 67.9 0l60.1 60.1c18.8 18.7 18.8 49.1 0 67.9zM284.2 99.8L21.6 362.4.4 483.9c-2.9 16.4 11.4 30.6 27.8 27.8l121.5-21.3 262.6-262.6c4.7-4.7 4.7-12.3 0-17l-111-111c-4.8-4.7-12.4-4.7-17.1 0zM124.1 339.9c-5.5-5.5-5.5-14.3 0-19.8l154-154c5.5-5.5 14.3-5.5 19.8 0s5.5 14.3 0 19.8l-154 154c-5.5 5.5-14.3 5.5-19.8 0zM88 424h48v36.3l-64.5 11.3-31.1-31.1L51.7 376H88v48z"]},Ju={prefix:"fas",iconName:"sort",icon:[320,512,[],"f0dc","M41 288h238c21.4 0 32.1 25.9 17 41L177 448c-9.4 9.4-24.6 9.4-33.9 0L24 329c-15.1-15.1-4.4-41 17-41zm255-105L177 64c-9.4-9.4-24.6-9.4-33.9 0L24 183c-15.1 15.1-4.4 41 17 41h238c21.4 0 32.1-25.9 17-41z"]},Qu={prefix:"fas",iconName:"sort-down",icon:[320,512,[],"f0dd","M41 288h238c21.4 0 32.1 25.9 17 41L177 448c-9.4 9.4-24.6 9.4-33.9 0L24 329c-15.1-15.1-4.4-41 17-41z"]},ep={prefix:"fas",iconName:"sort-up",icon:[320,512,[],"f0de","M279 224H41c-21.4 0-32.1-25.9-17-41L143 64c9.4-9.4 24.6-9.4 33.9 0l119 119c15.2 15.1 4.5 41-16.9 41z"]};xc.b.add(Zu,Uu,Xu,Ju,Qu,ep,Ku,Gu,Yu,Hu,$u);n(371);function tp(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function np(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function rp(e,t){return Math.ceil(e.length/t)}function op(e){if(null===e)return{loadNext:function(){},loadPrevious:function(){},loadFirst:function(){},loadLast:function(){},loadPage:function(){},hasPrevious:function(){return!0},hasNext:function(){return!0},isLast:function(){return!1},lastPage:void 0};var t=e.setProps,n=e.page_current,r=e.page_count;function o(){t(function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?tp(Object(n),!0).forEach(function(t){np(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):tp(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}({page_current:n},he))}function a(e){e=Math.max(0,e),e=r?Math.min(r-1,e):e,n=e,o()}return{loadNext:function(){return a(n+1)},loadPrevious:function(){return a(n-1)},loadFirst:function(){return a(0)},loadPage:a,loadLast:function(){r&&a(r-1)},hasPrevious:function(){return 0!==n},hasNext:function(){return!r||n!==r-1},isLast:function(){return!!r&&n===r-1},lastPage:r?Math.max(0,r-1):void 0}}var ap=Object(f.b)(function(e,t,n,r,o,a){return e===ve.i.Native&&(r=rp(a,n)),r&&(r=Math.max(r,1)),op(e===ve.i.None?null:{setProps:o,page_current:t,page_count:r})}),ip=Object(f.b)(function(e,t){return e.map(function(e){return e.id}).filter(function(e){return-1!==t.indexOf(e)})}),sp=Object(f.b)(function(e,t){var n=new Map;ge(P.a)(function(e,t){n.set(e,t)},e);var r=[];return P.a(function(e){var t=n.get(e);void 0!==t&&r.push(t)},t),r});var lp=Object(f.b)(function(e,t,n,r,o){switch(e){case ve.i.None:return function(e,t){return{data:e,indices:t}}(r,o);case ve.i.Native:return function(e,t,n,r){var o=t*Math.min(e,rp(n,t)),a=Math.min(o+t,n.length);return{data:n.slice(o,a),indices:r.slice(o,a)}}(t,n,r,o);case ve.i.Custom:return function(e,t){return{data:e,indices:t}}(r,o);default:throw new Error("Unknown pagination mode: '".concat(e,"'"))}}),cp=Object(f.b)(function(e,t,n,r,o){var a=arguments.length>5&&void 0!==arguments[5]?arguments[5]:[],i=new Map;if(ge(P.a)(function(e,t){i.set(e,t)},t),n===ve.i.Native){var s=new Es(r);t=s.isValid?s.filter(t):t}var l=function(t){var n=nt(function(e){return e.id===t},e);return n&&n.sort_as_null||[]},c=function(e,t){return x.a(e)||T.a(e,l(t))};o===ve.i.Native&&(t=mc(t,a,c));var u=h.a(function(e){return i.get(e)},t);return{data:t,indices:u}});function up(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function pp(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var fp=Object(f.b)(function(e,t,n,r,o){if(!e)return function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?up(Object(n),!0).forEach(function(t){pp(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):up(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}({},o,{offset:{rows:0,columns:0},padding:{rows:{before:0,after:0}}});if(!r||!t)return{data:o.data.slice(0,1),indices:o.indices.slice(0,1),offset:{rows:0,columns:0},padding:{rows:{before:0,after:0}}};var a=su(h.a(function(e){return e.height},n||[])),i=Math.max(r.scrollTop-a,0),s=Math.max(a-r.scrollTop,0),l=Math.floor(i/t.height),c=Math.ceil((r.height-s+i)/t.height),u=Math.min(l,1),p=Math.min(o.data.length-c,1);return l-=u,c+=p,{data:o.data.slice(l,c),indices:o.indices.slice(l,c),offset:{rows:l,columns:0},padding:{rows:{before:u,after:p}}}}),dp=function(){var e=ap(),t=lp(),n=ip(),r=sp(),o=cp(),a=sp(),i=fp();return function(s,l,c,u){var p=rn.a(c,u),f=p.data,h=p.filter_query,b=p.filter_action,v=p.page_action,m=p.page_current,y=p.page_size,g=p.page_count,w=p.selected_columns,k=p.selected_rows,O=p.sort_action,x=p.sort_by,_=p.uiCell,E=p.uiHeaders,S=p.uiViewport,C=p.virtualization,j=p.visibleColumns,A=o(j,f,b,h,O,x),P=t(v,m,y,A.data,A.indices),T=i(C,_,E,S,P),M=a(A.indices,k),F=n(j,w),D=r(P.indices,k),R=e(v,m,y,g,s,A.data);return d.a([c,u,{paginator:R,setProps:s,setState:l,viewport:P,viewport_selected_columns:F,viewport_selected_rows:D,virtual:A,virtual_selected_rows:M,virtualized:T}])}},hp=function(){var e=Object(f.c)(function(e){return e}),t=Object(f.c)(function(e,t){return[e,t]}),n=Object(f.c)(function(e){return e}),r=Object(f.c)(function(e){return e}),o=Object(f.c)(function(e){return e}),a=Object(f.c)(function(e){return e}),i=Object(f.c)(function(e){return e}),s=Object(f.c)(function(e){return e}),l=Object(f.c)(function(e){return new Es(e).toStructure()});return function(c,u){var p=c.filter_query,f=c.filter_action,d=c.page_action,b=c.page_current,v=c.page_size,m=c.sort_action,y=c.sort_by,g=c.viewport,w=c.viewport_selected_columns,k=c.viewport_selected_rows,O=c.virtual,x=c.virtual_selected_rows,_=l(p),E=r(g).cached,S=i(O).cached,C=o(w).cached,j=a(k).cached,A=s(x).cached,P=e(p),T=t(b,v),M=n(y),F=!P.cached&&!P.first&&f===ve.i.Custom||!T.cached&&!T.first&&d===ve.i.Custom||!M.cached&&!M.first&&m===ve.i.Custom,D={};_.cached||(D.derived_filter_query_structure=_.result),S||(D.derived_virtual_data=O.data,D.derived_virtual_indices=O.indices,D.derived_virtual_row_ids=Q.a("id",O.data)),E||(D.derived_viewport_data=g.data,D.derived_viewport_indices=g.indices,D.derived_viewport_row_ids=Q.a("id",g.data)),A||(D.derived_virtual_selected_rows=x,D.derived_virtual_selected_row_ids=h.a(function(e){return O.data[e].id},x)),C||(D.derived_viewport_selected_columns=w),j||(D.derived_viewport_selected_rows=k,D.derived_viewport_selected_row_ids=h.a(function(e){return g.data[e].id},k)),F&&(D.active_cell=void 0,D.selected_cells=[],D.start_cell=void 0,D.end_cell=void 0,D.selected_rows=[],D.selected_row_ids=[]),Ce.a(D).length&&setTimeout(function(){return u(D)},0)}};function bp(e){return(bp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function vp(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function mp(e,t){return!t||"object"!==bp(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function yp(e){return(yp=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function gp(e,t){return(gp=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var wp=/^derived_/,kp=function(e){function t(e){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=mp(this,yp(t).call(this,e))).__setProps=Object(f.a)(function(e){return e?function(t){if(l("data",t)){var r=n.props.data;t.data_timestamp=Date.now(),t.data_previous=r}e(t)}:function(e){n.setState(e)}}),n.__setState=Object(f.a)(function(){return function(e){return n.setState(e)}}),n.filterMap=Gl(),n.controlledPropsHelper=dp(),n.updateDerivedProps=hp(),n.state={forcedResizeOnly:!1,workFilter:{value:e.filter_query,map:n.filterMap(new Map,e.filter_query,e.visibleColumns)},rawFilterQuery:"",scrollbarWidth:0},n}var n,a,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&gp(e,t)}(t,r["Component"]),n=t,(a=[{key:"componentWillReceiveProps",value:function(e){var t=this;this.setState(function(n){var r=n.applyFocus,o=n.workFilter,a=o.map,i=o.value,s={};if(e.filter_query!==t.props.filter_query&&i!==e.filter_query){var l=t.filterMap(a,e.filter_query,e.visibleColumns);l!==a&&(s.workFilter={map:l,value:i})}if(e.active_cell!==t.props.active_cell)s.applyFocus=!0;else if(e.loading_state!==t.props.loading_state){var c=document.activeElement,p=zr.getFirstParentOfType(c,"td"),f=zr.getParentById(p,t.props.id);s.applyFocus=!!f}return s.applyFocus===r&&delete s.applyFocus,u(s).length?s:null})}},{key:"shouldComponentUpdate",value:function(e,t){var n=this.props,r=this.state;return p.a(function(t){return!wp.test(t)&&n[t]!==e[t]},u(n))||!Object(bu.a)(r,t)}},{key:"render",value:function(){var e=this.controlledPropsHelper(this.controlledSetProps,this.controlledSetState,this.props,this.state);return this.updateDerivedProps(e,this.controlledSetProps),o.a.createElement(Wu,Object.assign({},e))}},{key:"controlledSetProps",get:function(){return this.__setProps(this.props.setProps)}},{key:"controlledSetState",get:function(){return this.__setState()}}])&&vp(n.prototype,a),i&&vp(n,i),t}(),Op=n(96),xp=n(97),_p=n(99),Ep=n(71);function Sp(e){return(Sp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Cp(){return(Cp=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function jp(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Ap(e,t){return!t||"object"!==Sp(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function Pp(e){return(Pp=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Tp(e,t){return(Tp=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}n.d(t,"default",function(){return Mp});var Mp=function(e){function t(e){var n,r;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=Ap(this,Pp(t).call(this,e))).getId=function(){return r=r||Object(Op.a)("table-")},n.sanitizer=new _p.a,n}var n,a,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Tp(e,t)}(t,r["Component"]),n=t,(a=[{key:"render",value:function(){if(!Object(xp.a)(this.props))return o.a.createElement("div",null,"Invalid props combination");var e=this.sanitizer.sanitize(this.props);return this.props.id?o.a.createElement(kp,e):o.a.createElement(kp,Cp({},e,{id:this.getId()}))}}])&&jp(n.prototype,a),i&&jp(n,i),t}();Mp.defaultProps=Ep.b,Mp.propTypes=Ep.c},32:function(e,t,n){"use strict";var r;n.d(t,"a",function(){return r}),function(e){e.Text="text",e.Markdown="markdown"}(r||(r={}))},351:function(e,t,n){"use strict";var r=n(127),o=n(2),a=Object(o.a)(Object(r.a)("forEach",function(e,t){for(var n=t.length,r=0;r<n;)e(t[r]),r+=1;return t}));t.a=a},352:function(e,t,n){"use strict";var r=n(126),o=n(2),a=Object(o.a)(r.a);t.a=a},353:function(e,t,n){"use strict";var r=n(2);function o(e){return"[object Number]"===Object.prototype.toString.call(e)}var a=Object(r.a)(function(e,t){if(!o(e)||!o(t))throw new TypeError("Both arguments to range must be numbers");for(var n=[],r=e;r<t;)n.push(r),r+=1;return n});t.a=a},354:function(e,t){var n;n=function(){return this}();try{n=n||new Function("return this")()}catch(e){"object"==typeof window&&(n=window)}e.exports=n},355:function(e,t,n){"use strict";var r=n(362);e.exports=function(e){var t=typeof e;if("string"===t){var n=e;if(0===(e=+e)&&r(n))return!1}else if("number"!==t)return!1;return e-e<1}},357:function(e,t,n){"use strict";(function(e,r){function o(e){return(o="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function a(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function i(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function s(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{},r=Object.keys(n);"function"==typeof Object.getOwnPropertySymbols&&(r=r.concat(Object.getOwnPropertySymbols(n).filter(function(e){return Object.getOwnPropertyDescriptor(n,e).enumerable}))),r.forEach(function(t){i(e,t,n[t])})}return e}function l(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=[],r=!0,o=!1,a=void 0;try{for(var i,s=e[Symbol.iterator]();!(r=(i=s.next()).done)&&(n.push(i.value),!t||n.length!==t);r=!0);}catch(e){o=!0,a=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw a}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}n.d(t,"a",function(){return Fe}),n.d(t,"b",function(){return Pe}),n.d(t,"c",function(){return Me});var c=function(){},u={},p={},f={mark:c,measure:c};try{"undefined"!=typeof window&&(u=window),"undefined"!=typeof document&&(p=document),"undefined"!=typeof MutationObserver&&MutationObserver,"undefined"!=typeof performance&&(f=performance)}catch(e){}var d=(u.navigator||{}).userAgent,h=void 0===d?"":d,b=u,v=p,m=f,y=(b.document,!!v.documentElement&&!!v.head&&"function"==typeof v.addEventListener&&"function"==typeof v.createElement),g=(~h.indexOf("MSIE")||h.indexOf("Trident/"),"fa"),w="svg-inline--fa",k="data-fa-i2svg",O=(function(){try{}catch(e){return!1}}(),[1,2,3,4,5,6,7,8,9,10]),x=O.concat([11,12,13,14,15,16,17,18,19,20]),_={GROUP:"group",SWAP_OPACITY:"swap-opacity",PRIMARY:"primary",SECONDARY:"secondary"},E=(["xs","sm","lg","fw","ul","li","border","pull-left","pull-right","spin","pulse","rotate-90","rotate-180","rotate-270","flip-horizontal","flip-vertical","flip-both","stack","stack-1x","stack-2x","inverse","layers","layers-text","layers-counter",_.GROUP,_.SWAP_OPACITY,_.PRIMARY,_.SECONDARY].concat(O.map(function(e){return"".concat(e,"x")})).concat(x.map(function(e){return"w-".concat(e)})),b.FontAwesomeConfig||{});if(v&&"function"==typeof v.querySelector){[["data-family-prefix","familyPrefix"],["data-replacement-class","replacementClass"],["data-auto-replace-svg","autoReplaceSvg"],["data-auto-add-css","autoAddCss"],["data-auto-a11y","autoA11y"],["data-search-pseudo-elements","searchPseudoElements"],["data-observe-mutations","observeMutations"],["data-mutate-approach","mutateApproach"],["data-keep-original-source","keepOriginalSource"],["data-measure-performance","measurePerformance"],["data-show-missing-icons","showMissingIcons"]].forEach(function(e){var t=l(e,2),n=t[0],r=t[1],o=function(e){return""===e||"false"!==e&&("true"===e||e)}(function(e){var t=v.querySelector("script["+e+"]");if(t)return t.getAttribute(e)}(n));null!=o&&(E[r]=o)})}var S=s({},{familyPrefix:g,replacementClass:w,autoReplaceSvg:!0,autoAddCss:!0,autoA11y:!0,searchPseudoElements:!1,observeMutations:!0,mutateApproach:"async",keepOriginalSource:!0,measurePerformance:!1,showMissingIcons:!0},E);S.autoReplaceSvg||(S.observeMutations=!1);var C=s({},S);b.FontAwesomeConfig=C;var j=b||{};j.___FONT_AWESOME___||(j.___FONT_AWESOME___={}),j.___FONT_AWESOME___.styles||(j.___FONT_AWESOME___.styles={}),j.___FONT_AWESOME___.hooks||(j.___FONT_AWESOME___.hooks={}),j.___FONT_AWESOME___.shims||(j.___FONT_AWESOME___.shims=[]);var A=j.___FONT_AWESOME___,P=[];y&&((v.documentElement.doScroll?/^loaded|^c/:/^loaded|^i|^c/).test(v.readyState)||v.addEventListener("DOMContentLoaded",function e(){v.removeEventListener("DOMContentLoaded",e),1,P.map(function(e){return e()})}));var T,M="pending",F="settled",D="fulfilled",R="rejected",I=function(){},N=void 0!==e&&void 0!==e.process&&"function"==typeof e.process.emit,z=void 0===r?setTimeout:r,L=[];function B(){for(var e=0;e<L.length;e++)L[e][0](L[e][1]);L=[],T=!1}function V(e,t){L.push([e,t]),T||(T=!0,z(B,0))}function q(e){var t=e.owner,n=t._state,r=t._data,o=e[n],a=e.then;if("function"==typeof o){n=D;try{r=o(r)}catch(e){H(a,e)}}W(a,r)||(n===D&&U(a,r),n===R&&H(a,r))}function W(e,t){var n;try{if(e===t)throw new TypeError("A promises callback cannot return that same promise.");if(t&&("function"==typeof t||"object"===o(t))){var r=t.then;if("function"==typeof r)return r.call(t,function(r){n||(n=!0,t===r?K(e,r):U(e,r))},function(t){n||(n=!0,H(e,t))}),!0}}catch(t){return n||H(e,t),!0}return!1}function U(e,t){e!==t&&W(e,t)||K(e,t)}function K(e,t){e._state===M&&(e._state=F,e._data=t,V(G,e))}function H(e,t){e._state===M&&(e._state=F,e._data=t,V(Y,e))}function $(e){e._then=e._then.forEach(q)}function G(e){e._state=D,$(e)}function Y(t){t._state=R,$(t),!t._handled&&N&&e.process.emit("unhandledRejection",t._data,t)}function Z(t){e.process.emit("rejectionHandled",t)}function X(e){if("function"!=typeof e)throw new TypeError("Promise resolver "+e+" is not a function");if(this instanceof X==!1)throw new TypeError("Failed to construct 'Promise': Please use the 'new' operator, this object constructor cannot be called as a function.");this._then=[],function(e,t){function n(e){H(t,e)}try{e(function(e){U(t,e)},n)}catch(e){n(e)}}(e,this)}X.prototype={constructor:X,_state:M,_then:null,_data:void 0,_handled:!1,then:function(e,t){var n={owner:this,then:new this.constructor(I),fulfilled:e,rejected:t};return!t&&!e||this._handled||(this._handled=!0,this._state===R&&N&&V(Z,this)),this._state===D||this._state===R?V(q,n):this._then.push(n),n.then},catch:function(e){return this.then(null,e)}},X.all=function(e){if(!Array.isArray(e))throw new TypeError("You must pass an array to Promise.all().");return new X(function(t,n){var r=[],o=0;function a(e){return o++,function(n){r[e]=n,--o||t(r)}}for(var i,s=0;s<e.length;s++)(i=e[s])&&"function"==typeof i.then?i.then(a(s),n):r[s]=i;o||t(r)})},X.race=function(e){if(!Array.isArray(e))throw new TypeError("You must pass an array to Promise.race().");return new X(function(t,n){for(var r,o=0;o<e.length;o++)(r=e[o])&&"function"==typeof r.then?r.then(t,n):t(r)})},X.resolve=function(e){return e&&"object"===o(e)&&e.constructor===X?e:new X(function(t){t(e)})},X.reject=function(e){return new X(function(t,n){n(e)})};"function"==typeof Promise&&Promise;var J={size:16,x:0,y:0,rotate:0,flipX:!1,flipY:!1};function Q(e){if(e&&y){var t=v.createElement("style");t.setAttribute("type","text/css"),t.innerHTML=e;for(var n=v.head.childNodes,r=null,o=n.length-1;o>-1;o--){var a=n[o],i=(a.tagName||"").toUpperCase();["STYLE","LINK"].indexOf(i)>-1&&(r=a)}return v.head.insertBefore(t,r),e}}var ee="0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ";function te(){for(var e=12,t="";e-- >0;)t+=ee[62*Math.random()|0];return t}function ne(e){return"".concat(e).replace(/&/g,"&amp;").replace(/"/g,"&quot;").replace(/'/g,"&#39;").replace(/</g,"&lt;").replace(/>/g,"&gt;")}function re(e){return Object.keys(e||{}).reduce(function(t,n){return t+"".concat(n,": ").concat(e[n],";")},"")}function oe(e){return e.size!==J.size||e.x!==J.x||e.y!==J.y||e.rotate!==J.rotate||e.flipX||e.flipY}function ae(e){var t=e.transform,n=e.containerWidth,r=e.iconWidth,o={transform:"translate(".concat(n/2," 256)")},a="translate(".concat(32*t.x,", ").concat(32*t.y,") "),i="scale(".concat(t.size/16*(t.flipX?-1:1),", ").concat(t.size/16*(t.flipY?-1:1),") "),s="rotate(".concat(t.rotate," 0 0)");return{outer:o,inner:{transform:"".concat(a," ").concat(i," ").concat(s)},path:{transform:"translate(".concat(r/2*-1," -256)")}}}var ie={x:0,y:0,width:"100%",height:"100%"};function se(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];return e.attributes&&(e.attributes.fill||t)&&(e.attributes.fill="black"),e}function le(e){var t=e.icons,n=t.main,r=t.mask,o=e.prefix,a=e.iconName,i=e.transform,l=e.symbol,c=e.title,u=e.extra,p=e.watchable,f=void 0!==p&&p,d=r.found?r:n,h=d.width,b=d.height,v="fa-w-".concat(Math.ceil(h/b*16)),m=[C.replacementClass,a?"".concat(C.familyPrefix,"-").concat(a):"",v].filter(function(e){return-1===u.classes.indexOf(e)}).concat(u.classes).join(" "),y={children:[],attributes:s({},u.attributes,{"data-prefix":o,"data-icon":a,class:m,role:u.attributes.role||"img",xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 ".concat(h," ").concat(b)})};f&&(y.attributes[k]=""),c&&y.children.push({tag:"title",attributes:{id:y.attributes["aria-labelledby"]||"title-".concat(te())},children:[c]});var g=s({},y,{prefix:o,iconName:a,main:n,mask:r,transform:i,symbol:l,styles:u.styles}),w=r.found&&n.found?function(e){var t,n=e.children,r=e.attributes,o=e.main,a=e.mask,i=e.transform,l=o.width,c=o.icon,u=a.width,p=a.icon,f=ae({transform:i,containerWidth:u,iconWidth:l}),d={tag:"rect",attributes:s({},ie,{fill:"white"})},h=c.children?{children:c.children.map(se)}:{},b={tag:"g",attributes:s({},f.inner),children:[se(s({tag:c.tag,attributes:s({},c.attributes,f.path)},h))]},v={tag:"g",attributes:s({},f.outer),children:[b]},m="mask-".concat(te()),y="clip-".concat(te()),g={tag:"mask",attributes:s({},ie,{id:m,maskUnits:"userSpaceOnUse",maskContentUnits:"userSpaceOnUse"}),children:[d,v]},w={tag:"defs",children:[{tag:"clipPath",attributes:{id:y},children:(t=p,"g"===t.tag?t.children:[t])},g]};return n.push(w,{tag:"rect",attributes:s({fill:"currentColor","clip-path":"url(#".concat(y,")"),mask:"url(#".concat(m,")")},ie)}),{children:n,attributes:r}}(g):function(e){var t=e.children,n=e.attributes,r=e.main,o=e.transform,a=re(e.styles);if(a.length>0&&(n.style=a),oe(o)){var i=ae({transform:o,containerWidth:r.width,iconWidth:r.width});t.push({tag:"g",attributes:s({},i.outer),children:[{tag:"g",attributes:s({},i.inner),children:[{tag:r.icon.tag,children:r.icon.children,attributes:s({},r.icon.attributes,i.path)}]}]})}else t.push(r.icon);return{children:t,attributes:n}}(g),O=w.children,x=w.attributes;return g.children=O,g.attributes=x,l?function(e){var t=e.prefix,n=e.iconName,r=e.children,o=e.attributes,a=e.symbol;return[{tag:"svg",attributes:{style:"display: none;"},children:[{tag:"symbol",attributes:s({},o,{id:!0===a?"".concat(t,"-").concat(C.familyPrefix,"-").concat(n):a}),children:r}]}]}(g):function(e){var t=e.children,n=e.main,r=e.mask,o=e.attributes,a=e.styles,i=e.transform;if(oe(i)&&n.found&&!r.found){var l={x:n.width/n.height/2,y:.5};o.style=re(s({},a,{"transform-origin":"".concat(l.x+i.x/16,"em ").concat(l.y+i.y/16,"em")}))}return[{tag:"svg",attributes:o,children:t}]}(g)}var ce=function(){},ue=(C.measurePerformance&&m&&m.mark&&m.measure,function(e,t,n,r){var o,a,i,s=Object.keys(e),l=s.length,c=void 0!==r?function(e,t){return function(n,r,o,a){return e.call(t,n,r,o,a)}}(t,r):t;for(void 0===n?(o=1,i=e[s[0]]):(o=0,i=n);o<l;o++)i=c(i,e[a=s[o]],a,e);return i});function pe(e,t){var n=(arguments.length>2&&void 0!==arguments[2]?arguments[2]:{}).skipHooks,r=void 0!==n&&n,o=Object.keys(t).reduce(function(e,n){var r=t[n];return!!r.icon?e[r.iconName]=r.icon:e[n]=r,e},{});"function"!=typeof A.hooks.addPack||r?A.styles[e]=s({},A.styles[e]||{},o):A.hooks.addPack(e,o),"fas"===e&&pe("fa",t)}var fe=A.styles,de=A.shims,he=function(){var e=function(e){return ue(fe,function(t,n,r){return t[r]=ue(n,e,{}),t},{})};e(function(e,t,n){return t[3]&&(e[t[3]]=n),e}),e(function(e,t,n){var r=t[2];return e[n]=n,r.forEach(function(t){e[t]=n}),e});var t="far"in fe;ue(de,function(e,n){var r=n[0],o=n[1],a=n[2];return"far"!==o||t||(o="fas"),e[r]={prefix:o,iconName:a},e},{})};he();A.styles;function be(e,t,n){if(e&&e[t]&&e[t][n])return{prefix:t,iconName:n,icon:e[t][n]}}function ve(e){var t=e.tag,n=e.attributes,r=void 0===n?{}:n,o=e.children,a=void 0===o?[]:o;return"string"==typeof e?ne(e):"<".concat(t," ").concat(function(e){return Object.keys(e||{}).reduce(function(t,n){return t+"".concat(n,'="').concat(ne(e[n]),'" ')},"").trim()}(r),">").concat(a.map(ve).join(""),"</").concat(t,">")}var me=function(e){var t={size:16,x:0,y:0,flipX:!1,flipY:!1,rotate:0};return e?e.toLowerCase().split(" ").reduce(function(e,t){var n=t.toLowerCase().split("-"),r=n[0],o=n.slice(1).join("-");if(r&&"h"===o)return e.flipX=!0,e;if(r&&"v"===o)return e.flipY=!0,e;if(o=parseFloat(o),isNaN(o))return e;switch(r){case"grow":e.size=e.size+o;break;case"shrink":e.size=e.size-o;break;case"left":e.x=e.x-o;break;case"right":e.x=e.x+o;break;case"up":e.y=e.y-o;break;case"down":e.y=e.y+o;break;case"rotate":e.rotate=e.rotate+o}return e},t):t};function ye(e){this.name="MissingIcon",this.message=e||"Icon unavailable",this.stack=(new Error).stack}ye.prototype=Object.create(Error.prototype),ye.prototype.constructor=ye;var ge={fill:"currentColor"},we={attributeType:"XML",repeatCount:"indefinite",dur:"2s"},ke={tag:"path",attributes:s({},ge,{d:"M156.5,447.7l-12.6,29.5c-18.7-9.5-35.9-21.2-51.5-34.9l22.7-22.7C127.6,430.5,141.5,440,156.5,447.7z M40.6,272H8.5 c1.4,21.2,5.4,41.7,11.7,61.1L50,321.2C45.1,305.5,41.8,289,40.6,272z M40.6,240c1.4-18.8,5.2-37,11.1-54.1l-29.5-12.6 C14.7,194.3,10,216.7,8.5,240H40.6z M64.3,156.5c7.8-14.9,17.2-28.8,28.1-41.5L69.7,92.3c-13.7,15.6-25.5,32.8-34.9,51.5 L64.3,156.5z M397,419.6c-13.9,12-29.4,22.3-46.1,30.4l11.9,29.8c20.7-9.9,39.8-22.6,56.9-37.6L397,419.6z M115,92.4 c13.9-12,29.4-22.3,46.1-30.4l-11.9-29.8c-20.7,9.9-39.8,22.6-56.8,37.6L115,92.4z M447.7,355.5c-7.8,14.9-17.2,28.8-28.1,41.5 l22.7,22.7c13.7-15.6,25.5-32.9,34.9-51.5L447.7,355.5z M471.4,272c-1.4,18.8-5.2,37-11.1,54.1l29.5,12.6 c7.5-21.1,12.2-43.5,13.6-66.8H471.4z M321.2,462c-15.7,5-32.2,8.2-49.2,9.4v32.1c21.2-1.4,41.7-5.4,61.1-11.7L321.2,462z M240,471.4c-18.8-1.4-37-5.2-54.1-11.1l-12.6,29.5c21.1,7.5,43.5,12.2,66.8,13.6V471.4z M462,190.8c5,15.7,8.2,32.2,9.4,49.2h32.1 c-1.4-21.2-5.4-41.7-11.7-61.1L462,190.8z M92.4,397c-12-13.9-22.3-29.4-30.4-46.1l-29.8,11.9c9.9,20.7,22.6,39.8,37.6,56.9 L92.4,397z M272,40.6c18.8,1.4,36.9,5.2,54.1,11.1l12.6-29.5C317.7,14.7,295.3,10,272,8.5V40.6z M190.8,50 c15.7-5,32.2-8.2,49.2-9.4V8.5c-21.2,1.4-41.7,5.4-61.1,11.7L190.8,50z M442.3,92.3L419.6,115c12,13.9,22.3,29.4,30.5,46.1 l29.8-11.9C470,128.5,457.3,109.4,442.3,92.3z M397,92.4l22.7-22.7c-15.6-13.7-32.8-25.5-51.5-34.9l-12.6,29.5 C370.4,72.1,384.4,81.5,397,92.4z"})},Oe=s({},we,{attributeName:"opacity"});s({},ge,{cx:"256",cy:"364",r:"28"}),s({},we,{attributeName:"r",values:"28;14;28;28;14;28;"}),s({},Oe,{values:"1;0;1;1;0;1;"}),s({},ge,{opacity:"1",d:"M263.7,312h-16c-6.6,0-12-5.4-12-12c0-71,77.4-63.9,77.4-107.8c0-20-17.8-40.2-57.4-40.2c-29.1,0-44.3,9.6-59.2,28.7 c-3.9,5-11.1,6-16.2,2.4l-13.1-9.2c-5.6-3.9-6.9-11.8-2.6-17.2c21.2-27.2,46.4-44.7,91.2-44.7c52.3,0,97.4,29.8,97.4,80.2 c0,67.6-77.4,63.5-77.4,107.8C275.7,306.6,270.3,312,263.7,312z"}),s({},Oe,{values:"1;0;0;0;0;1;"}),s({},ge,{opacity:"0",d:"M232.5,134.5l7,168c0.3,6.4,5.6,11.5,12,11.5h9c6.4,0,11.7-5.1,12-11.5l7-168c0.3-6.8-5.2-12.5-12-12.5h-23 C237.7,122,232.2,127.7,232.5,134.5z"}),s({},Oe,{values:"0;0;1;1;0;0;"}),A.styles;function xe(e){var t=e[0],n=e[1],r=l(e.slice(4),1)[0];return{found:!0,width:t,height:n,icon:Array.isArray(r)?{tag:"g",attributes:{class:"".concat(C.familyPrefix,"-").concat(_.GROUP)},children:[{tag:"path",attributes:{class:"".concat(C.familyPrefix,"-").concat(_.SECONDARY),fill:"currentColor",d:r[0]}},{tag:"path",attributes:{class:"".concat(C.familyPrefix,"-").concat(_.PRIMARY),fill:"currentColor",d:r[1]}}]}:{tag:"path",attributes:{fill:"currentColor",d:r}}}}A.styles;var _e='svg:not(:root).svg-inline--fa {\n  overflow: visible;\n}\n\n.svg-inline--fa {\n  display: inline-block;\n  font-size: inherit;\n  height: 1em;\n  overflow: visible;\n  vertical-align: -0.125em;\n}\n.svg-inline--fa.fa-lg {\n  vertical-align: -0.225em;\n}\n.svg-inline--fa.fa-w-1 {\n  width: 0.0625em;\n}\n.svg-inline--fa.fa-w-2 {\n  width: 0.125em;\n}\n.svg-inline--fa.fa-w-3 {\n  width: 0.1875em;\n}\n.svg-inline--fa.fa-w-4 {\n  width: 0.25em;\n}\n.svg-inline--fa.fa-w-5 {\n  width: 0.3125em;\n}\n.svg-inline--fa.fa-w-6 {\n  width: 0.375em;\n}\n.svg-inline--fa.fa-w-7 {\n  width: 0.4375em;\n}\n.svg-inline--fa.fa-w-8 {\n  width: 0.5em;\n}\n.svg-inline--fa.fa-w-9 {\n  width: 0.5625em;\n}\n.svg-inline--fa.fa-w-10 {\n  width: 0.625em;\n}\n.svg-inline--fa.fa-w-11 {\n  width: 0.6875em;\n}\n.svg-inline--fa.fa-w-12 {\n  width: 0.75em;\n}\n.svg-inline--fa.fa-w-13 {\n  width: 0.8125em;\n}\n.svg-inline--fa.fa-w-14 {\n  width: 0.875em;\n}\n.svg-inline--fa.fa-w-15 {\n  width: 0.9375em;\n}\n.svg-inline--fa.fa-w-16 {\n  width: 1em;\n}\n.svg-inline--fa.fa-w-17 {\n  width: 1.0625em;\n}\n.svg-inline--fa.fa-w-18 {\n  width: 1.125em;\n}\n.svg-inline--fa.fa-w-19 {\n  width: 1.1875em;\n}\n.svg-inline--fa.fa-w-20 {\n  width: 1.25em;\n}\n.svg-inline--fa.fa-pull-left {\n  margin-right: 0.3em;\n  width: auto;\n}\n.svg-inline--fa.fa-pull-right {\n  margin-left: 0.3em;\n  width: auto;\n}\n.svg-inline--fa.fa-border {\n  height: 1.5em;\n}\n.svg-inline--fa.fa-li {\n  width: 2em;\n}\n.svg-inline--fa.fa-fw {\n  width: 1.25em;\n}\n\n.fa-layers svg.svg-inline--fa {\n  bottom: 0;\n  left: 0;\n  margin: auto;\n  position: absolute;\n  right: 0;\n  top: 0;\n}\n\n.fa-layers {\n  display: inline-block;\n  height: 1em;\n  position: relative;\n  text-align: center;\n  vertical-align: -0.125em;\n  width: 1em;\n}\n.fa-layers svg.svg-inline--fa {\n  -webkit-transform-origin: center center;\n          transform-origin: center center;\n}\n\n.fa-layers-counter, .fa-layers-text {\n  display: inline-block;\n  position: absolute;\n  text-align: center;\n}\n\n.fa-layers-text {\n  left: 50%;\n  top: 50%;\n  -webkit-transform: translate(-50%, -50%);\n          transform: translate(-50%, -50%);\n  -webkit-transform-origin: center center;\n          transform-origin: center center;\n}\n\n.fa-layers-counter {\n  background-color: #ff253a;\n  border-radius: 1em;\n  -webkit-box-sizing: border-box;\n          box-sizing: border-box;\n  color: #fff;\n  height: 1.5em;\n  line-height: 1;\n  max-width: 5em;\n  min-width: 1.5em;\n  overflow: hidden;\n  padding: 0.25em;\n  right: 0;\n  text-overflow: ellipsis;\n  top: 0;\n  -webkit-transform: scale(0.25);\n          transform: scale(0.25);\n  -webkit-transform-origin: top right;\n          transform-origin: top right;\n}\n\n.fa-layers-bottom-right {\n  bottom: 0;\n  right: 0;\n  top: auto;\n  -webkit-transform: scale(0.25);\n          transform: scale(0.25);\n  -webkit-transform-origin: bottom right;\n          transform-origin: bottom right;\n}\n\n.fa-layers-bottom-left {\n  bottom: 0;\n  left: 0;\n  right: auto;\n  top: auto;\n  -webkit-transform: scale(0.25);\n          transform: scale(0.25);\n  -webkit-transform-origin: bottom left;\n          transform-origin: bottom left;\n}\n\n.fa-layers-top-right {\n  right: 0;\n  top: 0;\n  -webkit-transform: scale(0.25);\n          transform: scale(0.25);\n  -webkit-transform-origin: top right;\n          transform-origin: top right;\n}\n\n.fa-layers-top-left {\n  left: 0;\n  right: auto;\n  top: 0;\n  -webkit-transform: scale(0.25);\n          transform: scale(0.25);\n  -webkit-transform-origin: top left;\n          transform-origin: top left;\n}\n\n.fa-lg {\n  font-size: 1.3333333333em;\n  line-height: 0.75em;\n  vertical-align: -0.0667em;\n}\n\n.fa-xs {\n  font-size: 0.75em;\n}\n\n.fa-sm {\n  font-size: 0.875em;\n}\n\n.fa-1x {\n  font-size: 1em;\n}\n\n.fa-2x {\n  font-size: 2em;\n}\n\n.fa-3x {\n  font-size: 3em;\n}\n\n.fa-4x {\n  font-size: 4em;\n}\n\n.fa-5x {\n  font-size: 5em;\n}\n\n.fa-6x {\n  font-size: 6em;\n}\n\n.fa-7x {\n  font-size: 7em;\n}\n\n.fa-8x {\n  font-size: 8em;\n}\n\n.fa-9x {\n  font-size: 9em;\n}\n\n.fa-10x {\n  font-size: 10em;\n}\n\n.fa-fw {\n  text-align: center;\n  width: 1.25em;\n}\n\n.fa-ul {\n  list-style-type: none;\n  margin-left: 2.5em;\n  padding-left: 0;\n}\n.fa-ul > li {\n  position: relative;\n}\n\n.fa-li {\n  left: -2em;\n  position: absolute;\n  text-align: center;\n  width: 2em;\n  line-height: inherit;\n}\n\n.fa-border {\n  border: solid 0.08em #eee;\n  border-radius: 0.1em;\n  padding: 0.2em 0.25em 0.15em;\n}\n\n.fa-pull-left {\n  float: left;\n}\n\n.fa-pull-right {\n  float: right;\n}\n\n.fa.fa-pull-left,\n.fas.fa-pull-left,\n.far.fa-pull-left,\n.fal.fa-pull-left,\n.fab.fa-pull-left {\n  margin-right: 0.3em;\n}\n.fa.fa-pull-right,\n.fas.fa-pull-right,\n.far.fa-pull-right,\n.fal.fa-pull-right,\n.fab.fa-pull-right {\n  margin-left: 0.3em;\n}\n\n.fa-spin {\n  -webkit-animation: fa-spin 2s infinite linear;\n          animation: fa-spin 2s infinite linear;\n}\n\n.fa-pulse {\n  -webkit-animation: fa-spin 1s infinite steps(8);\n          animation: fa-spin 1s infinite steps(8);\n}\n\n@-webkit-keyframes fa-spin {\n  0% {\n    -webkit-transform: rotate(0deg);\n            transform: rotate(0deg);\n  }\n  100% {\n    -webkit-transform: rotate(360deg);\n            transform: rotate(360deg);\n  }\n}\n\n@keyframes fa-spin {\n  0% {\n    -webkit-transform: rotate(0deg);\n            transform: rotate(0deg);\n  }\n  100% {\n    -webkit-transform: rotate(360deg);\n            transform: rotate(360deg);\n  }\n}\n.fa-rotate-90 {\n  -ms-filter: "progid:DXImageTransform.Microsoft.BasicImage(rotation=1)";\n  -webkit-transform: rotate(90deg);\n          transform: rotate(90deg);\n}\n\n.fa-rotate-180 {\n  -ms-filter: "progid:DXImageTransform.Microsoft.BasicImage(rotation=2)";\n  -webkit-transform: rotate(180deg);\n          transform: rotate(180deg);\n}\n\n.fa-rotate-270 {\n  -ms-filter: "progid:DXImageTransform.Microsoft.BasicImage(rotation=3)";\n  -webkit-transform: rotate(270deg);\n          transform: rotate(270deg);\n}\n\n.fa-flip-horizontal {\n  -ms-filter: "progid:DXImageTransform.Microsoft.BasicImage(rotation=0, mirror=1)";\n  -webkit-transform: scale(-1, 1);\n          transform: scale(-1, 1);\n}\n\n.fa-flip-vertical {\n  -ms-filter: "progid:DXImageTransform.Microsoft.BasicImage(rotation=2, mirror=1)";\n  -webkit-transform: scale(1, -1);\n          transform: scale(1, -1);\n}\n\n.fa-flip-both, .fa-flip-horizontal.fa-flip-vertical {\n  -ms-filter: "progid:DXImageTransform.Microsoft.BasicImage(rotation=2, mirror=1)";\n  -webkit-transform: scale(-1, -1);\n          transform: scale(-1, -1);\n}\n\n:root .fa-rotate-90,\n:root .fa-rotate-180,\n:root .fa-rotate-270,\n:root .fa-flip-horizontal,\n:root .fa-flip-vertical,\n:root .fa-flip-both {\n  -webkit-filter: none;\n          filter: none;\n}\n\n.fa-stack {\n  display: inline-block;\n  height: 2em;\n  position: relative;\n  width: 2.5em;\n}\n\n.fa-stack-1x,\n.fa-stack-2x {\n  bottom: 0;\n  left: 0;\n  margin: auto;\n  position: absolute;\n  right: 0;\n  top: 0;\n}\n\n.svg-inline--fa.fa-stack-1x {\n  height: 1em;\n  width: 1.25em;\n}\n.svg-inline--fa.fa-stack-2x {\n  height: 2em;\n  width: 2.5em;\n}\n\n.fa-inverse {\n  color: #fff;\n}\n\n.sr-only {\n  border: 0;\n  clip: rect(0, 0, 0, 0);\n  height: 1px;\n  margin: -1px;\n  overflow: hidden;\n  padding: 0;\n  position: absolute;\n  width: 1px;\n}\n\n.sr-only-focusable:active, .sr-only-focusable:focus {\n  clip: auto;\n  height: auto;\n  margin: 0;\n  overflow: visible;\n  position: static;\n  width: auto;\n}\n\n.svg-inline--fa .fa-primary {\n  fill: var(--fa-primary-color, currentColor);\n  opacity: 1;\n  opacity: var(--fa-primary-opacity, 1);\n}\n\n.svg-inline--fa .fa-secondary {\n  fill: var(--fa-secondary-color, currentColor);\n  opacity: 0.4;\n  opacity: var(--fa-secondary-opacity, 0.4);\n}\n\n.svg-inline--fa.fa-swap-opacity .fa-primary {\n  opacity: 0.4;\n  opacity: var(--fa-secondary-opacity, 0.4);\n}\n\n.svg-inline--fa.fa-swap-opacity .fa-secondary {\n  opacity: 1;\n  opacity: var(--fa-primary-opacity, 1);\n}\n\n.svg-inline--fa mask .fa-primary,\n.svg-inline--fa mask .fa-secondary {\n  fill: black;\n}\n\n.fad.fa-inverse {\n  color: #fff;\n}';function Ee(){var e=g,t=w,n=C.familyPrefix,r=C.replacementClass,o=_e;if(n!==e||r!==t){var a=new RegExp("\\.".concat(e,"\\-"),"g"),i=new RegExp("\\--".concat(e,"\\-"),"g"),s=new RegExp("\\.".concat(t),"g");o=o.replace(a,".".concat(n,"-")).replace(i,"--".concat(n,"-")).replace(s,".".concat(r))}return o}function Se(){C.autoAddCss&&!Te&&(Q(Ee()),Te=!0)}function Ce(e,t){return Object.defineProperty(e,"abstract",{get:t}),Object.defineProperty(e,"html",{get:function(){return e.abstract.map(function(e){return ve(e)})}}),Object.defineProperty(e,"node",{get:function(){if(y){var t=v.createElement("div");return t.innerHTML=e.html,t.children}}}),e}function je(e){var t=e.prefix,n=void 0===t?"fa":t,r=e.iconName;if(r)return be(Pe.definitions,n,r)||be(A.styles,n,r)}var Ae,Pe=new(function(){function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.definitions={}}var t,n,r;return t=e,(n=[{key:"add",value:function(){for(var e=this,t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];var o=n.reduce(this._pullDefinitions,{});Object.keys(o).forEach(function(t){e.definitions[t]=s({},e.definitions[t]||{},o[t]),pe(t,o[t]),he()})}},{key:"reset",value:function(){this.definitions={}}},{key:"_pullDefinitions",value:function(e,t){var n=t.prefix&&t.iconName&&t.icon?{0:t}:t;return Object.keys(n).map(function(t){var r=n[t],o=r.prefix,a=r.iconName,i=r.icon;e[o]||(e[o]={}),e[o][a]=i}),e}}])&&a(t.prototype,n),r&&a(t,r),e}()),Te=!1,Me={transform:function(e){return me(e)}},Fe=(Ae=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.transform,r=void 0===n?J:n,o=t.symbol,a=void 0!==o&&o,i=t.mask,l=void 0===i?null:i,c=t.title,u=void 0===c?null:c,p=t.classes,f=void 0===p?[]:p,d=t.attributes,h=void 0===d?{}:d,b=t.styles,v=void 0===b?{}:b;if(e){var m=e.prefix,y=e.iconName,g=e.icon;return Ce(s({type:"icon"},e),function(){return Se(),C.autoA11y&&(u?h["aria-labelledby"]="".concat(C.replacementClass,"-title-").concat(te()):(h["aria-hidden"]="true",h.focusable="false")),le({icons:{main:xe(g),mask:l?xe(l.icon):{found:!1,width:null,height:null,icon:{}}},prefix:m,iconName:y,transform:s({},J,r),symbol:a,title:u,extra:{attributes:h,styles:v,classes:f}})})}},function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=(e||{}).icon?e:je(e||{}),r=t.mask;return r&&(r=(r||{}).icon?r:je(r||{})),Ae(n,s({},t,{mask:r}))})}).call(this,n(354),n(365).setImmediate)},358:function(e,t){var n,r,o=e.exports={};function a(){throw new Error("setTimeout has not been defined")}function i(){throw new Error("clearTimeout has not been defined")}function s(e){if(n===setTimeout)return setTimeout(e,0);if((n===a||!n)&&setTimeout)return n=setTimeout,setTimeout(e,0);try{return n(e,0)}catch(t){try{return n.call(null,e,0)}catch(t){return n.call(this,e,0)}}}!function(){try{n="function"==typeof setTimeout?setTimeout:a}catch(e){n=a}try{r="function"==typeof clearTimeout?clearTimeout:i}catch(e){r=i}}();var l,c=[],u=!1,p=-1;function f(){u&&l&&(u=!1,l.length?c=l.concat(c):p=-1,c.length&&d())}function d(){if(!u){var e=s(f);u=!0;for(var t=c.length;t;){for(l=c,c=[];++p<t;)l&&l[p].run();p=-1,t=c.length}l=null,u=!1,function(e){if(r===clearTimeout)return clearTimeout(e);if((r===i||!r)&&clearTimeout)return r=clearTimeout,clearTimeout(e);try{r(e)}catch(t){try{return r.call(null,e)}catch(t){return r.call(this,e)}}}(e)}}function h(e,t){this.fun=e,this.array=t}function b(){}o.nextTick=function(e){var t=new Array(arguments.length-1);if(arguments.length>1)for(var n=1;n<arguments.length;n++)t[n-1]=arguments[n];c.push(new h(e,t)),1!==c.length||u||s(d)},h.prototype.run=function(){this.fun.apply(null,this.array)},o.title="browser",o.browser=!0,o.env={},o.argv=[],o.version="",o.versions={},o.on=b,o.addListener=b,o.once=b,o.off=b,o.removeListener=b,o.removeAllListeners=b,o.emit=b,o.prependListener=b,o.prependOnceListener=b,o.listeners=function(e){return[]},o.binding=function(e){throw new Error("process.binding is not supported")},o.cwd=function(){return"/"},o.chdir=function(e){throw new Error("process.chdir is not supported")},o.umask=function(){return 0}},361:function(e,t,n){!function(t){"use strict";function n(){}function r(e){return e.split('"').length-1}n.prototype=Object.create(Object.prototype,{parse:{value:function(e){var t,n,o,a,i,s,l,c=[],u=0;for((o=e.split("\n")).length>1&&""===o[o.length-1]&&o.pop(),t=0,n=o.length;t<n;t+=1){for(o[t]=o[t].split("\t"),a=0,i=o[t].length;a<i;a+=1)c[u]||(c[u]=[]),s&&0===a?(l=c[u].length-1,c[u][l]=c[u][l]+"\n"+o[t][0],s&&1&r(o[t][0])&&(s=!1,c[u][l]=c[u][l].substring(0,c[u][l].length-1).replace(/""/g,'"'))):a===i-1&&0===o[t][a].indexOf('"')&&1&r(o[t][a])?(c[u].push(o[t][a].substring(1).replace(/""/g,'"')),s=!0):(c[u].push(o[t][a].replace(/""/g,'"')),s=!1);s||(u+=1)}return c},enumerable:!0,configurable:!1,writable:!1},stringify:{value:function(e){var t,n,r,o,a,i="";for(t=0,n=e.length;t<n;t+=1){for(r=0,o=e[t].length;r<o;r+=1)r>0&&(i+="\t"),"string"==typeof(a=e[t][r])?a.indexOf("\n")>-1?i+='"'+a.replace(/"/g,'""')+'"':i+=a:i+=null==a?"":a;i+="\n"}return i},enumerable:!0,configurable:!1,writable:!1}}),e.exports?e.exports=n:t.SheetClip=n}(this)},362:function(e,t,n){"use strict";e.exports=function(e){for(var t,n=e.length,r=0;r<n;r++)if(((t=e.charCodeAt(r))<9||t>13)&&32!==t&&133!==t&&160!==t&&5760!==t&&6158!==t&&(t<8192||t>8205)&&8232!==t&&8233!==t&&8239!==t&&8287!==t&&8288!==t&&12288!==t&&65279!==t)return!1;return!0}},363:function(e,t,n){"use strict";Object.defineProperty(t,"__esModule",{value:!0});var r=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},o=function(){function e(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}return function(t,n,r){return n&&e(t.prototype,n),r&&e(t,r),t}}(),a=n(12),i=l(a),s=l(n(0));function l(e){return e&&e.__esModule?e:{default:e}}var c={position:"absolute",top:0,left:0,visibility:"hidden",height:0,overflow:"scroll",whiteSpace:"pre"},u=["extraWidth","injectStyles","inputClassName","inputRef","inputStyle","minWidth","onAutosize","placeholderIsMinWidth"],p=function(e,t){t.style.fontSize=e.fontSize,t.style.fontFamily=e.fontFamily,t.style.fontWeight=e.fontWeight,t.style.fontStyle=e.fontStyle,t.style.letterSpacing=e.letterSpacing,t.style.textTransform=e.textTransform},f=!("undefined"==typeof window||!window.navigator)&&/MSIE |Trident\/|Edge\//.test(window.navigator.userAgent),d=function(){return f?"_"+Math.random().toString(36).substr(2,12):void 0},h=function(e){function t(e){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t);var n=function(e,t){if(!e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!t||"object"!=typeof t&&"function"!=typeof t?e:t}(this,(t.__proto__||Object.getPrototypeOf(t)).call(this,e));return n.inputRef=function(e){n.input=e,"function"==typeof n.props.inputRef&&n.props.inputRef(e)},n.placeHolderSizerRef=function(e){n.placeHolderSizer=e},n.sizerRef=function(e){n.sizer=e},n.state={inputWidth:e.minWidth,inputId:e.id||d()},n}return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function, not "+typeof t);e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,enumerable:!1,writable:!0,configurable:!0}}),t&&(Object.setPrototypeOf?Object.setPrototypeOf(e,t):e.__proto__=t)}(t,a.Component),o(t,[{key:"componentDidMount",value:function(){this.mounted=!0,this.copyInputStyles(),this.updateInputWidth()}},{key:"componentWillReceiveProps",value:function(e){var t=e.id;t!==this.props.id&&this.setState({inputId:t||d()})}},{key:"componentDidUpdate",value:function(e,t){t.inputWidth!==this.state.inputWidth&&"function"==typeof this.props.onAutosize&&this.props.onAutosize(this.state.inputWidth),this.updateInputWidth()}},{key:"componentWillUnmount",value:function(){this.mounted=!1}},{key:"copyInputStyles",value:function(){if(this.mounted&&window.getComputedStyle){var e=this.input&&window.getComputedStyle(this.input);e&&(p(e,this.sizer),this.placeHolderSizer&&p(e,this.placeHolderSizer))}}},{key:"updateInputWidth",value:function(){if(this.mounted&&this.sizer&&void 0!==this.sizer.scrollWidth){var e=void 0;e=this.props.placeholder&&(!this.props.value||this.props.value&&this.props.placeholderIsMinWidth)?Math.max(this.sizer.scrollWidth,this.placeHolderSizer.scrollWidth)+2:this.sizer.scrollWidth+2,(e+="number"===this.props.type&&void 0===this.props.extraWidth?16:parseInt(this.props.extraWidth)||0)<this.props.minWidth&&(e=this.props.minWidth),e!==this.state.inputWidth&&this.setState({inputWidth:e})}}},{key:"getInput",value:function(){return this.input}},{key:"focus",value:function(){this.input.focus()}},{key:"blur",value:function(){this.input.blur()}},{key:"select",value:function(){this.input.select()}},{key:"renderStyles",value:function(){var e=this.props.injectStyles;return f&&e?i.default.createElement("style",{dangerouslySetInnerHTML:{__html:"input#"+this.state.inputId+"::-ms-clear {display: none;}"}}):null}},{key:"render",value:function(){var e=[this.props.defaultValue,this.props.value,""].reduce(function(e,t){return null!=e?e:t}),t=r({},this.props.style);t.display||(t.display="inline-block");var n=r({boxSizing:"content-box",width:this.state.inputWidth+"px"},this.props.inputStyle),o=function(e,t){var n={};for(var r in e)t.indexOf(r)>=0||Object.prototype.hasOwnProperty.call(e,r)&&(n[r]=e[r]);return n}(this.props,[]);return function(e){u.forEach(function(t){return delete e[t]})}(o),o.className=this.props.inputClassName,o.id=this.state.inputId,o.style=n,i.default.createElement("div",{className:this.props.className,style:t},this.renderStyles(),i.default.createElement("input",r({},o,{ref:this.inputRef})),i.default.createElement("div",{ref:this.sizerRef,style:c},e),this.props.placeholder?i.default.createElement("div",{ref:this.placeHolderSizerRef,style:c},this.props.placeholder):null)}}]),t}();h.propTypes={className:s.default.string,defaultValue:s.default.any,extraWidth:s.default.oneOfType([s.default.number,s.default.string]),id:s.default.string,injectStyles:s.default.bool,inputClassName:s.default.string,inputRef:s.default.func,inputStyle:s.default.object,minWidth:s.default.oneOfType([s.default.number,s.default.string]),onAutosize:s.default.func,onChange:s.default.func,placeholder:s.default.string,placeholderIsMinWidth:s.default.bool,style:s.default.object,value:s.default.any},h.defaultProps={minWidth:1,injectStyles:!0},t.default=h},364:function(e,t,n){var r;
-/*!
-  Copyright (c) 2017 Jed Watson.
-  Licensed under the MIT License (MIT), see
-  http://jedwatson.github.io/classnames
-*/!function(){"use strict";var n={}.hasOwnProperty;function o(){for(var e=[],t=0;t<arguments.length;t++){var r=arguments[t];if(r){var a=typeof r;if("string"===a||"number"===a)e.push(r);else if(Array.isArray(r)&&r.length){var i=o.apply(null,r);i&&e.push(i)}else if("object"===a)for(var s in r)n.call(r,s)&&r[s]&&e.push(s)}}return e.join(" ")}e.exports?(o.default=o,e.exports=o):void 0===(r=function(){return o}.apply(t,[]))||(e.exports=r)}()},365:function(e,t,n){(function(e){var r=void 0!==e&&e||"undefined"!=typeof self&&self||window,o=Function.prototype.apply;function a(e,t){this._id=e,this._clearFn=t}t.setTimeout=function(){return new a(o.call(setTimeout,r,arguments),clearTimeout)},t.setInterval=function(){return new a(o.call(setInterval,r,arguments),clearInterval)},t.clearTimeout=t.clearInterval=function(e){e&&e.close()},a.prototype.unref=a.prototype.ref=function(){},a.prototype.close=function(){this._clearFn.call(r,this._id)},t.enroll=function(e,t){clearTimeout(e._idleTimeoutId),e._idleTimeout=t},t.unenroll=function(e){clearTimeout(e._idleTimeoutId),e._idleTimeout=-1},t._unrefActive=t.active=function(e){clearTimeout(e._idleTimeoutId);var t=e._idleTimeout;t>=0&&(e._idleTimeoutId=setTimeout(function(){e._onTimeout&&e._onTimeout()},t))},n(366),t.setImmediate="undefined"!=typeof self&&self.setImmediate||void 0!==e&&e.setImmediate||this&&this.setImmediate,t.clearImmediate="undefined"!=typeof self&&self.clearImmediate||void 0!==e&&e.clearImmediate||this&&this.clearImmediate}).call(this,n(354))},366:function(e,t,n){(function(e,t){!function(e,n){"use strict";if(!e.setImmediate){var r,o,a,i,s,l=1,c={},u=!1,p=e.document,f=Object.getPrototypeOf&&Object.getPrototypeOf(e);f=f&&f.setTimeout?f:e,"[object process]"==={}.toString.call(e.process)?r=function(e){t.nextTick(function(){h(e)})}:!function(){if(e.postMessage&&!e.importScripts){var t=!0,n=e.onmessage;return e.onmessage=function(){t=!1},e.postMessage("","*"),e.onmessage=n,t}}()?e.MessageChannel?((a=new MessageChannel).port1.onmessage=function(e){h(e.data)},r=function(e){a.port2.postMessage(e)}):p&&"onreadystatechange"in p.createElement("script")?(o=p.documentElement,r=function(e){var t=p.createElement("script");t.onreadystatechange=function(){h(e),t.onreadystatechange=null,o.removeChild(t),t=null},o.appendChild(t)}):r=function(e){setTimeout(h,0,e)}:(i="setImmediate$"+Math.random()+"$",s=function(t){t.source===e&&"string"==typeof t.data&&0===t.data.indexOf(i)&&h(+t.data.slice(i.length))},e.addEventListener?e.addEventListener("message",s,!1):e.attachEvent("onmessage",s),r=function(t){e.postMessage(i+t,"*")}),f.setImmediate=function(e){"function"!=typeof e&&(e=new Function(""+e));for(var t=new Array(arguments.length-1),n=0;n<t.length;n++)t[n]=arguments[n+1];var o={callback:e,args:t};return c[l]=o,r(l),l++},f.clearImmediate=d}function d(e){delete c[e]}function h(e){if(u)setTimeout(h,0,e);else{var t=c[e];if(t){u=!0;try{!function(e){var t=e.callback,r=e.args;switch(r.length){case 0:t();break;case 1:t(r[0]);break;case 2:t(r[0],r[1]);break;case 3:t(r[0],r[1],r[2]);break;default:t.apply(n,r)}}(t)}finally{d(e),u=!1}}}}}("undefined"==typeof self?void 0===e?this:e:self)}).call(this,n(354),n(358))},367:function(e,t,n){var r=n(160),o=n(368);"string"==typeof(o=o.__esModule?o.default:o)&&(o=[[e.i,o,""]]);var a={insert:"head",singleton:!1},i=(r(e.i,o,a),o.locals?o.locals:{});e.exports=i},368:function(e,t,n){(t=n(161)(!1)).push([e.i,"/**\n * React Select\n * ============\n * Created by Jed Watson and Joss Mackison for KeystoneJS, http://www.keystonejs.com/\n * https://twitter.com/jedwatson https://twitter.com/jossmackison https://twitter.com/keystonejs\n * MIT License: https://github.com/JedWatson/react-select\n*/\n.Select {\n  position: relative;\n}\n.Select input::-webkit-contacts-auto-fill-button,\n.Select input::-webkit-credentials-auto-fill-button {\n  display: none !important;\n}\n.Select input::-ms-clear {\n  display: none !important;\n}\n.Select input::-ms-reveal {\n  display: none !important;\n}\n.Select,\n.Select div,\n.Select input,\n.Select span {\n  -webkit-box-sizing: border-box;\n  -moz-box-sizing: border-box;\n  box-sizing: border-box;\n}\n.Select.is-disabled .Select-arrow-zone {\n  cursor: default;\n  pointer-events: none;\n  opacity: 0.35;\n}\n.Select.is-disabled > .Select-control {\n  background-color: #f9f9f9;\n}\n.Select.is-disabled > .Select-control:hover {\n  box-shadow: none;\n}\n.Select.is-open > .Select-control {\n  border-bottom-right-radius: 0;\n  border-bottom-left-radius: 0;\n  background: #fff;\n  border-color: #b3b3b3 #ccc #d9d9d9;\n}\n.Select.is-open > .Select-control .Select-arrow {\n  top: -2px;\n  border-color: transparent transparent #999;\n  border-width: 0 5px 5px;\n}\n.Select.is-searchable.is-open > .Select-control {\n  cursor: text;\n}\n.Select.is-searchable.is-focused:not(.is-open) > .Select-control {\n  cursor: text;\n}\n.Select.is-focused > .Select-control {\n  background: #fff;\n}\n.Select.is-focused:not(.is-open) > .Select-control {\n  border-color: #007eff;\n  box-shadow: inset 0 1px 1px rgba(0, 0, 0, 0.075), 0 0 0 3px rgba(0, 126, 255, 0.1);\n  background: #fff;\n}\n.Select.has-value.is-clearable.Select--single > .Select-control .Select-value {\n  padding-right: 42px;\n}\n.Select.has-value.Select--single > .Select-control .Select-value .Select-value-label,\n.Select.has-value.is-pseudo-focused.Select--single > .Select-control .Select-value .Select-value-label {\n  color: #333;\n}\n.Select.has-value.Select--single > .Select-control .Select-value a.Select-value-label,\n.Select.has-value.is-pseudo-focused.Select--single > .Select-control .Select-value a.Select-value-label {\n  cursor: pointer;\n  text-decoration: none;\n}\n.Select.has-value.Select--single > .Select-control .Select-value a.Select-value-label:hover,\n.Select.has-value.is-pseudo-focused.Select--single > .Select-control .Select-value a.Select-value-label:hover,\n.Select.has-value.Select--single > .Select-control .Select-value a.Select-value-label:focus,\n.Select.has-value.is-pseudo-focused.Select--single > .Select-control .Select-value a.Select-value-label:focus {\n  color: #007eff;\n  outline: none;\n  text-decoration: underline;\n}\n.Select.has-value.Select--single > .Select-control .Select-value a.Select-value-label:focus,\n.Select.has-value.is-pseudo-focused.Select--single > .Select-control .Select-value a.Select-value-label:focus {\n  background: #fff;\n}\n.Select.has-value.is-pseudo-focused .Select-input {\n  opacity: 0;\n}\n.Select.is-open .Select-arrow,\n.Select .Select-arrow-zone:hover > .Select-arrow {\n  border-top-color: #666;\n}\n.Select.Select--rtl {\n  direction: rtl;\n  text-align: right;\n}\n.Select-control {\n  background-color: #fff;\n  border-color: #d9d9d9 #ccc #b3b3b3;\n  border-radius: 4px;\n  border: 1px solid #ccc;\n  color: #333;\n  cursor: default;\n  display: table;\n  border-spacing: 0;\n  border-collapse: separate;\n  height: 36px;\n  outline: none;\n  overflow: hidden;\n  position: relative;\n  width: 100%;\n}\n.Select-control:hover {\n  box-shadow: 0 1px 0 rgba(0, 0, 0, 0.06);\n}\n.Select-control .Select-input:focus {\n  outline: none;\n  background: #fff;\n}\n.Select-placeholder,\n.Select--single > .Select-control .Select-value {\n  bottom: 0;\n  color: #aaa;\n  left: 0;\n  line-height: 34px;\n  padding-left: 10px;\n  padding-right: 10px;\n  position: absolute;\n  right: 0;\n  top: 0;\n  max-width: 100%;\n  overflow: hidden;\n  text-overflow: ellipsis;\n  white-space: nowrap;\n}\n.Select-input {\n  height: 34px;\n  padding-left: 10px;\n  padding-right: 10px;\n  vertical-align: middle;\n}\n.Select-input > input {\n  width: 100%;\n  background: none transparent;\n  border: 0 none;\n  box-shadow: none;\n  cursor: default;\n  display: inline-block;\n  font-family: inherit;\n  font-size: inherit;\n  margin: 0;\n  outline: none;\n  line-height: 17px;\n  /* For IE 8 compatibility */\n  padding: 8px 0 12px;\n  /* For IE 8 compatibility */\n  -webkit-appearance: none;\n}\n.is-focused .Select-input > input {\n  cursor: text;\n}\n.has-value.is-pseudo-focused .Select-input {\n  opacity: 0;\n}\n.Select-control:not(.is-searchable) > .Select-input {\n  outline: none;\n}\n.Select-loading-zone {\n  cursor: pointer;\n  display: table-cell;\n  position: relative;\n  text-align: center;\n  vertical-align: middle;\n  width: 16px;\n}\n.Select-loading {\n  -webkit-animation: Select-animation-spin 400ms infinite linear;\n  -o-animation: Select-animation-spin 400ms infinite linear;\n  animation: Select-animation-spin 400ms infinite linear;\n  width: 16px;\n  height: 16px;\n  box-sizing: border-box;\n  border-radius: 50%;\n  border: 2px solid #ccc;\n  border-right-color: #333;\n  display: inline-block;\n  position: relative;\n  vertical-align: middle;\n}\n.Select-clear-zone {\n  -webkit-animation: Select-animation-fadeIn 200ms;\n  -o-animation: Select-animation-fadeIn 200ms;\n  animation: Select-animation-fadeIn 200ms;\n  color: #999;\n  cursor: pointer;\n  display: table-cell;\n  position: relative;\n  text-align: center;\n  vertical-align: middle;\n  width: 17px;\n}\n.Select-clear-zone:hover {\n  color: #D0021B;\n}\n.Select-clear {\n  display: inline-block;\n  font-size: 18px;\n  line-height: 1;\n}\n.Select--multi .Select-clear-zone {\n  width: 17px;\n}\n.Select-arrow-zone {\n  cursor: pointer;\n  display: table-cell;\n  position: relative;\n  text-align: center;\n  vertical-align: middle;\n  width: 25px;\n  padding-right: 5px;\n}\n.Select--rtl .Select-arrow-zone {\n  padding-right: 0;\n  padding-left: 5px;\n}\n.Select-arrow {\n  border-color: #999 transparent transparent;\n  border-style: solid;\n  border-width: 5px 5px 2.5px;\n  display: inline-block;\n  height: 0;\n  width: 0;\n  position: relative;\n}\n.Select-control > *:last-child {\n  padding-right: 5px;\n}\n.Select--multi .Select-multi-value-wrapper {\n  display: inline-block;\n}\n.Select .Select-aria-only {\n  position: absolute;\n  display: inline-block;\n  height: 1px;\n  width: 1px;\n  margin: -1px;\n  clip: rect(0, 0, 0, 0);\n  overflow: hidden;\n  float: left;\n}\n@-webkit-keyframes Select-animation-fadeIn {\n  from {\n    opacity: 0;\n  }\n  to {\n    opacity: 1;\n  }\n}\n@keyframes Select-animation-fadeIn {\n  from {\n    opacity: 0;\n  }\n  to {\n    opacity: 1;\n  }\n}\n.Select-menu-outer {\n  border-bottom-right-radius: 4px;\n  border-bottom-left-radius: 4px;\n  background-color: #fff;\n  border: 1px solid #ccc;\n  border-top-color: #e6e6e6;\n  box-shadow: 0 1px 0 rgba(0, 0, 0, 0.06);\n  box-sizing: border-box;\n  margin-top: -1px;\n  max-height: 200px;\n  position: absolute;\n  left: 0;\n  top: 100%;\n  width: 100%;\n  z-index: 1;\n  -webkit-overflow-scrolling: touch;\n}\n.Select-menu {\n  max-height: 198px;\n  overflow-y: auto;\n}\n.Select-option {\n  box-sizing: border-box;\n  background-color: #fff;\n  color: #666666;\n  cursor: pointer;\n  display: block;\n  padding: 8px 10px;\n}\n.Select-option:last-child {\n  border-bottom-right-radius: 4px;\n  border-bottom-left-radius: 4px;\n}\n.Select-option.is-selected {\n  background-color: #f5faff;\n  /* Fallback color for IE 8 */\n  background-color: rgba(0, 126, 255, 0.04);\n  color: #333;\n}\n.Select-option.is-focused {\n  background-color: #ebf5ff;\n  /* Fallback color for IE 8 */\n  background-color: rgba(0, 126, 255, 0.08);\n  color: #333;\n}\n.Select-option.is-disabled {\n  color: #cccccc;\n  cursor: default;\n}\n.Select-noresults {\n  box-sizing: border-box;\n  color: #999999;\n  cursor: default;\n  display: block;\n  padding: 8px 10px;\n}\n.Select--multi .Select-input {\n  vertical-align: middle;\n  margin-left: 10px;\n  padding: 0;\n}\n.Select--multi.Select--rtl .Select-input {\n  margin-left: 0;\n  margin-right: 10px;\n}\n.Select--multi.has-value .Select-input {\n  margin-left: 5px;\n}\n.Select--multi .Select-value {\n  background-color: #ebf5ff;\n  /* Fallback color for IE 8 */\n  background-color: rgba(0, 126, 255, 0.08);\n  border-radius: 2px;\n  border: 1px solid #c2e0ff;\n  /* Fallback color for IE 8 */\n  border: 1px solid rgba(0, 126, 255, 0.24);\n  color: #007eff;\n  display: inline-block;\n  font-size: 0.9em;\n  line-height: 1.4;\n  margin-left: 5px;\n  margin-top: 5px;\n  vertical-align: top;\n}\n.Select--multi .Select-value-icon,\n.Select--multi .Select-value-label {\n  display: inline-block;\n  vertical-align: middle;\n}\n.Select--multi .Select-value-label {\n  border-bottom-right-radius: 2px;\n  border-top-right-radius: 2px;\n  cursor: default;\n  padding: 2px 5px;\n}\n.Select--multi a.Select-value-label {\n  color: #007eff;\n  cursor: pointer;\n  text-decoration: none;\n}\n.Select--multi a.Select-value-label:hover {\n  text-decoration: underline;\n}\n.Select--multi .Select-value-icon {\n  cursor: pointer;\n  border-bottom-left-radius: 2px;\n  border-top-left-radius: 2px;\n  border-right: 1px solid #c2e0ff;\n  /* Fallback color for IE 8 */\n  border-right: 1px solid rgba(0, 126, 255, 0.24);\n  padding: 1px 5px 3px;\n}\n.Select--multi .Select-value-icon:hover,\n.Select--multi .Select-value-icon:focus {\n  background-color: #d8eafd;\n  /* Fallback color for IE 8 */\n  background-color: rgba(0, 113, 230, 0.08);\n  color: #0071e6;\n}\n.Select--multi .Select-value-icon:active {\n  background-color: #c2e0ff;\n  /* Fallback color for IE 8 */\n  background-color: rgba(0, 126, 255, 0.24);\n}\n.Select--multi.Select--rtl .Select-value {\n  margin-left: 0;\n  margin-right: 5px;\n}\n.Select--multi.Select--rtl .Select-value-icon {\n  border-right: none;\n  border-left: 1px solid #c2e0ff;\n  /* Fallback color for IE 8 */\n  border-left: 1px solid rgba(0, 126, 255, 0.24);\n}\n.Select--multi.is-disabled .Select-value {\n  background-color: #fcfcfc;\n  border: 1px solid #e3e3e3;\n  color: #333;\n}\n.Select--multi.is-disabled .Select-value-icon {\n  cursor: not-allowed;\n  border-right: 1px solid #e3e3e3;\n}\n.Select--multi.is-disabled .Select-value-icon:hover,\n.Select--multi.is-disabled .Select-value-icon:focus,\n.Select--multi.is-disabled .Select-value-icon:active {\n  background-color: #fcfcfc;\n}\n@keyframes Select-animation-spin {\n  to {\n    transform: rotate(1turn);\n  }\n}\n@-webkit-keyframes Select-animation-spin {\n  to {\n    -webkit-transform: rotate(1turn);\n  }\n}\n",""]),e.exports=t},369:function(e,t,n){var r=n(160),o=n(370);"string"==typeof(o=o.__esModule?o.default:o)&&(o=[[e.i,o,""]]);var a={insert:"head",singleton:!1},i=(r(e.i,o,a),o.locals?o.locals:{});e.exports=i},370:function(e,t,n){(t=n(161)(!1)).push([e.i,".dash-spreadsheet.dash-freeze-left,\n.dash-spreadsheet.dash-freeze-top {\n  width: auto;\n  width: fit-content;\n  width: -moz-fit-content;\n  width: -webkit-fit-content;\n}\n.dash-spreadsheet.dash-freeze-left {\n  max-width: 500px;\n}\n.dash-spreadsheet.dash-freeze-top,\n.dash-spreadsheet.dash-virtualized {\n  max-height: 500px;\n}\n.dash-tooltip {\n  border: 1px solid #e4e4e4;\n  border-radius: 5px;\n  position: absolute;\n  z-index: 500;\n}\n.dash-tooltip .dash-table-tooltip {\n  position: relative;\n  background-color: #f6f6f6;\n  max-width: 300px;\n  min-width: 300px;\n  padding: 2px 10px;\n}\n.dash-tooltip[data-attr-anchor='top'] {\n  margin-top: 10px;\n}\n.dash-tooltip[data-attr-anchor='top']:after,\n.dash-tooltip[data-attr-anchor='top']:before {\n  bottom: 100%;\n  left: 50%;\n  border: solid transparent;\n  content: \" \";\n  height: 0;\n  width: 0;\n  position: absolute;\n  pointer-events: none;\n}\n.dash-tooltip[data-attr-anchor='top']:after {\n  border-color: transparent;\n  border-bottom-color: #f6f6f6;\n  border-width: 8px;\n  margin-left: -8px;\n}\n.dash-tooltip[data-attr-anchor='top']:before {\n  border-color: transparent;\n  border-bottom-color: #e4e4e4;\n  border-width: 9px;\n  margin-left: -9px;\n}\n.dash-tooltip[data-attr-anchor='bottom'] {\n  margin-bottom: 10px;\n}\n.dash-tooltip[data-attr-anchor='bottom']:after,\n.dash-tooltip[data-attr-anchor='bottom']:before {\n  top: 100%;\n  left: 50%;\n  border: solid transparent;\n  content: \" \";\n  height: 0;\n  width: 0;\n  position: absolute;\n  pointer-events: none;\n}\n.dash-tooltip[data-attr-anchor='bottom']:after {\n  border-color: transparent;\n  border-top-color: #f6f6f6;\n  border-width: 8px;\n  margin-left: -8px;\n}\n.dash-tooltip[data-attr-anchor='bottom']:before {\n  border-color: transparent;\n  border-top-color: #e4e4e4;\n  border-width: 9px;\n  margin-left: -9px;\n}\n.dash-spreadsheet-menu {\n  display: flex;\n  flex-direction: row;\n}\n.dash-spreadsheet-menu > * {\n  padding-right: 5px;\n}\n.dash-spreadsheet-menu .dash-spreadsheet-menu-item {\n  position: relative;\n}\n.dash-spreadsheet-menu .dash-spreadsheet-menu-item .show-hide-menu {\n  background-color: #fafafa;\n  border: 1px solid #d3d3d3;\n  display: flex;\n  flex-direction: column;\n  max-height: 300px;\n  overflow: auto;\n  position: absolute;\n  top: 100%;\n  left: 0;\n  z-index: 500;\n}\n.dash-spreadsheet-menu .dash-spreadsheet-menu-item .show-hide-menu .show-hide-menu-item {\n  display: flex;\n  flex-direction: row;\n  padding: 5px;\n}\n.dash-spreadsheet-menu .dash-spreadsheet-menu-item .show-hide-menu .show-hide-menu-item label {\n  white-space: nowrap;\n}\n.dash-table-container .previous-next-container {\n  display: inline-block;\n  float: right;\n  padding: 5px 0px;\n}\n.dash-table-container .previous-next-container .page-number {\n  font-family: monospace;\n  display: inline-block;\n}\n.dash-table-container .previous-next-container .page-number .last-page {\n  min-width: 30px;\n  display: inline-block;\n  text-align: center;\n  margin: 0.5em;\n}\n.dash-table-container .previous-next-container input.current-page {\n  display: inline-block;\n  border-bottom: solid lightgrey 1px !important;\n  color: black;\n  border: none;\n  width: 30px;\n  text-align: center;\n  font-family: monospace;\n  font-size: 10pt;\n  margin: 0.5em;\n}\n.dash-table-container .previous-next-container input.current-page::placeholder {\n  color: black;\n}\n.dash-table-container .previous-next-container input.current-page:focus {\n  outline: none;\n}\n.dash-table-container .previous-next-container input.current-page:focus::placeholder {\n  opacity: 0;\n}\n.dash-table-container .previous-next-container button.previous-page,\n.dash-table-container .previous-next-container button.next-page,\n.dash-table-container .previous-next-container button.first-page,\n.dash-table-container .previous-next-container button.last-page {\n  transition-duration: 400ms;\n  padding: 5px;\n  border: none;\n  display: inline-block;\n  margin-left: 5px;\n  margin-right: 5px;\n}\n.dash-table-container .previous-next-container button.previous-page:hover,\n.dash-table-container .previous-next-container button.next-page:hover,\n.dash-table-container .previous-next-container button.first-page:hover,\n.dash-table-container .previous-next-container button.last-page:hover {\n  color: hotpink;\n}\n.dash-table-container .previous-next-container button.previous-page:hover:disabled,\n.dash-table-container .previous-next-container button.next-page:hover:disabled,\n.dash-table-container .previous-next-container button.first-page:hover:disabled,\n.dash-table-container .previous-next-container button.last-page:hover:disabled {\n  color: graytext;\n}\n.dash-table-container .previous-next-container button.previous-page:focus,\n.dash-table-container .previous-next-container button.next-page:focus,\n.dash-table-container .previous-next-container button.first-page:focus,\n.dash-table-container .previous-next-container button.last-page:focus {\n  outline: none;\n}\n.dash-table-container .dash-spreadsheet-container {\n  /* The \"normal\" reset CSS */\n  /* The \"modified\" reset CSS applied to the table to ignore markdown cells */\n  display: flex;\n  flex-direction: row;\n  position: relative;\n  /* focus happens after copying to clipboard */\n}\n.dash-table-container .dash-spreadsheet-container th {\n  font-style: normal;\n  font-weight: normal;\n  text-align: left;\n}\n.dash-table-container .dash-spreadsheet-container th,\n.dash-table-container .dash-spreadsheet-container td {\n  margin: 0;\n  padding: 0;\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown),\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) {\n  margin: 0;\n  padding: 0;\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) dl,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) dl,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) dt,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) dt,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) dd,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) dd,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) ul,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) ul,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) ol,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) ol,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) li,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) li,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) h1,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) h1,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) h2,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) h2,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) h3,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) h3,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) h4,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) h4,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) h5,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) h5,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) h6,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) h6,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) pre,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) pre,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) code,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) code,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) form,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) form,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) fieldset,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) fieldset,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) legend,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) legend,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) input,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) input,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) textarea,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) textarea,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) p,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) p,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) blockquote,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) blockquote,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) th,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) th,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) td,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) td {\n  margin: 0;\n  padding: 0;\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) table,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) table {\n  border-collapse: collapse;\n  border-spacing: 0;\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) fieldset,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) fieldset,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) img,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) img {\n  border: 0;\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) address,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) address,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) caption,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) caption,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) cite,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) cite,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) code,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) code,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) dfn,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) dfn,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) em,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) em,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) strong,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) strong,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) th,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) th,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) var,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) var {\n  font-style: normal;\n  font-weight: normal;\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) ol,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) ol,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) ul,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) ul {\n  list-style: none;\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) caption,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) caption,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) th,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) th {\n  text-align: left;\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) h1,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) h1,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) h2,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) h2,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) h3,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) h3,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) h4,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) h4,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) h5,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) h5,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) h6,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) h6 {\n  font-size: 100%;\n  font-weight: normal;\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) q:before,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) q:before,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) q:after,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) q:after {\n  content: '';\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) abbr,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) abbr,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) acronym,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) acronym {\n  border: 0;\n  font-variant: normal;\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) sup,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) sup {\n  vertical-align: text-top;\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) sub,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) sub {\n  vertical-align: text-bottom;\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) input,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) input,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) textarea,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) textarea,\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) select,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) select {\n  font-family: inherit;\n  font-size: inherit;\n  font-weight: inherit;\n  *font-size: 100%;\n}\n.dash-table-container .dash-spreadsheet-container th > div:not(.cell-markdown) legend,\n.dash-table-container .dash-spreadsheet-container td > div:not(.cell-markdown) legend {\n  color: #000;\n}\n.dash-table-container .dash-spreadsheet-container input[type=\"button\"] {\n  border-radius: 0;\n  -webkit-appearance: none;\n}\n.dash-table-container .dash-spreadsheet-container *:focus {\n  outline: none;\n}\n.dash-table-container .dash-spreadsheet-container table {\n  font-size: inherit;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner {\n  box-sizing: border-box;\n  display: flex;\n  flex-direction: column;\n  /*\n         * fixes Firefox td height bug on td > dropdown children\n         * bug should only appear on FF but\n         * @supports = scoped to Firefox only\n         * to minimize side effects\n         */\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner *,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner *:after,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner *:before {\n  box-sizing: inherit;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .Select {\n  overflow: hidden;\n  position: static;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .Select,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .Select-control {\n  background-color: inherit;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .Select-value {\n  display: flex;\n  flex-direction: column;\n  justify-content: center;\n  margin-top: -2px;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .marker-row tr {\n  visibility: hidden !important;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .marker-row td,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .marker-row th {\n  height: 0 !important;\n  padding: 0 !important;\n  margin: 0 !important;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .dash-filter input::placeholder {\n  color: inherit;\n  font-size: 0.8em;\n  padding-right: 5px;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .dash-filter + .dash-filter:not(:hover):not(:focus-within) input::placeholder {\n  color: transparent;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .dash-filter.invalid {\n  background-color: pink;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner:not(.dash-empty-11) .row-0 tr:last-of-type td,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner:not(.dash-empty-11) .row-0 tr:last-of-type th {\n  border-bottom: none !important;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner:not(.dash-empty-01) .cell-0-0 tr td:last-of-type,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner:not(.dash-empty-01) .cell-1-0 tr td:last-of-type,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner:not(.dash-empty-01) .cell-0-0 tr th:last-of-type,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner:not(.dash-empty-01) .cell-1-0 tr th:last-of-type {\n  border-right: none !important;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-left,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-top,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-virtualized {\n  overflow: hidden !important;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-left .row-0,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-top .row-0,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-virtualized .row-0 {\n  display: flex;\n  flex: 0 0 auto;\n  flex-direction: row;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-left .row-1,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-top .row-1,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-virtualized .row-1 {\n  display: flex;\n  flex-direction: row;\n  overflow: auto;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-left .cell-0-0,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-top .cell-0-0,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-virtualized .cell-0-0,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-left .cell-1-0,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-top .cell-1-0,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-virtualized .cell-1-0 {\n  flex: 0 0 auto;\n  left: 0;\n  position: sticky;\n  position: -webkit-sticky;\n  z-index: 400;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-left .cell-0-1,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-top .cell-0-1,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-virtualized .cell-0-1 {\n  z-index: 300;\n  flex: 0 0 auto;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-left .cell-1-1,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-freeze-top .cell-1-1,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-virtualized .cell-1-1 {\n  flex: 0 0 auto;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-fill-width .cell-0-1,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-fill-width .cell-1-1 {\n  flex: 1 0 auto;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner.dash-fill-width table {\n  width: 100%;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td {\n  background-color: inherit;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td.focused {\n  margin: -1px;\n  z-index: 200;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td .dash-cell-value-container {\n  width: 100%;\n  height: 100%;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td .dash-input-cell-value-container {\n  position: relative;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td .dash-cell-value {\n  height: 100%;\n  width: 100%;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td input.dash-cell-value {\n  position: absolute;\n  left: 0;\n  top: 0;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td input.dash-cell-value.unfocused::selection {\n  background-color: transparent;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td input.dash-cell-value.unfocused {\n  caret-color: transparent;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td .cell-value-shadow {\n  margin: auto 0;\n  opacity: 0;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td .input-cell-value-shadow {\n  display: inline-block;\n  height: initial;\n  width: initial;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td .dropdown-cell-value-shadow {\n  display: block;\n  height: 0px;\n  padding: 0 42px 0 10px;\n}\n@supports (-moz-appearance:none) {\n  .dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td.dropdown .dash-cell-value-container {\n    height: auto;\n  }\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th.dash-filter {\n  position: relative;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th.dash-filter input {\n  position: absolute;\n  left: 0;\n  top: 0;\n  height: 100%;\n  width: 100%;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th {\n  white-space: nowrap;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th .column-header--clear,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th .column-header--delete,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th .column-header--edit,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th .column-header--hide .column-header--sort {\n  -webkit-touch-callout: none;\n  -webkit-user-select: none;\n  -khtml-user-select: none;\n  -moz-user-select: none;\n  -ms-user-select: none;\n  user-select: none;\n  cursor: default;\n  cursor: pointer;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th {\n  background-clip: padding-box;\n  padding: 2px;\n  overflow-x: hidden;\n  white-space: nowrap;\n  height: 30px;\n  text-align: right;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td div.dash-cell-value,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th div.dash-cell-value {\n  display: inline;\n  vertical-align: middle;\n  white-space: inherit;\n  overflow: inherit;\n  text-overflow: inherit;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td div.dash-cell-value.cell-markdown,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th div.dash-cell-value.cell-markdown {\n  text-align: left;\n  font-family: sans-serif;\n  display: inline-block;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td div.dash-cell-value.cell-markdown blockquote,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th div.dash-cell-value.cell-markdown blockquote {\n  white-space: pre;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner textarea {\n  white-space: pre;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner table {\n  border-collapse: collapse;\n  font-family: monospace;\n  --accent: hotpink;\n  --border: lightgrey;\n  --text-color: #3c3c3c;\n  --hover: #fdfdfd;\n  --background-color-ellipses: #fdfdfd;\n  --faded-text: #fafafa;\n  --faded-text-header: #b4b4b4;\n  --selected-background: rgba(255, 65, 54, 0.2);\n  --faded-dropdown: #f0f0f0;\n  --muted: #c8c8c8;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner table:focus {\n  outline: none;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner thead {\n  display: table-row-group;\n}\n.dash-table-container .dash-spreadsheet-container .elip {\n  text-align: center;\n  width: 100%;\n  background-color: var(--background-color-ellipses);\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td.dropdown {\n  /*\n             * To view the dropdown's contents, we need\n             * overflow-y: visible.\n             * Unfortunately, overflow-x: hidden and overflow-y: visible\n             * can't both be set at the same time.\n             * So, we have to make both overflow-x: visible and overflow-y: visble\n             *\n             * See https://stackoverflow.com/questions/6421966/\n             *\n             * There might be another solution with parent divs, but I haven't\n             * tried it.\n             */\n  overflow-x: visible;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner :not(.cell--selected) tr:hover,\n.dash-table-container .dash-spreadsheet-container tr:hover input :not(.cell--selected) {\n  background-color: var(--hover);\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th {\n  background-color: #fafafa;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner td {\n  background-color: white;\n}\n.dash-table-container .dash-spreadsheet-container .expanded-row--empty-cell {\n  background-color: transparent;\n}\n.dash-table-container .dash-spreadsheet-container .expanded-row {\n  text-align: center;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner input:not([type=radio]):not([type=checkbox]) {\n  padding: 0px;\n  margin: 0px;\n  height: calc(100% - 1px);\n  line-height: 30px;\n  border: none;\n  font-family: inherit;\n  text-align: right;\n  box-sizing: border-box;\n  color: var(--text-color);\n  background-color: transparent;\n  /* so as to not overlay the box shadow */\n  /* browser's default text-shadow is `$color 0px 0px 0px;`\n             * for `input`, which makes it look a little bit heavier than dropdowns\n             * or bare `td`\n             */\n  text-shadow: none;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner input.unfocused {\n  color: transparent;\n  text-shadow: 0 0 0 var(--text-color);\n  cursor: default;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner input.unfocused:focus {\n  outline: none;\n}\n.dash-table-container .dash-spreadsheet-container .toggle-row {\n  border: none;\n  box-shadow: none;\n  width: 10px;\n  padding-left: 10px;\n  padding-right: 10px;\n  cursor: pointer;\n  color: var(--faded-text);\n}\n.dash-table-container .dash-spreadsheet-container .toggle-row--expanded {\n  color: var(--accent);\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner tr:hover .toggle-row {\n  color: var(--accent);\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .dash-delete-cell,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .dash-delete-header {\n  -webkit-touch-callout: none;\n  -webkit-user-select: none;\n  -khtml-user-select: none;\n  -moz-user-select: none;\n  -ms-user-select: none;\n  user-select: none;\n  cursor: default;\n  font-size: 1.3rem;\n  text-align: center;\n  cursor: pointer;\n  color: var(--muted);\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .dash-delete-cell:hover,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .dash-delete-header:hover {\n  color: var(--accent);\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner [class^='column-header--'] {\n  cursor: pointer;\n  float: left;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .column-header--select {\n  height: auto;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .column-header--select,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .column-header--sort {\n  color: var(--faded-text-header);\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .column-header--clear,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .column-header--delete,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .column-header--edit,\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner .column-header--hide {\n  opacity: 0.1;\n  padding-left: 2px;\n  padding-right: 2px;\n}\n.dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th:hover [class^='column-header--']:not(.disabled) {\n  color: var(--accent);\n  opacity: 1;\n}\n",""]),e.exports=t},371:function(e,t,n){var r=n(160),o=n(372);"string"==typeof(o=o.__esModule?o.default:o)&&(o=[[e.i,o,""]]);var a={insert:"head",singleton:!1},i=(r(e.i,o,a),o.locals?o.locals:{});e.exports=i},372:function(e,t,n){(t=n(161)(!1)).push([e.i,".dash-spreadsheet .Select,\n.dash-spreadsheet .Select-control {\n    border: none;\n    cursor: pointer;\n    height: 30px;  /* matches the td height and line-height */\n    border: none;\n}\n\n.dash-spreadsheet .Select-placeholder,\n.dash-spreadsheet .Select--single > .Select-control .Select-value {\n    height: 100%;\n    line-height: inherit;\n}\n\n.dash-spreadsheet .Select.has-value.Select--single > .Select-control .Select-value .Select-value-label,\n.dash-spreadsheet .Select.has-value.is-pseudo-focused.Select--single > .Select-control .Select-value .Select-value-label {\n    color: var(--text-color);\n}\n\n.dash-spreadsheet .Select:hover,\n.dash-spreadsheet .Select-control:hover {\n    border: none;\n    box-shadow: none;\n    cursor: pointer;\n}\n\n.dash-spreadsheet .Select-menu-outer {\n    z-index: 100;\n}\n\n.dash-spreadsheet .Select-arrow {\n    border-top-color: var(--faded-dropdown);\n    border-left-color: transparent;\n    border-right-color: transparent;\n    border-bottom-color: transparent;\n}\n\n.dash-spreadsheet .Select-control:hover .Select-arrow {\n    border-top-color: var(--accent);\n    border-left-color: transparent;\n    border-right-color: transparent;\n    border-bottom-color: transparent;\n}\n\n.dash-spreadsheet .is-open > .Select-control .Select-arrow {\n    border-bottom-color: var(--background-color-8-react-select);\n    border-left-color: transparent;\n    border-right-color: transparent;\n    border-top-color: transparent;\n}\n\n.dash-spreadsheet .Select--multi .Select-value,\n.dash-spreadsheet .Select--multi a.Select-value-label {\n    color: var(--color-8-react-select);\n}\n\n.dash-spreadsheet .Select {\n    border-radius: 0;\n}\n\n.dash-spreadsheet .Select.is-disabled > .Select-control {\n    border: none;\n}\n\n.dash-spreadsheet .Select--multi .Select-value-icon:hover,\n.dash-spreadsheet .Select--multi .Select-value-icon:focus {\n    font-weight: bold;\n}\n\n.dash-spreadsheet .Select.is-disabled .Select-control {\n    cursor: not-allowed;\n}\n\n.dash-spreadsheet .Select-menu-outer {\n    background-color: white;\n    border: none;\n    border-bottom: thin var(--border) solid;\n    border-radius: 0;\n    border-top: none;\n}\n\n.dash-spreadsheet .Select-option {\n    background-color: inherit;\n    color: var(--accent);\n}\n\n.dash-spreadsheet .Select-option:hover {\n    font-weight: bold;\n    color: var(--accent);\n    background-color: var(--hover);\n}\n\n.dash-spreadsheet .Select.is-focused:not(.is-open) > .Select-control {\n    border: none;\n    -webkit-box-shadow: none;\n    box-shadow: none;\n    background: #fff;\n}\n\n.dash-spreadsheet .Select-option.is-focused {\n    background-color: white;\n    color: var(--accent);\n    font-weight: bold;\n}\n\n.dash-spreadsheet .Select-clear {\n    color: transparent;\n}\n.dash-spreadsheet .Select:hover .Select-clear {\n    color: var(--accent);\n}\n\n.dash-spreadsheet .Select-control {\n    padding-left: 2px;\n}\n",""]),e.exports=t},396:function(e,t,n){"use strict";var r=function(e,t){if((n=(e=t?e.toExponential(t-1):e.toExponential()).indexOf("e"))<0)return null;var n,r=e.slice(0,n);return[r.length>1?r[0]+r.slice(2):r,+e.slice(n+1)]},o=function(e){return(e=r(Math.abs(e)))?e[1]:NaN},a=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function i(e){if(!(t=a.exec(e)))throw new Error("invalid format: "+e);var t;return new s({fill:t[1],align:t[2],sign:t[3],symbol:t[4],zero:t[5],width:t[6],comma:t[7],precision:t[8]&&t[8].slice(1),trim:t[9],type:t[10]})}function s(e){this.fill=void 0===e.fill?" ":e.fill+"",this.align=void 0===e.align?">":e.align+"",this.sign=void 0===e.sign?"-":e.sign+"",this.symbol=void 0===e.symbol?"":e.symbol+"",this.zero=!!e.zero,this.width=void 0===e.width?void 0:+e.width,this.comma=!!e.comma,this.precision=void 0===e.precision?void 0:+e.precision,this.trim=!!e.trim,this.type=void 0===e.type?"":e.type+""}i.prototype=s.prototype,s.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(void 0===this.width?"":Math.max(1,0|this.width))+(this.comma?",":"")+(void 0===this.precision?"":"."+Math.max(0,0|this.precision))+(this.trim?"~":"")+this.type};var l,c=function(e){e:for(var t,n=e.length,r=1,o=-1;r<n;++r)switch(e[r]){case".":o=t=r;break;case"0":0===o&&(o=r),t=r;break;default:if(!+e[r])break e;o>0&&(o=0)}return o>0?e.slice(0,o)+e.slice(t+1):e},u=function(e,t){var n=r(e,t);if(!n)return e+"";var o=n[0],a=n[1];return a<0?"0."+new Array(-a).join("0")+o:o.length>a+1?o.slice(0,a+1)+"."+o.slice(a+1):o+new Array(a-o.length+2).join("0")},p={"%":function(e,t){return(100*e).toFixed(t)},b:function(e){return Math.round(e).toString(2)},c:function(e){return e+""},d:function(e){return Math.round(e).toString(10)},e:function(e,t){return e.toExponential(t)},f:function(e,t){return e.toFixed(t)},g:function(e,t){return e.toPrecision(t)},o:function(e){return Math.round(e).toString(8)},p:function(e,t){return u(100*e,t)},r:u,s:function(e,t){var n=r(e,t);if(!n)return e+"";var o=n[0],a=n[1],i=a-(l=3*Math.max(-8,Math.min(8,Math.floor(a/3))))+1,s=o.length;return i===s?o:i>s?o+new Array(i-s+1).join("0"):i>0?o.slice(0,i)+"."+o.slice(i):"0."+new Array(1-i).join("0")+r(e,Math.max(0,t+i-1))[0]},X:function(e){return Math.round(e).toString(16).toUpperCase()},x:function(e){return Math.round(e).toString(16)}},f=function(e){return e},d=Array.prototype.map,h=["y","z","a","f","p","n","µ","m","","k","M","G","T","P","E","Z","Y"];t.a=function(e){var t,n,r=void 0===e.grouping||void 0===e.thousands?f:(t=d.call(e.grouping,Number),n=e.thousands+"",function(e,r){for(var o=e.length,a=[],i=0,s=t[0],l=0;o>0&&s>0&&(l+s+1>r&&(s=Math.max(1,r-l)),a.push(e.substring(o-=s,o+s)),!((l+=s+1)>r));)s=t[i=(i+1)%t.length];return a.reverse().join(n)}),a=void 0===e.currency?"":e.currency[0]+"",s=void 0===e.currency?"":e.currency[1]+"",u=void 0===e.decimal?".":e.decimal+"",b=void 0===e.numerals?f:function(e){return function(t){return t.replace(/[0-9]/g,function(t){return e[+t]})}}(d.call(e.numerals,String)),v=void 0===e.percent?"%":e.percent+"",m=void 0===e.minus?"-":e.minus+"",y=void 0===e.nan?"NaN":e.nan+"";function g(e){var t=(e=i(e)).fill,n=e.align,o=e.sign,f=e.symbol,d=e.zero,g=e.width,w=e.comma,k=e.precision,O=e.trim,x=e.type;"n"===x?(w=!0,x="g"):p[x]||(void 0===k&&(k=12),O=!0,x="g"),(d||"0"===t&&"="===n)&&(d=!0,t="0",n="=");var _="$"===f?a:"#"===f&&/[boxX]/.test(x)?"0"+x.toLowerCase():"",E="$"===f?s:/[%p]/.test(x)?v:"",S=p[x],C=/[defgprs%]/.test(x);function j(e){var a,i,s,p=_,f=E;if("c"===x)f=S(e)+f,e="";else{var v=(e=+e)<0;if(e=isNaN(e)?y:S(Math.abs(e),k),O&&(e=c(e)),v&&0==+e&&(v=!1),p=(v?"("===o?o:m:"-"===o||"("===o?"":o)+p,f=("s"===x?h[8+l/3]:"")+f+(v&&"("===o?")":""),C)for(a=-1,i=e.length;++a<i;)if(48>(s=e.charCodeAt(a))||s>57){f=(46===s?u+e.slice(a+1):e.slice(a))+f,e=e.slice(0,a);break}}w&&!d&&(e=r(e,1/0));var j=p.length+e.length+f.length,A=j<g?new Array(g-j+1).join(t):"";switch(w&&d&&(e=r(A+e,A.length?g-f.length:1/0),A=""),n){case"<":e=p+e+f+A;break;case"=":e=p+A+e+f;break;case"^":e=A.slice(0,j=A.length>>1)+p+e+f+A.slice(j);break;default:e=A+p+e+f}return b(e)}return k=void 0===k?6:/[gprs]/.test(x)?Math.max(1,Math.min(21,k)):Math.max(0,Math.min(20,k)),j.toString=function(){return e+""},j}return{format:g,formatPrefix:function(e,t){var n=g(((e=i(e)).type="f",e)),r=3*Math.max(-8,Math.min(8,Math.floor(o(t)/3))),a=Math.pow(10,-r),s=h[8+r/3];return function(e){return n(a*e)+s}}}}}}]);
-//# sourceMappingURL=async-table.js.map
\ No newline at end of file
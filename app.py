@@ -7,17 +7,31 @@ To launch the app, run
 
 Dash documentation: https://dash.plot.ly/
 """
+import functools
 import os
+import threading
+import time
+import traceback
 import numpy as np
 
+import flask
 import dash
 from dash.dependencies import Input, Output, State, ClientsideFunction
 import dash_table
 import dash_html_components as html
 import dash_core_components as dcc
 
-from make_figures import make_map, make_timeplot, FIRST_LINE_HEIGHT
+from make_figures import (make_map, make_map_frames, make_timeplot,
+                          make_timeplot_store, split_timeplot_store,
+                          write_shards, evict_shards,
+                          freeze_timeplot_store,
+                          timeplot_figure, selected_countries,
+                          FIRST_LINE_HEIGHT)
 from data_input import tidy_most_recent, get_all_data
+from figure_cache import cached_figure, evict_figures
+from snapshot import get_snapshot_time
+from refresh import start_refresh
+from instrumentation import INSTRUMENT, instrumented, get_metrics
 
 if 'DEBUG' in os.environ:
     debug = os.environ['DEBUG'] == 'True'
@@ -26,28 +40,176 @@ else:
     print("No DEBUG environment variable: defaulting to debug mode")
     debug = True
 
-# -------- Data --------------------------
-df, df_prediction = get_all_data()
-# most recent date, tidy format (one column for countries)
-df_tidy = tidy_most_recent(df)
-df_tidy_fatalities = tidy_most_recent(df, 'death')
-# keep only two columns for Dash DataTable
-df_tidy_table = df_tidy[['country_region', 'value']]
-
-df_tidy_table = df_tidy_table.reset_index()
-# The indices initially displayed
-initial_indices = list(df_tidy_table['value'].nlargest(3).index)
-# We hardcode the second and third index shown as being China, and Korea
-# to give a message of hope
-# Not China so far, as it is still the top on in terms of numbers of
-# total confirmed cases
-#initial_indices[-1]  = np.where(df_tidy['iso'] == 'CHN')[0][0]
-initial_indices[-2]  = np.where(df_tidy['iso'] == 'KOR')[0][0]
-
-# ----------- Figures ---------------------
-fig1 = make_map(df_tidy, df_tidy_fatalities)
-fig2 = make_timeplot(df, df_prediction, countries=['France', 'Italy', 'Spain'])
-fig_store = make_timeplot(df, df_prediction)
+# Set COVID_DASH_SERVER_CALLBACKS to True to build the figure of the time
+# plot on the server, rather than sending the data of all the countries
+# to the browser. The static website always uses the clientside callbacks
+SERVER_CALLBACKS = os.environ.get('COVID_DASH_SERVER_CALLBACKS',
+                                  'False') == 'True'
+# The number of figures of the time plot kept in memory by each worker,
+# in the server-callback mode
+TIMEPLOT_CACHE_SIZE = int(os.environ.get('COVID_DASH_TIMEPLOT_CACHE_SIZE',
+                                         256))
+
+# How long, in seconds, a worker may serve a former snapshot before
+# /_health answers 503: a reload takes a few seconds, and the workers
+# reload at their own pace
+HEALTH_STALE_TIMEOUT = float(os.environ.get('COVID_DASH_HEALTH_STALE_TIMEOUT',
+                                            600))
+
+# -------- Data and figures --------------------------
+TIMEPLOT_SHARDS_DIR = 'timeplot'
+# How long, in seconds, the shards of a former snapshot are kept for the
+# pages loaded before a reload
+TIMEPLOT_SHARDS_MAX_AGE = 24 * 3600
+
+
+@instrumented('app.load_state')
+def load_state():
+    """ Load the data snapshot, and build the figures and the data shown
+        in the layout
+    """
+    snapshot_time = get_snapshot_time()
+    df, df_prediction = get_all_data()
+    # most recent date, tidy format (one column for countries)
+    df_tidy = tidy_most_recent(df)
+    df_tidy_fatalities = tidy_most_recent(df, 'death')
+    # keep only two columns for Dash DataTable
+    df_tidy_table = df_tidy[['country_region', 'value']]
+
+    df_tidy_table = df_tidy_table.reset_index()
+    # The indices initially displayed
+    initial_indices = list(df_tidy_table['value'].nlargest(3).index)
+    # We hardcode the second and third index shown as being China, and Korea
+    # to give a message of hope
+    # Not China so far, as it is still the top on in terms of numbers of
+    # total confirmed cases
+    #initial_indices[-1]  = np.where(df_tidy['iso'] == 'CHN')[0][0]
+    initial_indices[-2]  = np.where(df_tidy['iso'] == 'KOR')[0][0]
+
+    # The figures are cached on disk, and shared with the other workers.
+    # The figures of former snapshots are not used anymore
+    if snapshot_time is None:
+        snapshot_time = get_snapshot_time()
+    evict_figures(older_than=snapshot_time)
+    fig1 = cached_figure(make_map, df_tidy, df_tidy_fatalities)
+    # The compact frames from which the browser animates the map over time
+    map_frames = cached_figure(make_map_frames, df)
+    fig2 = cached_figure(make_timeplot, df, df_prediction,
+                         countries=['France', 'Italy', 'Spain'])
+    # Compact data of all the countries, from which the traces of the
+    # selected countries are assembled
+    timeplot_store = cached_figure(make_timeplot_store, df, df_prediction)
+    # The rows of the table of each country, for the clicks on the map
+    table_rows = {
+        country: [int(row) for row in rows] for country, rows in
+        df_tidy_table.groupby('country_region', sort=False).groups.items()}
+    if SERVER_CALLBACKS:
+        # The figures are built on the server, for each selection, and the
+        # most recent ones are kept in memory. The cache goes with the
+        # state: a new snapshot starts with an empty cache
+        fig_store = dict(table_rows=table_rows)
+        timeplot_store = freeze_timeplot_store(timeplot_store)
+        timeplot_cache = functools.lru_cache(maxsize=TIMEPLOT_CACHE_SIZE)(
+            functools.partial(timeplot_figure, timeplot_store))
+    else:
+        # The browser assembles the traces. Only the countries initially
+        # displayed have their data in the page: the data of the others
+        # is in one JSON shard per country, fetched by the browser when
+        # they are selected
+        fig_store, timeplot_shards = split_timeplot_store(
+            timeplot_store,
+            inline_countries=list(
+                df_tidy_table.loc[initial_indices, 'country_region']))
+        # The shards of each snapshot are in their own directory: a page
+        # loads the shards of the snapshot of its store, even after a
+        # reload
+        shards_version = write_shards(timeplot_shards, TIMEPLOT_SHARDS_DIR)
+        evict_shards(TIMEPLOT_SHARDS_DIR, keep=shards_version,
+                     max_age=TIMEPLOT_SHARDS_MAX_AGE)
+        fig_store['shard_url'] = f'{TIMEPLOT_SHARDS_DIR}/{shards_version}/'
+        fig_store['table_rows'] = table_rows
+        timeplot_store = timeplot_cache = None
+
+    # Only what the layout needs is kept: the data frames are released
+    return dict(
+        snapshot_time=snapshot_time,
+        fig1=fig1,
+        fig2=fig2,
+        map_frames=map_frames,
+        fig_store=fig_store,
+        timeplot_store=timeplot_store,
+        timeplot_cache=timeplot_cache,
+        initial_indices=initial_indices,
+        table_data=df_tidy_table.to_dict('records'),
+        last_date=df_tidy['date'].max().date(),
+    )
+
+
+state = load_state()
+
+# Held while the state is reloaded: a single reload at a time
+_reload_lock = threading.Lock()
+# The time of the last snapshot that could not be loaded: it is not
+# tried again until the snapshot changes
+_failed_snapshot_time = None
+
+
+def reload_state():
+    """ Reload the data if the snapshot changed
+
+    The new state is built while the former one keeps being served, and
+    then swapped in a single assignment: requests never wait for the
+    reload
+    """
+    global state
+    with _reload_lock:
+        if get_snapshot_time() != state['snapshot_time']:
+            state = load_state()
+
+
+def _reload_state_quietly():
+    global _failed_snapshot_time
+    snapshot_time = get_snapshot_time()
+    try:
+        reload_state()
+    except Exception:
+        # A broken snapshot must not stop the server: the former state
+        # keeps being served, and the failure is logged once
+        _failed_snapshot_time = snapshot_time
+        traceback.print_exc()
+
+
+def check_reload():
+    """ Reload the data in a thread if the snapshot changed, without
+        making the request wait
+
+    The snapshot may be updated by hand (python modeling.py), or by the
+    refresh of another worker: it is then picked up at the next request,
+    even when the background refresh is disabled. A snapshot that failed
+    to load is not tried again, until it is written again.
+    """
+    snapshot_time = get_snapshot_time()
+    if (snapshot_time != state['snapshot_time']
+            and snapshot_time != _failed_snapshot_time
+            and not _reload_lock.locked()):
+        threading.Thread(target=_reload_state_quietly, name='reload',
+                         daemon=True).start()
+
+
+def start_worker():
+    """ Start the background tasks of a process serving the app
+    """
+    # Set COVID_DASH_REFRESH_INTERVAL (in seconds) to refresh the data in
+    # the background, without restarting the server
+    start_refresh(reload_state)
+
+
+# When gunicorn preloads the app (see gunicorn.conf.py), the app is
+# loaded in the master process, and the workers are started after the
+# fork
+if os.environ.get('COVID_DASH_PRELOAD', 'False') != 'True':
+    start_worker()
+
 
 # ------------ Markdown text ---------------
 # maybe later we can break the text in several parts
@@ -71,120 +233,200 @@ app = dash.Dash(__name__,
 app.title = 'Covid-19: confirmed cases and extrapolation'
 server = app.server
 
-app.layout = html.Div([
-    html.H1(children=app.title, className="title"),
-    html.Div([#row
-        html.Div([
-            dcc.Graph(
-                id='map', figure=fig1,
-                config={
-                    'displayModeBar': True,
-                    'modeBarButtonsToRemove': ['toImage', 'lasso2d',
-                                               'toggleSpikelines',
-                                               'hoverClosestGeo']})
-            ],
-            className="pure-u-1 pure-u-lg-1 pure-u-xl-12-24",
-            ),
-        html.Div([
-            dcc.RadioItems(id='radio-cases',
-                options=[
-                    {'label':'Confirmed cases', 'value': 'active'},
-                    {'label': 'Fatalities', 'value': 'death'},
+
+@server.route(f'/{TIMEPLOT_SHARDS_DIR}/<path:filename>')
+def timeplot_shard(filename):
+    return flask.send_from_directory(os.path.abspath(TIMEPLOT_SHARDS_DIR),
+                                     filename)
+
+
+@server.route('/_health')
+def health():
+    """ The snapshot served by this worker: all the workers are up to
+        date if they serve the last snapshot written
+
+    A worker behind the last snapshot answers "stale", and starts to
+    reload it. It answers 503 only if it has been behind for longer than
+    HEALTH_STALE_TIMEOUT: the workers reload one after the other, and
+    must not all be dropped by the load balancer while they do.
+    """
+    check_reload()
+    current = state
+    snapshot_time = get_snapshot_time()
+    up_to_date = current['snapshot_time'] == snapshot_time
+    # The metadata of a snapshot being written may be unreadable for a
+    # moment: the worker is not behind then
+    stale_for = (0 if up_to_date or snapshot_time is None
+                 else time.time() - snapshot_time)
+    response = flask.jsonify(
+        status='ok' if up_to_date else 'stale',
+        pid=os.getpid(),
+        snapshot_time=current['snapshot_time'],
+        last_snapshot_time=snapshot_time,
+        stale_for=stale_for,
+        last_date=current['last_date'].isoformat(),
+    )
+    response.status_code = 503 if stale_for > HEALTH_STALE_TIMEOUT else 200
+    return response
+
+
+if INSTRUMENT:
+    # The timings of the stages run by this worker
+    @server.route('/_metrics')
+    def metrics():
+        metrics = get_metrics()
+        if state['timeplot_cache'] is not None:
+            # The hits and misses of the figures built on the server
+            metrics['timeplot_cache'] = \
+                state['timeplot_cache'].cache_info()._asdict()
+        return flask.jsonify(metrics)
+
+
+def serve_layout():
+    """ The layout of the app, built from the current state: each page
+        load gets the latest data
+    """
+    check_reload()
+    # A local reference: the state may be swapped while we build the
+    # layout
+    current = state
+    return html.Div([
+        html.H1(children=app.title, className="title"),
+        html.Div([#row
+            html.Div([
+                dcc.Graph(
+                    id='map', figure=current['fig1'],
+                    config={
+                        'displayModeBar': True,
+                        'modeBarButtonsToRemove': ['toImage', 'lasso2d',
+                                                   'toggleSpikelines',
+                                                   'hoverClosestGeo']}),
+                html.Div([
+                    html.Button('▶', id='map-play', className='map-play'),
+                    html.Div([
+                        dcc.Slider(
+                            id='map-date', min=0,
+                            max=len(current['map_frames']['dates']) - 1,
+                            value=len(current['map_frames']['dates']) - 1,
+                            step=1, marks=current['map_frames']['marks'],
+                            updatemode='drag'),
+                        ],
+                        className='map-date'),
+                    ],
+                    className='map-slider'),
+                dcc.Interval(id='map-interval', interval=300, disabled=True),
+                dcc.Store(id='map-store', data=current['map_frames']),
                 ],
-                value='active',
-                labelStyle={'display': 'inline-block',
-                            'padding-right': '0.5em'}
-          ),
-            dcc.RadioItems(id='log-lin',
-                options=[
-                    {'label':'log', 'value': 'log'},
-                    {'label': 'linear', 'value': 'linear'},
+                className="pure-u-1 pure-u-lg-1 pure-u-xl-12-24",
+                ),
+            html.Div([
+                dcc.RadioItems(id='radio-cases',
+                    options=[
+                        {'label':'Confirmed cases', 'value': 'active'},
+                        {'label': 'Fatalities', 'value': 'death'},
+                    ],
+                    value='active',
+                    labelStyle={'display': 'inline-block',
+                                'padding-right': '0.5em'}
+              ),
+                dcc.RadioItems(id='log-lin',
+                    options=[
+                        {'label':'log', 'value': 'log'},
+                        {'label': 'linear', 'value': 'linear'},
+                    ],
+                    value='linear',
+                    labelStyle={'display': 'inline-block',
+                                'padding-right': '0.5em'}
+              ),
+
+                dcc.Graph(
+                    id='plot', figure=current['fig2'],
+                    config={
+                        'displayModeBar': True,
+                        'modeBarButtonsToRemove': ['toImage', 'zoom2d',
+                                                   'select2d', 'lasso2d',
+                                                   'toggleSpikelines',
+                                                   'resetScale2d']}
+                    )
                 ],
-                value='linear',
-                labelStyle={'display': 'inline-block',
-                            'padding-right': '0.5em'}
-          ),
-
-            dcc.Graph(
-                id='plot', figure=fig2,
-                config={
-                    'displayModeBar': True,
-                    'modeBarButtonsToRemove': ['toImage', 'zoom2d',
-                                               'select2d', 'lasso2d',
-                                               'toggleSpikelines',
-                                               'resetScale2d']}
-                )
-            ],
-            className="pure-u-1 pure-u-lg-1-2 pure-u-xl-8-24",
-            ),
-        dcc.Store(id='store', data=[fig_store, initial_indices]),
-        html.Div([
-            dash_table.DataTable(
-                id='table',
-                columns=[{"name": "Country", "id": "country_region"},
-                         {"name": "Cases", "id": "value"},
-                        ],
-                data=df_tidy_table.to_dict('records'),
-                filter_action="native",
-                sort_action="native",
-                sort_by=[{'column_id':'value', 'direction':'desc'}],
-                row_selectable="multi",
-                style_table={
-                    'maxHeight': '{0}px'.format(FIRST_LINE_HEIGHT),
-                    'overflowY': 'scroll'
+                className="pure-u-1 pure-u-lg-1-2 pure-u-xl-8-24",
+                ),
+            dcc.Store(id='store', data=[current['fig_store'],
+                                         current['initial_indices']]),
+            # Clicked by the browser when the shards of the selected
+            # countries are loaded, to update the time plot
+            html.Button(id='shards-loaded', style={'display': 'none'}),
+            html.Div([
+                dash_table.DataTable(
+                    id='table',
+                    columns=[{"name": "Country", "id": "country_region"},
+                             {"name": "Cases", "id": "value"},
+                            ],
+                    data=current['table_data'],
+                    filter_action="native",
+                    sort_action="native",
+                    sort_by=[{'column_id':'value', 'direction':'desc'}],
+                    row_selectable="multi",
+                    style_table={
+                        'maxHeight': '{0}px'.format(FIRST_LINE_HEIGHT),
+                        'overflowY': 'scroll'
+                        },
+                    style_cell={
+                        'height': 'auto', 'minHeight': '30px',
+                        'minWidth': '0px', 'maxWidth': '10px',
+                        'whiteSpace': 'normal'
                     },
-                style_cell={
-                    'height': 'auto', 'minHeight': '30px',
-                    'minWidth': '0px', 'maxWidth': '10px',
-                    'whiteSpace': 'normal'
-                },
-                style_filter={'height':'20px',
-                    },
-                style_cell_conditional=[
-                    {'if': {'column_id': 'country_region'},
-                     'width': '60%'},
-                    {'if': {'column_id': 'value'},
-                     'width': '40%'},
+                    style_filter={'height':'20px',
+                        },
+                    style_cell_conditional=[
+                        {'if': {'column_id': 'country_region'},
+                         'width': '60%'},
+                        {'if': {'column_id': 'value'},
+                         'width': '40%'},
+                    ],
+                    style_data_conditional=[
+                    {
+                        'if': {'row_index': 'odd'},
+                        'backgroundColor': 'rgb(248, 248, 248)'
+                    }
+                    ],
+                ),
                 ],
-                style_data_conditional=[
-                {
-                    'if': {'row_index': 'odd'},
-                    'backgroundColor': 'rgb(248, 248, 248)'
-                }
+                className="pure-u-1 pure-u-lg-1-2 pure-u-xl-4-24"),
+            html.Div([html.Div([dcc.Markdown(intro_md,
+                                             dangerously_allow_html=True)],
+                      className="text-block")],
+                className="pure-u-1 pure-u-lg-1 pure-u-xl-22-24"),
+            html.Div([
+                html.Div(['Latest data point: ',
+                           current['last_date']],
+                         className="date")
                 ],
-            ),
-            ],
-            className="pure-u-1 pure-u-lg-1-2 pure-u-xl-4-24"),
-        html.Div([html.Div([dcc.Markdown(intro_md,
-                                         dangerously_allow_html=True)],
-                  className="text-block")],
-            className="pure-u-1 pure-u-lg-1 pure-u-xl-22-24"),
-        html.Div([
-            html.Div(['Latest data point: ',
-                       df_tidy['date'].max().date()],
-                     className="date")
+                className="pure-u-1 pure-u-xl-1-24"),
             ],
-            className="pure-u-1 pure-u-xl-1-24"),
-        ],
-        className="pure-g"),
-        html.Div([
-            html.Span('Contributors', className='contributors'),
-            html.Ul([
-                html.Li(['Gaël Varoquaux, Inria & McGill University']),
-                html.Li(['Emmanuelle Gouillart, Plotly Inc']),
-                html.Li(['Russell Poldrack, Stanford University']),
-                html.Li(['Guillaume Lemaitre, Inria']),
-                html.Li(['Ashwin Nalwade, NYU Courant']),
-            ]),
+            className="pure-g"),
+            html.Div([
+                html.Span('Contributors', className='contributors'),
+                html.Ul([
+                    html.Li(['Gaël Varoquaux, Inria & McGill University']),
+                    html.Li(['Emmanuelle Gouillart, Plotly Inc']),
+                    html.Li(['Russell Poldrack, Stanford University']),
+                    html.Li(['Guillaume Lemaitre, Inria']),
+                    html.Li(['Ashwin Nalwade, NYU Courant']),
+                ]),
+                ],
+                className="footer"),
             ],
-            className="footer"),
-        ],
-    )
+        )
+
+
+app.layout = serve_layout
 
 # ---------------------- Callbacks ---------------------------------
-# Callbacks are all client-side (https://dash.plot.ly/performance)
+# Callbacks are client-side (https://dash.plot.ly/performance)
 # in order to transform the app into static html pages
 # javascript functions are defined in assets/callbacks.js
+# Only the time plot can be built on the server (see SERVER_CALLBACKS)
 
 app.clientside_callback(
     ClientsideFunction(
@@ -204,19 +446,74 @@ app.clientside_callback(
 
 app.clientside_callback(
     ClientsideFunction(
-        namespace='clientside',
-        function_name='update_store_data'
+        namespace='clientside_map',
+        function_name='update_map_date'
     ),
-    output=Output('plot', 'figure'),
-    inputs=[
-        Input('table', "data"),
-        Input('table', "selected_rows"),
-        Input('radio-cases', 'value'),
-        Input('log-lin', 'value')],
-    state=[State('store', 'data')],
+    output=Output('map', 'figure'),
+    inputs=[Input('map-date', 'value')],
+    state=[State('map', 'figure'),
+           State('map-store', 'data')],
     )
 
 
+app.clientside_callback(
+    ClientsideFunction(
+        namespace='clientside_map',
+        function_name='toggle_map_animation'
+    ),
+    output=[Output('map-interval', 'disabled'),
+            Output('map-play', 'children')],
+    inputs=[Input('map-play', 'n_clicks')],
+    )
+
+
+app.clientside_callback(
+    ClientsideFunction(
+        namespace='clientside_map',
+        function_name='step_map_date'
+    ),
+    output=Output('map-date', 'value'),
+    inputs=[Input('map-interval', 'n_intervals')],
+    state=[State('map-date', 'value'),
+           State('map-date', 'max')],
+    )
+
+
+if SERVER_CALLBACKS:
+    @app.callback(
+        Output('plot', 'figure'),
+        [Input('table', "data"),
+         Input('table', "selected_rows"),
+         Input('radio-cases', 'value'),
+         Input('log-lin', 'value')])
+    def update_plot(rows, selected_rows, cases_type, log_or_lin):
+        """ The figure of the time plot for the selected rows of the
+            table, from the cache of the current state
+
+        The rows are those of the table shown in the browser: a page
+        loaded before a reload of the data has the former table.
+        """
+        current = state
+        countries = selected_countries(current['timeplot_store'], rows,
+                                       selected_rows)
+        return current['timeplot_cache'](countries, cases_type, log_or_lin)
+else:
+    app.clientside_callback(
+        ClientsideFunction(
+            namespace='clientside',
+            function_name='update_store_data'
+        ),
+        output=Output('plot', 'figure'),
+        inputs=[
+            Input('table', "data"),
+            Input('table', "selected_rows"),
+            Input('radio-cases', 'value'),
+            Input('log-lin', 'value'),
+            Input('shards-loaded', 'n_clicks')],
+        state=[State('store', 'data')],
+        )
+
+
 
 if __name__ == '__main__':
     app.run_server(debug=debug)
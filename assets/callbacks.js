@@ -22,8 +22,9 @@ window.dash_clientside.clientside3 = {
 	 * selectedrows: list of indices
 	 *     list of selected countries to be updated
 	 * store: list
-	 *     store[1] is the list of countries to be used when initializing
-	 *     the app
+	 *     store[0]['table_rows'] maps each country to its rows in the
+	 *     table, store[1] is the list of countries to be used when
+	 *     initializing the app
 	 */
     	if ((!selecteddata) && (!clickdata)) {
 	    // this is only visited when initializing the app
@@ -33,39 +34,171 @@ window.dash_clientside.clientside3 = {
 	if (!selectedrows) {
 	    selectedrows = [];
 	}
-	var ids = [...selectedrows];
+	var was_selected = new Set(selectedrows);
+	var ids = new Set(selectedrows);
 
 	var countries = [];
 	if (clickdata) {
-	    var country = clickdata['points'][0]['customdata'][0];
-	    countries.push(country);
+	    countries.push(clickdata['points'][0]['customdata'][0]);
 	}
 	if (selecteddata) {
-	    var countries = [];
-		for (i = 0; i < selecteddata['points'].length; i++) {
-		    countries.push(selecteddata['points'][i]['customdata'][0]);
+	    countries = [];
+	    for (var i = 0; i < selecteddata['points'].length; i++) {
+		countries.push(selecteddata['points'][i]['customdata'][0]);
 	    }
 	}
-	for (i = 0; i < countries.length; i++) {
-	    for (j = 0; j < table_data.length; j++) {
-		if (countries[i] == table_data[j]["country_region"]) {
-		    if (selectedrows.includes(j)){
-			var index = ids.indexOf(j);
-			ids.splice(index, 1);
-			}
-		    else{
-			ids.push(j);
-		    }
+	// The rows of each country are looked up in the store, rather than
+	// searched in the whole table
+	var table_rows = store[0]['table_rows'];
+	for (var i = 0; i < countries.length; i++) {
+	    var rows = table_rows[countries[i]] || [];
+	    for (var j = 0; j < rows.length; j++) {
+		if (was_selected.has(rows[j])) {
+		    ids.delete(rows[j]);
+		}
+		else {
+		    ids.add(rows[j]);
 		}
 	    }
 	}
-	return ids;
+	return Array.from(ids);
     }
 };
 
     
 window.dash_clientside.clientside = {
-    update_store_data: function(rows, selectedrows, cases_type, log_or_lin, store) {
+    // The shards downloaded, and those being downloaded, by url
+    shards: {},
+    pending: {},
+
+    fetch_shard: function(url) {
+	/**
+	 * Download a JSON shard into the cache
+	 *
+	 * Returns a promise of whether it was loaded
+	 */
+	var cache = window.dash_clientside.clientside;
+	cache.pending[url] = true;
+	return fetch(url).then(function(response) {
+	    if (!response.ok) {
+		throw "Could not load " + url;
+	    }
+	    return response.json();
+	}).then(function(data) {
+	    cache.shards[url] = data;
+	    delete cache.pending[url];
+	    return true;
+	}, function(error) {
+	    console.error(error);
+	    delete cache.pending[url];
+	    return false;
+	});
+    },
+
+    load_shards: function(store, countries) {
+	/**
+	 * Download in the background the shards of the countries that are
+	 * not loaded yet, all at once.
+	 *
+	 * The clientside callbacks of Dash must return their result
+	 * directly, and not a promise: when shards are loaded, the hidden
+	 * "shards-loaded" button is clicked, which runs update_store_data
+	 * again
+	 */
+	var cache = window.dash_clientside.clientside;
+	var requests = [];
+	for (var i = 0; i < countries.length; i++) {
+	    var data = store['countries'][countries[i]];
+	    if (!data || !data['shard']) {
+		continue;
+	    }
+	    var url = store['shard_url'] + data['shard'];
+	    if (!(url in cache.shards) && !(url in cache.pending)) {
+		requests.push(cache.fetch_shard(url));
+	    }
+	}
+	if (requests.length) {
+	    Promise.all(requests).then(function(loaded) {
+		if (loaded.indexOf(true) >= 0) {
+		    document.getElementById('shards-loaded').click();
+		}
+	    });
+	}
+    },
+
+    make_traces: function(store, country, cases_type) {
+	/**
+	 * Assemble the plotly traces of a country from the compact store
+	 * built by make_figures.make_timeplot_store
+	 *
+	 * Returns an object with the traces of the measures and of the
+	 * predictions (empty for fatalities)
+	 */
+	var data = store['countries'][country];
+	var traces = {'measure': [], 'prediction': []};
+	if (!data) {
+	    return traces;
+	}
+	if (data['shard']) {
+	    // The country is shown once its shard is loaded
+	    var shard = window.dash_clientside.clientside.shards[
+		store['shard_url'] + data['shard']];
+	    if (!shard) {
+		return traces;
+	    }
+	    data = Object.assign({}, data, shard);
+	}
+	var type = (cases_type === 'active') ? 'confirmed' : 'death';
+	if (!data[type]) {
+	    return traces;
+	}
+	var index = data[type + '_index'];
+	var color = store['colors'][index % store['colors'].length];
+	traces['measure'].push({
+	    'type': 'scatter',
+	    'x': store['dates'],
+	    'y': data[type],
+	    'name': (type === 'confirmed') ? country : '  ' + country,
+	    'mode': 'markers+lines',
+	    'marker': {'color': color, 'symbol': store['symbols'][index]},
+	    'line': {'color': color},
+	    'meta': country,
+	    'hovertemplate': store['hovertemplates'][type],
+	    'visible': true
+	});
+	if ((type === 'confirmed') && data['prediction']) {
+	    traces['prediction'].push({
+		'type': 'scatter',
+		'x': store['prediction_dates'],
+		'y': data['prediction'],
+		'name': '+' + country,
+		'mode': 'lines',
+		'line': {'color': color, 'dash': 'dash'},
+		'showlegend': false,
+		'meta': country,
+		'hovertemplate': store['hovertemplates']['prediction'],
+		'visible': true
+	    });
+	    var bounds = ['upper_bound', 'lower_bound'];
+	    for (var k = 0; k < bounds.length; k++) {
+		traces['prediction'].push({
+		    'type': 'scatter',
+		    'x': store['prediction_dates'],
+		    'y': data[bounds[k]],
+		    'name': '+' + country,
+		    'mode': 'lines',
+		    'line': {'color': color, 'dash': 'dot', 'width': .8},
+		    'showlegend': false,
+		    'visible': true,
+		    'hoverinfo': 'skip'
+		});
+	    }
+	}
+	return traces;
+    },
+
+    update_store_data: function(rows, selectedrows, cases_type, log_or_lin,
+				shards_loaded, store) {
 	/**
 	 * Update timeseries figure when selected countries change,
 	 * or type of cases (active cases or fatalities)
@@ -81,51 +214,62 @@ window.dash_clientside.clientside = {
 	 *	active or death
 	 *  log_or_lin: str
 	 *	log or linear axis
+	 *  shards_loaded: int
+	 *	clicks of the hidden button clicked when shards are loaded
 	 *  store: list
-	 *	store[0]: plotly-figure-dict, containing all the traces (all
-	 *	countries, data and prediction, for active cases and deaths)
+	 *	store[0]: compact data of all the countries (data and
+	 *	prediction, for active cases and deaths), from which the traces
+	 *	are assembled. The data of most countries is in shards,
+	 *	downloaded when they are selected: the figure is updated again
+	 *	once they are loaded
 	 *	store[1]: list of countries to be used at initialization
 	 */
-	var fig = store[0];
+	var fig_store = store[0];
 	if (!rows) {
            throw "Figure data not loaded, aborting update."
        }
 	var new_fig = {};
 	new_fig['data'] = [];
-	new_fig['layout'] = fig['layout'];
-	var countries = [];
+	new_fig['layout'] = fig_store['layout'];
+	var selected = new Set();
+	for (var i = 0; i < selectedrows.length; i++) {
+	    var country = rows[selectedrows[i]]["country_region"];
+	    if (country in fig_store['country_index']) {
+		selected.add(country);
+	    }
+	}
+	// The traces follow the order of the countries in the store, with
+	// the predictions after the measures
+	var country_index = fig_store['country_index'];
+	var countries = Array.from(selected).sort(function(a, b) {
+	    return country_index[a] - country_index[b];
+	});
+	window.dash_clientside.clientside.load_shards(fig_store, countries);
+	var type = (cases_type === 'active') ? 'confirmed' : 'death';
 	var max = 100;
-	var max_data = 0;
-	for (i = 0; i < selectedrows.length; i++) {
-	    countries.push(rows[selectedrows[i]]["country_region"]);
+	var predictions = [];
+	for (var i = 0; i < countries.length; i++) {
+	    var traces = window.dash_clientside.clientside.make_traces(
+		fig_store, countries[i], cases_type);
+	    new_fig['data'].push(...traces['measure']);
+	    predictions.push(...traces['prediction']);
+	    // The maxima of the values are precomputed in the store
+	    var data = fig_store['countries'][countries[i]];
+	    if (traces['measure'].length && data[type + '_max'] > max) {
+		max = data[type + '_max'];
+	    }
+	    if (traces['prediction'].length && data['prediction_max'] > max) {
+		max = data['prediction_max'];
+	    }
 	}
+	new_fig['data'].push(...predictions);
 	if (cases_type === 'active'){
 	    new_fig['layout']['annotations'][0]['visible'] = false;
 	    new_fig['layout']['annotations'][1]['visible'] = true;
-	    for (i = 0; i < fig['data'].length; i++) {
-		var name = fig['data'][i]['name'];
-		if (countries.includes(name) || countries.includes(name.substring(1))){
-		    new_fig['data'].push(fig['data'][i]);
-		    max_data = Math.max(...fig['data'][i]['y']);
-		    if (max_data > max){
-			max = max_data;
-		    }
-		}
-	    }
 	}
 	else{
 	    new_fig['layout']['annotations'][0]['visible'] = true;
 	    new_fig['layout']['annotations'][1]['visible'] = false;
-	    for (i = 0; i < fig['data'].length; i++) {
-		var name = fig['data'][i]['name'];
-		if (countries.includes(name.substring(2))){
-		    new_fig['data'].push(fig['data'][i]);
-		    max_data = Math.max(...fig['data'][i]['y']);
-		    if (max_data > max){
-			max = max_data;
-		    }
-		}
-	    }
 	}
 	new_fig['layout']['yaxis']['type'] = log_or_lin;
 	if (log_or_lin === 'log'){
@@ -143,3 +287,133 @@ window.dash_clientside.clientside = {
     }
 };
 
+
+window.dash_clientside.clientside_map = {
+    // The frames decoded, and the codes they were decoded from
+    frames: null,
+    frames_codes: null,
+
+    decode_map_frames: function(map_store) {
+	/**
+	 * Decode the frames of the animation of the map, built by
+	 * make_figures.make_map_frames: each frame is the difference
+	 * (modulo 256) of its quantized values to the frame before it.
+	 *
+	 * Returns a list of Uint8Array, the codes of the countries for
+	 * each date
+	 */
+	var cache = window.dash_clientside.clientside_map;
+	if (cache.frames_codes === map_store['codes']) {
+	    return cache.frames;
+	}
+	var bytes = atob(map_store['codes']);
+	var n_countries = map_store['iso'].length;
+	var frames = [];
+	var previous = new Uint8Array(n_countries);
+	for (var d = 0; d < map_store['dates'].length; d++) {
+	    var codes = new Uint8Array(n_countries);
+	    for (var i = 0; i < n_countries; i++) {
+		codes[i] = (previous[i] +
+			    bytes.charCodeAt(d * n_countries + i)) & 255;
+	    }
+	    frames.push(codes);
+	    previous = codes;
+	}
+	cache.frames = frames;
+	cache.frames_codes = map_store['codes'];
+	return frames;
+    },
+
+    update_map_date: function(index, figure, map_store) {
+	/**
+	 * Show on the map the cases as of the date of the slider
+	 *
+	 * Parameters
+	 * ----------
+	 *
+	 *  index: int
+	 *	index of the date in map_store['dates']
+	 *  figure: object (dict)
+	 *	the map, as built by make_figures.make_map for the last date
+	 *  map_store: object (dict)
+	 *	the frames of the animation, from make_figures.make_map_frames
+	 */
+	if (!figure || !map_store || (index === null) ||
+	    (index === undefined)) {
+	    return figure;
+	}
+	var trace = Object.assign({}, figure['data'][0]);
+	var n_dates = map_store['dates'].length;
+	if ((index >= n_dates - 1) && (trace['meta'] === undefined)) {
+	    // The map of the last date, as built by the server
+	    return figure;
+	}
+	if (index >= n_dates - 1) {
+	    // The exact values of the last date are in the customdata
+	    trace['z'] = trace['customdata'].map(function(d) {
+		return (d[1] > 0) ? Math.log10(d[1]) : null;
+	    });
+	    trace['hovertemplate'] = map_store['hovertemplates']['last'];
+	    delete trace['text'];
+	    delete trace['meta'];
+	}
+	else {
+	    var codes = window.dash_clientside.clientside_map.decode_map_frames(
+		map_store)[index];
+	    var position = {};
+	    for (var i = 0; i < map_store['iso'].length; i++) {
+		position[map_store['iso'][i]] = i;
+	    }
+	    var z = [];
+	    var text = [];
+	    for (var i = 0; i < trace['locations'].length; i++) {
+		var code = codes[position[trace['locations'][i]]];
+		if ((code === undefined) || (code === map_store['missing'])) {
+		    z.push(null);
+		    text.push('no data');
+		}
+		else {
+		    var value = map_store['vmin'] + code * map_store['scale'];
+		    z.push(value);
+		    text.push(Math.pow(10, value).toFixed(1));
+		}
+	    }
+	    trace['z'] = z;
+	    trace['text'] = text;
+	    trace['meta'] = map_store['dates'][index];
+	    trace['hovertemplate'] = map_store['hovertemplates']['past'];
+	}
+	// The colors keep the scale of the last date, and the zoom is kept
+	// from one date to the next
+	var layout = Object.assign({}, figure['layout']);
+	layout['coloraxis'] = Object.assign({}, layout['coloraxis'], {
+	    'cmin': map_store['cmin'], 'cmax': map_store['cmax']});
+	layout['uirevision'] = 'map';
+	return {'data': [trace].concat(figure['data'].slice(1)),
+		'layout': layout};
+    },
+
+    toggle_map_animation: function(n_clicks) {
+	/**
+	 * Start or stop the animation of the map, when clicking on the play
+	 * button
+	 */
+	var playing = (n_clicks || 0) % 2 === 1;
+	return [!playing, playing ? '❚❚' : '▶'];
+    },
+
+    step_map_date: function(n_intervals, index, max) {
+	/**
+	 * Move the slider of the map to the next date, looping back to the
+	 * first one after the last
+	 */
+	if (!n_intervals) {
+	    // Initialization of the app: the map shows the last date
+	    return index;
+	}
+	if ((index === null) || (index === undefined) || (index >= max)) {
+	    return 0;
+	}
+	return index + 1;
+    }
+};
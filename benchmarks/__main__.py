@@ -0,0 +1,69 @@
+"""
+Run the benchmarks, without asv
+
+> python -m benchmarks [pattern]
+
+runs the benchmarks whose name contains pattern, and prints the best
+time of a few repeats of each.
+"""
+
+import inspect
+import itertools
+import sys
+import timeit
+import traceback
+
+from . import bench_pipeline
+
+N_REPEATS = 5
+
+
+def run_benchmark(method, args):
+    if method.__name__.startswith('track_'):
+        value = method(*args)
+        return f'{value} {getattr(method, "unit", "")}'
+    timer = timeit.Timer(lambda: method(*args))
+    # Calibrate the number of calls so that each repeat lasts ~0.2s
+    number, duration = timer.autorange()
+    number = max(1, int(number * .2 / max(duration, 1e-9)))
+    best = min(timer.repeat(repeat=N_REPEATS, number=number)) / number
+    return f'{1000 * best:.2f} ms'
+
+
+def main(pattern=''):
+    for name, cls in inspect.getmembers(bench_pipeline, inspect.isclass):
+        if cls.__module__ != bench_pipeline.__name__:
+            continue
+        methods = [method_name for method_name in dir(cls)
+                   if method_name.startswith(('time_', 'track_'))
+                   and pattern in f'{name}.{method_name}']
+        if not methods:
+            continue
+        params = getattr(cls, 'params', [[]])
+        for args in itertools.product(*params):
+            benchmark = cls()
+            label = ', '.join(f'{param_name}={arg}' for param_name, arg
+                              in zip(getattr(cls, 'param_names', ()),
+                                     args))
+            try:
+                benchmark.setup(*args)
+            except Exception:
+                traceback.print_exc()
+                print(f'{name} ({label}): setup failed')
+                continue
+            try:
+                for method_name in methods:
+                    try:
+                        result = run_benchmark(
+                            getattr(benchmark, method_name), args)
+                    except Exception:
+                        traceback.print_exc()
+                        result = 'failed'
+                    print(f'{name}.{method_name} ({label}): {result}')
+            finally:
+                if hasattr(benchmark, 'teardown'):
+                    benchmark.teardown(*args)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
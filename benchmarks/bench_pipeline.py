@@ -0,0 +1,137 @@
+"""
+Benchmarks of the pipeline: data -> model -> figures
+
+The benchmarks follow the conventions of asv (airspeed velocity): the
+methods starting with "time_" are timed, those starting with "track_"
+return a value to follow, "params" gives the sizes of data to run them
+on. Run them with
+
+> python -m benchmarks
+"""
+
+import json
+import shutil
+import tempfile
+
+from plotly.utils import PlotlyJSONEncoder
+
+import data_input
+import fetcher
+import modeling
+from data_input import tidy_as_of, tidy_most_recent
+from make_figures import (make_map, make_map_frames, make_timeplot,
+                          make_timeplot_store, split_timeplot_store)
+
+from .synthetic import make_wide_data, write_john_hopkins_csvs
+
+
+class Fetch:
+    """ Parsing the files of Johns Hopkins, and building the wide data
+        frame
+    """
+    # fetch_john_hopkins_columns checks that at least 143 countries are
+    # matched
+    params = ([100, 1000], [150, 240], [1, 5])
+    param_names = ['n_days', 'n_countries', 'n_provinces']
+    timeout = 300
+
+    def setup(self, n_days, n_countries, n_provinces):
+        self.directory = tempfile.mkdtemp()
+        urls = write_john_hopkins_csvs(self.directory, n_days=n_days,
+                                       n_countries=n_countries,
+                                       n_provinces=n_provinces)
+        self.urls = fetcher.URL_BASE, fetcher.URL_COUNTRY_ISO
+        fetcher.URL_BASE, fetcher.URL_COUNTRY_ISO = urls
+        # get_data is timed on the parsed files: the parsing is timed by
+        # time_fetch_john_hopkins_data
+        columns = fetcher.fetch_john_hopkins_columns(source='http',
+                                                     cache_dir=None)
+        self.fetch_columns = data_input.fetch_john_hopkins_columns
+        data_input.fetch_john_hopkins_columns = lambda: columns
+        self.previous = data_input.get_data().iloc[:-1]
+
+    def teardown(self, n_days, n_countries, n_provinces):
+        fetcher.URL_BASE, fetcher.URL_COUNTRY_ISO = self.urls
+        data_input.fetch_john_hopkins_columns = self.fetch_columns
+        shutil.rmtree(self.directory)
+
+    def time_fetch_john_hopkins_data(self, n_days, n_countries, n_provinces):
+        fetcher.fetch_john_hopkins_data(source='http', cache_dir=None)
+
+    def time_get_data(self, n_days, n_countries, n_provinces):
+        data_input.get_data()
+
+    def time_get_data_one_new_day(self, n_days, n_countries, n_provinces):
+        data_input.get_data(previous=self.previous)
+
+
+class Model:
+    """ Fitting the model, and replaying it on the history
+    """
+    params = ([100, 1000], [50, 190])
+    param_names = ['n_days', 'n_countries']
+    timeout = 300
+
+    def setup(self, n_days, n_countries):
+        self.confirmed = make_wide_data(n_countries=n_countries,
+                                        n_days=n_days)['confirmed']
+        self.window = modeling.default_window()
+
+    def time_fit_on_window(self, n_days, n_countries):
+        modeling.fit_on_window(self.confirmed, self.window)
+
+    def time_historical_replay(self, n_days, n_countries):
+        modeling.historical_replay(self.confirmed, self.window)
+
+
+class Figures:
+    """ Building the figures, and the size of what is sent to the browser
+    """
+    params = ([100, 1000], [50, 190])
+    param_names = ['n_days', 'n_countries']
+    timeout = 300
+
+    def setup(self, n_days, n_countries):
+        self.data = make_wide_data(n_countries=n_countries, n_days=n_days)
+        self.predictions = modeling.fit_predictions(self.data['confirmed'])
+        self.df_tidy = tidy_most_recent(self.data)
+        self.df_tidy_fatalities = tidy_most_recent(self.data, 'death')
+
+    def time_tidy_most_recent(self, n_days, n_countries):
+        tidy_most_recent(self.data)
+
+    def time_tidy_as_of_weekly(self, n_days, n_countries):
+        # One date per week of the history, as for an animated map
+        tidy_as_of(self.data, self.data.index[::7])
+
+    def time_make_map(self, n_days, n_countries):
+        make_map(self.df_tidy, self.df_tidy_fatalities)
+
+    def time_make_map_frames(self, n_days, n_countries):
+        make_map_frames(self.data)
+
+    def time_make_timeplot(self, n_days, n_countries):
+        make_timeplot(self.data, self.predictions,
+                      countries=['France', 'Italy', 'Spain'])
+
+    def time_make_timeplot_store(self, n_days, n_countries):
+        make_timeplot_store(self.data, self.predictions)
+
+    def track_layout_size(self, n_days, n_countries):
+        """ The size of the figures and of the data of the layout, as
+            serialized in JSON
+        """
+        countries = ['France', 'Italy', 'Spain']
+        # As in the app, the data of the other countries is in shards
+        store, _ = split_timeplot_store(
+            make_timeplot_store(self.data, self.predictions),
+            inline_countries=countries)
+        layout = [
+            make_map(self.df_tidy, self.df_tidy_fatalities),
+            make_timeplot(self.data, self.predictions, countries=countries),
+            store,
+            make_map_frames(self.data),
+        ]
+        return len(json.dumps(layout, cls=PlotlyJSONEncoder))
+
+    track_layout_size.unit = 'bytes'
@@ -0,0 +1,125 @@
+"""
+Synthetic data, shaped as the data of Johns Hopkins, to run the
+benchmarks offline
+
+The countries are taken from our database of populations, so that the
+whole pipeline (matching of the countries, normalization by population,
+figures) runs as on the real data.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+import fetcher
+from data_input import get_populations
+
+
+def _countries(n_countries):
+    """ The names and ISO3 codes of n_countries countries, always
+        including the countries that the pipeline checks for
+    """
+    pop = get_populations()
+    pop = pop[pop['Population'] > 0]
+    required = pop['Country'].isin(['China', 'South Korea', 'France',
+                                    'Italy', 'Spain'])
+    pop = pd.concat([pop[required], pop[~required]]).iloc[:n_countries]
+    return pop['Country'].values, pop['ISO3'].values
+
+
+def make_cases(n_countries=190, n_days=300, seed=0):
+    """ Cumulated cases growing exponentially at a random rate, starting
+        at a random date
+
+    Returns a 2D array of counts, countries times days
+    """
+    rng = np.random.RandomState(seed)
+    growth = rng.uniform(1., 1.15, size=(n_countries, 1))
+    noise = rng.uniform(.95, 1.05, size=(n_countries, n_days))
+    log_cases = np.cumsum(np.log(growth * noise), axis=1)
+    # The epidemic saturates at a level specific to each country
+    log_cases = np.minimum(log_cases,
+                           rng.uniform(8, 16, size=(n_countries, 1)))
+    cases = np.exp(log_cases) * rng.uniform(1, 50, size=(n_countries, 1))
+    cases = np.maximum.accumulate(np.floor(cases), axis=1)
+    start = rng.randint(0, max(n_days // 4, 1), size=n_countries)
+    cases[np.arange(n_days) < start[:, np.newaxis]] = 0
+    return cases
+
+
+def write_john_hopkins_csvs(directory, n_countries=190, n_days=300,
+                            n_provinces=1, seed=0):
+    """ Write the time-series files of Johns Hopkins, and the table of the
+        country codes, in directory
+
+    Parameters
+    ----------
+    directory: str
+        Where to write the files
+    n_countries: int
+        The number of countries
+    n_days: int
+        The number of dates, starting on 2020-01-22
+    n_provinces: int
+        The number of lines (provinces) of each country
+
+    Returns
+    -------
+    url_base, url_country_iso: str
+        The file:// urls to give in place of fetcher.URL_BASE and
+        fetcher.URL_COUNTRY_ISO
+    """
+    os.makedirs(directory, exist_ok=True)
+    names, iso = _countries(n_countries)
+    # The names used by Johns Hopkins for the few countries named
+    # differently in the table of the country codes
+    jhu_names = {name: jhu_name for jhu_name, name
+                 in fetcher.MAP_UNMATCHED_COUNTRIES.items()}
+    dates = pd.date_range('2020-01-22', periods=n_days)
+    date_columns = [f'{date.month}/{date.day}/{date.year % 100}'
+                    for date in dates]
+    for i, (key, filename) in enumerate(
+            fetcher.FILENAME_JOHN_HOPKINS.items()):
+        cases = make_cases(len(names) * n_provinces, n_days, seed=seed + i)
+        if key == 'death':
+            cases = np.floor(.03 * cases)
+        df = pd.DataFrame(cases.astype(int), columns=date_columns)
+        df.insert(0, 'Province/State',
+                  np.tile([f'Province {j}' if n_provinces > 1 else ''
+                           for j in range(n_provinces)], len(names)))
+        df.insert(1, 'Country/Region',
+                  np.repeat([jhu_names.get(name, name) for name in names],
+                            n_provinces))
+        df.insert(2, 'Lat', 0.)
+        df.insert(3, 'Long', 0.)
+        df.to_csv(os.path.join(directory, filename), index=False)
+
+    # The table of the country codes is written as the gist that we
+    # download: quoted fields, separated by a comma and a space
+    path_country_iso = os.path.join(directory, 'countries_codes.csv')
+    with open(path_country_iso, 'w') as f:
+        f.write('Country,Alpha-2 code,Alpha-3 code,Numeric code,'
+                'Latitude (average),Longitude (average)\n')
+        for i, (name, code) in enumerate(zip(names, iso)):
+            f.write(f'"{name}", "{code[:2]}", "{code}", "{i}", "0", "0"\n')
+
+    url_base = 'file://' + os.path.abspath(directory) + '/'
+    return url_base, 'file://' + os.path.abspath(path_country_iso)
+
+
+def make_wide_data(n_countries=190, n_days=300, seed=0):
+    """ The wide data frame of cases, as returned by data_input.get_data
+    """
+    names, iso = _countries(n_countries)
+    dates = pd.date_range('2020-01-22', periods=n_days, name='date')
+    confirmed = make_cases(len(names), n_days, seed=seed).T
+    columns = pd.MultiIndex.from_arrays([iso, names],
+                                        names=['iso', 'country_region'])
+    data = pd.concat(dict(
+        confirmed=pd.DataFrame(confirmed, index=dates, columns=columns),
+        death=pd.DataFrame(np.floor(.03 * confirmed), index=dates,
+                           columns=columns),
+    ), axis=1)
+    data.columns.names = ['type', 'iso', 'country_region']
+    return data
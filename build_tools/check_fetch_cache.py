@@ -0,0 +1,132 @@
+"""
+Check the download cache of fetcher.read_csv_cached against a local HTTP
+server and file:// urls: revalidation with ETag (304), new downloads when
+the file changes, the offline mode, the fallback when the server cannot
+be reached, and the recovery from unreadable metadata.
+
+Usage: python build_tools/check_fetch_cache.py
+"""
+import collections
+import hashlib
+import http.server
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetcher import read_csv_cached, _cache_paths  # noqa: E402
+
+# The status codes answered by the server
+STATUS = collections.Counter()
+
+
+class ETagHandler(http.server.BaseHTTPRequestHandler):
+    """ Serve the files of the current directory with an ETag, answering
+        304 to a matching If-None-Match
+    """
+
+    def do_GET(self):
+        path = os.path.join(self.server.directory, self.path.lstrip('/'))
+        with open(path, 'rb') as f:
+            content = f.read()
+        etag = '"' + hashlib.sha1(content).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            STATUS[304] += 1
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        STATUS[200] += 1
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+def check(condition, message):
+    if not condition:
+        raise AssertionError(message)
+    print(f'ok: {message}')
+
+
+def write_csv(path, n_rows):
+    with open(path, 'w') as f:
+        f.write('a,b\n')
+        for i in range(n_rows):
+            f.write(f'{i},{2 * i}\n')
+
+
+def check_http(directory, cache_dir):
+    server = http.server.HTTPServer(('127.0.0.1', 0), ETagHandler)
+    server.directory = directory
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f'http://127.0.0.1:{server.server_port}/data.csv'
+    write_csv(os.path.join(directory, 'data.csv'), 3)
+
+    df = read_csv_cached(url, cache_dir=cache_dir)
+    check(len(df) == 3 and STATUS[200] == 1, 'first read downloads')
+    df = read_csv_cached(url, cache_dir=cache_dir)
+    check(len(df) == 3 and STATUS[304] == 1 and STATUS[200] == 1,
+          'second read is revalidated with a 304')
+
+    write_csv(os.path.join(directory, 'data.csv'), 5)
+    df = read_csv_cached(url, cache_dir=cache_dir)
+    check(len(df) == 5 and STATUS[200] == 2, 'a changed file is downloaded')
+
+    n_requests = sum(STATUS.values())
+    df = read_csv_cached(url, cache_dir=cache_dir, offline=True)
+    check(len(df) == 5 and sum(STATUS.values()) == n_requests,
+          'offline mode serves the cache without a request')
+
+    # A truncated metadata file, as left by an older version interrupted
+    # while writing it
+    with open(_cache_paths(url, cache_dir)['.json'], 'w') as f:
+        f.write('{"url": ')
+    df = read_csv_cached(url, cache_dir=cache_dir)
+    check(len(df) == 5 and STATUS[200] == 3,
+          'unreadable metadata is a cache miss')
+    df = read_csv_cached(url, cache_dir=cache_dir)
+    check(STATUS[304] == 2, 'the entry is revalidated again afterwards')
+
+    server.shutdown()
+    server.server_close()
+    df = read_csv_cached(url, cache_dir=cache_dir)
+    check(len(df) == 5, 'the cache is served when the server is down')
+    check(not [name for name in os.listdir(cache_dir)
+               if name.endswith('.tmp')], 'no temporary file is left')
+
+
+def check_file_url(directory, cache_dir):
+    path = os.path.join(directory, 'local.csv')
+    write_csv(path, 2)
+    url = 'file://' + os.path.abspath(path)
+    df = read_csv_cached(url, cache_dir=cache_dir)
+    check(len(df) == 2, 'file:// urls are read')
+    pickle_path = _cache_paths(url, cache_dir)['.pkl']
+    mtime = os.path.getmtime(pickle_path)
+    df = read_csv_cached(url, cache_dir=cache_dir)
+    check(len(df) == 2 and os.path.getmtime(pickle_path) == mtime,
+          'an unchanged file:// url reuses the cached dataframe')
+
+    write_csv(path, 4)
+    # Last-Modified has a resolution of a second
+    os.utime(path, (mtime + 2, mtime + 2))
+    df = read_csv_cached(url, cache_dir=cache_dir)
+    check(len(df) == 4, 'a changed file:// url is read again')
+
+
+if __name__ == "__main__":
+    directory = tempfile.mkdtemp()
+    try:
+        check_http(directory, os.path.join(directory, 'cache_http'))
+        check_file_url(directory, os.path.join(directory, 'cache_file'))
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,86 @@
+"""
+Check that the modules imported when the app starts do not import the
+heavy modules that are only needed to build the figures or to fit the
+model, and report the slowest imports.
+
+By default, the modules imported at the top of app.py are checked
+(dash, dash_table... and our modules): importing app itself would load
+the data. Pass module names to check them instead, e.g. "app" when a
+snapshot of the data is available.
+
+Usage: python build_tools/check_import_time.py [module ...]
+"""
+import ast
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The modules that must be imported only when they are used
+LAZY_MODULES = [
+    'joblib', 'matplotlib', 'modeling', 'plotly.express',
+    'plotly.graph_objects', 'plotly.io', 'scipy.stats', 'statsmodels',
+]
+
+N_SLOWEST = 15
+
+
+def top_level_imports(path):
+    """ The modules imported by the top-level statements of a python file
+    """
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    modules = list()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and not node.level:
+            names = [node.module]
+        else:
+            continue
+        modules.extend(name for name in names if name not in modules)
+    return modules
+
+
+# The modules imported by app.py when it starts from a snapshot and from
+# cached figures
+STARTUP_MODULES = top_level_imports(os.path.join(ROOT, 'app.py'))
+
+
+def import_times(modules):
+    """ Import the modules in a fresh interpreter, with -X importtime
+
+    Returns a dict mapping the name of each module imported to its
+    cumulative import time, in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         'import ' + ', '.join(modules)],
+        cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise RuntimeError(f"Could not import {', '.join(modules)}")
+    times = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+if __name__ == "__main__":
+    modules = sys.argv[1:] or STARTUP_MODULES
+    times = import_times(modules)
+
+    print(f"Slowest imports of {', '.join(modules)} (cumulative):")
+    for name, cumulative in sorted(times.items(), key=lambda item: -item[1]
+                                   )[:N_SLOWEST]:
+        print(f'{cumulative / 1000:10.1f} ms  {name}')
+
+    imported = [name for name in LAZY_MODULES if name in times]
+    if imported:
+        print(f"Error: {', '.join(imported)} should not be imported at "
+              "startup")
+        sys.exit(1)
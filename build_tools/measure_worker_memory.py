@@ -0,0 +1,100 @@
+"""
+Measure the memory of the workers forked from a preloaded app, as
+gunicorn does (see gunicorn.conf.py)
+
+The app is loaded in this process, then N workers are forked, each
+serializing the data of the layout (and building figures, with
+COVID_DASH_SERVER_CALLBACKS=True) as for a number of requests. Pass
+--reload to rebuild the state in each worker first, as after a refresh
+of the data.
+
+Usage: python build_tools/measure_worker_memory.py [n_workers] [--reload]
+
+Linux only: the memory is read from /proc/<pid>/smaps_rollup.
+"""
+import gc
+import json
+import os
+import random
+import signal
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+N_REQUESTS = 300
+
+
+def memory_mb(pid):
+    """ The resident, proportional and private memory of a process, in
+        megabytes
+    """
+    memory = dict()
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            name, *values = line.split()
+            if name in ('Rss:', 'Pss:', 'Private_Dirty:'):
+                memory[name[:-1]] = int(values[0]) / 1024
+    return memory
+
+
+def serve(app, n_requests=N_REQUESTS, reload=False):
+    """ Do the work of n_requests requests on the state of the app
+    """
+    from plotly.utils import PlotlyJSONEncoder
+    if reload:
+        app.state = app.load_state()
+    current = app.state
+    rows = current['table_data']
+    rng = random.Random(os.getpid())
+    for _ in range(n_requests):
+        # The data of the layout, serialized at each page load
+        json.dumps([current['fig1'], current['fig2'], current['fig_store'],
+                    current['map_frames'], current['table_data']],
+                   cls=PlotlyJSONEncoder)
+        if current['timeplot_cache'] is not None:
+            selected_rows = [rng.randrange(len(rows))
+                             for _ in range(rng.randrange(1, 6))]
+            countries = app.selected_countries(current['timeplot_store'],
+                                               rows, selected_rows)
+            json.dumps(current['timeplot_cache'](countries, 'active', 'log'),
+                       cls=PlotlyJSONEncoder)
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != '--reload']
+    n_workers = int(args[0]) if args else 2
+    reload = '--reload' in sys.argv
+
+    # As in gunicorn.conf.py
+    os.environ['COVID_DASH_PRELOAD'] = 'True'
+    import app
+    gc.collect()
+    gc.freeze()
+
+    read_fd, write_fd = os.pipe()
+    pids = list()
+    for _ in range(n_workers):
+        pid = os.fork()
+        if pid == 0:
+            serve(app, reload=reload)
+            os.write(write_fd, b'.')
+            # Wait to be measured
+            os.kill(os.getpid(), signal.SIGSTOP)
+            os._exit(0)
+        pids.append(pid)
+    for _ in pids:
+        os.read(read_fd, 1)
+    time.sleep(.5)
+    workers = [memory_mb(pid) for pid in pids]
+    for pid in pids:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+
+    master = memory_mb(os.getpid())
+    print(f"Master: RSS {master['Rss']:.1f} MB")
+    for name in ('Rss', 'Private_Dirty'):
+        print(f"Per worker: {name} "
+              f"{sum(w[name] for w in workers) / n_workers:.1f} MB")
+    print(f"Total PSS, {n_workers} worker(s): "
+          f"{master['Pss'] + sum(w['Pss'] for w in workers):.1f} MB")
@@ -2,18 +2,66 @@
 Data massaging: prepare the data so that it is easy to plot it.
 """
 
-import os
-import pickle
+import functools
 
+import numpy as np
 import pandas as pd
 
-from fetcher import fetch_john_hopkins_data
+from fetcher import fetch_john_hopkins_columns
+from instrumentation import instrumented
+from snapshot import load_snapshot
+
+@instrumented('tidy')
+def tidy_as_of(df, dates, column='confirmed'):
+    """ The values of each country as of one or several dates, in tidy
+        format
+
+    The rows of the wide dataframe are looked up directly: the cost is
+    proportional to the number of countries times the number of dates
+    asked, not to the length of the history.
+
+    Parameters
+    ----------
+    df: pandas DataFrame
+        The wide dataframe of get_data, indexed by date
+    dates: date or list of dates
+        For each date, the values of the last date of the data on or
+        before it are returned
+    column: str
+        The type of cases, "confirmed" or "death"
+
+    Returns
+    -------
+    tidy_df: pandas DataFrame
+        With columns "date" (the date asked), "iso", "country_region" and
+        "value", ordered by date and then by iso
+    """
+    wide = df[column]
+    if not wide.index.is_monotonic_increasing:
+        wide = wide.sort_index()
+    dates = pd.DatetimeIndex(np.atleast_1d(dates))
+    positions = wide.index.searchsorted(dates, side='right') - 1
+    if (positions < 0).any():
+        raise KeyError(f"No data on or before {dates[positions < 0][0]}")
+    # Sort the countries once: the order is the same for every date
+    iso = wide.columns.get_level_values('iso')
+    order = np.argsort(iso, kind='stable')
+    n_dates, n_countries = len(dates), len(order)
+    return pd.DataFrame(dict(
+        date=dates.repeat(n_countries),
+        iso=np.tile(iso[order], n_dates),
+        country_region=np.tile(
+            wide.columns.get_level_values('country_region')[order], n_dates),
+        value=np.asarray(wide.values, dtype=float)[
+            positions[:, np.newaxis], order].ravel(),
+    ))
+
 
 def tidy_most_recent(df, column='confirmed'):
-    df = df[column].reset_index().melt(id_vars='date')
-    date_max = df['date'].max()
-    df = df.query("date == @date_max")
-    return df.sort_values('iso')
+    """ The values of each country on the last date of the data, in tidy
+        format (see tidy_as_of)
+    """
+    return tidy_as_of(df, df.index.max(), column=column)
 
 
 
@@ -66,49 +114,110 @@ UNMATCHED_COUNTRIES = ['Cruise Ship', 'Others', 'Channel Islands']
 
 
 
-def get_data():
-    """ Download the data and return it as a 'wide' data frame
+def forward_fill(values):
+    """ Forward fill the NaNs along the first axis of a 2D array, and
+        replace the leading NaNs by 0
     """
-    df = fetch_john_hopkins_data()
-    # The number of reported cases per day, country, and type
-    df_day = df.groupby(['country_region', 'iso', 'date', 'type']).sum()
+    missing = np.isnan(values)
+    # For each entry, the index of the last row with a value
+    last_valid = np.where(missing, 0, np.arange(len(values))[:, np.newaxis])
+    last_valid = np.maximum.accumulate(last_valid, axis=0)
+    values = values[last_valid, np.arange(values.shape[1])]
+    values[np.isnan(values)] = 0
+    return values
 
-    # Switch to wide format (time series)
-    data = df_day.pivot_table(values='cases',
-                              columns=['type', 'iso', 'country_region'],
-                              index=['date'])
-    data = data.fillna(method='ffill')
-    data = data.fillna(value=0)
 
-    return data
+def _wide_values(data):
+    """ Sum the cases of each country, and align the types of cases on
+        the same dates
+
+    Returns the dates, the columns (type, iso, country_region) and the 2D
+    array of the cases (dates times columns), with NaNs for the missing
+    entries
+    """
+    dates = data[sorted(data)[0]][1]
+    for _, other_dates, _ in data.values():
+        dates = dates.union(other_dates)
+
+    columns = list()
+    values = list()
+    for key in sorted(data):
+        countries, key_dates, cases = data[key]
+        # The number of reported cases per day and country: the lines
+        # matching the same country are summed
+        country_index = pd.MultiIndex.from_arrays(
+            [countries['iso'], countries['country_region']],
+            names=['iso', 'country_region'])
+        codes, country_index = pd.factorize(country_index, sort=True)
+        summed = np.zeros((len(country_index), len(key_dates)))
+        np.add.at(summed, codes, cases)
+        # Align on the dates of all types of cases
+        key_values = np.full((len(dates), len(country_index)), np.nan)
+        key_values[dates.get_indexer(key_dates)] = summed.T
+        values.append(key_values)
+        columns.extend((key, ) + country for country in country_index)
+    columns = pd.MultiIndex.from_tuples(
+        columns, names=['type', 'iso', 'country_region'])
+    return dates, columns, np.concatenate(values, axis=1)
+
+
+def first_changed_date(values, previous):
+    """ The index of the first date at which the cases differ from the
+        previous (forward-filled) ones, len(previous) if none does
+
+    The missing entries (NaNs) are not compared: they are forward filled
+    from the dates before them, and hence change only if those do.
+    """
+    values = values[:len(previous)]
+    changed = ~np.isnan(values) & (values != previous)
+    changed_dates = np.flatnonzero(changed.any(axis=1))
+    return changed_dates[0] if len(changed_dates) else len(previous)
 
 
-def exec_full(filepath):
-    """ Execute a Python file as a script
+@instrumented('reshape')
+def get_data(previous=None):
+    """ Download the data and return it as a 'wide' data frame
+
+    Parameters
+    ----------
+    previous: pandas DataFrame, optional
+        The data returned by a former call. Only the dates that are new
+        or were revised since are then forward filled, the others are
+        taken from previous
     """
-    global_namespace = {
-        "__file__": filepath,
-        "__name__": "__main__",
-    }
-    with open(filepath, 'rb') as file:
-        exec(compile(file.read(), filepath, 'exec'), global_namespace)
+    dates, columns, values = _wide_values(fetch_john_hopkins_columns())
+
+    if (previous is not None and previous.columns.equals(columns)
+            and dates[:len(previous)].equals(previous.index)):
+        previous_values = np.asarray(previous.values, dtype=float)
+        first_changed = first_changed_date(values, previous_values)
+        # The forward fill starts from the last unchanged date
+        seed = previous_values[first_changed - 1:first_changed]
+        delta = forward_fill(np.concatenate([seed, values[first_changed:]]))
+        values = np.concatenate([previous_values[:first_changed],
+                                 delta[len(seed):]])
+    else:
+        # No previous data, or the countries changed: we process all
+        # the dates
+        values = forward_fill(values)
+
+    data = pd.DataFrame(values, index=dates, columns=columns)
+    return data
 
 
+@instrumented('load')
 def get_all_data():
     """ Retrieve both the actual data and the predictions from our model.
     """
-    df = get_data() # all data
-
-    if not os.path.exists('predictions.pkl'):
-        print('Running the model')
-        exec_full('modeling.py')
-    with open('predictions.pkl', 'rb') as f_pkl:
-        df_prediction = pickle.load(f_pkl)
-    # MultiIndex does not pickle, hence we need to rebuild it
-    for p in df_prediction.values():
-        p.columns = pd.MultiIndex.from_tuples(p.columns,
-                                              names=('iso', 'country'))
-    return df, df_prediction
+    try:
+        return load_snapshot()
+    except FileNotFoundError:
+        pass
+    print('Running the model')
+    # Imported here: the model uses the functions of this module
+    from modeling import update_snapshot
+    update_snapshot()
+    return load_snapshot()
 
 
 def get_populations():
@@ -117,13 +226,41 @@ def get_populations():
     return pop
 
 
+@functools.lru_cache(maxsize=None)
+def get_population_registry():
+    """ The populations of the countries, parsed only once
+
+    Returns
+    -------
+    iso: pandas Index
+        The ISO3 codes of the countries
+    population: 1d numpy array
+        The population of each country, as floats
+    """
+    pop = get_populations()
+    population = pop['Population'].values.astype(float)
+    # The arrays are shared by all the callers
+    population.flags.writeable = False
+    return pd.Index(pop['ISO3']), population
+
+
+def get_population(iso):
+    """ The population of each of the given ISO3 codes, NaN for the codes
+        that are not in our database of populations
+    """
+    registry_iso, population = get_population_registry()
+    positions = registry_iso.get_indexer(iso)
+    return np.where(positions >= 0, population[positions], np.nan)
+
+
+@instrumented('normalize')
 def normalize_by_population(tidy_df):
     """ Normalize by population the column "value" of a dataframe with
         lines being the country ISO
     """
-    pop = get_populations()
-    normalized_values = (tidy_df.set_index('iso')['value']
-                         / pop.set_index('ISO3')['Population'])
+    normalized_values = pd.Series(
+        tidy_df['value'].values / get_population(tidy_df['iso']),
+        index=pd.Index(tidy_df['iso'].values, name='iso'))
 
     # NAs appeared because we don't have data for all entries of the pop
     # table
@@ -134,16 +271,16 @@ def normalize_by_population(tidy_df):
     return normalized_values
 
 
+@instrumented('normalize')
 def normalize_by_population_wide(df):
     """ Normalize by population the columns of a dataframe with
         column names being the country iso
     """
-    pop = get_populations()
-    # Grap a series, indexed by "iso"
-    pop = pop.rename(dict(ISO3='iso'), axis=1).set_index('iso')['Population']
-    # Use the ".div" for the divison because it support explicit
-    # alignement
-    normalized_df = df.div(pop, level='iso', axis=1)
+    # Divide the underlying array rather than relying on the alignment of
+    # pandas: the populations are looked up once per column
+    population = get_population(df.columns.get_level_values('iso'))
+    normalized_df = pd.DataFrame(df.values / population, index=df.index,
+                                 columns=df.columns)
 
     return normalized_df
 
@@ -0,0 +1,212 @@
+"""
+Export the app as a static website, without running a server
+
+> python export_static.py [output_dir]
+
+The pages are rendered with the test client of the Flask server of the
+app. The layout, the dependencies, the scripts, the stylesheets and the
+data of the time plot are written under a hash of their content, so that
+they can be cached forever, and with gzip and brotli precompressed
+variants.
+"""
+import gzip
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import shutil
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+OUTPUT_DIR = '127.0.0.1:8050'
+
+# The files copied as they are, at the root of the website
+EXTRA_FILES = ['modeling_short.html', 'thumbnail.png']
+
+# A script of a component suite, with the fingerprint of its package,
+# e.g. /_dash-component-suites/dash_table/bundle.v4_6_1m1582839172.min.js
+COMPONENT_SCRIPT = re.compile(
+    r'^/_dash-component-suites/([^/]+)/.*\.(v[0-9_]+m[0-9]+)\.(?:min\.)?js$')
+# The names of the chunks that a script of a component suite loads
+ASYNC_CHUNK_NAME = re.compile(rb'"(async-[a-z0-9-]+)"')
+
+COMPRESSED_EXTENSIONS = ('.html', '.js', '.css', '.json', '.svg', '.ico')
+
+HASH_LENGTH = 12
+
+# The local urls of the scripts, stylesheets and icons of the index page
+LOCAL_URL = re.compile(r'(?:src|href)="(/[^"/][^"]*)"')
+
+
+def hashed_path(path, content):
+    """ The path of a file, with the hash of its content before its
+        extension
+    """
+    root, ext = os.path.splitext(path)
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    return f'{root}.{digest}{ext}'
+
+
+def write_file(output_dir, path, content):
+    """ Write a file of the website, and its precompressed variants
+    """
+    full_path = os.path.join(output_dir, path.lstrip('/'))
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, 'wb') as f:
+        f.write(content)
+    if not full_path.endswith(COMPRESSED_EXTENSIONS):
+        return
+    # mtime=0: the same content always gives the same file
+    with open(full_path + '.gz', 'wb') as f:
+        f.write(gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(full_path + '.br', 'wb') as f:
+            f.write(brotli.compress(content))
+
+
+def package_dir(package):
+    """ The directory of an installed python package
+    """
+    return importlib.util.find_spec(package).submodule_search_locations[0]
+
+
+def export_async_chunks(scripts, output_dir):
+    """ Write the chunks that the Dash components load by themselves
+
+    The components request them with the fingerprint of their package
+    (e.g. async-slider.v1_8_1m1582838719.js): every async-*.js file of
+    the installed packages is written under this name, and we check that
+    each chunk named in their scripts is written.
+
+    Parameters
+    ----------
+    scripts: dict
+        For each package, its fingerprint and the content of its scripts
+    """
+    for package, (fingerprint, contents) in sorted(scripts.items()):
+        directory = package_dir(package)
+        written = set()
+        for filename in sorted(os.listdir(directory)):
+            if not (filename.startswith('async-')
+                    and filename.endswith('.js')):
+                continue
+            name = filename[:-len('.js')]
+            with open(os.path.join(directory, filename), 'rb') as f:
+                write_file(output_dir, f'_dash-component-suites/{package}/'
+                                       f'{name}.{fingerprint}.js', f.read())
+            written.add(name)
+        needed = {name.decode('utf-8') for content in contents
+                  for name in ASYNC_CHUNK_NAME.findall(content)}
+        missing = needed - written
+        if missing:
+            raise RuntimeError(f"{package}: the chunks "
+                               f"{', '.join(sorted(missing))} are not in "
+                               f"{directory}")
+
+
+def get(client, url):
+    response = client.get(url)
+    if response.status_code != 200:
+        raise RuntimeError(f'{url}: status {response.status_code}')
+    return response.get_data()
+
+
+def find_component(layout, component_id):
+    """ The component of the (JSON) layout with the given id
+    """
+    if isinstance(layout, list):
+        children = layout
+    elif isinstance(layout, dict):
+        if layout.get('props', {}).get('id') == component_id:
+            return layout
+        children = layout.get('props', {}).get('children')
+    else:
+        return None
+    if not isinstance(children, (list, dict)):
+        return None
+    for child in (children if isinstance(children, list) else [children]):
+        component = find_component(child, component_id)
+        if component is not None:
+            return component
+    return None
+
+
+def export_shards(layout, output_dir):
+    """ Write the shards of the time plot under hashed names, and point
+        the store of the layout to them
+    """
+    store = find_component(layout, 'store')['props']['data'][0]
+    for entry in store['countries'].values():
+        if 'shard' not in entry:
+            continue
+        with open(store['shard_url'] + entry['shard'], 'rb') as f:
+            content = f.read()
+        entry['shard'] = hashed_path(entry['shard'], content)
+        write_file(output_dir, store['shard_url'] + entry['shard'], content)
+
+
+def export_static(app, output_dir=OUTPUT_DIR):
+    """ Write the static website of a Dash app in output_dir
+
+    The files of the app, as the shards of the time plot, are read from
+    the current directory
+    """
+    client = app.server.test_client()
+
+    # The layout, with the data of the time plot under hashed names
+    layout = json.loads(get(client, '/_dash-layout'))
+    export_shards(layout, output_dir)
+    layout = json.dumps(layout, separators=(',', ':')).encode('utf-8')
+    layout_path = hashed_path('_dash-layout.json', layout)
+    write_file(output_dir, layout_path, layout)
+    dependencies = get(client, '/_dash-dependencies')
+    dependencies_path = hashed_path('_dash-dependencies.json', dependencies)
+    write_file(output_dir, dependencies_path, dependencies)
+
+    index = get(client, '/').decode('utf-8')
+    scripts = dict()
+    for url in sorted(set(LOCAL_URL.findall(index))):
+        path = url.split('?')[0]
+        content = get(client, url)
+        match = COMPONENT_SCRIPT.match(path)
+        if match:
+            package, fingerprint = match.groups()
+            scripts.setdefault(package, (fingerprint, list()))[1].append(
+                content)
+        if path.startswith('/_dash-component-suites/dash_renderer/'):
+            # The renderer requests the layout and the dependencies: we
+            # point it to their files
+            content = content.replace(
+                b'_dash-layout', layout_path.encode('utf-8')).replace(
+                b'_dash-dependencies', dependencies_path.encode('utf-8'))
+        new_path = hashed_path(path, content)
+        write_file(output_dir, new_path, content)
+        index = index.replace(f'"{url}"', f'"{new_path}"')
+
+    with open('head.html') as f:
+        head = f.read()
+    index = index.replace('<head>', '<head>\n' + head, 1)
+    write_file(output_dir, 'index.html', index.encode('utf-8'))
+
+    export_async_chunks(scripts, output_dir)
+    for filename in EXTRA_FILES:
+        if os.path.exists(filename):
+            shutil.copy(filename, output_dir)
+
+
+if __name__ == '__main__':
+    # A static website cannot run server callbacks: the time plot must be
+    # built by the browser, whatever the environment of the build
+    os.environ['COVID_DASH_SERVER_CALLBACKS'] = 'False'
+    from app import app, SERVER_CALLBACKS
+    if SERVER_CALLBACKS:
+        raise RuntimeError("The app was loaded with server callbacks: it "
+                           "cannot be exported as a static website")
+    if brotli is None:
+        print('brotli is not installed: writing only gzip variants')
+    export_static(app, *sys.argv[1:])
@@ -2,13 +2,36 @@
 Fetch the data from Johns Hopkins' github
 """
 
+import hashlib
+import io
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+
+import numpy as np
 import pandas as pd
-import urllib
+
+from instrumentation import instrumented
+
+# The raw downloads are cached on disk, and revalidated with conditional
+# requests. Set the environment variable COVID_DASH_OFFLINE to serve the
+# last downloaded snapshot without going to the network
+FETCH_CACHE_DIR = os.environ.get('COVID_DASH_FETCH_CACHE', 'fetch_cache')
+FETCH_OFFLINE = os.environ.get('COVID_DASH_OFFLINE', 'False') == 'True'
+
+# Where to read the time series from: "http" for the github of Johns
+# Hopkins, or "local" for the checkout of the COVID-19 git submodule
+DATA_SOURCE = os.environ.get('COVID_DASH_DATA_SOURCE', 'http')
 
 URL_BASE = (
     "https://raw.githubusercontent.com/CSSEGISandData/COVID-19/master/"
     "csse_covid_19_data/csse_covid_19_time_series/"
 )
+LOCAL_JOHN_HOPKINS_DIR = os.path.join(
+    "COVID-19", "csse_covid_19_data", "csse_covid_19_time_series"
+)
 FILENAME_JOHN_HOPKINS = {
     "confirmed": "time_series_covid19_confirmed_global.csv",
     "death": "time_series_covid19_deaths_global.csv",
@@ -47,36 +70,196 @@ MISSING_COUNTRIES = pd.DataFrame({
 
 UNMATCHED_COUNTRIES = ['Cruise Ship']
 
+COLUMNS_RENAME = {
+    "Country/Region": "name",
+    "Country": "country_region",
+    "Alpha-3 code": "iso",
+    "Latitude (average)": "lat",
+    "Longitude (average)": "long",
+}
+
+
+def _cache_paths(url, cache_dir):
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return {ext: os.path.join(cache_dir, key + ext)
+            for ext in ('.json', '.raw', '.pkl')}
+
+
+def _write_atomic(path, write):
+    """ Call write(tmp_path), then move tmp_path to path
+
+    Readers, and the other processes writing the same entry, never see a
+    partial file
+    """
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _read_metadata(paths):
+    """ The metadata of a cache entry, None if there is no entry or if it
+        cannot be read
+    """
+    if not os.path.exists(paths['.pkl']):
+        return None
+    try:
+        with open(paths['.json']) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+@instrumented('fetch.read_csv')
+def read_csv_cached(url, cache_dir=FETCH_CACHE_DIR, offline=FETCH_OFFLINE):
+    """ Read a csv file from a url, going through an on-disk cache
+
+    The raw payload and its parsed dataframe are stored in cache_dir,
+    with the ETag and Last-Modified headers of the response. The next
+    calls send a conditional request, and reuse the parsed dataframe if
+    the payload did not change.
+
+    Parameters
+    ----------
+    url: str
+        The url of the file: http(s):// or file://
+    cache_dir: str or None
+        The directory of the cache. If None, no caching is done
+    offline: bool
+        If True, serve the last cached snapshot without any request
+
+    Returns
+    -------
+    df: pandas DataFrame
+    """
+    if cache_dir is None:
+        return pd.read_csv(url)
+    paths = _cache_paths(url, cache_dir)
+    metadata = _read_metadata(paths)
+    if offline:
+        if metadata is None:
+            raise RuntimeError(f"Offline mode, and {url} is not in the "
+                               f"cache {cache_dir}")
+        return pd.read_pickle(paths['.pkl'])
+
+    request = urllib.request.Request(url)
+    if metadata is not None:
+        if metadata.get('etag'):
+            request.add_header('If-None-Match', metadata['etag'])
+        if metadata.get('last_modified'):
+            request.add_header('If-Modified-Since',
+                               metadata['last_modified'])
+    try:
+        with urllib.request.urlopen(request) as response:
+            headers = response.headers
+            etag = headers.get('ETag')
+            last_modified = headers.get('Last-Modified')
+            # file:// urls, and some servers, do not answer conditional
+            # requests: we compare the validators ourselves
+            if (metadata is not None
+                    and (etag or last_modified)
+                    and etag == metadata.get('etag')
+                    and last_modified == metadata.get('last_modified')):
+                return pd.read_pickle(paths['.pkl'])
+            payload = response.read()
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and metadata is not None:
+            return pd.read_pickle(paths['.pkl'])
+        raise
+    except urllib.error.URLError:
+        if metadata is None:
+            raise
+        print(f"Could not reach {url}, using the cached snapshot from "
+              f"{time.ctime(metadata['fetched'])}")
+        return pd.read_pickle(paths['.pkl'])
+
+    df = pd.read_csv(io.BytesIO(payload))
+    os.makedirs(cache_dir, exist_ok=True)
+
+    def write_raw(path):
+        with open(path, 'wb') as f:
+            f.write(payload)
+
+    def write_metadata(path):
+        with open(path, 'w') as f:
+            json.dump(dict(url=url, etag=etag, last_modified=last_modified,
+                           fetched=time.time()), f)
+
+    # Each file is replaced at once, and the metadata last: the metadata
+    # read always comes with the dataframe it describes, or a newer one
+    _write_atomic(paths['.raw'], write_raw)
+    _write_atomic(paths['.pkl'], df.to_pickle)
+    _write_atomic(paths['.json'], write_metadata)
+    return df
+
+
+def _read_john_hopkins_http(filename, cache_dir, offline):
+    return read_csv_cached(urllib.request.urljoin(URL_BASE, filename),
+                           cache_dir=cache_dir, offline=offline)
+
+
+def _read_john_hopkins_local(filename, cache_dir, offline):
+    path = os.path.join(LOCAL_JOHN_HOPKINS_DIR, filename)
+    if not os.path.exists(path):
+        raise RuntimeError(f"{path} not found: run 'make submodules' to "
+                           "checkout the data of Johns Hopkins")
+    # The file is on disk: no need for the download cache
+    return pd.read_csv(path, memory_map=True)
+
+
+JOHN_HOPKINS_SOURCES = {
+    'http': _read_john_hopkins_http,
+    'local': _read_john_hopkins_local,
+}
+
+
+def read_john_hopkins_csv(filename, source=DATA_SOURCE,
+                          cache_dir=FETCH_CACHE_DIR, offline=FETCH_OFFLINE):
+    """ Read one of the time-series files of Johns Hopkins
+
+    Parameters
+    ----------
+    filename: str
+        The name of the file, one of the values of FILENAME_JOHN_HOPKINS
+    source: str
+        The data source, one of the keys of JOHN_HOPKINS_SOURCES: "http"
+        downloads the file, "local" reads the COVID-19 submodule
+    cache_dir, offline:
+        The parameters of the download cache, see read_csv_cached
+    """
+    if source not in JOHN_HOPKINS_SOURCES:
+        raise ValueError(f"Unknown data source {source!r}, should be one "
+                         f"of {list(JOHN_HOPKINS_SOURCES)}")
+    return JOHN_HOPKINS_SOURCES[source](filename, cache_dir, offline)
+
 
-def fetch_john_hopkins_data():
-    df_covid = {
-        key: pd.read_csv(urllib.request.urljoin(URL_BASE, filename))
-        for key, filename in FILENAME_JOHN_HOPKINS.items()
-    }
+def _wide_john_hopkins(df):
+    """ Sum the provinces of each country of a time-series file
+
+    Returns the names of the countries, the dates, and the 2D array of
+    the counts (countries times dates)
+    """
     columns_drop = ["Province/State", "Province_State",
                     "Lat", "Long", "Long_", "Population",
                     "UID", "iso2", "iso3", "code3", "FIPS", "Admin2",
                     ]
-    for key in df_covid:
-        for col in columns_drop:
-            if col in df_covid[key].columns:
-                df_covid[key] = df_covid[key].drop(columns=[col, ])
-        df_covid[key] = df_covid[key].rename(
-                            columns={'Country_Region': 'Country/Region'})
-    for key in df_covid:
-        df_covid[key] = df_covid[key].groupby("Country/Region").sum()
-        # move each date column as a row entry to get a "date" column instead
-        df_covid[key] = df_covid[key].stack().to_frame().reset_index().rename(
-            columns={"level_1": "date", 0: "cases"}
-        )
-        df_covid[key]["date"] = df_covid[key]["date"].apply(
-            lambda x: pd.to_datetime(x)
-        )
-        df_covid[key]["type"] = key
-    df_covid = pd.concat(df_covid.values(), ignore_index=True)
-    df_covid = df_covid.replace({"Country/Region": MAP_UNMATCHED_COUNTRIES})
+    df = df.drop(columns=[col for col in columns_drop if col in df.columns])
+    df = df.rename(columns={'Country_Region': 'Country/Region'})
+    df = df.groupby("Country/Region").sum()
+    # The dates are in the header: we parse them only once
+    dates = pd.DatetimeIndex([pd.to_datetime(date) for date in df.columns],
+                             name='date')
+    return df.index, dates, df.values
 
-    df_countries = pd.read_csv(URL_COUNTRY_ISO)
+
+def get_country_codes(cache_dir=FETCH_CACHE_DIR, offline=FETCH_OFFLINE):
+    """ The table of the ISO codes and coordinates of the countries
+    """
+    df_countries = read_csv_cached(URL_COUNTRY_ISO, cache_dir=cache_dir,
+                                   offline=offline)
     for col_name in df_countries.columns:
         df_countries[col_name] = df_countries[col_name].str.strip('. "."')
     float_column = [
@@ -86,30 +269,89 @@ def fetch_john_hopkins_data():
     df_countries = pd.concat(
         [df_countries, MISSING_COUNTRIES], ignore_index=True
     )
+    return df_countries
 
-    df = pd.merge(
-        left=df_covid,
-        right=df_countries,
-        left_on="Country/Region",
-        right_on="Country",
-        how="inner",
-    )
 
-    assert df["Country"].unique().shape[0] >= 143, \
+@instrumented('fetch')
+def fetch_john_hopkins_columns(source=DATA_SOURCE, cache_dir=FETCH_CACHE_DIR,
+                               offline=FETCH_OFFLINE):
+    """ Fetch the data from Johns Hopkins in a columnar layout
+
+    Returns
+    -------
+    data: dict
+        For each type of cases ("confirmed", "death"), a tuple
+        (countries, dates, cases) with countries a DataFrame describing
+        the countries (name, country_region, iso, lat, long) and indexed
+        by their line in the file of Johns Hopkins, dates a
+        DatetimeIndex, and cases the 2D array of the counts, with one row
+        per line of countries and one column per date
+    """
+    df_countries = get_country_codes(cache_dir=cache_dir, offline=offline)
+    data = dict()
+    for key, filename in FILENAME_JOHN_HOPKINS.items():
+        df = read_john_hopkins_csv(filename, source=source,
+                                   cache_dir=cache_dir, offline=offline)
+        names, dates, cases = _wide_john_hopkins(df)
+        # Match the countries with their ISO codes on the small table of
+        # country names, rather than on the long table of cases
+        countries = pd.merge(
+            left=pd.DataFrame({
+                "Country/Region": names.map(
+                    lambda name: MAP_UNMATCHED_COUNTRIES.get(name, name)),
+                "row": np.arange(len(names)),
+            }),
+            right=df_countries,
+            left_on="Country/Region",
+            right_on="Country",
+            how="inner",
+        )
+        # The index keeps track of the line of the country in the file
+        countries = countries.set_index("row")
+        countries.index.name = None
+        data[key] = (countries, dates, cases[countries.index.values])
+
+    matched = pd.concat([countries for countries, _, _ in data.values()])
+    matched = matched["Country"].unique()
+    assert matched.shape[0] >= 143, \
         "Missing countries when making the merge: not enough countries"
-    assert 'China' in df["Country"].unique(), \
+    assert 'China' in matched, \
         "Missing countries when making the merge: China missing"
-    assert 'South Korea' in df["Country"].unique(), \
+    assert 'South Korea' in matched, \
         "Missing countries when making the merge: South Korea missing"
 
-    df = df.rename(
-        columns={
-            "Country/Region": "name",
-            "Country": "country_region",
-            "Alpha-3 code": "iso",
-            "Latitude (average)": "lat",
-            "Longitude (average)": "long",
-        }
-    )
+    for countries, _, _ in data.values():
+        countries.rename(columns=COLUMNS_RENAME, inplace=True)
+    return data
 
-    return df
+
+def fetch_john_hopkins_data(source=DATA_SOURCE, cache_dir=FETCH_CACHE_DIR,
+                            offline=FETCH_OFFLINE):
+    """ Fetch the data from Johns Hopkins in a long format: one line per
+        country, date, and type of cases
+    """
+    data = fetch_john_hopkins_columns(source=source, cache_dir=cache_dir,
+                                      offline=offline)
+    df = list()
+    for key, (countries, dates, cases) in data.items():
+        n_countries, n_dates = cases.shape
+        country_index = np.repeat(np.arange(n_countries), n_dates)
+        date_index = np.tile(np.arange(n_dates), n_countries)
+        rows = countries.index.values
+        if len(np.unique(rows)) < n_countries:
+            # A country matched several entries of the ISO table: the
+            # lines are grouped by country and date, then by entry
+            order = np.lexsort((country_index, date_index,
+                                rows[country_index]))
+            country_index = country_index[order]
+            date_index = date_index[order]
+        df_key = pd.DataFrame({
+            "name": countries["name"].values[country_index],
+            "date": dates[date_index],
+            "cases": cases[country_index, date_index],
+            "type": key,
+        })
+        for col_name in countries.columns.drop("name"):
+            df_key[col_name] = countries[col_name].values[country_index]
+        df.append(df_key)
+    return pd.concat(df, ignore_index=True)
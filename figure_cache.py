@@ -0,0 +1,120 @@
+"""
+Cache the figures on disk, shared by all the processes serving the app
+
+The figures depend only on the data and on a few parameters: they are
+stored as JSON, under a hash of the function building them, of the
+source of its module and of its arguments.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+FIGURE_CACHE_DIR = os.environ.get('COVID_DASH_FIGURE_CACHE', 'figure_cache')
+
+
+def _hash_arg(hasher, arg):
+    """ Update the hasher with the content of an argument
+    """
+    if isinstance(arg, (pd.DataFrame, pd.Series)):
+        hasher.update(type(arg).__name__.encode('utf-8'))
+        hasher.update(np.ascontiguousarray(arg.values).tobytes())
+        hasher.update(pd.util.hash_pandas_object(arg.index).values.tobytes())
+        if isinstance(arg, pd.DataFrame):
+            hasher.update(
+                pd.util.hash_pandas_object(arg.columns).values.tobytes())
+    elif isinstance(arg, dict):
+        hasher.update(b'dict')
+        for key in sorted(arg):
+            _hash_arg(hasher, key)
+            _hash_arg(hasher, arg[key])
+    elif isinstance(arg, (list, tuple)):
+        hasher.update(type(arg).__name__.encode('utf-8'))
+        for item in arg:
+            _hash_arg(hasher, item)
+    else:
+        hasher.update(repr(arg).encode('utf-8'))
+
+
+@functools.lru_cache()
+def _source_digest(module_name):
+    """ The hash of the source of a module: the figures cached by an
+        older version of the code are not used
+    """
+    path = getattr(sys.modules.get(module_name), '__file__', None)
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except (OSError, TypeError):
+        return None
+
+
+def figure_key(make_figure, *args, **kwargs):
+    """ The hash of the function building a figure, of the source of its
+        module and of its arguments
+    """
+    hasher = hashlib.sha1()
+    _hash_arg(hasher, make_figure.__module__ + '.' + make_figure.__name__)
+    _hash_arg(hasher, _source_digest(make_figure.__module__))
+    _hash_arg(hasher, args)
+    _hash_arg(hasher, kwargs)
+    return hasher.hexdigest()
+
+
+def cached_figure(make_figure, *args, cache_dir=FIGURE_CACHE_DIR,
+                  **kwargs):
+    """ Call make_figure(*args, **kwargs), going through the cache
+
+    Returns the dict loaded from the JSON of the figure, whether it comes
+    from the cache or is computed: the first start of the app and the
+    next ones serve the same objects (with NaNs as None), which can be
+    given to dcc.Graph. If cache_dir is None, no caching is done.
+    """
+    if cache_dir is not None:
+        path = os.path.join(
+            cache_dir, figure_key(make_figure, *args, **kwargs) + '.json')
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # Not in the cache, or a corrupted entry
+            pass
+    # plotly is imported only when a figure is computed
+    import plotly.io as pio
+    content = pio.to_json(make_figure(*args, **kwargs), validate=False)
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write through a temporary file: other processes reading the
+        # cache never see a partial entry
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    return json.loads(content)
+
+
+def evict_figures(older_than, cache_dir=FIGURE_CACHE_DIR):
+    """ Remove the figures computed before the time older_than (in
+        seconds since the epoch), for instance the creation of the data
+        snapshot in use
+
+    Returns the number of figures removed.
+    """
+    if cache_dir is None or not os.path.exists(cache_dir):
+        return 0
+    n_removed = 0
+    for filename in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, filename)
+        try:
+            if os.path.getmtime(path) < older_than:
+                os.remove(path)
+                n_removed += 1
+        except OSError:
+            # Removed by another process
+            pass
+    return n_removed
@@ -0,0 +1,40 @@
+"""
+Configuration of gunicorn, to serve the app with
+
+> gunicorn app:server
+
+The app is loaded once, in the master process, before the workers are
+forked: the data and the figures are loaded and built once, and the
+workers share their memory pages until they write to them.
+
+The libraries and most of the data stay shared, but not all of it: the
+data of the layout is made of Python lists and dicts, and serializing it
+writes to the reference counts of its objects, which copies their pages
+in each worker. After a reload of the data, each worker builds its own
+state, which is not shared anymore. Measure it with
+build_tools/measure_worker_memory.py.
+"""
+import gc
+import os
+
+# Loading the app in the master tells it to start its background
+# refresh in each worker, after the fork (threads do not survive a fork)
+os.environ['COVID_DASH_PRELOAD'] = 'True'
+
+preload_app = True
+
+# The number of workers, as set by Heroku for the size of the dyno
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+
+
+def when_ready(server):
+    # The objects loaded with the app are moved out of reach of the
+    # garbage collector: its passes in the workers would otherwise write
+    # to every page holding them, and unshare them
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    import app
+    app.start_worker()
@@ -0,0 +1,130 @@
+"""
+Measure the stages of the pipeline: fetch, reshape, model fit,
+normalization, figures...
+
+Set the environment variable COVID_DASH_INSTRUMENT to True to record,
+for each stage, its wall time, CPU time, the peak memory of the process
+and the shape of its result. The records are logged as JSON lines, and
+kept in memory for the /_metrics endpoint of the app.
+
+When disabled, the decorator returns the functions unchanged: the
+instrumentation then costs nothing.
+"""
+
+import collections
+import contextlib
+import functools
+import json
+import logging
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+INSTRUMENT = os.environ.get('COVID_DASH_INSTRUMENT', 'False') == 'True'
+
+# The records of the last stages run in this process
+STAGES = collections.deque(maxlen=1000)
+
+logger = logging.getLogger('covid_dash.stages')
+
+
+def _peak_rss_mb():
+    """ The peak resident memory of the process, in megabytes
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # In bytes on macOS, in kilobytes elsewhere
+    return peak / (2 ** 20 if sys.platform == 'darwin' else 2 ** 10)
+
+
+def _shape(result):
+    """ The shape of the result of a stage, or of its first element that
+        has one
+    """
+    if isinstance(result, (tuple, list)):
+        for item in result:
+            if hasattr(item, 'shape'):
+                result = item
+                break
+    shape = getattr(result, 'shape', None)
+    return None if shape is None else list(shape)
+
+
+class StageRecord(dict):
+    """ The measures of a stage, as a dict. Call set_result to record the
+        shape of the result of the stage
+    """
+
+    def set_result(self, result):
+        self['shape'] = _shape(result)
+        return result
+
+
+@contextlib.contextmanager
+def stage(name, enabled=None):
+    """ Measure the code run in a with block
+
+    >>> with stage('reshape') as record:
+    ...     df = record.set_result(reshape(data))
+    """
+    if enabled is None:
+        enabled = INSTRUMENT
+    record = StageRecord(stage=name, pid=os.getpid())
+    if not enabled:
+        yield record
+        return
+    peak_rss_before = _peak_rss_mb()
+    start_cpu = time.process_time()
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record['wall_time'] = time.perf_counter() - start
+        record['cpu_time'] = time.process_time() - start_cpu
+        peak_rss = _peak_rss_mb()
+        record['peak_rss_mb'] = peak_rss
+        if peak_rss is not None:
+            record['peak_rss_increase_mb'] = peak_rss - peak_rss_before
+        record['time'] = time.time()
+        STAGES.append(record)
+        logger.info(json.dumps(record))
+
+
+def instrumented(name, enabled=None):
+    """ Decorator measuring each call of a function as a stage
+    """
+    if enabled is None:
+        enabled = INSTRUMENT
+
+    def decorator(function):
+        if not enabled:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with stage(name, enabled=True) as record:
+                return record.set_result(function(*args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def get_metrics():
+    """ The records of the stages run in this process, for the /_metrics
+        endpoint
+    """
+    return dict(pid=os.getpid(), stages=list(STAGES))
+
+
+if INSTRUMENT and not logger.handlers:
+    # The records are written as they are, one JSON object per line
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
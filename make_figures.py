@@ -2,22 +2,69 @@
 Utility functions to generate plotly figures from dataframe. Called in app.py
 """
 
-import plotly.graph_objects as go
-import plotly.express as px
+import base64
+import copy
+import functools
+import hashlib
+import json
+import math
+import os
+import shutil
+import time
+
 import numpy as np
 import pandas as pd
-import plotly.io as pio
-from plotly.validators.scatter.marker import SymbolValidator
 
 from data_input import normalize_by_population, normalize_by_population_wide
-
-pio.templates.default = "plotly_white"
+from instrumentation import instrumented
 
 FIRST_LINE_HEIGHT = 600
 
 LABEL_FONT_SIZE = 20
 
+HOVERTEMPLATE_MEASURE = '<b>%{meta}</b><br>%{x}<br>%{y:.0f} per Million<extra></extra>'
+HOVERTEMPLATE_PREDICTION = '<b>%{meta}<br>prediction</b><br>%{x}<br>%{y:.0f} per Million<extra></extra>'
+HOVERTEMPLATE_FATALITIES = '<b>%{meta}<br>fatalities</b><br>%{x}<br>%{y:.0f} per Million<extra></extra>'
+HOVERTEMPLATE_MAP = ('<b>Country</b>:%{customdata[0]}<br>' +
+                     '<b>Confirmed cases per million</b>: %{customdata[1]:.1f}<br>' +
+                     '<b>Confirmed cases</b>: %{customdata[2]}<br>' +
+                     '<b>Fatalities</b>: %{customdata[3]}'
+                     )
+# The frames of the animation of the map only have the cases per million,
+# in the text of the trace, and their date, in its meta
+HOVERTEMPLATE_MAP_PAST = ('<b>Country</b>:%{customdata[0]}<br>' +
+                          '<b>Date</b>: %{meta}<br>' +
+                          '<b>Confirmed cases per million</b>: %{text}'
+                          )
+
+# The largest size, in bytes, of the values of the frames of the animation
+# of the map: the dates are subsampled to fit in it
+MAP_FRAMES_MAX_BYTES = 2 ** 16
+# The values of the frames are quantized on 255 levels, 255 codes a
+# missing value
+MAP_FRAMES_MISSING = 255
+MAP_FRAMES_MAX_MARKS = 8
+
+
+@functools.lru_cache(maxsize=None)
+def import_plotly():
+    """ Import plotly, only when a figure is built: it is the slowest
+        import of the app, and the figures are usually loaded from the
+        figure cache
+
+    Returns
+    -------
+    go, px: modules
+        plotly.graph_objects and plotly.express
+    """
+    import plotly.express as px
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    pio.templates.default = "plotly_white"
+    return go, px
 
+
+@instrumented('figure.map')
 def make_map(df, df_fatalities):
     """
     Build figure with map of total number of cases
@@ -29,14 +76,11 @@ def make_map(df, df_fatalities):
     df_fatalities: pandas DataFrame
         Tidy dataframe of fatalities
     """
+    go, px = import_plotly()
     normalized_values = normalize_by_population(df)
     # Plot per Million individual
     normalized_values *= 1e6
-    hovertemplate = ('<b>Country</b>:%{customdata[0]}<br>' +
-                     '<b>Confirmed cases per million</b>: %{customdata[1]:.1f}<br>' +
-                     '<b>Confirmed cases</b>: %{customdata[2]}<br>' +
-                     '<b>Fatalities</b>: %{customdata[3]}'
-                     )
+    hovertemplate = HOVERTEMPLATE_MAP
     fig = px.choropleth(df, locations='iso',
                     color=np.log10(normalized_values),
                     custom_data=[df['country_region'], normalized_values,
@@ -57,113 +101,110 @@ def make_map(df, df_fatalities):
     return fig
 
 
-def make_timeplot(df_measure, df_prediction, countries=None):
+@instrumented('figure.map_frames')
+def make_map_frames(df, max_bytes=MAP_FRAMES_MAX_BYTES):
     """
-    Build figure showing evolution of number of cases vs. time for all countries.
-    The visibility of traces is set to 0 so that the interactive app will
-    toggle the visibility.
+    The frames of the animation of the map over time, encoded compactly:
+    the browser rebuilds the values of the map of each date from them
+    (see update_map_date in assets/callbacks.js), rather than receiving
+    one figure per date.
+
+    The log10 of the confirmed cases per million are quantized on 255
+    levels, and each frame is stored as its difference (modulo 256) to the
+    frame before it: as the cases are cumulated, most differences are
+    zeros, which compress well.
 
     Parameters
     ----------
-    df_measure: pandas DataFrame
-        DataFrame of measured cases, created by :func:`data_input.get_data`, of wide format.
+    df: pandas DataFrame
+        The wide dataframe of get_data
+    max_bytes: int
+        The dates are subsampled, keeping the last one, so that the
+        frames hold at most max_bytes values
 
-    df_prediction: pandas DataFrame
-        DataFrame of predictions, with similar structure as df_measure
+    Returns
+    -------
+    store: dict
+        "dates" the dates of the frames, "iso" the countries, in the order
+        of the map, "codes" the differences of the quantized values, in
+        base64, one frame (a byte per country) after the other. A code c
+        stands for the value "vmin" + c * "scale". "cmin" and "cmax" are
+        the range of the colors of the map of the last date, "marks" the
+        labels of the slider of the dates, and "hovertemplates" the hover
+        templates of the frames.
+    """
+    confirmed = df['confirmed']
+    # The countries in the order of the map (see data_input.tidy_as_of)
+    confirmed = confirmed.iloc[:, np.argsort(
+        confirmed.columns.get_level_values('iso'), kind='stable')]
+    n_days, n_countries = confirmed.shape
+    # One date every step days (the division rounded up)
+    step = max(1, -(-n_days * n_countries // max_bytes))
+    confirmed = confirmed.iloc[np.arange(n_days - 1, -1, -step)[::-1]]
 
-    countries: list or None (default)
-        list of countries to use for the figure. If None, all countries are used.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_values = np.log10(
+            1e6 * normalize_by_population_wide(confirmed).values)
+    log_values[~np.isfinite(log_values)] = np.nan
+    last_values = log_values[-1][~np.isnan(log_values[-1])]
+    log_values = log_values.astype(np.float32)
+    finite_values = log_values[~np.isnan(log_values)]
+    vmin = float(finite_values.min()) if len(finite_values) else 0.
+    vmax = float(finite_values.max()) if len(finite_values) else 0.
+    scale = (vmax - vmin) / (MAP_FRAMES_MISSING - 1) or 1.
+
+    codes = np.round((np.nan_to_num(log_values, nan=vmin) - vmin) / scale)
+    codes = codes.astype(np.uint8)
+    codes[np.isnan(log_values)] = MAP_FRAMES_MISSING
+    # The arithmetic of uint8 wraps around: the browser decodes the frames
+    # by cumulating the differences modulo 256
+    deltas = np.diff(codes, axis=0,
+                     prepend=np.zeros((1, n_countries), dtype=np.uint8))
+
+    # The first frame of each month, a few of them labeled
+    months = confirmed.index.year * 12 + confirmed.index.month
+    month_starts = np.flatnonzero(np.diff(months, prepend=-1))
+    n_months = len(month_starts)
+    month_starts = month_starts[::-(-n_months // MAP_FRAMES_MAX_MARKS)]
+    marks = {str(i): confirmed.index[i].strftime('%b %Y')
+             for i in month_starts}
+
+    return dict(
+        dates=confirmed.index.strftime('%Y-%m-%d').tolist(),
+        iso=confirmed.columns.get_level_values('iso').tolist(),
+        vmin=vmin,
+        scale=scale,
+        missing=MAP_FRAMES_MISSING,
+        codes=base64.b64encode(deltas.tobytes()).decode('ascii'),
+        cmin=float(last_values.min()) if len(last_values) else None,
+        cmax=float(last_values.max()) if len(last_values) else None,
+        marks=marks,
+        hovertemplates=dict(last=HOVERTEMPLATE_MAP,
+                            past=HOVERTEMPLATE_MAP_PAST),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_symbols():
+    """ The marker symbols of plotly, listed once rather than for each
+        trace
     """
-    # active cases
-    mode = 'confirmed'
-    df_measure_confirmed = df_measure[mode]
-    df_measure_confirmed = normalize_by_population_wide(df_measure_confirmed)
-    # Plot per million
-    df_measure_confirmed *= 1e6
-    colors = px.colors.qualitative.Dark24
-    n_colors = len(colors)
-    fig = go.Figure()
-    hovertemplate_measure = '<b>%{meta}</b><br>%{x}<br>%{y:.0f} per Million<extra></extra>'
-    hovertemplate_prediction = '<b>%{meta}<br>prediction</b><br>%{x}<br>%{y:.0f} per Million<extra></extra>'
-    for i, country in enumerate(df_measure_confirmed.columns):
-        if countries and country[1] not in countries:
-            continue
-        fig.add_trace(go.Scatter(x=df_measure_confirmed.index,
-                                 y=df_measure_confirmed[country],
-                                 name=country[1], mode='markers+lines',
-                                 marker_symbol = SymbolValidator().values[i],
-                                 marker_color=colors[i%n_colors],
-                                 line_color=colors[i%n_colors],
-                                 meta=country[1],
-                                 hovertemplate=hovertemplate_measure,
-                                 visible=True))
+    from plotly.validators.scatter.marker import SymbolValidator
+    return tuple(SymbolValidator().values)
 
-    # predictions
-    prediction = df_prediction['prediction']
-    upper_bound = df_prediction['upper_bound']
-    lower_bound = df_prediction['lower_bound']
-    prediction = normalize_by_population_wide(prediction)
-    prediction *= 1e6
-    upper_bound = normalize_by_population_wide(upper_bound)
-    upper_bound *= 1e6
-    lower_bound = normalize_by_population_wide(lower_bound)
-    lower_bound *= 1e6
-    for i, country in enumerate(prediction.columns):
-        if countries and country[1] not in countries:
-            continue
-        # Do not plot predictions for a country with less than 50 cases
-        if df_measure_confirmed[country][-1] < 50:
-            continue
-        fig.add_trace(go.Scatter(x=prediction.index,
-                                 y=prediction[country],
-                                 name='+' + country[1], mode='lines',
-                                 line_dash='dash',
-                                 line_color=colors[i%n_colors],
-                                 showlegend=False,
-                                 meta=country[1],
-                                 hovertemplate=hovertemplate_prediction,
-                                 visible=True))
-        fig.add_trace(go.Scatter(x=upper_bound.index,
-                                 y=upper_bound[country],
-                                 name='+' + country[1], mode='lines',
-                                 line_dash='dot',
-                                 line_color=colors[i%n_colors],
-                                 showlegend=False,
-                                 visible=True,
-                                 hoverinfo='skip',
-                                 line_width=.8))
-        fig.add_trace(go.Scatter(x=lower_bound.index,
-                                 y=lower_bound[country],
-                                 name='+' + country[1], mode='lines',
-                                 line_dash='dot',
-                                 line_color=colors[i%n_colors],
-                                 showlegend=False,
-                                 visible=True,
-                                 hoverinfo='skip',
-                                 line_width=.8))
-    # fatalities
-    mode = 'death'
-    df_measure_death = df_measure[mode]
-    df_measure_death = normalize_by_population_wide(df_measure_death)
-    # Plot per million
-    df_measure_death *= 1e6
-    colors = px.colors.qualitative.Dark24
-    n_colors = len(colors)
-    hovertemplate_fatalities = '<b>%{meta}<br>fatalities</b><br>%{x}<br>%{y:.0f} per Million<extra></extra>'
-    for i, country in enumerate(df_measure_death.columns):
-        if countries and country[1] not in countries:
-            continue
-        fig.add_trace(go.Scatter(x=df_measure_death.index,
-                                 y=df_measure_death[country],
-                                 name='  ' + country[1], mode='markers+lines',
-                                 marker_symbol = SymbolValidator().values[i],
-                                 marker_color=colors[i%n_colors],
-                                 line_color=colors[i%n_colors],
-                                 meta=country[1],
-                                 hovertemplate=hovertemplate_fatalities,
-                                 visible=True))
-
-    last_day = df_measure_confirmed.index.max()
+
+def update_timeplot_layout(fig, last_day):
+    """
+    Set the layout of the time plot: axes, annotations and the line
+    separating the measurements from the predictions.
+
+    Parameters
+    ----------
+    fig: plotly Figure
+        The figure to update
+    last_day: timestamp
+        The last day of measurements
+    """
     day = pd.DateOffset(days=1)
     fig.update_layout(title='',
             xaxis=dict(rangeslider_visible=True,
@@ -235,8 +276,489 @@ def make_timeplot(df_measure, df_prediction, countries=None):
     )
 
 
+@instrumented('figure.timeplot')
+def make_timeplot(df_measure, df_prediction, countries=None):
+    """
+    Build figure showing evolution of number of cases vs. time for all countries.
+    The visibility of traces is set to 0 so that the interactive app will
+    toggle the visibility.
+
+    Parameters
+    ----------
+    df_measure: pandas DataFrame
+        DataFrame of measured cases, created by :func:`data_input.get_data`, of wide format.
+
+    df_prediction: pandas DataFrame
+        DataFrame of predictions, with similar structure as df_measure
+
+    countries: list or None (default)
+        list of countries to use for the figure. If None, all countries are used.
+
+    Returns
+    -------
+    fig: dict
+        The plotly figure, as a dict with "data" and "layout"
+    """
+    # The traces are built as plain dicts from the arrays of values:
+    # building and validating a go.Scatter for each trace is the costly
+    # part when there are many countries
+    go, px = import_plotly()
+    colors = px.colors.qualitative.Dark24
+    n_colors = len(colors)
+    symbols = get_symbols()
+
+    def selected(columns):
+        # The position and the name of the countries to plot
+        return [(i, country) for i, country in enumerate(columns)
+                if not countries or country[1] in countries]
 
-    return fig
+    # active cases
+    df_measure_confirmed = normalize_by_population_wide(
+                                            df_measure['confirmed']) * 1e6
+    dates = df_measure_confirmed.index
+    values = df_measure_confirmed.values
+    traces = list()
+    for i, country in selected(df_measure_confirmed.columns):
+        traces.append(dict(
+            hovertemplate=HOVERTEMPLATE_MEASURE,
+            line=dict(color=colors[i % n_colors]),
+            marker=dict(color=colors[i % n_colors], symbol=symbols[i]),
+            meta=country[1],
+            mode='markers+lines',
+            name=country[1],
+            visible=True,
+            x=dates,
+            y=values[:, i],
+            type='scatter'))
+
+    # predictions
+    prediction, upper_bound, lower_bound = [
+        normalize_by_population_wide(df_prediction[key]) * 1e6
+        for key in ('prediction', 'upper_bound', 'lower_bound')]
+    prediction_dates = prediction.index
+    last_measure = df_measure_confirmed.iloc[-1]
+    for i, country in selected(prediction.columns):
+        # Do not plot predictions for a country with less than 50 cases
+        if last_measure[country] < 50:
+            continue
+        color = colors[i % n_colors]
+        traces.append(dict(
+            hovertemplate=HOVERTEMPLATE_PREDICTION,
+            line=dict(color=color, dash='dash'),
+            meta=country[1],
+            mode='lines',
+            name='+' + country[1],
+            showlegend=False,
+            visible=True,
+            x=prediction_dates,
+            y=prediction.values[:, i],
+            type='scatter'))
+        for bound in (upper_bound, lower_bound):
+            traces.append(dict(
+                hoverinfo='skip',
+                line=dict(color=color, dash='dot', width=.8),
+                mode='lines',
+                name='+' + country[1],
+                showlegend=False,
+                visible=True,
+                x=prediction_dates,
+                y=bound.values[:, i],
+                type='scatter'))
+
+    # fatalities
+    df_measure_death = normalize_by_population_wide(
+                                            df_measure['death']) * 1e6
+    values = df_measure_death.values
+    for i, country in selected(df_measure_death.columns):
+        traces.append(dict(
+            hovertemplate=HOVERTEMPLATE_FATALITIES,
+            line=dict(color=colors[i % n_colors]),
+            marker=dict(color=colors[i % n_colors], symbol=symbols[i]),
+            meta=country[1],
+            mode='markers+lines',
+            name='  ' + country[1],
+            visible=True,
+            x=df_measure_death.index,
+            y=values[:, i],
+            type='scatter'))
+
+    # The layout is built on a plotly figure, as it relies on the "magic
+    # underscores" of plotly
+    layout = go.Figure()
+    update_timeplot_layout(layout, df_measure_confirmed.index.max())
+    return dict(data=traces, layout=layout.to_plotly_json()['layout'])
+
+
+@instrumented('figure.timeplot_store')
+def make_timeplot_store(df_measure, df_prediction):
+    """
+    Build the compact data from which the browser assembles the traces of
+    the time plot, for all countries. Compared to the full figure, the
+    dates and the trace styles are sent only once, and the values are
+    rounded.
+
+    Parameters
+    ----------
+    df_measure: pandas DataFrame
+        DataFrame of measured cases, created by :func:`data_input.get_data`, of wide format.
+
+    df_prediction: pandas DataFrame
+        DataFrame of predictions, with similar structure as df_measure
+
+    Returns
+    -------
+    store: dict
+        "layout" is the layout of the time plot, "dates" and
+        "prediction_dates" the shared x axes, "colors" and "symbols" the
+        styles, "hovertemplates" the hover templates for each type of
+        trace. "countries" maps each country name to its y values
+        ("confirmed", "death", and "prediction", "upper_bound",
+        "lower_bound" when there is a prediction), to its index in the
+        styles ("confirmed_index", "death_index"), to its "iso" code and
+        to the maximum of its values ("confirmed_max", "death_max",
+        "prediction_max"). "country_index" maps each country name to its
+        position in "countries".
+    """
+    go, px = import_plotly()
+    df_measure_confirmed = normalize_by_population_wide(
+                                            df_measure['confirmed']) * 1e6
+    df_measure_death = normalize_by_population_wide(
+                                            df_measure['death']) * 1e6
+    predictions = {key: normalize_by_population_wide(df_prediction[key]) * 1e6
+                   for key in ('prediction', 'upper_bound', 'lower_bound')}
+
+    def to_list(values):
+        # Rounding to 2 decimals keeps the JSON small, and is well below
+        # the precision shown on the plot
+        return np.round(np.asarray(values, dtype=float), 2).tolist()
+
+    def max_of(*lists):
+        # The maximum of the values, ignoring NaNs, used by the browser
+        # to scale the y axis without scanning the values
+        values = np.concatenate([np.asarray(values, dtype=float)
+                                 for values in lists])
+        values = values[~np.isnan(values)]
+        return float(values.max()) if len(values) else None
+
+    countries = dict()
+    for i, country in enumerate(df_measure_confirmed.columns):
+        countries[country[1]] = dict(
+            iso=country[0],
+            confirmed_index=i,
+            confirmed=to_list(df_measure_confirmed[country]))
+    for country in predictions['prediction'].columns:
+        # Do not plot predictions for a country with less than 50 cases
+        if (country[1] not in countries
+                or df_measure_confirmed[country].iloc[-1] < 50):
+            continue
+        for key, prediction in predictions.items():
+            countries[country[1]][key] = to_list(prediction[country])
+    for i, country in enumerate(df_measure_death.columns):
+        countries.setdefault(country[1], dict(iso=country[0])).update(
+            death_index=i,
+            death=to_list(df_measure_death[country]))
+    for entry in countries.values():
+        maxima = dict(
+            confirmed_max=max_of(entry.get('confirmed', [])),
+            death_max=max_of(entry.get('death', [])),
+            prediction_max=max_of(*(entry.get(key, []) for key in
+                                    ('prediction', 'upper_bound',
+                                     'lower_bound'))),
+        )
+        entry.update((key, value) for key, value in maxima.items()
+                     if value is not None)
+
+    fig = go.Figure()
+    update_timeplot_layout(fig, df_measure_confirmed.index.max())
+    n_symbols = max(len(df_measure_confirmed.columns),
+                    len(df_measure_death.columns))
+    return dict(
+        layout=fig.to_plotly_json()['layout'],
+        dates=df_measure_confirmed.index.strftime('%Y-%m-%d').tolist(),
+        prediction_dates=predictions['prediction'].index.strftime(
+                                                    '%Y-%m-%d').tolist(),
+        colors=px.colors.qualitative.Dark24,
+        symbols=list(get_symbols()[:n_symbols]),
+        hovertemplates=dict(
+            confirmed=HOVERTEMPLATE_MEASURE,
+            prediction=HOVERTEMPLATE_PREDICTION,
+            death=HOVERTEMPLATE_FATALITIES,
+        ),
+        countries=countries,
+        # The position of each country in the store: the traces of the
+        # selected countries are shown in this order
+        country_index={country: i for i, country in enumerate(countries)},
+    )
+
+
+# The keys of the entries of the countries holding their data, which go
+# into the shards
+SHARD_KEYS = ('confirmed', 'death', 'prediction', 'upper_bound',
+              'lower_bound')
+
+
+def split_timeplot_store(store, inline_countries=()):
+    """
+    Split the store of :func:`make_timeplot_store` into a light store and
+    one shard per country, holding its data, that the browser fetches
+    when the country is selected.
+
+    Parameters
+    ----------
+    store: dict
+        The store of :func:`make_timeplot_store`
+    inline_countries: list
+        The countries kept with their data in the light store, typically
+        the countries shown at initialization
+
+    Returns
+    -------
+    light_store: dict
+        The store, in which each country not in inline_countries has a
+        "shard" entry, the name of its shard, instead of its data
+    shards: dict
+        The data of each shard, by shard name
+    """
+    light_store = dict(store)
+    light_store['countries'] = dict()
+    shards = dict()
+    for country, entry in store['countries'].items():
+        if country in inline_countries:
+            light_store['countries'][country] = entry
+            continue
+        shard_name = entry['iso'] + '.json'
+        light_store['countries'][country] = {
+            key: value for key, value in entry.items()
+            if key not in SHARD_KEYS}
+        light_store['countries'][country]['shard'] = shard_name
+        shards[shard_name] = {key: value for key, value in entry.items()
+                              if key in SHARD_KEYS}
+    return light_store, shards
+
+
+def freeze_timeplot_store(store):
+    """
+    The store of :func:`make_timeplot_store`, with the data of each
+    country in read-only float arrays rather than in lists.
+
+    The store is kept in memory by the processes building the figures on
+    the server. Serializing a list of floats writes to the reference
+    count of each float, and so to every page holding them: in processes
+    forked from a preloaded app, this copies the data in each process.
+    The buffer of an array is never written to, and stays shared.
+    """
+    frozen = dict(store)
+    frozen['countries'] = dict()
+    for country, entry in store['countries'].items():
+        entry = dict(entry)
+        for key in SHARD_KEYS:
+            if key in entry:
+                values = np.array(entry[key], dtype=float)
+                values.flags.writeable = False
+                entry[key] = values
+        frozen['countries'][country] = entry
+    return frozen
+
+
+def write_shards(shards, directory):
+    """
+    Write the shards in JSON files, in a subdirectory of directory named
+    after a hash of their content: the shards of a new snapshot do not
+    overwrite those of the pages loaded before it. The shards already
+    written, by another process, are kept.
+
+    Returns the name of the subdirectory.
+    """
+    from plotly.utils import PlotlyJSONEncoder
+    contents = {shard_name: json.dumps(shard, cls=PlotlyJSONEncoder,
+                                       separators=(',', ':'))
+                for shard_name, shard in shards.items()}
+    hasher = hashlib.sha1()
+    for shard_name, content in sorted(contents.items()):
+        hasher.update(f'{shard_name}\n{content}\n'.encode('utf-8'))
+    version = hasher.hexdigest()[:12]
+    version_dir = os.path.join(directory, version)
+    os.makedirs(version_dir, exist_ok=True)
+    for shard_name, content in contents.items():
+        path = os.path.join(version_dir, shard_name)
+        if os.path.exists(path):
+            continue
+        # Write through a temporary file: the shards may be served while
+        # they are written
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    # The modification time of the subdirectory is when it was last put
+    # in use, see evict_shards
+    os.utime(version_dir)
+    return version
+
+
+def evict_shards(directory, keep, max_age):
+    """
+    Remove the subdirectories of shards written by :func:`write_shards`
+    that were replaced by a newer one more than max_age seconds ago: the
+    pages loaded before may still request them until then.
+
+    Parameters
+    ----------
+    directory: str
+        The directory of the subdirectories
+    keep: str
+        A subdirectory never removed, the one in use
+    max_age: float
+        In seconds
+
+    Returns the number of subdirectories removed.
+    """
+    versions = list()
+    for entry in os.scandir(directory):
+        try:
+            if entry.is_dir():
+                versions.append((entry.stat().st_mtime, entry.path,
+                                 entry.name))
+        except OSError:
+            # Removed by another process
+            pass
+    versions.sort()
+    n_removed = 0
+    now = time.time()
+    for (_, path, name), (replaced_time, _, _) in zip(versions,
+                                                      versions[1:]):
+        if name != keep and now - replaced_time > max_age:
+            shutil.rmtree(path, ignore_errors=True)
+            n_removed += 1
+    return n_removed
+
+
+def timeplot_traces(store, country, cases_type='active'):
+    """
+    The traces of a country, assembled from the store of
+    :func:`make_timeplot_store`, as done in the browser by make_traces in
+    assets/callbacks.js
+
+    Returns
+    -------
+    measures, predictions: lists of dicts
+        The traces of the measures and of the predictions (empty for
+        fatalities)
+    """
+    data = store['countries'].get(country)
+    measures, predictions = list(), list()
+    type_ = 'confirmed' if cases_type == 'active' else 'death'
+    if data is None or data.get(type_) is None:
+        return measures, predictions
+    index = data[type_ + '_index']
+    color = store['colors'][index % len(store['colors'])]
+    measures.append(dict(
+        type='scatter',
+        x=store['dates'],
+        y=data[type_],
+        name=country if type_ == 'confirmed' else '  ' + country,
+        mode='markers+lines',
+        marker=dict(color=color, symbol=store['symbols'][index]),
+        line=dict(color=color),
+        meta=country,
+        hovertemplate=store['hovertemplates'][type_],
+        visible=True,
+    ))
+    if type_ == 'confirmed' and data.get('prediction') is not None:
+        predictions.append(dict(
+            type='scatter',
+            x=store['prediction_dates'],
+            y=data['prediction'],
+            name='+' + country,
+            mode='lines',
+            line=dict(color=color, dash='dash'),
+            showlegend=False,
+            meta=country,
+            hovertemplate=store['hovertemplates']['prediction'],
+            visible=True,
+        ))
+        for bound in ('upper_bound', 'lower_bound'):
+            predictions.append(dict(
+                type='scatter',
+                x=store['prediction_dates'],
+                y=data[bound],
+                name='+' + country,
+                mode='lines',
+                line=dict(color=color, dash='dot', width=.8),
+                showlegend=False,
+                visible=True,
+                hoverinfo='skip',
+            ))
+    return measures, predictions
+
+
+def timeplot_figure(store, countries, cases_type='active',
+                    log_or_lin='linear'):
+    """
+    The figure of the time plot for the selected countries, built from
+    the store of :func:`make_timeplot_store` on the server, as done in the
+    browser by update_store_data in assets/callbacks.js
+
+    Parameters
+    ----------
+    store: dict
+        The store of :func:`make_timeplot_store`, with the data of all
+        the countries (not split in shards)
+    countries: tuple
+        The selected countries, in the order of "country_index" (see
+        :func:`selected_countries`)
+    cases_type: str
+        "active" or "death"
+    log_or_lin: str
+        "log" or "linear" y axis
+
+    Returns
+    -------
+    figure: dict
+        The plotly figure, as a dict
+    """
+    type_ = 'confirmed' if cases_type == 'active' else 'death'
+    data, predictions = list(), list()
+    y_max = 100
+    for country in countries:
+        country_measures, country_predictions = timeplot_traces(
+            store, country, cases_type)
+        data.extend(country_measures)
+        predictions.extend(country_predictions)
+        entry = store['countries'][country]
+        if country_measures:
+            y_max = max(y_max, entry.get(type_ + '_max', y_max))
+        if country_predictions:
+            y_max = max(y_max, entry.get('prediction_max', y_max))
+    data.extend(predictions)
+
+    # The layout of the store is shared by all the figures
+    layout = copy.deepcopy(store['layout'])
+    layout['annotations'][0]['visible'] = cases_type != 'active'
+    layout['annotations'][1]['visible'] = cases_type == 'active'
+    layout['yaxis']['type'] = log_or_lin
+    if log_or_lin == 'log':
+        layout['legend']['x'] = .65
+        layout['legend']['y'] = .1
+        layout['yaxis']['range'] = [1.2, math.log10(y_max)]
+        layout['yaxis']['autorange'] = False
+    else:
+        layout['legend']['x'] = .05
+        layout['legend']['y'] = .8
+        layout['yaxis']['autorange'] = True
+    return dict(data=data, layout=layout)
+
+
+def selected_countries(store, rows, selected_rows):
+    """
+    The countries of the selected rows of the table, without duplicates,
+    in the order of "country_index" of the store: the same selection
+    always gives the same tuple, which can be used as a cache key
+    """
+    country_index = store['country_index']
+    countries = {rows[i]['country_region'] for i in selected_rows or ()}
+    return tuple(sorted((country for country in countries
+                         if country in country_index),
+                        key=country_index.get))
 
 
 if __name__ == '__main__':
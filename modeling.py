@@ -1,55 +1,35 @@
 """
-# Statistical model to extrapolate Covid-19 actives cases
-
-Here we build the statistical model behind
-https://covid19-dash.github.io/
+Statistical model to extrapolate Covid-19 actives cases
 
 The model is made by fitting a weighted least square on the log of the
 number of cases over a window of the few last days.
 
-This is a computational notebook: it is the actual code that is run to
-build the model.
-"""
+The errors in the data are expected to be proportional to the value of
+the data: the more cases are present, the more tests are realized, and
+the more errors as well as the more cases are missed. This noise
+becomes additive after taking the log, and can then reasonnably be
+assumed Gaussian, which justifies the use of a squared loss.
 
-# %%
-# Use joblib, to speed up interactions
-from joblib import Memory
-mem = Memory(location='.')
+The notebook modeling_notebook.py explains the model, and how its window
+was chosen.
+"""
 
-# %%
-# ## Load and plot the data
+import numpy as np
+import pandas as pd
+from scipy import stats
 
-# %%
-# Download the data
 import data_input
-data = mem.cache(data_input.get_data)()
+from instrumentation import instrumented
+from snapshot import (SNAPSHOT_DIR, PREDICTION_KEYS, load_snapshot,
+                      save_snapshot, get_snapshot_window)
 
+# The window used for the predictions, chosen with a historical replay
+# (see modeling_notebook.py)
+WINDOW_SIZE = 17
+WINDOW_GROWTH = 1.6
 
-# We model only the confirmed cases
-confirmed = data['confirmed']
-
-# %%
-# First plot the time course of the most affected countries
-last_day = confirmed.iloc[-1]
-most_affected_countries = confirmed.columns[last_day.argsort()][::-1]
-
-import matplotlib.pyplot as plt
-ax = confirmed[most_affected_countries[:20]].plot(figsize=(12, 7))
-ax.set_yscale('log')
-ax.set_title("Log-scale plot of number of confirmed cases")
-plt.legend(loc='best', ncol=3)
-plt.tight_layout()
-
-# %%
-# ## Define our weighted window
-#
-# The windows that we use are weighted: we give more weight to the last
-# day, and less to the days further away in time.
 
-# %%
 # Some functions to build normalized weighted windows
-import numpy as np
-
 def ramp_window(start=14, middle=7):
     window = np.ones(start)
     window[:middle] = np.arange(middle) / float(middle)
@@ -62,87 +42,126 @@ def exp_window(start=14, growth=1.1):
     window /= window.sum()
     return window
 
-# %%
-# To define the optimal window, specified below, we used a historical
-# replay: we chose the window and the set of weights that predict been
-# observations already seen from their past
-window_size = 17
-weighted_window = exp_window(start=window_size, growth=1.6)
-
-plt.figure()
-plt.plot(weighted_window)
-plt.title('The weights over the last few days')
-
-# %%
-# # A simple model: fit the last few points
-
-# %%
-# the log of the confirmed counts in the last fortnight
-last_fortnight = confirmed.iloc[-window_size:]
-np.seterr(divide='ignore')
-log_last_fortnight = np.log(last_fortnight)
-log_last_fortnight[log_last_fortnight == -np.inf] = 0
-
-ax = log_last_fortnight[most_affected_countries[:20]].plot(figsize=(12, 7))
-ax.set_title('Log of the number of confirmed cases in the last fortnight')
-plt.legend(loc='best', ncol=3)
-plt.tight_layout()
-
-# %%
+
+def default_window():
+    """ The window used for the predictions of the dashboard
+    """
+    return exp_window(start=WINDOW_SIZE, growth=WINDOW_GROWTH)
+
+
 # Our model-fitting routine: a weighted least square on the log of
 # the confirmed counts
-#
-# The errors in the data are expected to be proportional to the value of
-# the data: the more cases are present, the more tests are realized, and
-# the more errors as well as the more cases are missed. This noise
-# becomes additive after taking the log, and can then reasonnably be
-# assumed Gaussian, which justifies the use of a squared loss.
-import pandas as pd
-import statsmodels.api as sm
+def rolling_weighted_sums(log_data, window):
+    """ The weighted sums of the data over each position of the window
+
+    Parameters
+    ==========
+    log_data: 2d numpy array
+        The log of the cases: time (rows) times countries (columns)
+    window: 1d numpy array
+        The array of weights defining the window
+
+    Returns
+    =======
+    sum_wy, sum_wxy: 2d numpy arrays
+        The sums of w * y and w * x * y, with x the day in the window,
+        for each start of the window (rows) and each country (columns)
+    """
+    window_size = len(window)
+    n_positions = log_data.shape[0] - window_size + 1
+    sum_wy = np.zeros((n_positions, ) + log_data.shape[1:])
+    sum_wxy = np.zeros_like(sum_wy)
+    # Loop on the days in the window rather than on its positions: each
+    # step is a vectorized update on all the positions and countries
+    for day, weight in enumerate(window):
+        shifted = log_data[day:day + n_positions]
+        sum_wy += weight * shifted
+        sum_wxy += weight * day * shifted
+    return sum_wy, sum_wxy
+
+
+def trend_from_sums(sum_wy, sum_wxy, window):
+    """ Intercept and slope of the weighted least square, computed with
+        the normal equations from the weighted sums
+    """
+    x = np.arange(len(window))
+    sum_w = window.sum()
+    sum_wx = window @ x
+    det = sum_w * (window @ x ** 2) - sum_wx ** 2
+    linear = (sum_w * sum_wxy - sum_wx * sum_wy) / det
+    const = (sum_wy - linear * sum_wx) / sum_w
+    return const, linear
+
 
+def wls_fit(log_data, window, alpha=.25):
+    """ Closed-form weighted least square of each column of log_data
+        on a linear trend, with weights given by the window
+
+    Parameters
+    ==========
+    log_data: 2d numpy array
+        The log of the cases: time (rows) times countries (columns)
+    window: 1d numpy array
+        The array of weights defining the window
+    alpha: number
+        The confidence level of the interval on the slope, as in
+        statsmodels' "conf_int"
+
+    Returns
+    =======
+    const, linear: 1d numpy arrays
+        The intercept and the slope for each country
+    linear_lower, linear_upper: 1d numpy arrays
+        The bounds of the confidence interval on the slope
+    """
+    # All the countries share the same design matrix and weights: we
+    # use the normal equations on the weighted sums, which gives the
+    # same result as fitting a statsmodels' WLS on each column
+    sum_wy, sum_wxy = rolling_weighted_sums(log_data, window)
+    const, linear = trend_from_sums(sum_wy[0], sum_wxy[0], window)
+
+    window_size = len(window)
+    x = np.arange(window_size)
+    sum_w = window.sum()
+    det = sum_w * (window @ x ** 2) - (window @ x) ** 2
+    residuals = log_data - const - np.outer(x, linear)
+    df_resid = window_size - 2
+    scale = (window @ residuals ** 2) / df_resid
+    linear_stderr = np.sqrt(scale * sum_w / det)
+    q = stats.t.ppf(1 - alpha / 2, df_resid)
+    return (const, linear, linear - q * linear_stderr,
+            linear + q * linear_stderr)
+
+
+@instrumented('fit')
 def fit_on_window(data, window):
     """ Fit the last window of the data
     """
     window_size = len(window)
     last_fortnight = data.iloc[-window_size:]
-    log_last_fortnight = np.log(last_fortnight)
+    log_last_fortnight = np.log(last_fortnight.values.astype(float))
     log_last_fortnight[log_last_fortnight == -np.inf] = 0
 
-    design = pd.DataFrame({'linear': np.arange(window_size),
-                           'const': np.ones(window_size)})
+    const, linear, linear_lower, linear_upper = wls_fit(
+        log_last_fortnight, np.asarray(window, dtype=float))
 
-    growth_rate = pd.DataFrame(data=np.zeros((1, len(data.columns))),
+    growth_rate = pd.DataFrame(data=np.exp(linear)[np.newaxis],
                                columns=data.columns)
 
-    predicted_cases = pd.DataFrame()
-    predicted_cases_lower = pd.DataFrame()
-    predicted_cases_upper = pd.DataFrame()
     prediction_dates = pd.date_range(data.index[-window_size],
                                     periods=window_size + 7)
-
-    for country in data.columns:
-        mod_wls = sm.WLS(log_last_fortnight[country].values, design,
-                         weights=window, hasconst=True)
-        res_wls = mod_wls.fit()
-        growth_rate[country] = np.exp(res_wls.params.linear)
-        predicted_cases[country] = np.exp(res_wls.params.const +
-                res_wls.params.linear * np.arange(len(prediction_dates))
-            )
-        # 1st and 3rd quartiles in the confidence intervals
-        conf_int = res_wls.conf_int(alpha=.25)
-        # We chose to account only for error in growth rate, and not in
-        # baseline number of cases
-        predicted_cases_lower[country] = np.exp(res_wls.params.const +
-                conf_int[0].linear * np.arange(len(prediction_dates))
-            )
-        predicted_cases_upper[country] = np.exp(res_wls.params.const +
-                conf_int[1].linear * np.arange(len(prediction_dates))
-            )
-
-    predicted_cases = pd.concat(dict(prediction=predicted_cases,
-                                     lower_bound=predicted_cases_lower,
-                                     upper_bound=predicted_cases_upper),
-                                axis=1)
+    days = np.arange(len(prediction_dates))[:, np.newaxis]
+    # We chose to account only for error in growth rate, and not in
+    # baseline number of cases: the bounds are the 1st and 3rd quartiles
+    # in the confidence intervals on the slope
+    predicted_cases = pd.concat(dict(
+        prediction=pd.DataFrame(np.exp(const + linear * days),
+                                columns=data.columns),
+        lower_bound=pd.DataFrame(np.exp(const + linear_lower * days),
+                                 columns=data.columns),
+        upper_bound=pd.DataFrame(np.exp(const + linear_upper * days),
+                                 columns=data.columns)),
+        axis=1)
     predicted_cases['date'] = prediction_dates
     predicted_cases = predicted_cases.set_index('date')
     if window_size > 10:
@@ -152,56 +171,129 @@ def fit_on_window(data, window):
     return growth_rate, predicted_cases
 
 
+def refit_on_window(data, window, previous_data, previous_predictions):
+    """ Fit the last window of the data, refitting only the countries
+        whose cases changed in this window since the previous fit
+
+    Parameters
+    ==========
+    data: dataframe
+        The dataframe of the cases across countries (columns) and
+        time (index)
+    window: 1d numpy array
+        The array of weights defining the window
+    previous_data: dataframe or None
+        The data of the previous fit
+    previous_predictions: dict of dataframes or None
+        The predictions of the previous fit, with the same window, as
+        stored in the snapshot: keys "prediction", "lower_bound" and
+        "upper_bound"
+
+    Returns
+    =======
+    The same as fit_on_window
+    """
+    window_size = len(window)
+    if (previous_data is None
+            or not previous_data.columns.equals(data.columns)
+            or len(previous_data) < window_size):
+        return fit_on_window(data, window)
+    # The fit depends only on the values in the window, and not on their
+    # dates: the predictions of the other countries are the same, on
+    # shifted dates
+    changed = np.any(data.values[-window_size:]
+                     != previous_data.values[-window_size:], axis=0)
+    prediction_dates = (previous_predictions['prediction'].index
+                        + (data.index[-1] - previous_data.index[-1]))
+
+    predictions = {key: np.array(previous_predictions[key], dtype=float)
+                   for key in PREDICTION_KEYS}
+    # The growth rate is the ratio of the predictions on successive days
+    growth_rate = predictions['prediction'][1] / predictions['prediction'][0]
+    if changed.any():
+        changed_growth_rate, changed_cases = fit_on_window(
+            data.loc[:, changed], window)
+        growth_rate[changed] = changed_growth_rate.values[0]
+        for key, values in predictions.items():
+            values[:, changed] = changed_cases[key].values
+
+    growth_rate = pd.DataFrame(data=growth_rate[np.newaxis],
+                               columns=data.columns)
+    predictions = {key: pd.DataFrame(values, columns=data.columns,
+                                     index=prediction_dates)
+                   for key, values in predictions.items()}
+    predicted_cases = pd.concat(predictions, axis=1)
+    return growth_rate, predicted_cases
+
+
+def fit_predictions(confirmed, window=None, previous_confirmed=None,
+                    previous_predictions=None):
+    """ The predictions of the model, as shown in the dashboard
+
+    Parameters
+    ==========
+    confirmed: dataframe
+        The confirmed cases across countries (columns) and time (index)
+    window: 1d numpy array, optional
+        The array of weights defining the window, default_window() if
+        not given
+    previous_confirmed, previous_predictions: optional
+        The data and the predictions of a previous fit with the same
+        window: only the countries whose data changed are then refitted
+
+    Returns
+    =======
+    predictions: dict of dataframes
+        The predicted cases, with keys "prediction", "lower_bound" and
+        "upper_bound"
+    """
+    if window is None:
+        window = default_window()
+    if previous_predictions is None:
+        _, predicted_cases = fit_on_window(confirmed, window)
+    else:
+        _, predicted_cases = refit_on_window(
+            confirmed, window, previous_confirmed, previous_predictions)
+    return {key: predicted_cases[key] for key in PREDICTION_KEYS}
+
+
+@instrumented('update_snapshot')
+def update_snapshot(directory=SNAPSHOT_DIR, window=None):
+    """ Fetch the data, fit the model, and save both in the snapshot
+
+    The data and the predictions of the former snapshot are updated
+    rather than recomputed: only the new dates, and the countries whose
+    data changed, are processed.
+
+    Returns
+    =======
+    data: dataframe
+        The wide data frame of cases
+    predictions: dict of dataframes
+        The predicted cases, as returned by fit_predictions
+    """
+    if window is None:
+        window = default_window()
+    try:
+        previous_data, previous_predictions = load_snapshot(
+            directory, mmap_mode=None)
+    except FileNotFoundError:
+        previous_data = previous_predictions = None
+    data = data_input.get_data(previous=previous_data)
+
+    previous_window = get_snapshot_window(directory)
+    if (previous_data is None or previous_window is None
+            or not np.array_equal(previous_window, window)):
+        # The previous predictions were made with another window
+        previous_confirmed = previous_predictions = None
+    else:
+        previous_confirmed = previous_data['confirmed']
+    predictions = fit_predictions(data['confirmed'], window,
+                                  previous_confirmed, previous_predictions)
+    save_snapshot(data, predictions, directory, window=window)
+    return data, predictions
 
-# %%
-# Fit it on the data
-growth_rate, predicted_cases = fit_on_window(confirmed, weighted_window)
-
-ax = growth_rate[most_affected_countries[:20]].T.plot(kind='barh',
-    legend=False)
-ax.set_title('Estimated growth rate')
-ax.axvline(1, color='.5')
-plt.tight_layout()
-
-# %%
-# Display the estimated growth rates
-pd.set_option('display.max_rows', 60)
-growth_rate[most_affected_countries[:60]].T
-
-# %%
-# Plot our prediction
-
-ax = last_fortnight[most_affected_countries[:10]].plot(figsize=(12, 7))
-predicted_cases['prediction'][most_affected_countries[:10]].plot(
-        ax=ax, style='--')
-predicted_cases['lower_bound'][most_affected_countries[:10]].plot(
-        ax=ax, style=':')
-predicted_cases['upper_bound'][most_affected_countries[:10]].plot(
-        ax=ax, style=':')
-
-plt.legend(loc=(.8, -1.3))
-ax.set_yscale('log')
-ax.set_title('Number of confirmed cases in the last fortnight and prediction')
-
-# %%
-# Save our results for the dashboard. We pickle a dict, because
-# hierachical columns do not pickle right
-import pickle
-with open('predictions.pkl', 'wb') as out_file:
-    pickle.dump(dict(prediction=predicted_cases['prediction'],
-                     lower_bound=predicted_cases['lower_bound'],
-                     upper_bound=predicted_cases['upper_bound'],
-                    ),
-                out_file)
-
-# %%
-# --------
-# Now an analysis to optimize the window.
-#
-# This takes longer and is left out from the notebook displayed on the
-# website (modeling_short)
 
-# %%
 # Historical replay to estimate an error
 
 def historical_replay(data, window, threshold=50, prediction_horizon=4):
@@ -209,7 +301,7 @@ def historical_replay(data, window, threshold=50, prediction_horizon=4):
 
     Parameters
     ==========
-    data: dataframe
+    data: dataframe or 2d numpy array
         The dataframe of the cases across countries (columns) and
         time (index)
     window: 1d numpy array
@@ -220,116 +312,104 @@ def historical_replay(data, window, threshold=50, prediction_horizon=4):
     prediction_horizon: number
         The number of points we consider in the future to compute the
         error
-    """
 
-    all_errors = list()
-    for i in range(len(window) + prediction_horizon, data.shape[0]):
-        past_data = data[:i]
-        # First, limit to countries with cases at the end that are more than
-        # threshold
-        past_data = past_data[past_data.columns[
-                            (past_data.iloc[-prediction_horizon - 1:]
-                            > threshold).all()]]
-        train_data = past_data[:-prediction_horizon]
-        test_data = past_data[-prediction_horizon:]
-        _, predicted_data = fit_on_window(train_data, window)
-        predicted_data = predicted_data['prediction']
+    Returns
+    =======
+    errors: 1d numpy array
+        The mean absolute relative error for each day in the future,
+        up to prediction_horizon
+    """
+    window = np.asarray(window, dtype=float)
+    window_size = len(window)
+    values = np.asarray(data, dtype=float)
+    with np.errstate(divide='ignore'):
+        log_values = np.log(values)
+    log_values[log_values == -np.inf] = 0
+
+    # Rather than refitting on every past time point, we compute in one
+    # go the weighted sums for all the positions of the window. The
+    # replay at time i trains on the window ending at
+    # i - prediction_horizon and tests on the prediction_horizon next days
+    n_steps = data.shape[0] - window_size - prediction_horizon
+    if n_steps <= 0:
+        return np.full(prediction_horizon, np.nan)
+    sum_wy, sum_wxy = rolling_weighted_sums(
+        log_values[:n_steps + window_size - 1], window)
+    const, linear = trend_from_sums(sum_wy, sum_wxy, window)
+
+    # Only include in the evaluation the countries with more cases than
+    # threshold at the end of the training window and during the test
+    selected = np.ones((n_steps, data.shape[1]), dtype=bool)
+    for day in range(-1, prediction_horizon):
+        selected &= (values[window_size + day:window_size + day + n_steps]
+                     > threshold)
+
+    all_errors = np.empty((n_steps, prediction_horizon))
+    for day in range(prediction_horizon):
+        test_data = values[window_size + day:window_size + day + n_steps]
+        predicted_data = np.exp(const + linear * (window_size + day))
         # We now compute the mean absolute relative error
-
-        # Note that pandas' axis align magical matches the dates below
-        relative_error = ((test_data - predicted_data[-prediction_horizon:])
-                          / test_data)
-        relative_error = relative_error.abs().mean(axis=1)
-        all_errors.append(relative_error.reset_index()[0])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relative_error = np.abs((test_data - predicted_data)
+                                    / test_data)
+        relative_error = np.where(selected, relative_error, 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            all_errors[:, day] = (relative_error.sum(axis=1)
+                                  / selected.sum(axis=1))
     return np.mean(all_errors, axis=0)
 
 
-# %%
 # Calibrate the errors of our model for different windows
-
-# %%
-# First with ramp windows
-errors_by_window = dict()
-
-for start in range(8, 14):
-    for middle in range(2, start + 1):
-        window = ramp_window(start, middle)
-        window_name = f'Ramp, from -{start} to -{middle}'
-        errors = mem.cache(historical_replay)(confirmed, window)
-        errors_by_window[window_name] = (errors, start, middle)
-
-# %%
-# First we plot the errors are a function of prediction time
-plt.figure()
-for window_name, errors in errors_by_window.items():
-    plt.plot(errors[0], label=window_name)
-plt.legend(loc='best')
-plt.xlabel('Days to predict')
-plt.ylabel('Relative absolute error')
-plt.title('Errors as a function of time')
-
-# %%
-# Our conclusion from the above is that the shape of the error does not
-# depend much on the window
-
-# %%
-# We now plot the error after 4 days as a function of window params
-
-plt.figure()
-error, start, middle = zip(*errors_by_window.values())
-plt.scatter(start, middle, np.array(error)[:, 1])
-plt.scatter(start, middle, s=300*np.array(error)[:, 1],
-            c=np.array(error)[:, 3], marker='o')
-plt.colorbar()
-plt.xlabel('start parameter')
-plt.ylabel('middle parameter')
-plt.title('Errors as a function of ramp window parameter')
-
-# %%
-# These results tell us that we want a ramp with a length of 10 and
-# ramping all the way
-
-# %%
-# Now the exponential windows
-errors_by_window = dict()
-
-for start in range(12, 18):
-    for growth in [1.4, 1.5, 1.6, 1.7, 1.8, 1.9]:
-        window = exp_window(start, growth)
-        window_name = f'Exp, from -{start} with growth {growth}'
-        errors = mem.cache(historical_replay)(confirmed, window)
-        errors_by_window[window_name] = (errors, start, growth)
-
-# %%
-# First we plot the errors are a function of prediction time
-plt.figure()
-for window_name, errors in errors_by_window.items():
-    plt.plot(errors[0], label=window_name)
-plt.legend(loc='best')
-plt.xlabel('Days to predict')
-plt.ylabel('Relative absolute error')
-plt.title('Errors as a function of time')
-
-# %%
-# Our conclusion from the above is that the shape of the error does not
-# depend much on the window
-
-# %%
-# We now plot the error after 4 days as a function of window params
-
-plt.figure()
-error, start, growth = zip(*errors_by_window.values())
-plt.scatter(start, growth, np.array(error)[:, 1])
-plt.scatter(start, growth, s=300*np.array(error)[:, 1],
-            c=np.array(error)[:, 3], marker='o')
-plt.colorbar()
-plt.xlabel('start parameter')
-plt.ylabel('growth parameter')
-plt.title('Errors as a function of exp window parameter')
-
-# %%
-# We see that longer windows are better, with 1.6 growth.
 #
-# We chose not to explore longer than 17 days because these very long
-# windows only improve prediction slightly, but risk biasing it when
-# there is a change in public policy.
+# The windows are evaluated in parallel. The joblib workers receive the
+# matrix of cases as a read-only memmap, which they all share, rather
+# than as a pickled copy each
+def _replay_window(values, make_window, params, **replay_params):
+    window = make_window(**params)
+    return historical_replay(values, window, **replay_params)
+
+
+def grid_search_windows(data, make_window, param_grid, n_jobs=-1,
+                        **replay_params):
+    """ Run the historical replay for a grid of windows
+
+    Parameters
+    ==========
+    data: dataframe
+        The dataframe of the cases across countries (columns) and
+        time (index)
+    make_window: function
+        The function building the window, such as ramp_window or
+        exp_window
+    param_grid: list of dict
+        The parameters given to make_window for each candidate window
+    n_jobs: number
+        The number of workers, as in joblib.Parallel
+    replay_params:
+        The other parameters of historical_replay
+
+    Returns
+    =======
+    results: dataframe
+        A tidy dataframe, with the parameters of the window, the
+        day to predict and the corresponding error on each line
+    """
+    # joblib is needed only for this analysis, not for the dashboard
+    from joblib import Parallel, delayed
+    values = np.asarray(data, dtype=float)
+    # max_nbytes=0 makes joblib memmap all the arrays given to workers
+    all_errors = Parallel(n_jobs=n_jobs, max_nbytes=0, mmap_mode='r')(
+        delayed(_replay_window)(values, make_window, params,
+                                **replay_params)
+        for params in param_grid)
+
+    results = list()
+    for params, errors in zip(param_grid, all_errors):
+        for day, error in enumerate(errors, start=1):
+            results.append(dict(params, day=day, error=error))
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    # Update the data and the predictions of the dashboard
+    update_snapshot()
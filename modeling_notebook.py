@@ -0,0 +1,215 @@
+"""
+# Statistical model to extrapolate Covid-19 actives cases
+
+Here we build the statistical model behind
+https://covid19-dash.github.io/
+
+The model is made by fitting a weighted least square on the log of the
+number of cases over a window of the few last days.
+
+This is a computational notebook: it runs the code of the model, defined
+in modeling.py, and explains it.
+"""
+
+# %%
+# ## Load and plot the data
+
+# %%
+# Download the data, fit the model, and save both for the dashboard.
+# This is what the dashboard runs to update its data (the downloads are
+# cached, and the data of the last snapshot is updated rather than
+# recomputed)
+from modeling import update_snapshot
+data, predicted_cases = update_snapshot()
+
+# We model only the confirmed cases
+confirmed = data['confirmed']
+
+# %%
+# First plot the time course of the most affected countries
+last_day = confirmed.iloc[-1]
+most_affected_countries = confirmed.columns[last_day.argsort()][::-1]
+
+import matplotlib.pyplot as plt
+ax = confirmed[most_affected_countries[:20]].plot(figsize=(12, 7))
+ax.set_yscale('log')
+ax.set_title("Log-scale plot of number of confirmed cases")
+plt.legend(loc='best', ncol=3)
+plt.tight_layout()
+
+# %%
+# ## Define our weighted window
+#
+# The windows that we use are weighted: we give more weight to the last
+# day, and less to the days further away in time.
+
+# %%
+# To define the optimal window, specified below, we used a historical
+# replay: we chose the window and the set of weights that predict been
+# observations already seen from their past
+from modeling import WINDOW_SIZE, default_window
+window_size = WINDOW_SIZE
+weighted_window = default_window()
+
+plt.figure()
+plt.plot(weighted_window)
+plt.title('The weights over the last few days')
+
+# %%
+# # A simple model: fit the last few points
+
+# %%
+# the log of the confirmed counts in the last fortnight
+import numpy as np
+last_fortnight = confirmed.iloc[-window_size:]
+np.seterr(divide='ignore')
+log_last_fortnight = np.log(last_fortnight)
+log_last_fortnight[log_last_fortnight == -np.inf] = 0
+
+ax = log_last_fortnight[most_affected_countries[:20]].plot(figsize=(12, 7))
+ax.set_title('Log of the number of confirmed cases in the last fortnight')
+plt.legend(loc='best', ncol=3)
+plt.tight_layout()
+
+# %%
+# Our model-fitting routine is a weighted least square on the log of
+# the confirmed counts (see fit_on_window in modeling.py)
+#
+# The errors in the data are expected to be proportional to the value of
+# the data: the more cases are present, the more tests are realized, and
+# the more errors as well as the more cases are missed. This noise
+# becomes additive after taking the log, and can then reasonnably be
+# assumed Gaussian, which justifies the use of a squared loss.
+
+# %%
+# Fit it on the data
+from modeling import fit_on_window
+growth_rate, _ = fit_on_window(confirmed, weighted_window)
+
+ax = growth_rate[most_affected_countries[:20]].T.plot(kind='barh',
+    legend=False)
+ax.set_title('Estimated growth rate')
+ax.axvline(1, color='.5')
+plt.tight_layout()
+
+# %%
+# Display the estimated growth rates
+import pandas as pd
+pd.set_option('display.max_rows', 60)
+growth_rate[most_affected_countries[:60]].T
+
+# %%
+# Plot our prediction
+
+ax = last_fortnight[most_affected_countries[:10]].plot(figsize=(12, 7))
+predicted_cases['prediction'][most_affected_countries[:10]].plot(
+        ax=ax, style='--')
+predicted_cases['lower_bound'][most_affected_countries[:10]].plot(
+        ax=ax, style=':')
+predicted_cases['upper_bound'][most_affected_countries[:10]].plot(
+        ax=ax, style=':')
+
+plt.legend(loc=(.8, -1.3))
+ax.set_yscale('log')
+ax.set_title('Number of confirmed cases in the last fortnight and prediction')
+
+# %%
+# --------
+# Now an analysis to optimize the window.
+#
+# This takes longer and is left out from the notebook displayed on the
+# website (modeling_short)
+
+# %%
+# We calibrate the errors of our model for different windows with a
+# historical replay: the model is run in the past, and its predictions
+# compared to the data observed since (see historical_replay and
+# grid_search_windows in modeling.py)
+from modeling import ramp_window, grid_search_windows
+
+# %%
+# First with ramp windows
+errors_by_window = grid_search_windows(
+    confirmed, ramp_window,
+    [dict(start=start, middle=middle)
+     for start in range(8, 14) for middle in range(2, start + 1)])
+
+# %%
+# First we plot the errors are a function of prediction time
+plt.figure()
+for (start, middle), errors in errors_by_window.groupby(['start',
+                                                         'middle']):
+    plt.plot(errors['day'], errors['error'],
+             label=f'Ramp, from -{start} to -{middle}')
+plt.legend(loc='best')
+plt.xlabel('Days to predict')
+plt.ylabel('Relative absolute error')
+plt.title('Errors as a function of time')
+
+# %%
+# Our conclusion from the above is that the shape of the error does not
+# depend much on the window
+
+# %%
+# We now plot the error after 4 days as a function of window params
+
+plt.figure()
+error = errors_by_window.pivot_table(index=['start', 'middle'],
+                                     columns='day', values='error')
+start, middle = zip(*error.index)
+plt.scatter(start, middle, error[2])
+plt.scatter(start, middle, s=300*error[2], c=error[4], marker='o')
+plt.colorbar()
+plt.xlabel('start parameter')
+plt.ylabel('middle parameter')
+plt.title('Errors as a function of ramp window parameter')
+
+# %%
+# These results tell us that we want a ramp with a length of 10 and
+# ramping all the way
+
+# %%
+# Now the exponential windows
+from modeling import exp_window
+errors_by_window = grid_search_windows(
+    confirmed, exp_window,
+    [dict(start=start, growth=growth)
+     for start in range(12, 18)
+     for growth in [1.4, 1.5, 1.6, 1.7, 1.8, 1.9]])
+
+# %%
+# First we plot the errors are a function of prediction time
+plt.figure()
+for (start, growth), errors in errors_by_window.groupby(['start',
+                                                         'growth']):
+    plt.plot(errors['day'], errors['error'],
+             label=f'Exp, from -{start} with growth {growth}')
+plt.legend(loc='best')
+plt.xlabel('Days to predict')
+plt.ylabel('Relative absolute error')
+plt.title('Errors as a function of time')
+
+# %%
+# Our conclusion from the above is that the shape of the error does not
+# depend much on the window
+
+# %%
+# We now plot the error after 4 days as a function of window params
+
+plt.figure()
+error = errors_by_window.pivot_table(index=['start', 'growth'],
+                                     columns='day', values='error')
+start, growth = zip(*error.index)
+plt.scatter(start, growth, error[2])
+plt.scatter(start, growth, s=300*error[2], c=error[4], marker='o')
+plt.colorbar()
+plt.xlabel('start parameter')
+plt.ylabel('growth parameter')
+plt.title('Errors as a function of exp window parameter')
+
+# %%
+# We see that longer windows are better, with 1.6 growth.
+#
+# We chose not to explore longer than 17 days because these very long
+# windows only improve prediction slightly, but risk biasing it when
+# there is a change in public policy.
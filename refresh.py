@@ -0,0 +1,85 @@
+"""
+Refresh the data of the running app in the background
+
+A thread checks periodically the age of the data snapshot. When it is
+too old, the snapshot is updated (downloading the data and fitting the
+model) in this thread, so that the server keeps answering requests. The
+app is then told to reload the snapshot.
+"""
+
+import fcntl
+import os
+import threading
+import time
+import traceback
+
+from snapshot import SNAPSHOT_DIR, get_snapshot_time
+
+# The maximum age of the data, in seconds. 0 disables the refresh
+REFRESH_INTERVAL = float(os.environ.get('COVID_DASH_REFRESH_INTERVAL', 0))
+
+# How often to check the age of the snapshot, in seconds
+REFRESH_CHECK_EVERY = 60
+
+
+def rebuild_snapshot(directory=SNAPSHOT_DIR):
+    """ Update the data and the predictions of the snapshot
+
+    Returns False if another process (for instance another worker of the
+    server) is already rebuilding it.
+    """
+    # A lock file next to the snapshot makes sure that only one of the
+    # processes serving the app runs the model
+    with open(directory.rstrip(os.sep) + '.lock', 'w') as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        # The model is imported only when it is run: most workers never
+        # refit it
+        from modeling import update_snapshot
+        update_snapshot(directory)
+    return True
+
+
+def _refresh_loop(reload, interval, check_every):
+    while True:
+        time.sleep(check_every)
+        try:
+            snapshot_time = get_snapshot_time()
+            if (snapshot_time is None
+                    or time.time() - snapshot_time > interval):
+                rebuild_snapshot()
+            reload()
+        except Exception:
+            # The refresh must never stop the server: we retry at the
+            # next check
+            traceback.print_exc()
+
+
+def start_refresh(reload, interval=REFRESH_INTERVAL,
+                  check_every=REFRESH_CHECK_EVERY):
+    """ Start the background refresh of the data
+
+    Parameters
+    ----------
+    reload: function
+        Called without arguments after each check: it should reload the
+        data if the snapshot changed
+    interval: float
+        The maximum age of the data, in seconds. If 0, no refresh is done
+    check_every: float
+        How often the age of the snapshot is checked, in seconds
+
+    Returns
+    -------
+    thread: threading.Thread or None
+    """
+    if interval <= 0:
+        return None
+    thread = threading.Thread(target=_refresh_loop,
+                              args=(reload, interval,
+                                    min(check_every, interval)),
+                              name='refresh', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,167 @@
+"""
+Store the processed data and the predictions of the model on disk
+
+A snapshot is a directory with one .npy file per data frame, holding its
+values, and a metadata.json file describing the index and the columns of
+the frames. The .npy files are loaded memory-mapped: processes loading
+the same snapshot share its pages through the OS cache.
+
+Each save writes new .npy files, and then replaces metadata.json, which
+points to them: a snapshot can be updated while processes are loading
+it, they see either the former or the new one.
+"""
+
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+SNAPSHOT_DIR = os.environ.get('COVID_DASH_SNAPSHOT', 'snapshot')
+
+# Increment when the layout of the snapshot changes: older snapshots are
+# then ignored
+SNAPSHOT_VERSION = 2
+
+PREDICTION_KEYS = ('prediction', 'lower_bound', 'upper_bound')
+
+
+def _write_atomic(path, write):
+    """ Write a file through a temporary file, so that readers never see
+        a partial file
+    """
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def _frame_metadata(df):
+    columns = df.columns
+    if isinstance(columns, pd.MultiIndex):
+        columns = [list(column) for column in columns]
+    else:
+        columns = list(columns)
+    return dict(
+        index=[date.isoformat() for date in df.index],
+        index_name=df.index.name,
+        columns=columns,
+        column_names=list(df.columns.names),
+    )
+
+
+def _frame_from_metadata(values, metadata):
+    if len(metadata['column_names']) > 1:
+        columns = pd.MultiIndex.from_tuples(
+            [tuple(column) for column in metadata['columns']],
+            names=metadata['column_names'])
+    else:
+        columns = pd.Index(metadata['columns'],
+                           name=metadata['column_names'][0])
+    index = pd.DatetimeIndex(metadata['index'], name=metadata['index_name'])
+    # copy=False: the frame is a view on the memory-mapped array
+    return pd.DataFrame(values, index=index, columns=columns, copy=False)
+
+
+def _read_metadata(directory):
+    with open(os.path.join(directory, 'metadata.json')) as f:
+        return json.load(f)
+
+
+def save_snapshot(data, predictions, directory=SNAPSHOT_DIR, window=None):
+    """ Save the data and the predictions in a snapshot
+
+    Parameters
+    ----------
+    data: pandas DataFrame
+        The wide data frame of cases, as returned by data_input.get_data
+    predictions: dict of pandas DataFrame
+        The predicted cases, with keys "prediction", "lower_bound" and
+        "upper_bound"
+    directory: str
+        The directory of the snapshot
+    window: 1d numpy array, optional
+        The weights of the window used for the predictions
+    """
+    os.makedirs(directory, exist_ok=True)
+    try:
+        previous_files = {frame['file'] for frame in
+                          _read_metadata(directory)['frames'].values()}
+    except (OSError, ValueError, KeyError):
+        previous_files = set()
+    frames = dict(data=data)
+    frames.update((key, predictions[key]) for key in PREDICTION_KEYS)
+    created = time.time()
+    metadata = dict(version=SNAPSHOT_VERSION, created=created,
+                    frames=dict())
+    if window is not None:
+        metadata['window'] = [float(weight) for weight in window]
+    for name, df in frames.items():
+        values = np.ascontiguousarray(df.values, dtype=np.float64)
+        filename = f'{name}-{int(created * 1e6)}-{os.getpid()}.npy'
+        _write_atomic(os.path.join(directory, filename),
+                      lambda f: np.save(f, values))
+        metadata['frames'][name] = _frame_metadata(df)
+        metadata['frames'][name]['file'] = filename
+    # The metadata is written last: it is what makes a snapshot valid
+    _write_atomic(os.path.join(directory, 'metadata.json'),
+                  lambda f: f.write(json.dumps(metadata).encode('utf-8')))
+
+    # Remove the files of the older snapshots. Those of the previous one
+    # are kept for the processes that may be loading it right now
+    current_files = {frame['file'] for frame in metadata['frames'].values()}
+    for filename in os.listdir(directory):
+        if (filename.endswith('.npy') and filename not in current_files
+                and filename not in previous_files):
+            os.remove(os.path.join(directory, filename))
+
+
+def load_snapshot(directory=SNAPSHOT_DIR, mmap_mode='r'):
+    """ Load the data and the predictions of a snapshot
+
+    Returns
+    -------
+    data: pandas DataFrame
+        The wide data frame of cases
+    predictions: dict of pandas DataFrame
+        The predicted cases, with keys "prediction", "lower_bound" and
+        "upper_bound"
+
+    Raises FileNotFoundError if there is no valid snapshot in directory.
+    """
+    if not os.path.exists(os.path.join(directory, 'metadata.json')):
+        raise FileNotFoundError(f'No snapshot in {directory}')
+    metadata = _read_metadata(directory)
+    if metadata.get('version') != SNAPSHOT_VERSION:
+        raise FileNotFoundError(
+            f"The snapshot in {directory} has version "
+            f"{metadata.get('version')}, expected {SNAPSHOT_VERSION}")
+    frames = dict()
+    for name, frame_metadata in metadata['frames'].items():
+        values = np.load(os.path.join(directory, frame_metadata['file']),
+                         mmap_mode=mmap_mode)
+        frames[name] = _frame_from_metadata(values, frame_metadata)
+    data = frames.pop('data')
+    return data, frames
+
+
+def get_snapshot_time(directory=SNAPSHOT_DIR):
+    """ The time (in seconds since the epoch) at which the snapshot was
+        created, None if there is no snapshot
+    """
+    try:
+        return _read_metadata(directory)['created']
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def get_snapshot_window(directory=SNAPSHOT_DIR):
+    """ The weights of the window used for the predictions of the
+        snapshot, None if unknown
+    """
+    try:
+        window = _read_metadata(directory).get('window')
+    except (OSError, ValueError):
+        return None
+    return None if window is None else np.array(window)